@@ -0,0 +1,63 @@
+"""
+Compares the size on disk and the load time of the extended spec as pretty
+JSON, minified JSON, plain msgpack and spec_binary's interned msgpack.
+
+Measured on the spec of Bot API 9.2 (best time, garbage collector off):
+
+                  format       size       load
+                    json     854 KiB    3.32 ms
+          json, minified     579 KiB    3.04 ms
+                 msgpack     517 KiB    2.81 ms
+        interned, >= 4 B     382 KiB    3.92 ms
+       interned, >= 16 B     446 KiB    3.17 ms
+      interned, >= 128 B     490 KiB    3.05 ms
+
+spec-extended.msgpack uses the default of 4 bytes, and the load_spec cases
+of benchmarks/suite.py keep its load time from regressing.
+
+Run from the repository root with ``python -m benchmarks.bench_binary``.
+"""
+
+import json
+import sys
+
+import spec_binary
+from benchmarks.suite import best_of
+
+SPEC_PATH = "spec-extended.json"
+MIN_SPEC_PATH = "spec-extended.min.json"
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def main():
+    if not spec_binary.HAS_MSGPACK:
+        sys.exit("msgpack is not installed")
+    msgpack = spec_binary.msgpack
+    spec = json.loads(read(SPEC_PATH))
+    formats = [
+        ("json", read(SPEC_PATH), json.loads),
+        ("json, minified", read(MIN_SPEC_PATH), json.loads),
+        ("msgpack", msgpack.packb(spec), msgpack.unpackb),
+    ]
+    for min_length in (spec_binary.MIN_INTERNED_LENGTH, 16, 128):
+        formats.append(
+            (
+                f"interned, >= {min_length} B",
+                spec_binary.dumps(spec, min_length),
+                spec_binary.loads,
+            )
+        )
+
+    print(f"{'format':>20} {'size':>10} {'load':>10}")
+    for name, data, loads in formats:
+        assert loads(data) == spec
+        seconds = best_of(lambda: loads(data))
+        print(f"{name:>20} {len(data) // 1024:>7} KiB {seconds * 1000:>7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
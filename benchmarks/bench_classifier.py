@@ -0,0 +1,37 @@
+"""
+Times sentence_index.SentenceIndex.classify on every sentence of an API page
+rendered from api.json, at several scales of the spec.
+
+Run from the repository root with ``python -m benchmarks.bench_classifier``.
+"""
+
+import time
+
+import scraper
+from benchmarks.pages import render_api_page
+from sentence_index import SentenceIndex, iter_sentences
+from update_extensions import AIComponent
+
+
+def main():
+    vectorizer = AIComponent({}).vectorizer
+    start = time.perf_counter()
+    index = SentenceIndex.from_file(vectorizer)
+    print(f"index build: {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"{'scale':>5} {'sentences':>10} {'classify':>10} {'per 1k':>8}")
+    for scale in (1, 4, 10):
+        data = scraper.scrape_body(
+            render_api_page(scale=scale), scraper.scrape_api_page, "lxml-direct"
+        )
+        sentences = [sentence for _, sentence in iter_sentences(data)]
+        start = time.perf_counter()
+        index.classify(sentences)
+        seconds = time.perf_counter() - start
+        per_thousand = seconds * 1000 / len(sentences) * 1000
+        print(
+            f"{scale:>5} {len(sentences):>10} {seconds:>9.3f}s {per_thousand:>6.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
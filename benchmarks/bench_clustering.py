@@ -0,0 +1,79 @@
+"""
+Compares AIComponent.analyze_data with the CountVectorizer and KMeans version
+it replaced, on reference data scraped from an API page rendered from
+api.json. The new version is timed without a vector cache, with a cold one
+and with a warm one after a single description changed.
+
+Run from the repository root with ``python -m benchmarks.bench_clustering``.
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from sklearn.cluster import KMeans
+from sklearn.feature_extraction.text import CountVectorizer
+
+import scraper
+from benchmarks.pages import render_api_page
+from update_extensions import AIComponent
+from vector_cache import VectorCache
+
+
+def legacy_analyze_data(extensions_ref_data):
+    """AIComponent.analyze_data before the vector cache."""
+    descriptions = []
+    for method in extensions_ref_data["methods"].values():
+        descriptions.append(method["description"])
+    for type in extensions_ref_data["types"].values():
+        descriptions.append(type["description"])
+
+    X = CountVectorizer(stop_words="english").fit_transform(descriptions)
+    kmeans = KMeans(n_clusters=2, random_state=0, n_init="auto")
+    kmeans.fit(X)
+
+    clusters = {}
+    for i, label in enumerate(kmeans.labels_):
+        if label not in clusters:
+            clusters[label] = []
+        if i < len(extensions_ref_data["methods"]):
+            clusters[label].append(list(extensions_ref_data["methods"].keys())[i])
+        else:
+            clusters[label].append(
+                list(extensions_ref_data["types"].keys())[
+                    i - len(extensions_ref_data["methods"])
+                ]
+            )
+    return clusters
+
+
+def timed(func):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        func()
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'scale':>5} {'legacy':>9} {'no cache':>9} {'cold':>9} {'warm':>9}")
+    for scale in (1, 4, 10):
+        data = scraper.scrape_body(
+            render_api_page(scale=scale), scraper.scrape_api_page, "lxml-direct"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "vectors.npz")
+            legacy = timed(lambda: legacy_analyze_data(data))
+            uncached = timed(lambda: AIComponent(data).analyze_data())
+            cold = timed(lambda: AIComponent(data, VectorCache(path)).analyze_data())
+            name = next(iter(data["methods"]))
+            data["methods"][name]["description"] += " Changed."
+            warm = timed(lambda: AIComponent(data, VectorCache(path)).analyze_data())
+        print(
+            f"{scale:>5} {legacy:>8.2f}s {uncached:>8.2f}s {cold:>8.2f}s {warm:>8.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Times constraints.extract on api.json and on a spec ten times as large,
+against running every pattern over every field description one at a time.
+
+Run from the repository root with ``python -m benchmarks.bench_constraints``.
+"""
+
+import re
+import time
+
+import constraints
+from benchmarks.pages import load_spec, scale_spec
+
+PATTERNS = [re.compile(pattern) for pattern, _ in constraints.PATTERNS]
+
+
+def per_field(spec):
+    """Every pattern on every field description, without the combined scan."""
+    found = 0
+    for _, _, field in constraints.iter_fields(spec):
+        for pattern in PATTERNS:
+            found += sum(1 for _ in pattern.finditer(field["description"]))
+        constraints.LIMIT_LIKE.search(field["description"])
+    return found
+
+
+def best_of(func, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    spec = load_spec()
+    print(f"{'scale':>5} {'fields':>7} {'per field':>10} {'extract':>10}")
+    for scale in (1, 10):
+        data = scale_spec(spec, scale)
+        fields = sum(1 for _ in constraints.iter_fields(data))
+        loop = best_of(lambda: per_field(data))
+        extract = best_of(lambda: constraints.extract(data))
+        print(f"{scale:>5} {fields:>7} {loop * 1000:>8.1f}ms {extract * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compares the size of extensions.json and spec-extended.json, and the time of
+spec_merge.build, with and without the shared x-definitions table, using the
+rate limits of the saved FAQ page. Also times expanding every method and type
+with definitions.Resolver.
+
+Run from the repository root with ``python -m benchmarks.bench_definitions``.
+"""
+
+import copy
+import json
+import os
+import tempfile
+import time
+
+import constraints
+import definitions
+import rules
+import scraper
+import spec_merge
+
+FAQ_PAGE = os.path.join("tests", "fixtures", "faq.html")
+
+
+def extensions_data():
+    """The extensions update_extensions generates with the FAQ scraped."""
+    with open(FAQ_PAGE) as f:
+        ref = scraper.scrape_body(f.read(), scraper.scrape_faq_page, "lxml-direct")
+    spec = spec_merge.load_json(spec_merge.API_PATH)
+    extensions = rules.RuleEngine(spec["methods"]).generate(ref)
+    restrictions, _ = constraints.extract(spec)
+    for name, fields in restrictions.items():
+        rules.merge_missing(extensions.setdefault(name, {}), {"x-restrictions": fields})
+    return extensions
+
+
+def best_of(func, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def expand_all(spec):
+    resolver = definitions.Resolver(spec)
+    for kind in ("methods", "types"):
+        for name in spec[kind]:
+            resolver.get(kind, name)
+
+
+def main():
+    inline = extensions_data()
+    hoisted = definitions.hoist(copy.deepcopy(inline))
+    print(f"x-definitions: {', '.join(hoisted['x-definitions'])}")
+    print(f"{'':>8} {'extensions':>11} {'spec':>9} {'spec.min':>9} {'merge':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = os.path.join(tmp, "spec-extended.json")
+        min_output_path = os.path.join(tmp, "spec-extended.min.json")
+
+        def merge(extensions):
+            return spec_merge.build(
+                extensions=extensions,
+                output_path=output_path,
+                min_output_path=min_output_path,
+                patch_path=None,
+                restrictions_path=None,
+                binary_path=None,
+            )
+
+        for label, extensions in (("inline", inline), ("hoisted", hoisted)):
+            spec = merge(extensions)
+            size = len(json.dumps(extensions, indent=2)) / 1024
+            pretty = os.path.getsize(output_path) / 1024
+            minified = os.path.getsize(min_output_path) / 1024
+            seconds = best_of(lambda: merge(extensions))
+            print(
+                f"{label:>8} {size:>9.1f}KB {pretty:>7.1f}KB {minified:>7.1f}KB"
+                f" {seconds * 1000:>6.1f}ms"
+            )
+        print(
+            f"resolve all methods and types: {best_of(lambda: expand_all(spec)) * 1000:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Compares sequential and concurrent page downloads against a local stand-in
+for core.telegram.org.
+
+Run from the repository root with ``python -m benchmarks.bench_fetch``.
+"""
+
+import time
+
+import scraper
+from tests.http_stub import Route, StubServer
+
+# Simulated server latency and body size of each documentation page.
+PAGES = {
+    "/bots/faq": (0.25, 120_000),
+    "/bots/api": (0.6, 1_000_000),
+    "/bots/features": (0.2, 90_000),
+}
+
+
+def fetch_sequential(urls):
+    return {url: scraper.get_soup(url) for url in urls}
+
+
+def main():
+    routes = {
+        path: Route("<p>" + "x" * size + "</p>", delay=delay)
+        for path, (delay, size) in PAGES.items()
+    }
+    with StubServer(routes) as server:
+        urls = [server.url(path) for path in PAGES]
+        for name, fetch in [
+            ("sequential", fetch_sequential),
+            ("concurrent", scraper.fetch_soups),
+        ]:
+            start = time.perf_counter()
+            fetch(urls)
+            print(f"{name:>10}: {time.perf_counter() - start:.3f}s")
+    print(f"slowest page: {max(delay for delay, _ in PAGES.values()):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
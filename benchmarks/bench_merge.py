@@ -0,0 +1,53 @@
+"""
+Compares the jq merge the spec workflow used to run with spec_merge.build.
+
+Run from the repository root with ``python -m benchmarks.bench_merge``.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+import spec_merge
+
+
+def run_jq(tmp):
+    for api, extensions, output in [
+        ("api.json", "extensions.json", "spec-extended.json"),
+        ("api.min.json", "extensions.min.json", "spec-extended.min.json"),
+    ]:
+        with open(os.path.join(tmp, output), "w") as f:
+            subprocess.run(
+                ["jq", "-s", ".[0] * .[1]", api, extensions], stdout=f, check=True
+            )
+
+
+def run_python(tmp):
+    spec_merge.build(
+        output_path=os.path.join(tmp, "spec-extended.json"),
+        min_output_path=os.path.join(tmp, "spec-extended.min.json"),
+    )
+
+
+def best_of(func, tmp, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(tmp)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    runs = [("spec_merge", run_python)]
+    if shutil.which("jq"):
+        runs.insert(0, ("jq x2", run_jq))
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, func in runs:
+            print(f"{name:>10}: {best_of(func, tmp):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
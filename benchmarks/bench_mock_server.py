@@ -0,0 +1,151 @@
+"""
+Load test of mock_server.MockServer. Starts the server in its own process (or
+uses --url), opens --connections keep-alive connections and sends requests
+over each of them one after the other: sendMessage to random private chats
+and groups, with a getMe and an invalid request now and then. Reports the
+requests per second, the status codes and the latency percentiles.
+
+Run from the repository root with ``python -m benchmarks.bench_mock_server``;
+``--spec`` serves another spec, such as one with the FAQ rate limits.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+import spec_merge
+
+TOKEN = "123456:mock-token"
+PERCENTILES = [50, 90, 99, 99.9]
+
+
+class Client:
+    """An HTTP/1.1 keep-alive connection to a Bot API server."""
+
+    def __init__(self, url, token=TOKEN):
+        self.url = urlsplit(url)
+        self.token = token
+        self.reader = self.writer = None
+
+    async def __aenter__(self):
+        self.reader, self.writer = await asyncio.open_connection(
+            self.url.hostname, self.url.port
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+    def encode(self, method, payload=None, content_type="application/json"):
+        """The bytes of a request; payload is a dict, or an already encoded body."""
+        if isinstance(payload, dict):
+            payload = json.dumps(payload).encode()
+        body = payload or b""
+        head = (
+            f"POST /bot{self.token}/{method} HTTP/1.1\r\n"
+            f"Host: {self.url.netloc}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        )
+        return head.encode() + body
+
+    async def send(self, request):
+        """Sends the bytes of a request; returns the status and the JSON reply."""
+        self.writer.write(request)
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        status = int(head.split(b" ", 2)[1])
+        length = int(head.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+        return status, json.loads(await self.reader.readexactly(length))
+
+    async def call(self, method, payload=None, content_type="application/json"):
+        return await self.send(self.encode(method, payload, content_type))
+
+
+def requests(client, count, seed=0):
+    """The encoded requests of one connection."""
+    rng = random.Random(seed)
+    found = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.05:
+            found.append(client.encode("getMe"))
+        elif roll < 0.06:
+            found.append(client.encode("sendMessage", {"chat_id": 1, "text": ""}))
+        else:
+            chat_id = rng.choice([rng.randrange(1, 10**6), -rng.randrange(1, 1000)])
+            payload = {"chat_id": chat_id, "text": "x" * rng.randrange(1, 300)}
+            found.append(client.encode("sendMessage", payload))
+    return found
+
+
+async def connection(url, count, seed, latencies, statuses):
+    async with Client(url) as client:
+        for request in requests(client, count, seed):
+            start = time.perf_counter()
+            status, _ = await client.send(request)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+
+
+async def load(url, connections, count):
+    latencies, statuses = [], Counter()
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            connection(url, count // connections, seed, latencies, statuses)
+            for seed in range(connections)
+        )
+    )
+    return time.perf_counter() - start, latencies, statuses
+
+
+def percentile(ordered, percent):
+    return ordered[min(int(len(ordered) * percent / 100), len(ordered) - 1)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", help="a running server; started here by default")
+    parser.add_argument("--spec", default=spec_merge.OUTPUT_PATH)
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=50_000)
+    args = parser.parse_args(argv)
+
+    process = None
+    url = args.url
+    if url is None:
+        process = subprocess.Popen(
+            [sys.executable, "mock_server.py", "--port", "0", "--spec", args.spec],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        url = process.stdout.readline().split()[-1]
+    try:
+        seconds, latencies, statuses = asyncio.run(
+            load(url, args.connections, args.requests)
+        )
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+
+    latencies.sort()
+    print(
+        f"{len(latencies):,} requests over {args.connections} connections"
+        f" in {seconds:.2f}s: {len(latencies) / seconds:,.0f} requests/s"
+    )
+    print("statuses: " + ", ".join(f"{k}: {v:,}" for k, v in sorted(statuses.items())))
+    quantiles = [f"p{p:g} {percentile(latencies, p) * 1000:.2f}ms" for p in PERCENTILES]
+    quantiles.append(f"max {latencies[-1] * 1000:.2f}ms")
+    print("latency: " + ", ".join(quantiles))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
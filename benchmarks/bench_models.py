@@ -0,0 +1,118 @@
+"""
+Compares the generated models of models.py with plain dicts and with
+dataclasses built by reflection over the spec, the way services without
+generated code decode objects. Decodes synthetic Message objects from
+synthetic_updates.py, typical ones (sender and text) and rich ones (5% of the
+optional fields filled as well), and reports the decode throughput from JSON
+text and the memory every decoded message holds.
+
+Run from the repository root with ``python -m benchmarks.bench_models``.
+"""
+
+import dataclasses
+import json
+import keyword
+import time
+import tracemalloc
+
+import models
+import spec_merge
+import synthetic_updates
+import type_graph
+
+MESSAGES = 20_000
+
+
+def _name(field):
+    return field + "_" if keyword.iskeyword(field) else field
+
+
+class Dataclasses:
+    """A dataclass per type, with every field defaulting to None."""
+
+    def __init__(self, spec):
+        self.types = spec["types"]
+        graph = type_graph.TypeGraph.from_spec(spec)
+        self.classes = {}
+        self.fields = {}
+        for name, entry in self.types.items():
+            fields = entry.get("fields", [])
+            self.fields[name] = {field["name"]: field["types"][0] for field in fields}
+            self.classes[name] = dataclasses.make_dataclass(
+                name,
+                [
+                    (_name(field["name"]), object, dataclasses.field(default=None))
+                    for field in fields
+                ],
+            )
+        self.concrete = {
+            name: sorted(graph.concrete_types(name)) for name in self.types
+        }
+
+    def decode(self, type_ref, value):
+        if type_ref.startswith(type_graph.ARRAY_PREFIX):
+            item_type = type_ref.removeprefix(type_graph.ARRAY_PREFIX)
+            return [self.decode(item_type, item) for item in value]
+        if type_ref not in self.types:
+            return value
+        # The first concrete type that has every field of the object.
+        for name in self.concrete[type_ref]:
+            fields = self.fields[name]
+            if value.keys() <= fields.keys():
+                break
+        kwargs = {
+            _name(key): self.decode(fields[key], item) for key, item in value.items()
+        }
+        return self.classes[name](**kwargs)
+
+
+def messages(count, optional):
+    generator = synthetic_updates.UpdateGenerator.from_file(
+        seed=0, mix={"message": 1}, optional=optional
+    )
+    return [
+        synthetic_updates.encode(update["message"])
+        for update in generator.updates(count)
+    ]
+
+
+def rate(decode, texts):
+    best = 0
+    for _ in range(3):
+        start = time.perf_counter()
+        for text in texts:
+            decode(json.loads(text))
+        best = max(best, len(texts) / (time.perf_counter() - start))
+    return best
+
+
+def memory(decode, texts):
+    """The bytes every decoded message holds on average."""
+    tracemalloc.start()
+    held = [decode(json.loads(text)) for text in texts]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return size / len(texts)
+
+
+def main():
+    reflective = Dataclasses(spec_merge.load_json(spec_merge.OUTPUT_PATH))
+    decoders = [
+        ("dict", lambda data: data),
+        ("dataclass", lambda data: reflective.decode("Message", data)),
+        ("models", models.Message.from_dict),
+    ]
+    for label, optional in (("typical", 0.0), ("rich", 0.05)):
+        texts = messages(MESSAGES, optional)
+        size = sum(map(len, texts)) / len(texts)
+        print(f"{label} messages ({size:.0f} bytes of JSON on average):")
+        for name, decode in decoders:
+            print(
+                f"{name:>12}: {rate(decode, texts):>10,.0f} messages/s,"
+                f" {memory(decode, texts):>8,.0f} bytes per message"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Reports parse time, extraction time and peak memory of each scraper parser
+backend on an API page rendered from api.json.
+
+Every backend runs in a fresh interpreter so that peak RSS is not shared
+between them. The Python heap peak is taken from tracemalloc; the RSS growth
+also covers memory allocated by libxml2, which tracemalloc cannot see.
+
+Run from the repository root with ``python -m benchmarks.bench_parsers``.
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import scraper
+import scraper_lxml
+from benchmarks.pages import render_api_page
+
+
+def max_rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def scrape(parser, body):
+    """Parses body and extracts the API page, returning both durations."""
+    start = time.perf_counter()
+    if parser == "lxml-direct":
+        doc = scraper_lxml.parse(body)
+        parsed = time.perf_counter()
+        scraper_lxml.scrape_api_page(doc, {})
+    else:
+        doc = scraper.BeautifulSoup(body, parser)
+        parsed = time.perf_counter()
+        scraper.scrape_api_page(doc, {})
+    return parsed - start, time.perf_counter() - parsed
+
+
+def measure(parser, scale):
+    body = render_api_page(scale=scale)
+    rss_before = max_rss_kb()
+    parse_s, extract_s = scrape(parser, body)
+    rss_growth = max_rss_kb() - rss_before
+
+    # Tracing slows parsing down several times, so it gets a run of its own.
+    tracemalloc.start()
+    scrape(parser, body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "parser": parser,
+        "parse_s": parse_s,
+        "extract_s": extract_s,
+        "traced_peak_mb": peak / 2**20,
+        "rss_growth_mb": rss_growth / 1024,
+    }
+
+
+def main(argv=None):
+    args = argparse.ArgumentParser()
+    args.add_argument("--parser", choices=scraper.PARSERS)
+    args.add_argument("--scale", type=int, default=1)
+    args = args.parse_args(argv)
+
+    if args.parser:
+        print(json.dumps(measure(args.parser, args.scale)))
+        return
+
+    parsers = scraper.PARSERS if scraper_lxml.lxml else ("html.parser",)
+    print(
+        f"{'parser':>12} {'parse':>8} {'extract':>8} {'traced peak':>12} "
+        f"{'RSS growth':>11}"
+    )
+    for parser in parsers:
+        command = [sys.executable, "-m", "benchmarks.bench_parsers"]
+        command += ["--parser", parser, "--scale", str(args.scale)]
+        output = subprocess.run(
+            command,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output)
+        print(
+            f"{parser:>12} {result['parse_s']:>7.3f}s {result['extract_s']:>7.3f}s "
+            f"{result['traced_peak_mb']:>9.1f} MB {result['rss_growth_mb']:>8.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
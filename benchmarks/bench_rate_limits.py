@@ -0,0 +1,136 @@
+"""
+Replays a synthetic day of bot traffic through rate_limits.RateLimiter and
+through ScalarRateLimiter, the same limits kept as a dictionary of buckets
+per chat and decided one event at a time. Reports the replay time, the
+largest number of buckets held at once and their memory.
+
+The traffic mixes replies in private chats, busy groups and a few broadcasts
+of a message to many users at once, with the FAQ limits of sendMessage.
+
+Run from the repository root with ``python -m benchmarks.bench_rate_limits``.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import rate_limits
+
+DAY = 86_400.0
+EVENTS = 3_000_000
+CHATS = 1_000_000
+GROUPS = 20_000
+METHODS = ["sendMessage", "sendPhoto", "getMe"]
+FAQ_LIMITS = {
+    "per_chat_per_second": {"value": 1},
+    "group_per_minute": {"value": 20},
+    "broadcast_per_second": {"value": 30},
+}
+
+
+def limits():
+    return {"sendMessage": FAQ_LIMITS, "sendPhoto": FAQ_LIMITS}
+
+
+def traffic(events=EVENTS, seed=0):
+    """Returns the times, chat ids and method indexes of a day of traffic."""
+    rng = np.random.default_rng(seed)
+    times = np.sort(rng.uniform(0, DAY, events))
+    # Most events go to private chats; groups are fewer but busier.
+    chat_ids = rng.integers(1, CHATS + 1, events)
+    in_group = rng.random(events) < 0.3
+    chat_ids[in_group] = -rng.zipf(1.5, in_group.sum()) % GROUPS - 1
+    # A few broadcasts of one message to 5,000 users within a second.
+    for start in rng.uniform(0, DAY - 1, 10):
+        hit = np.searchsorted(times, start)
+        broadcast = slice(hit, hit + 5000)
+        chat_ids[broadcast] = rng.integers(1, CHATS + 1, 5000)
+        times[broadcast] = start + np.sort(rng.uniform(0, 1, 5000))
+    times.sort()
+    methods = rng.choice(len(METHODS), events, p=[0.8, 0.15, 0.05])
+    return times, chat_ids, methods
+
+
+class ScalarRateLimiter:
+    """The limits of RateLimiter with a dictionary of TATs per level."""
+
+    def __init__(self, limits, burst=None):
+        self.burst = dict(rate_limits.DEFAULT_BURST, **(burst or {}))
+        self.limits = limits
+        self.buckets = [{} for _ in rate_limits.LEVELS]
+        self.largest = 0
+
+    def decide_one(self, t, chat_id, method):
+        block = self.limits.get(method)
+        if block is None:
+            return True, 0, -1
+        for column, (key, seconds) in enumerate(rate_limits.LEVELS):
+            if key not in block or (key == "group_per_minute" and chat_id >= 0):
+                continue
+            increment = seconds / block[key]["value"]
+            tolerance = (self.burst[key] - 1) * increment
+            bucket = 0 if key == "broadcast_per_second" else chat_id
+            tat = self.buckets[column].get(bucket, float("-inf"))
+            if t < tat - tolerance - rate_limits.EPSILON:
+                return False, max(int(np.ceil(tat - tolerance - t)), 1), column
+            self.buckets[column][bucket] = max(tat, t) + increment
+        return True, 0, -1
+
+    def replay(self, times, chat_ids, methods):
+        results = [
+            self.decide_one(t, chat_id, METHODS[method])
+            for t, chat_id, method in zip(
+                times.tolist(), chat_ids.tolist(), methods.tolist()
+            )
+        ]
+        self.largest = sum(len(buckets) for buckets in self.buckets)
+        return results
+
+
+def main():
+    times, chat_ids, methods = traffic()
+    print(f"{len(times):,} events, {len(np.unique(chat_ids)):,} chats")
+
+    limiter = rate_limits.RateLimiter(limits())
+    names = np.array(
+        [limiter._index.get(name, len(limiter.methods)) for name in METHODS]
+    )
+    start = time.perf_counter()
+    largest = 0
+    results = ([], [], [])
+    window = 60.0
+    begin = 0
+    while begin < len(times):
+        end = np.searchsorted(times, times[begin] + window)
+        batch = slice(begin, end)
+        for parts, part in zip(
+            results,
+            limiter.decide(times[batch], chat_ids[batch], names[methods[batch]]),
+        ):
+            parts.append(part)
+        largest = max(largest, sum(limiter.live_buckets().values()))
+        begin = end
+    vectorized = time.perf_counter() - start
+    allowed = np.concatenate(results[0])
+    print(
+        f"RateLimiter:       {vectorized:6.2f}s, {(~allowed).sum():,} rejected,"
+        f" at most {largest:,} buckets ({largest * 16 / 1024:.0f} KB)"
+    )
+
+    scalar = ScalarRateLimiter(limits())
+    start = time.perf_counter()
+    expected = scalar.replay(times, chat_ids, methods)
+    seconds = time.perf_counter() - start
+    held = sum(len(buckets) for buckets in scalar.buckets)
+    size = sum(sys.getsizeof(buckets) for buckets in scalar.buckets) + held * 56
+    print(
+        f"ScalarRateLimiter: {seconds:6.2f}s, {sum(not ok for ok, _, _ in expected):,}"
+        f" rejected, {held:,} buckets at the end ({size / 1024 / 1024:.0f} MB)"
+    )
+    same = np.array_equal(allowed, [ok for ok, _, _ in expected])
+    print(f"same decisions: {same}")
+
+
+if __name__ == "__main__":
+    main()
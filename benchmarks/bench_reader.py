@@ -0,0 +1,82 @@
+"""
+Compares spec_reader.SpecReader with json.load on api.json and
+spec-extended.json: opening the file (with and without a persisted index),
+looking up a single method, and iterating over every method and type.
+
+Run from the repository root with ``python -m benchmarks.bench_reader``.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import spec_reader
+
+SPECS = ("api.json", "spec-extended.json")
+LOOKUP = "sendMessage"
+
+
+def best_of(func, repeat=20):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def load_json(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def json_lookup(path):
+    return load_json(path)["methods"][LOOKUP]
+
+
+def json_iterate(path):
+    spec = load_json(path)
+    return len(spec["methods"]) + len(spec["types"])
+
+
+def reader_cold(path):
+    os.remove(spec_reader.index_path_for(path))
+    spec_reader.SpecReader(path).close()
+
+
+def reader_lookup(path):
+    with spec_reader.SpecReader(path) as reader:
+        return reader.method(LOOKUP)
+
+
+def reader_iterate(path):
+    with spec_reader.SpecReader(path) as reader:
+        return sum(1 for _ in reader.iter_methods()) + sum(
+            1 for _ in reader.iter_types()
+        )
+
+
+def main():
+    runs = [
+        ("json.load", lambda path: load_json(path)),
+        ("reader, no index", reader_cold),
+        ("json lookup", json_lookup),
+        ("reader lookup", reader_lookup),
+        ("json iterate", json_iterate),
+        ("reader iterate", reader_iterate),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in SPECS:
+            path = os.path.join(tmp, name)
+            shutil.copyfile(name, path)
+            spec_reader.SpecReader(path).close()
+            print(f"{name} ({os.path.getsize(path) // 1024} KiB)")
+            for label, func in runs:
+                seconds = best_of(lambda: func(path))
+                print(f"{label:>18}: {seconds * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
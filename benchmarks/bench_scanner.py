@@ -0,0 +1,131 @@
+"""
+Compares the single-pass section scanner with the sibling walks it replaced,
+on an API page rendered from api.json.
+
+Run from the repository root with ``python -m benchmarks.bench_scanner``.
+"""
+
+import time
+
+from bs4 import BeautifulSoup
+
+import scraper
+from benchmarks.pages import render_api_page
+
+
+def legacy_scrape_methods(soup):
+    """scraper.scrape_methods before the single-pass scanner."""
+    methods = {}
+    methods_section = soup.find("h3", {"id": "available-methods"})
+    if methods_section:
+        for h4 in methods_section.find_next_siblings("h4"):
+            anchor = h4.find("a", {"name": True})
+            if not anchor:
+                continue
+            method_name = anchor.get("name")
+            if not method_name:
+                continue
+
+            description = ""
+            for p in h4.find_next_siblings("p"):
+                if p.find_previous_sibling("h4") != h4:
+                    break
+                description += p.get_text() + "\n"
+
+            parameters = []
+            table = h4.find_next_sibling("table")
+            if table:
+                for tr in table.find_all("tr")[1:]:
+                    tds = tr.find_all("td")
+                    if len(tds) == 4:
+                        parameters.append(
+                            {
+                                "name": tds[0].get_text(),
+                                "type": tds[1].get_text(),
+                                "required": tds[2].get_text(),
+                                "description": tds[3].get_text(),
+                            }
+                        )
+            methods[method_name] = {
+                "description": description.strip(),
+                "parameters": parameters,
+            }
+    return methods
+
+
+def legacy_scrape_types(soup):
+    """scraper.scrape_types before the single-pass scanner."""
+    types = {}
+    types_section = soup.find("h3", {"id": "available-types"})
+    if types_section:
+        for h4 in types_section.find_next_siblings("h4"):
+            anchor = h4.find("a", {"name": True})
+            if not anchor:
+                continue
+            type_name = anchor.get("name")
+            if not type_name:
+                continue
+
+            description = ""
+            for p in h4.find_next_siblings("p"):
+                if p.find_previous_sibling("h4") != h4:
+                    break
+                description += p.get_text() + "\n"
+
+            fields = []
+            table = h4.find_next_sibling("table")
+            if table:
+                for tr in table.find_all("tr")[1:]:
+                    tds = tr.find_all("td")
+                    if len(tds) == 3:
+                        fields.append(
+                            {
+                                "name": tds[0].get_text(),
+                                "type": tds[1].get_text(),
+                                "description": tds[2].get_text(),
+                            }
+                        )
+            types[type_name] = {
+                "description": description.strip(),
+                "fields": fields,
+            }
+    return types
+
+
+def legacy_scrape_api_page(soup, data):
+    data["methods"] = legacy_scrape_methods(soup)
+    data["types"] = legacy_scrape_types(soup)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main(scales=(1, 2, 4)):
+    print(
+        f"{'scale':>5} {'sections':>8} {'legacy':>9} {'scanner':>9} {'speedup':>8} {'differ':>8}"
+    )
+    for scale in scales:
+        soup = BeautifulSoup(render_api_page(scale=scale), "html.parser")
+        legacy = {}
+        _, legacy_time = timed(legacy_scrape_api_page, soup, legacy)
+        data = {}
+        _, scanner_time = timed(scraper.scrape_api_page, soup, data)
+        sections = len(scraper.split_sections(soup))
+        # The sibling walks gave a section without a table the table of the
+        # next section, so entries without parameters or fields differ.
+        differing = sum(
+            legacy[kind][name] != data[kind][name]
+            for kind in ("methods", "types")
+            for name in data[kind]
+        )
+        print(
+            f"{scale:>5} {sections:>8} {legacy_time:>8.3f}s {scanner_time:>8.3f}s "
+            f"{legacy_time / scanner_time:>7.1f}x {differing:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
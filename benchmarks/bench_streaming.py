@@ -0,0 +1,76 @@
+"""
+Reports the peak RSS of scraping the API page with the whole body in memory
+and with the streaming mode, against a local stand-in serving a page rendered
+from api.json.
+
+Every run happens in a fresh interpreter so that peak RSS is not shared
+between them. Run from the repository root with
+``python -m benchmarks.bench_streaming``.
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+import scraper
+import scraper_lxml
+from benchmarks.pages import render_api_page
+from tests.http_stub import Route, StubServer
+
+
+def max_rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(mode, parser, scale):
+    route = Route(render_api_page(scale=scale).encode("utf-8"))
+    with StubServer({"/bots/api": route}) as server:
+        url = server.url("/bots/api")
+        rss_before = max_rss_kb()
+        start = time.perf_counter()
+        if mode == "stream":
+            scraper.stream_source(url, scraper.scrape_api_page, parser=parser)
+        else:
+            scraper.scrape_source(url, scraper.scrape_api_page, parser=parser)
+        elapsed = time.perf_counter() - start
+    return {
+        "elapsed_s": elapsed,
+        "rss_growth_mb": (max_rss_kb() - rss_before) / 1024,
+        "page_mb": len(route.body) / 2**20,
+    }
+
+
+def main(argv=None):
+    args = argparse.ArgumentParser()
+    args.add_argument("--mode", choices=("whole", "stream"))
+    args.add_argument("--parser", choices=scraper.PARSERS)
+    args.add_argument("--scale", type=int, default=1)
+    args = args.parse_args(argv)
+
+    if args.mode:
+        print(json.dumps(measure(args.mode, args.parser, args.scale)))
+        return
+
+    parsers = scraper.PARSERS if scraper_lxml.lxml else ("html.parser",)
+    print(f"{'parser':>12} {'mode':>6} {'time':>8} {'RSS growth':>11}")
+    for parser in parsers:
+        for mode in ("whole", "stream"):
+            command = [sys.executable, "-m", "benchmarks.bench_streaming"]
+            command += ["--mode", mode, "--parser", parser]
+            command += ["--scale", str(args.scale)]
+            output = subprocess.run(
+                command, check=True, capture_output=True, text=True
+            ).stdout
+            result = json.loads(output)
+            print(
+                f"{parser:>12} {mode:>6} {result['elapsed_s']:>7.3f}s "
+                f"{result['rss_growth_mb']:>8.1f} MB"
+            )
+    print(f"page size: {result['page_mb']:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
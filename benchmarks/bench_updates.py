@@ -0,0 +1,64 @@
+"""
+Streams synthetic updates from synthetic_updates.UpdateGenerator and reports
+the updates and bytes per second, and the peak memory traced while streaming
+ten times as many updates, which stays the same. Also compares building a
+list of the same updates before encoding them.
+
+Run from the repository root with ``python -m benchmarks.bench_updates``.
+"""
+
+import time
+import tracemalloc
+
+import spec_merge
+import synthetic_updates
+
+UPDATES = 1_000_000
+TRACED = [10_000, 100_000]
+
+
+def stream(spec, count, **kwargs):
+    generator = synthetic_updates.UpdateGenerator(spec, seed=0, **kwargs)
+    size = 0
+    for line in generator.ndjson(count):
+        size += len(line)
+    return size
+
+
+def materialized(spec, count):
+    generator = synthetic_updates.UpdateGenerator(spec, seed=0)
+    updates = list(generator.updates(count))
+    return sum(len(synthetic_updates.encode(update)) + 1 for update in updates)
+
+
+def peak(func, *args, **kwargs):
+    tracemalloc.start()
+    func(*args, **kwargs)
+    found = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return found
+
+
+def main():
+    spec = spec_merge.load_json(spec_merge.OUTPUT_PATH)
+    start = time.perf_counter()
+    size = stream(spec, UPDATES)
+    seconds = time.perf_counter() - start
+    print(
+        f"{UPDATES:,} updates in {seconds:.2f}s: {UPDATES / seconds:,.0f} updates/s,"
+        f" {size / seconds / 1024 / 1024:.1f} MB/s"
+    )
+    start = time.perf_counter()
+    stream(spec, UPDATES // 10, optional=0.05)
+    seconds = time.perf_counter() - start
+    print(f"with 5% of the optional fields: {UPDATES / 10 / seconds:,.0f} updates/s")
+    for count in TRACED:
+        print(
+            f"peak traced memory for {count:,} updates: streamed"
+            f" {peak(stream, spec, count) / 1024:,.0f} KB, as a list"
+            f" {peak(materialized, spec, count) / 1024:,.0f} KB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+Compares the compiled validators of validators.py with validating
+sendMessage payloads by interpreting the spec on every call, and with a
+generic JSON Schema validator when jsonschema is installed. Also times
+compiling the validators and loading them from the on-disk cache.
+
+Run from the repository root with ``python -m benchmarks.bench_validators``.
+"""
+
+import random
+import tempfile
+import time
+
+import spec_merge
+import type_graph
+import validators
+
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
+PAYLOADS = 10_000
+METHOD = "sendMessage"
+SCALAR_TYPES = {
+    "String": str,
+    "Integer": int,
+    "Float": (int, float),
+    "Boolean": bool,
+    "InputFile": (str, bytes),
+}
+SCHEMA_TYPES = {
+    "String": {"type": "string"},
+    "Integer": {"type": "integer"},
+    "Float": {"type": "number"},
+    "Boolean": {"type": "boolean"},
+    "InputFile": {},
+}
+SCHEMA_KEYWORDS = {
+    "min_length": "minLength",
+    "max_length": "maxLength",
+    "min_items": "minItems",
+    "max_items": "maxItems",
+    "min_value": "minimum",
+    "max_value": "maximum",
+}
+
+
+def payloads(count=PAYLOADS, seed=0):
+    """sendMessage payloads, about one in ten of them invalid."""
+    rng = random.Random(seed)
+    found = []
+    for _ in range(count):
+        payload = {
+            "chat_id": rng.choice([rng.randrange(1, 10**10), "@channel"]),
+            "text": "x" * rng.randrange(1, 200),
+        }
+        if rng.random() < 0.3:
+            payload["parse_mode"] = "HTML"
+        if rng.random() < 0.2:
+            payload["entities"] = [{"type": "bold", "offset": 0, "length": 1}]
+        if rng.random() < 0.1:
+            payload["text"] = "x" * 5000
+        found.append(payload)
+    return found
+
+
+class Interpreter:
+    """Validates by walking the method and type entries on every call."""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.graph = type_graph.TypeGraph.from_spec(spec)
+
+    def validate(self, method, payload):
+        errors = []
+        self._object(self.spec["methods"][method], payload, "", errors)
+        return errors
+
+    def _object(self, entry, value, loc, errors):
+        if not isinstance(value, dict):
+            errors.append(f"{loc}: expected {entry['name']}")
+            return
+        restrictions = entry.get("x-restrictions", {})
+        fields = {field["name"]: field for field in entry.get("fields", [])}
+        for key in value:
+            if key not in fields:
+                errors.append(f"{loc}{key}: unknown field")
+        for name, field in fields.items():
+            if name not in value:
+                if field["required"]:
+                    errors.append(f"{loc}{name}: required")
+                continue
+            found = []
+            for type_ref in field["types"]:
+                found = []
+                self._value(type_ref, value[name], f"{loc}{name}", found)
+                if not found:
+                    break
+            errors.extend(found)
+            limits = restrictions.get(name, {})
+            if isinstance(value[name], str):
+                low = limits.get("min_length", 0)
+                high = limits.get("max_length", float("inf"))
+                if not low <= len(value[name]) <= high:
+                    errors.append(f"{loc}{name}: length out of range")
+
+    def _value(self, type_ref, value, loc, errors):
+        if type_ref.startswith(type_graph.ARRAY_PREFIX):
+            if not isinstance(value, list):
+                errors.append(f"{loc}: expected {type_ref}")
+                return
+            item_type = type_ref.removeprefix(type_graph.ARRAY_PREFIX)
+            for index, item in enumerate(value):
+                self._value(item_type, item, f"{loc}[{index}]", errors)
+        elif type_ref in SCALAR_TYPES:
+            if not isinstance(value, SCALAR_TYPES[type_ref]):
+                errors.append(f"{loc}: expected {type_ref}")
+        else:
+            for name in self.graph.concrete_types(type_ref):
+                found = []
+                self._object(self.spec["types"][name], value, f"{loc}.", found)
+                if not found:
+                    return
+            errors.extend(found)
+
+
+def json_schema(spec, method):
+    """A JSON Schema (draft 2020-12) of the requests of a method."""
+    graph = type_graph.TypeGraph.from_spec(spec)
+    defs = {}
+
+    def ref(type_ref):
+        if type_ref.startswith(type_graph.ARRAY_PREFIX):
+            item_type = type_ref.removeprefix(type_graph.ARRAY_PREFIX)
+            return {"type": "array", "items": ref(item_type)}
+        if type_ref in SCHEMA_TYPES:
+            return SCHEMA_TYPES[type_ref]
+        if type_ref not in defs:
+            defs[type_ref] = {}
+            concrete = graph.concrete_types(type_ref)
+            if concrete == {type_ref}:
+                defs[type_ref] = entry_schema(spec["types"][type_ref])
+            else:
+                defs[type_ref] = {"anyOf": [ref(name) for name in sorted(concrete)]}
+        return {"$ref": f"#/$defs/{type_ref}"}
+
+    def entry_schema(entry):
+        properties = {}
+        restrictions = entry.get("x-restrictions", {})
+        for field in entry.get("fields", []):
+            schema = {"anyOf": [ref(type_ref) for type_ref in field["types"]]}
+            for key, keyword in SCHEMA_KEYWORDS.items():
+                if key in restrictions.get(field["name"], {}):
+                    schema[keyword] = restrictions[field["name"]][key]
+            properties[field["name"]] = schema
+        return {
+            "type": "object",
+            "properties": properties,
+            "required": [f["name"] for f in entry.get("fields", []) if f["required"]],
+            "additionalProperties": False,
+        }
+
+    schema = entry_schema(spec["methods"][method])
+    schema["$defs"] = defs
+    return schema
+
+
+def rate(validate, batch):
+    """Returns the best number of payloads validated per second."""
+    best = 0
+    for _ in range(5):
+        start = time.perf_counter()
+        for payload in batch:
+            validate(payload)
+        best = max(best, len(batch) / (time.perf_counter() - start))
+    return best
+
+
+def main():
+    spec = spec_merge.load_json(spec_merge.OUTPUT_PATH)
+    batch = payloads()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        start = time.perf_counter()
+        compiled = validators.Validators.from_file(cache_dir=cache_dir)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        validators.Validators.from_file(cache_dir=cache_dir)
+        cached = time.perf_counter() - start
+    print(
+        f"compile every method: {cold * 1000:.1f}ms, from cache: {cached * 1000:.1f}ms"
+    )
+
+    invalid = sum(1 for payload in batch if compiled.validate(METHOD, payload))
+    print(f"{len(batch)} {METHOD} payloads, {invalid} invalid")
+    interpreter = Interpreter(spec)
+    results = [
+        ("compiled", compiled[METHOD]),
+        ("interpreted", lambda payload: interpreter.validate(METHOD, payload)),
+    ]
+    if jsonschema is not None:
+        schema = json_schema(spec, METHOD)
+        validator = jsonschema.validators.validator_for(schema)(schema)
+        results.append(
+            ("jsonschema", lambda payload: list(validator.iter_errors(payload)))
+        )
+    else:
+        print("jsonschema is not installed; skipping the JSON Schema validator")
+    for label, validate in results:
+        print(f"{label:>12}: {rate(validate, batch):>12,.0f} payloads/s")
+
+
+if __name__ == "__main__":
+    main()
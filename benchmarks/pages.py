@@ -0,0 +1,109 @@
+"""
+Renders documentation pages in the markup of core.telegram.org/bots/api from
+api.json, so the scrapers can be benchmarked offline on a page of realistic
+size. A scale greater than one repeats every method and type under a
+suffixed name to simulate a larger spec.
+"""
+
+import json
+from html import escape
+
+API_JSON = "api.json"
+
+
+def load_spec(path=API_JSON):
+    with open(path) as f:
+        return json.load(f)
+
+
+def scale_spec(spec, scale):
+    """
+    Returns a spec with only the methods and types of spec, each repeated
+    under the same suffixed names that render_api_page uses.
+    """
+    scaled = {"methods": {}, "types": {}}
+    for kind in scaled:
+        for index in range(scale):
+            for name, entry in spec[kind].items():
+                scaled[kind][f"{name}{index or ''}"] = entry
+    return scaled
+
+
+def _heading(level, name, title, **attrs):
+    extra = "".join(f' {key}="{escape(value)}"' for key, value in attrs.items())
+    return (
+        f'<{level}{extra}><a class="anchor" name="{escape(name)}" '
+        f'href="#{escape(name)}"><i class="anchor-icon"></i></a>'
+        f"{escape(title)}</{level}>"
+    )
+
+
+def _table(header, rows):
+    parts = ['<table class="table">', "<thead>", "<tr>"]
+    parts += [f"<th>{escape(cell)}</th>" for cell in header]
+    parts += ["</tr>", "</thead>", "<tbody>"]
+    for row in rows:
+        parts.append("<tr>")
+        parts += [f"<td>{escape(cell)}</td>" for cell in row]
+        parts.append("</tr>")
+    parts += ["</tbody>", "</table>"]
+    return "\n".join(parts)
+
+
+def _entry(name, entry, method):
+    parts = [_heading("h4", name, name)]
+    for line in entry["description"]:
+        if line.startswith("- "):
+            continue
+        parts.append(f"<p>{escape(line)}</p>")
+    if entry.get("subtypes"):
+        items = "".join(f"<li>{escape(sub)}</li>" for sub in entry["subtypes"])
+        parts.append(f"<ul>{items}</ul>")
+    if entry.get("fields"):
+        if method:
+            header = ["Parameter", "Type", "Required", "Description"]
+            rows = [
+                [
+                    field["name"],
+                    " or ".join(field["types"]),
+                    "Yes" if field["required"] else "Optional",
+                    field["description"],
+                ]
+                for field in entry["fields"]
+            ]
+        else:
+            header = ["Field", "Type", "Description"]
+            rows = [
+                [field["name"], " or ".join(field["types"]), field["description"]]
+                for field in entry["fields"]
+            ]
+        parts.append(_table(header, rows))
+    return "\n".join(parts)
+
+
+def _entries(entries, scale, method):
+    for copy in range(scale):
+        suffix = str(copy) if copy else ""
+        for name, entry in entries.items():
+            yield _entry(name + suffix, entry, method)
+
+
+def render_api_page(spec=None, scale=1):
+    """Returns the HTML of the API page for a spec."""
+    spec = spec or load_spec()
+    parts = [
+        "<html><head><title>Telegram Bot API</title></head><body>",
+        '<div id="dev_page_content">',
+        _heading("h3", "available-types", "Available types", id="available-types"),
+        "<p>All types used in the Bot API responses are represented as "
+        "JSON-objects.</p>",
+        *_entries(spec["types"], scale, method=False),
+        _heading(
+            "h3", "available-methods", "Available methods", id="available-methods"
+        ),
+        "<p>All methods in the Bot API are case-insensitive.</p>",
+        *_entries(spec["methods"], scale, method=True),
+        "</div>",
+        "</body></html>",
+    ]
+    return "\n".join(parts)
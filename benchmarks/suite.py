@@ -0,0 +1,338 @@
+"""
+Benchmark suite with regression thresholds.
+
+The [page] cases run the scrapers on the real FAQ, API and features pages,
+as recorded by ``python update_extensions.py --record benchmarks/recording``
+(recording.py); the weekly workflow refreshes that recording. Without it they
+are skipped. The [1x] cases run the API scrapers on a page rendered from
+api.json (benchmarks/pages.py) and the later stages on api.json, and the
+[10x] cases repeat them with every method and type repeated ten times, to
+show how each stage scales. The load_spec cases decode the committed
+spec-extended.min.json and spec-extended.msgpack, whose point is a faster
+cold start. Everything runs offline.
+
+Each case reports the best of a few runs. A case regresses when its time
+exceeds its time in benchmarks/baseline.json multiplied by the threshold:
+the "threshold" of the baseline file, unless --threshold or the
+BENCHMARK_THRESHOLD environment variable overrides it. Baselines depend on
+the machine, so record them where they are checked:
+
+    python -m benchmarks.suite                  # compare with the baseline
+    python -m benchmarks.suite --save-baseline  # record a new baseline
+    RUN_BENCHMARKS=1 python -m pytest tests/test_benchmarks.py
+
+Run from the repository root.
+"""
+
+import argparse
+import contextlib
+import functools
+import gc
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import output
+import recording
+import scraper
+import spec_binary
+import spec_merge
+import update_extensions
+from benchmarks.pages import load_spec, render_api_page, scale_spec
+
+FIXTURES = os.path.join("tests", "fixtures")
+RECORDING_DIR = os.path.join("benchmarks", "recording")
+BASELINE_PATH = os.path.join("benchmarks", "baseline.json")
+DEFAULT_THRESHOLD = 2.0
+THRESHOLD_VARIABLE = "BENCHMARK_THRESHOLD"
+SCALES = (1, 10)
+REPEAT = 5
+MIN_SECONDS = 0.5
+MAX_REPEAT = 1000
+# Differences below this many seconds are timer noise, whatever the ratio.
+NOISE_FLOOR = 0.0005
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+class MissingPage(Exception):
+    """A [page] case was run without a recording of its page."""
+
+
+class Inputs:
+    """The pages, reference data and specs the cases run on, built once."""
+
+    def __init__(self, directory, recording_dir=RECORDING_DIR):
+        self.directory = directory
+        self.recording = recording.Recording(recording_dir)
+
+    @functools.cache
+    def committed(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    @functools.cache
+    def page_soup(self, url):
+        """The recorded page at url."""
+        body = self.recording.body(url)
+        if body is None:
+            raise MissingPage(url)
+        return scraper.BeautifulSoup(body, scraper.DEFAULT_PARSER)
+
+    @functools.cache
+    def api_body(self, scale):
+        return render_api_page(self.spec(1), scale)
+
+    @functools.cache
+    def api_soup(self, scale):
+        return scraper.BeautifulSoup(self.api_body(scale), scraper.DEFAULT_PARSER)
+
+    @functools.cache
+    def spec(self, scale):
+        spec = load_spec()
+        return spec if scale == 1 else scale_spec(spec, scale)
+
+    @functools.cache
+    def spec_path(self, scale):
+        if scale == 1:
+            return spec_merge.API_PATH
+        path = os.path.join(self.directory, f"api.{scale}x.json")
+        output.write_json(self.spec(scale), path)
+        return path
+
+    @functools.cache
+    def ref(self, scale):
+        """The reference data a run would scrape, with the FAQ fixture."""
+        ref = scraper.scrape_body(read_fixture("faq.html"), scraper.scrape_faq_page)
+        ref.update(scraper.scrape_body(self.api_body(scale), scraper.scrape_api_page))
+        return ref
+
+    @functools.cache
+    def extensions(self, scale):
+        return generate(self, scale)
+
+
+def generate(inputs, scale):
+    generator = update_extensions.Generator(
+        api_path=inputs.spec_path(scale), scraped_data=inputs.ref(scale)
+    )
+    generator.generate_extensions_ref_data()
+    generator.generate_extensions_data_from_ref()
+    generator.extract_restrictions()
+    generator.hoist_definitions()
+    return generator.extensions_data
+
+
+def analyze(inputs, scale):
+    with contextlib.redirect_stdout(io.StringIO()):
+        update_extensions.AIComponent(inputs.ref(scale)).analyze_data()
+
+
+def merge(inputs, scale):
+    spec_merge.build(
+        api_path=inputs.spec_path(scale),
+        extensions=inputs.extensions(scale),
+        output_path=os.path.join(inputs.directory, "spec-extended.json"),
+        min_output_path=os.path.join(inputs.directory, "spec-extended.min.json"),
+        patch_path=os.path.join(inputs.directory, "spec-extended.patch.json"),
+        restrictions_path=os.path.join(
+            inputs.directory, "spec-extended.restrictions.json"
+        ),
+        binary_path=None,
+    )
+
+
+def cases():
+    """
+    Returns the cases as a dictionary mapping names to functions that take
+    the Inputs. The cases on the recorded pages come first, then every stage
+    per scale, then the load time of the committed minified and binary spec.
+    """
+    suite = {
+        "scrape_rate_limits[page]": lambda inputs: scraper.scrape_rate_limits(
+            inputs.page_soup(scraper.FAQ_URL)
+        ),
+        "scrape_features[page]": lambda inputs: scraper.scrape_features(
+            inputs.page_soup(scraper.FEATURES_URL)
+        ),
+        "scrape_methods[page]": lambda inputs: scraper.scrape_methods(
+            inputs.page_soup(scraper.API_URL)
+        ),
+        "scrape_types[page]": lambda inputs: scraper.scrape_types(
+            inputs.page_soup(scraper.API_URL)
+        ),
+    }
+    for scale in SCALES:
+        suite.update(
+            {
+                f"scrape_methods[{scale}x]": lambda inputs, scale=scale: (
+                    scraper.scrape_methods(inputs.api_soup(scale))
+                ),
+                f"scrape_types[{scale}x]": lambda inputs, scale=scale: (
+                    scraper.scrape_types(inputs.api_soup(scale))
+                ),
+                f"analyze_data[{scale}x]": functools.partial(analyze, scale=scale),
+                f"generator[{scale}x]": functools.partial(generate, scale=scale),
+                f"spec_merge[{scale}x]": functools.partial(merge, scale=scale),
+            }
+        )
+    suite.update(
+        {
+            "load_spec[json]": lambda inputs: json.loads(
+                inputs.committed(spec_merge.MIN_OUTPUT_PATH)
+            ),
+            "load_spec[msgpack]": lambda inputs: spec_binary.loads(
+                inputs.committed(spec_merge.BINARY_PATH)
+            ),
+        }
+    )
+    return suite
+
+
+def best_of(func, repeat=REPEAT):
+    """
+    Returns the best time of at least repeat calls, with the garbage collector
+    disabled as timeit does. Fast cases are repeated until they have run for
+    MIN_SECONDS, so that their best time is not a lucky or unlucky outlier.
+    """
+    times = []
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while len(times) < repeat or (
+            sum(times) < MIN_SECONDS and len(times) < MAX_REPEAT
+        ):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+    finally:
+        if enabled:
+            gc.enable()
+    return min(times)
+
+
+def run(names=None, repeat=REPEAT, recording_dir=RECORDING_DIR):
+    """
+    Runs the cases (all of them unless names are given) and returns their
+    times. The [page] cases whose page is not recorded are left out.
+    """
+    suite = cases()
+    directory = tempfile.mkdtemp()
+    try:
+        inputs = Inputs(directory, recording_dir)
+        results = {}
+        for name in names or suite:
+            func = suite[name]
+            # The first call builds the inputs the case shares with others.
+            try:
+                func(inputs)
+            except MissingPage:
+                continue
+            results[name] = best_of(lambda: func(inputs), repeat)
+        return results
+    finally:
+        shutil.rmtree(directory)
+
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except OSError:
+        return {"threshold": DEFAULT_THRESHOLD, "cases": {}}
+
+
+def save_baseline(results, path=BASELINE_PATH, threshold=DEFAULT_THRESHOLD):
+    """
+    Records the results as the baseline of their cases; the other cases keep
+    their previous baseline, or null if they never had one.
+    """
+    previous = load_baseline(path)["cases"]
+    recorded = {}
+    for name in cases():
+        seconds = results.get(name, previous.get(name))
+        recorded[name] = None if seconds is None else round(seconds, 6)
+    baseline = {"threshold": threshold, "cases": recorded}
+    output.write_json(baseline, path)
+    return baseline
+
+
+def threshold_for(baseline, override=None):
+    if override is not None:
+        return override
+    if os.environ.get(THRESHOLD_VARIABLE):
+        return float(os.environ[THRESHOLD_VARIABLE])
+    return baseline.get("threshold", DEFAULT_THRESHOLD)
+
+
+def regressions(results, baseline, threshold):
+    """
+    Returns (name, seconds, baseline seconds) for every case that took longer
+    than its baseline multiplied by threshold, by more than NOISE_FLOOR. Cases
+    without a baseline never regress.
+    """
+    found = []
+    for name, seconds in results.items():
+        base = baseline["cases"].get(name)
+        if base is None:
+            continue
+        if seconds > base * threshold and seconds - base > NOISE_FLOOR:
+            found.append((name, seconds, base))
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Runs the benchmark suite.")
+    parser.add_argument("cases", nargs="*", help="cases to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--threshold", type=float)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--recording",
+        default=RECORDING_DIR,
+        help=f"the recorded pages of the [page] cases (default: {RECORDING_DIR})",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="record the results as the new baseline instead of comparing",
+    )
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    results = run(args.cases, args.repeat, args.recording)
+    skipped = [name for name in args.cases or cases() if name not in results]
+    if skipped:
+        print(
+            f"Skipped {', '.join(skipped)}: record the pages with"
+            f" python update_extensions.py --record {args.recording}"
+        )
+    baseline = load_baseline(args.baseline)
+    threshold = threshold_for(baseline, args.threshold)
+    print(f"{'case':<28} {'time':>10} {'baseline':>10} {'ratio':>6}")
+    for name, seconds in results.items():
+        base = baseline["cases"].get(name)
+        ratio = f"{seconds / base:>6.2f}" if base else f"{'-':>6}"
+        base = f"{base * 1000:>8.2f}ms" if base else f"{'-':>10}"
+        print(f"{name:<28} {seconds * 1000:>8.2f}ms {base} {ratio}")
+    if args.save_baseline:
+        save_baseline(results, args.baseline, threshold)
+        print(f"Saved the baseline to {args.baseline}")
+        return 0
+    regressed = regressions(results, baseline, threshold)
+    for name, seconds, base in regressed:
+        print(
+            f"REGRESSION {name}: {seconds * 1000:.2f}ms"
+            f" > {threshold} x {base * 1000:.2f}ms"
+        )
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
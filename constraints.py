@@ -0,0 +1,196 @@
+"""
+Extracts machine-readable limits from the field descriptions of api.json.
+
+Every pattern in PATTERNS recognises one way the documentation states a
+limit, such as "1-4096 characters", "1-64 Bytes" or "Values between 1-100 are
+accepted", and names the x-restrictions keys its groups fill. The patterns
+are compiled into a single alternation that runs once over the descriptions
+of every field of every method and type, joined into one string. Every
+pattern must start at a word boundary: the alternation is only tried at word
+boundaries whose next character can start one of the patterns, which makes
+the scan about ten times faster.
+
+A match only becomes a limit when the words around it do not change its
+meaning: a range relative to something else ("5 and no more than 600
+seconds in the future"), a range with an alternative value ("between 60 and
+86400, or 0x7FFFFFFF") and a length of several values together ("total
+length of up to 64 characters") are skipped (QUALIFIED), and so are keys
+that two matches of one description fill with different values, as in
+"price in Telegram Stars must be between 5 and 100000, and price in
+nanotoncoins must be between 10000000 and 10000000000000".
+
+Fields whose description looks like a limit (LIMIT_LIKE) but matches no
+pattern, or only matches that were skipped, are reported, so that new
+phrasings in the documentation get noticed; run ``python constraints.py`` to
+print them.
+"""
+
+import re
+import sys
+
+import numpy as np
+
+import spec_merge
+
+# (regular expression, value type); the named groups become x-restrictions
+# keys. Where several patterns match at the same position the earlier one
+# wins; the matches of a description are otherwise taken in text order.
+PATTERNS = [
+    (r"(?P<min_length>\d+)-(?P<max_length>\d+) characters", int),
+    (r"up to (?P<max_length>\d+) characters", int),
+    (r"(?P<min_bytes>\d+)-(?P<max_bytes>\d+) [Bb]ytes", int),
+    (r"[Ll]ist of (?P<min_items>\d+)-(?P<max_items>\d+)\b", int),
+    (r"(?P<min_items>\d+)-(?P<max_items>\d+) items", int),
+    (r"[Ll]ist of up to (?P<max_items>\d+)\b", int),
+    (r"up to (?P<max_items>\d+) items", int),
+    (r"[Aa]t most (?P<max_items>\d+) [\w ]+ can be specified", int),
+    (r"[Vv]alues between (?P<min_value>\d+)-(?P<max_value>\d+)", int),
+    (r"between (?P<min_value>-?\d+) and (?P<max_value>-?\d+)", int),
+    (r"at least (?P<min_value>\d+) and no more than (?P<max_value>\d+)", int),
+    # A bare range that ends a sentence, as in "in degrees; 1-360".
+    (r"(?P<min_value>\d+)-(?P<max_value>\d+)(?=\.|\0|$)", int),
+    (r"at most (?P<max_size_mb>\d+) MB", int),
+    (r"up to (?P<max_size_kb>\d+) kilobytes", int),
+    (r"at most (?P<max_significant_bits>\d+) significant bits", int),
+    (r"[Dd]efaults to (?P<default_value>-?\d+)(?!\.\d|\w)", int),
+    (r"[Dd]efaults to (?P<default_value>true|false|True|False)\b", "bool"),
+    (r'[Dd]efaults to "(?P<default_value>[^"]*)"', str),
+]
+
+# Phrases that usually state a limit. ISO standard numbers such as 639-1 are
+# not ranges. The lookahead skips word boundaries that cannot start a phrase.
+LIMIT_LIKE = re.compile(
+    r"\b(?=[0-9abdmnu])(?:(?<!ISO )\d+-\d+\b"
+    r"|(?:between|up to|at most|at least|maximum|minimum|no more than"
+    r"|must not exceed|defaults? to)\b)",
+    re.IGNORECASE,
+)
+
+# Words next to a match that make it something other than a limit of the
+# field's own value: (words before the match, words after the match).
+QUALIFIED = (
+    re.compile(r"\btotal (?:length|size|number) of $"),
+    re.compile(
+        r"(?:\s+\w+)?\s+(?:in the future|in the past|ago|from now|from the current)\b"
+        r"|,?\s+or\s+(?:0x[0-9A-Fa-f]+|-?\d+)\b"
+    ),
+)
+
+SEPARATOR = "\0"
+
+
+def _first_characters(pattern):
+    """Returns the character class the first character of a pattern is in."""
+    pattern = re.sub(r"^\(\?P<\w+>", "", pattern)
+    if pattern.startswith("\\d"):
+        return "0-9"
+    if pattern.startswith("["):
+        return pattern[1:].split("]", 1)[0]
+    return re.escape(pattern[0])
+
+
+def _compile(patterns):
+    alternatives = []
+    groups = []
+    first = ""
+    for index, (pattern, kind) in enumerate(patterns):
+        prefixed = re.sub(r"\(\?P<(\w+)>", rf"(?P<p{index}_\1>", pattern)
+        alternatives.append(f"(?P<p{index}>{prefixed})")
+        keys = re.findall(r"\(\?P<(\w+)>", pattern)
+        groups.append([(key, f"p{index}_{key}") for key in keys])
+        first += _first_characters(pattern)
+    combined = rf"\b(?=[{first}])(?:{'|'.join(alternatives)})"
+    return re.compile(combined), groups
+
+
+COMBINED, GROUPS = _compile(PATTERNS)
+KINDS = [kind for _, kind in PATTERNS]
+
+
+def _convert(value, kind):
+    if kind == "bool":
+        return value.lower() == "true"
+    return kind(value)
+
+
+def _qualified(text, match):
+    """Tells whether the words around a match change what it limits."""
+    before, after = QUALIFIED
+    start, end = match.span()
+    return bool(
+        before.search(text, max(start - 32, 0), start) or after.match(text, end)
+    )
+
+
+def iter_fields(spec):
+    """Yields (owner, href, field) for every field of every method and type."""
+    for kind in ("methods", "types"):
+        for name, entry in spec.get(kind, {}).items():
+            for field in entry.get("fields", []):
+                yield name, entry.get("href"), field
+
+
+def extract(spec):
+    """
+    Returns the x-restrictions of every method and type of the spec, keyed by
+    their name, and the report of unmatched limit-like fields as a list of
+    (owner, field name, description) tuples.
+    """
+    fields = list(iter_fields(spec))
+    descriptions = [field["description"] for _, _, field in fields]
+    starts = np.cumsum([0] + [len(text) + 1 for text in descriptions[:-1]])
+    text = SEPARATOR.join(descriptions)
+
+    def owners(matches):
+        """Maps every match to the index of the field it was found in."""
+        positions = [match.start() for match in matches]
+        return np.searchsorted(starts, positions, side="right") - 1
+
+    found = [None] * len(fields)
+    skipped = set()
+    conflicting = []
+    matches = list(COMBINED.finditer(text))
+    for match, index in zip(matches, owners(matches).tolist()):
+        if _qualified(text, match):
+            skipped.add(index)
+            continue
+        pattern = int(match.lastgroup[1:])
+        constraints = found[index]
+        if constraints is None:
+            constraints = found[index] = {}
+        for key, group in GROUPS[pattern]:
+            value = _convert(match.group(group), KINDS[pattern])
+            if constraints.setdefault(key, value) != value:
+                conflicting.append((index, key))
+    # A key with two values depends on a condition the patterns cannot see.
+    for index, key in conflicting:
+        found[index].pop(key, None)
+        skipped.add(index)
+    limit_like = set(owners(list(LIMIT_LIKE.finditer(text))).tolist())
+
+    restrictions = {}
+    unmatched = []
+    for index, ((owner, href, field), constraints) in enumerate(zip(fields, found)):
+        if index in skipped or (not constraints and index in limit_like):
+            unmatched.append((owner, field["name"], field["description"]))
+        if not constraints:
+            continue
+        # The description itself is in api.json; only point to its source.
+        constraints["ref"] = {"url": href}
+        restrictions.setdefault(owner, {})[field["name"]] = constraints
+    return restrictions, unmatched
+
+
+def main(argv=None):
+    """Prints the fields that look like limits but match no pattern."""
+    api_path = argv[0] if argv else spec_merge.API_PATH
+    restrictions, unmatched = extract(spec_merge.load_json(api_path))
+    fields = sum(len(entry) for entry in restrictions.values())
+    print(f"Fields with restrictions: {fields}")
+    print(f"Unmatched limit-like fields: {len(unmatched)}")
+    for owner, name, description in unmatched:
+        print(f"- {owner}.{name}: {description}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,153 @@
+"""
+Shared x-definitions blocks for extensions.json and the extended spec.
+
+hoist moves every x- block that occurs more than once into a top-level
+x-definitions table and replaces each occurrence with a JSON Reference,
+{"$ref": "#/x-definitions/<name>"}. Other objects, such as the ref objects
+that point to the documentation of a limit, stay inline: they are little
+longer than a reference, and every reference is one more lookup for the
+consumers of the spec. Because extensions that name no method or type are
+merged into the root of the spec, the same pointers are valid in
+spec-extended.json.
+
+Resolver expands those references for consumers, lazily and with memoized
+results.
+"""
+
+import json
+
+DEFINITIONS = "x-definitions"
+REF = "$ref"
+# Blocks whose JSON is shorter than this cost more as a reference.
+MIN_SIZE = 64
+
+
+def _shareable(key):
+    return key.startswith("x-")
+
+
+def _canonical(value):
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def _count(node, counts):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if _shareable(key) and isinstance(value, dict) and value:
+                canonical = _canonical(value)
+                counts[canonical] = counts.get(canonical, 0) + 1
+            _count(value, counts)
+    elif isinstance(node, list):
+        for value in node:
+            _count(value, counts)
+
+
+def pointer(name):
+    return f"#/{DEFINITIONS}/" + name.replace("~", "~0").replace("/", "~1")
+
+
+def hoist(extensions, min_size=MIN_SIZE):
+    """
+    Moves repeated x- blocks of the extensions into their x-definitions
+    table, in place, and returns the extensions. Definitions are named after
+    the key they were found under, with a numeric suffix when different
+    blocks share a key, in the order they first occur.
+    """
+    counts = {}
+    _count(extensions, counts)
+    definitions = extensions.get(DEFINITIONS, {})
+    names = {}
+
+    def replace(node):
+        if isinstance(node, list):
+            for value in node:
+                replace(value)
+            return
+        if not isinstance(node, dict):
+            return
+        for key, value in node.items():
+            if _shareable(key) and isinstance(value, dict) and value:
+                canonical = _canonical(value)
+                if counts.get(canonical, 0) > 1 and len(canonical) >= min_size:
+                    if canonical not in names:
+                        name = key
+                        suffix = 1
+                        while name in definitions:
+                            suffix += 1
+                            name = f"{key}-{suffix}"
+                        names[canonical] = name
+                        definitions[name] = value
+                    node[key] = {REF: pointer(names[canonical])}
+                    continue
+            replace(value)
+
+    for name, entry in extensions.items():
+        if name != DEFINITIONS:
+            replace(entry)
+    if definitions:
+        extensions[DEFINITIONS] = definitions
+    return extensions
+
+
+def _is_reference(node):
+    return isinstance(node, dict) and len(node) == 1 and REF in node
+
+
+class Resolver:
+    """
+    Expands the JSON References of a document on demand. Every pointer is
+    resolved once and the expanded target is shared between the places that
+    reference it, so results must be treated as read-only.
+    """
+
+    def __init__(self, document):
+        self.document = document
+        self._resolved = {}
+        self._resolving = set()
+
+    def lookup(self, ref):
+        """Returns the unexpanded node a local JSON pointer ("#/a/b") names."""
+        if not ref.startswith("#"):
+            raise ValueError(f"only local references are supported: {ref!r}")
+        node = self.document
+        path = ref[1:]
+        if not path:
+            return node
+        for token in path.lstrip("/").split("/"):
+            token = token.replace("~1", "/").replace("~0", "~")
+            node = node[int(token)] if isinstance(node, list) else node[token]
+        return node
+
+    def resolve(self, ref):
+        """Returns the fully expanded node a local JSON pointer names."""
+        if ref not in self._resolved:
+            if ref in self._resolving:
+                raise ValueError(f"circular reference: {ref!r}")
+            self._resolving.add(ref)
+            try:
+                self._resolved[ref] = self.expand(self.lookup(ref))
+            finally:
+                self._resolving.discard(ref)
+        return self._resolved[ref]
+
+    def expand(self, node):
+        """Returns node with every reference inside it expanded."""
+        if _is_reference(node):
+            return self.resolve(node[REF])
+        if isinstance(node, dict):
+            return {key: self.expand(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [self.expand(value) for value in node]
+        return node
+
+    def get(self, *path):
+        """
+        Returns the expanded value at path, following references on the way
+        down but expanding nothing outside the requested subtree.
+        """
+        node = self.document
+        for key in path:
+            if _is_reference(node):
+                node = self.lookup(node[REF])
+            node = node[key]
+        return self.expand(node)
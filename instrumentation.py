@@ -0,0 +1,267 @@
+"""
+Per-stage timing and memory instrumentation for the update pipeline.
+
+Functions decorated with timed, and blocks wrapped in span, are recorded
+while a Recorder is active and cost a single check otherwise. For every
+stage the recorder sums the wall time and the CPU time of the calling
+thread over all calls and keeps the largest growth of traced memory over a
+call. Memory is only traced for spans of the main thread: tracemalloc counts
+the allocations of every thread together, so the peaks of the download
+threads would be meaningless.
+
+With profile, every top-level stage of the main thread runs under a cProfile
+profiler of its own, and so does every span a worker thread starts while
+that stage runs, so a stage that waits on a thread pool is profiled with the
+work of its threads. save writes the merged stats and a tracemalloc snapshot
+of the slowest stage next to the run report. The slowest stage is the
+top-level stage with the largest wall time summed over its calls, in the
+report and in the profile alike.
+"""
+
+import contextlib
+import cProfile
+import functools
+import os
+import platform
+import pstats
+import threading
+import time
+import tracemalloc
+
+import output
+
+DEFAULT_REPORT_PATH = os.path.join(".cache", "run-report.json")
+# Bump when the layout of the run report changes.
+REPORT_VERSION = 1
+# Lines of the tracemalloc statistics written for the slowest stage.
+MEMORY_TOP_LINES = 25
+
+_active = None
+
+
+def span(name):
+    """Returns a context manager that records a block as the stage name."""
+    recorder = _active
+    if recorder is None:
+        return contextlib.nullcontext()
+    return recorder.span(name)
+
+
+def timed(name=None):
+    """
+    Decorator that records every call of a function as a stage, named after
+    the function unless a name is given.
+    """
+
+    def decorator(func):
+        stage = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return func(*args, **kwargs)
+            with _active.span(stage):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class Recorder:
+    """
+    Records the stages of a run while it is active, as a context manager:
+
+        with Recorder() as recorder:
+            update_extensions.run(args)
+        recorder.save()
+    """
+
+    def __init__(self, trace_memory=True, profile=False):
+        self.trace_memory = trace_memory or profile
+        self.profile = profile
+        self.stages = {}
+        self.total = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # The profiler and summed wall time of every profiled stage, the
+        # profilers of the worker thread spans it started, and the snapshot
+        # taken after a call of the stage that was then the slowest.
+        self._profilers = {}
+        self._thread_profilers = {}
+        self._profiled_wall = {}
+        self._snapshot = None
+        self._started_tracing = False
+        self._previous = None
+        self._main_stack = None
+
+    def __enter__(self):
+        global _active
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._previous = _active
+        _active = self
+        self._start = (time.perf_counter(), time.process_time())
+        return self
+
+    def __exit__(self, *exc_info):
+        global _active
+        wall, cpu = self._start
+        self.total = {
+            "wall_seconds": time.perf_counter() - wall,
+            "cpu_seconds": time.process_time() - cpu,
+            "peak_memory_bytes": None,
+        }
+        if tracemalloc.is_tracing():
+            self.total["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        _active = self._previous
+        return False
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+            if threading.current_thread() is threading.main_thread():
+                self._main_stack = self._local.stack
+        return self._local.stack
+
+    @contextlib.contextmanager
+    def span(self, name):
+        stack = self._stack()
+        main = threading.current_thread() is threading.main_thread()
+        memory = main and tracemalloc.is_tracing()
+        frame = {"floor": 0}
+        if memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                # The enclosing span keeps the peak it reached before this
+                # one resets it.
+                stack[-1]["floor"] = max(stack[-1]["floor"], peak)
+            frame["start"] = current
+            tracemalloc.reset_peak()
+        parent = stack[-1]["name"] if stack else None
+        if parent is None and not main and self._main_stack:
+            # Work handed to a thread pool belongs to the stage that started it.
+            parent = self._main_stack[-1]["name"]
+        profiler = None
+        if self.profile and not stack:
+            if main:
+                profiler = self._profilers.get(name)
+                if profiler is None:
+                    profiler = self._profilers[name] = cProfile.Profile()
+                profiler.enable()
+            elif parent is not None:
+                # Merged into the profile of the top-level stage.
+                owner = self._main_stack[0]["name"]
+                profiler = cProfile.Profile()
+                try:
+                    profiler.enable()
+                except ValueError:
+                    # From Python 3.12, the profiler of the running stage
+                    # already sees every thread and cannot share it.
+                    profiler = None
+        frame["name"] = name
+        stack.append(frame)
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.thread_time() - cpu
+            stack.pop()
+            growth = None
+            if memory:
+                peak = max(tracemalloc.get_traced_memory()[1], frame["floor"])
+                growth = peak - frame["start"]
+                if stack:
+                    stack[-1]["floor"] = max(stack[-1]["floor"], peak)
+            if profiler is not None:
+                profiler.disable()
+                if main:
+                    self._snapshot_if_slowest(name, wall)
+                else:
+                    with self._lock:
+                        self._thread_profilers.setdefault(owner, []).append(profiler)
+            self._add(name, parent, wall, cpu, growth)
+
+    def _snapshot_if_slowest(self, name, wall):
+        """
+        Takes a snapshot when the summed time of the stage is the largest so
+        far. The last snapshot taken is then the one of the slowest stage:
+        sums only grow, so no other stage can lead after its last call.
+        """
+        total = self._profiled_wall[name] = self._profiled_wall.get(name, 0.0) + wall
+        if total < max(self._profiled_wall.values()):
+            return
+        if tracemalloc.is_tracing():
+            self._snapshot = (name, tracemalloc.take_snapshot())
+
+    def _add(self, name, parent, wall, cpu, growth):
+        with self._lock:
+            stage = self.stages.get(name)
+            if stage is None:
+                stage = self.stages[name] = {
+                    "name": name,
+                    "parent": parent,
+                    "calls": 0,
+                    "wall_seconds": 0.0,
+                    "cpu_seconds": 0.0,
+                    "peak_memory_bytes": None,
+                }
+            stage["calls"] += 1
+            stage["wall_seconds"] += wall
+            stage["cpu_seconds"] += cpu
+            if growth is not None:
+                stage["peak_memory_bytes"] = max(
+                    stage["peak_memory_bytes"] or 0, growth
+                )
+
+    def report(self):
+        """Returns the run report: the totals, then every stage, top-level first."""
+        stages = sorted(
+            self.stages.values(), key=lambda stage: stage["parent"] is not None
+        )
+        top_level = [stage for stage in stages if stage["parent"] is None]
+        slowest = max(top_level, key=lambda stage: stage["wall_seconds"], default=None)
+        return {
+            "version": REPORT_VERSION,
+            "python": platform.python_version(),
+            "total": self.total,
+            "slowest": slowest["name"] if slowest else None,
+            "stages": [dict(stage) for stage in stages],
+        }
+
+    def save(self, path=DEFAULT_REPORT_PATH):
+        """
+        Writes the run report to path and, when profiling, the cProfile stats
+        (<stage>.prof), merged with those of its worker thread spans, and the
+        tracemalloc statistics (<stage>.memory.txt) of the slowest stage next
+        to it. Returns the report.
+        """
+        report = self.report()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        name = report["slowest"]
+        if name in self._profilers:
+            base = os.path.join(directory, name.replace("/", "_"))
+            stats = pstats.Stats(self._profilers[name])
+            threads = self._thread_profilers.get(name, [])
+            for profiler in threads:
+                stats.add(profiler)
+            stats.dump_stats(base + ".prof")
+            report["profile"] = {
+                "stage": name,
+                "pstats": base + ".prof",
+                "thread_spans": len(threads),
+            }
+            if self._snapshot is not None and self._snapshot[0] == name:
+                statistics = self._snapshot[1].statistics("lineno")
+                lines = [str(stat) for stat in statistics[:MEMORY_TOP_LINES]]
+                output.write_text(base + ".memory.txt", "\n".join(lines) + "\n")
+                report["profile"]["memory"] = base + ".memory.txt"
+        output.write_json(report, path)
+        return report
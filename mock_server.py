@@ -0,0 +1,423 @@
+"""
+Mock Bot API server generated from spec-extended.json, for load-testing bots
+offline.
+
+MockServer serves every method of the spec at /bot<token>/<method> over
+HTTP/1.1 keep-alive connections, on asyncio streams:
+
+    server = MockServer.from_file()
+    await server.start(port=8081)
+
+Parameters are read from the query string and from JSON, urlencoded or
+multipart bodies, like the Bot API does; form values are decoded according
+to the types of their field. They are checked by the compiled validators of
+validators.py, and every request is answered the way the Bot API answers:
+
+    200  {"ok": true, "result": ...}
+    400  {"ok": false, "error_code": 400, "description": "Bad Request: ..."}
+    404  unknown methods and paths
+    429  requests over the x-rate-limit of their method, with
+         "parameters": {"retry_after": seconds}
+
+The result of every method is an example object of its return type, built
+once from the required fields of the type: abstract types use their first
+concrete subtype, fields documented with a fixed value ("Always 0") or a set
+of values ('can be "private", "group", ...') the fixed or first value, other
+strings the name of their field and arrays are empty. A result with a message_id gets a new one
+on every call. The responses are encoded when the server is created, so
+answering a request only splices in the message_id.
+
+Rate limits are decided by rate_limits.RateLimiter, for all the requests that
+arrive during one iteration of the event loop at once. Requests are limited
+by their chat_id; usernames (@channel) count as channels.
+
+Run with ``python mock_server.py --port 8081``; see
+benchmarks/bench_mock_server.py for a load test.
+"""
+
+import argparse
+import asyncio
+import email.parser
+import email.policy
+import itertools
+import json
+import re
+import sys
+import time
+from urllib.parse import parse_qsl
+
+import model_codegen
+import rate_limits
+import spec_merge
+import synthetic_updates
+import type_graph
+import validators
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8081
+PATH = re.compile(r"/bot(?P<token>\d+:[\w-]+)/(?P<method>\w+)")
+INTEGER = re.compile(r"-?\d+")
+EXAMPLES = {"Integer": 1, "Float": 1.0, "Boolean": True, "InputFile": "file"}
+# Stands for the message_id of a result until it is spliced in.
+MESSAGE_ID = "\0message_id"
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    429: "Too Many Requests",
+}
+MAX_BODY = 50 * 1024 * 1024
+
+
+class _BadRequest(Exception):
+    pass
+
+
+def _response(status, body, close=False):
+    head = (
+        f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+    )
+    if close:
+        head += "Connection: close\r\n"
+    return head.encode() + b"\r\n" + body
+
+
+def _error(status, description, parameters=None):
+    reply = {"ok": False, "error_code": status, "description": description}
+    if parameters:
+        reply["parameters"] = parameters
+    return json.dumps(reply, separators=(",", ":")).encode()
+
+
+def _coerce(value, types):
+    """
+    The value of a form field: JSON for fields that cannot be strings, an
+    integer for numeric Integer or String fields such as chat_id, and the
+    string itself otherwise.
+    """
+    if "String" not in types and "InputFile" not in types:
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+    if "Integer" in types and INTEGER.fullmatch(value):
+        return int(value)
+    return value
+
+
+def _multipart(content_type, body):
+    """Returns the form values and the uploaded files of a multipart body."""
+    message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body
+    )
+    if not message.is_multipart():
+        raise _BadRequest("invalid multipart body")
+    values, files = {}, {}
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        if name is None:
+            continue
+        if part.get_filename() is None:
+            values[name] = part.get_content()
+        else:
+            files[name] = part.get_payload(decode=True)
+    return values, files
+
+
+class _Examples:
+    """Builds the example values of type references, memoized by type."""
+
+    def __init__(self, spec):
+        self.types = spec.get("types", {})
+        self.graph = type_graph.TypeGraph.from_spec(spec)
+        self.objects = {}
+
+    def value(self, type_ref, field=None):
+        if type_ref.startswith(type_graph.ARRAY_PREFIX):
+            return []
+        if type_ref == "String":
+            if field is None:
+                return "string"
+            description = field["description"]
+            if synthetic_updates.CHOICES.search(description):
+                choices = synthetic_updates.QUOTED.findall(description)
+                if choices:
+                    return choices[0]
+            return field["name"]
+        if type_ref in EXAMPLES:
+            return EXAMPLES[type_ref]
+        return self.object(min(self.graph.concrete_types(type_ref)))
+
+    def object(self, name):
+        if name not in self.objects:
+            found = {}
+            for index, field in enumerate(self.types[name].get("fields", [])):
+                if not field["required"]:
+                    continue
+                discriminator = validators.DISCRIMINATOR.search(field["description"])
+                fixed = model_codegen.fixed_value(field)
+                if index == 0 and discriminator:
+                    found[field["name"]] = discriminator.group(1)
+                elif fixed is not None:
+                    found[field["name"]] = fixed
+                else:
+                    found[field["name"]] = self.value(field["types"][0], field)
+            self.objects[name] = found
+        return dict(self.objects[name])
+
+
+class MockServer:
+    """
+    Answers Bot API requests for every method of a spec. tokens limits the
+    bot tokens that are accepted (any well-formed token by default), and
+    rate_limiter decides the 429s (None never limits).
+    """
+
+    def __init__(self, spec, compiled, rate_limiter=None, tokens=None):
+        self.validators = compiled
+        self.rate_limiter = rate_limiter
+        self.tokens = None if tokens is None else set(tokens)
+        self.requests = 0
+        self.connections = 0
+        self._methods = {}
+        self._fields = {}
+        self._results = {}
+        examples = _Examples(spec)
+        for name, entry in spec.get("methods", {}).items():
+            self._methods[name.lower()] = name
+            self._fields[name] = {
+                field["name"]: field["types"] for field in entry.get("fields", [])
+            }
+            result = examples.value(entry.get("returns", ["Boolean"])[0])
+            if isinstance(result, dict) and "message_id" in result:
+                result["message_id"] = MESSAGE_ID
+            body = json.dumps({"ok": True, "result": result}, separators=(",", ":"))
+            self._results[name] = body.encode().split(json.dumps(MESSAGE_ID).encode())
+        self._limited = set(rate_limiter.methods) if rate_limiter else set()
+        self._message_ids = itertools.count(1)
+        self._usernames = {}
+        self._pending = []
+        self._started = time.monotonic()
+        self._server = None
+
+    @classmethod
+    def from_spec(cls, spec, cache_dir=validators.DEFAULT_CACHE_DIR, **kwargs):
+        """Creates a server for a spec, rate-limited by its x-rate-limit blocks."""
+        kwargs.setdefault("rate_limiter", rate_limits.RateLimiter.from_spec(spec))
+        compiled = validators.Validators.from_spec(spec, cache_dir=cache_dir)
+        return cls(spec, compiled, **kwargs)
+
+    @classmethod
+    def from_file(
+        cls,
+        path=spec_merge.OUTPUT_PATH,
+        cache_dir=validators.DEFAULT_CACHE_DIR,
+        **kwargs,
+    ):
+        return cls.from_spec(spec_merge.load_json(path), cache_dir, **kwargs)
+
+    @property
+    def base_url(self):
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def start(self, host=DEFAULT_HOST, port=0):
+        """Starts listening; port 0 picks a free port (see base_url)."""
+        self._server = await asyncio.start_server(self._serve, host, port)
+        return self
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _serve(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                request_line, _, header_lines = head[:-4].partition(b"\r\n")
+                parts = request_line.split()
+                headers = {}
+                for line in header_lines.split(b"\r\n"):
+                    name, _, value = line.partition(b":")
+                    headers[name.strip().lower()] = value.strip()
+                if len(parts) != 3 or not parts[2].startswith(b"HTTP/1."):
+                    writer.write(_response(400, _error(400, "Bad Request"), True))
+                    break
+                try:
+                    body = await self._body(reader, headers)
+                except (ValueError, asyncio.IncompleteReadError):
+                    writer.write(_response(400, _error(400, "Bad Request"), True))
+                    break
+                status, reply = await self.handle(
+                    parts[1].decode("latin-1"),
+                    headers.get(b"content-type", b"").decode("latin-1"),
+                    body,
+                )
+                connection = headers.get(b"connection", b"").lower()
+                if parts[2] == b"HTTP/1.0":
+                    close = connection != b"keep-alive"
+                else:
+                    close = connection == b"close"
+                writer.write(_response(status, reply, close))
+                await writer.drain()
+                if close:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _body(self, reader, headers):
+        if headers.get(b"transfer-encoding", b"").lower() == b"chunked":
+            chunks = []
+            size = 0
+            while True:
+                length = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                size += length
+                if size > MAX_BODY:
+                    raise ValueError("body too large")
+                chunks.append(await reader.readexactly(length + 2))
+                if not length:
+                    await reader.readuntil(b"\r\n")
+                    return b"".join(chunk[:-2] for chunk in chunks)
+        length = int(headers.get(b"content-length", 0))
+        if not 0 <= length <= MAX_BODY:
+            raise ValueError("bad Content-Length")
+        return await reader.readexactly(length) if length else b""
+
+    def _parameters(self, method, query, content_type, body):
+        fields = self._fields[method]
+        values = dict(parse_qsl(query, keep_blank_values=True))
+        files = {}
+        media_type = content_type.partition(";")[0].strip().lower()
+        if body and media_type == "application/json":
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                raise _BadRequest("can't parse JSON body")
+            if not isinstance(payload, dict):
+                raise _BadRequest("JSON body must be an object")
+            for name, value in values.items():
+                payload.setdefault(name, _coerce(value, fields.get(name, ())))
+            return payload
+        if body and media_type == "multipart/form-data":
+            form, files = _multipart(content_type, body)
+            values.update(form)
+        elif body:
+            values.update(parse_qsl(body.decode(), keep_blank_values=True))
+        payload = {
+            name: _coerce(value, fields.get(name, ())) for name, value in values.items()
+        }
+        # Uploads that are not parameters are attach:// targets of media.
+        for name, contents in files.items():
+            if name in fields:
+                payload[name] = contents
+        return payload
+
+    async def handle(self, target, content_type, body):
+        """
+        Answers the request for target (path and query string); returns the
+        status and the JSON body of the response.
+        """
+        self.requests += 1
+        path, _, query = target.partition("?")
+        match = PATH.fullmatch(path)
+        method = match and self._methods.get(match["method"].lower())
+        if method is None:
+            return 404, _error(404, "Not Found")
+        if self.tokens is not None and match["token"] not in self.tokens:
+            return 401, _error(401, "Unauthorized")
+        try:
+            payload = self._parameters(method, query, content_type, body)
+        except (_BadRequest, UnicodeDecodeError) as error:
+            return 400, _error(400, f"Bad Request: {error}")
+        errors = self.validators.validate(method, payload)
+        if errors:
+            return 400, _error(400, "Bad Request: " + "; ".join(errors))
+        if method in self._limited:
+            retry_after = await self._decide(payload.get("chat_id"), method)
+            if retry_after:
+                return 429, _error(
+                    429,
+                    f"Too Many Requests: retry after {retry_after}",
+                    {"retry_after": retry_after},
+                )
+        parts = self._results[method]
+        if len(parts) == 1:
+            return 200, parts[0]
+        return 200, str(next(self._message_ids)).encode().join(parts)
+
+    def _chat_key(self, chat_id):
+        if isinstance(chat_id, int):
+            return chat_id
+        if isinstance(chat_id, str):
+            # Usernames are of channels, which have negative ids.
+            return self._usernames.setdefault(chat_id, -(len(self._usernames) + 1))
+        return 0
+
+    def _decide(self, chat_id, method):
+        """Returns a future of the retry_after of a request, or 0."""
+        future = asyncio.get_running_loop().create_future()
+        if not self._pending:
+            asyncio.get_running_loop().call_soon(self._flush)
+        self._pending.append((future, self._chat_key(chat_id), method))
+        return future
+
+    def _flush(self):
+        pending, self._pending = self._pending, []
+        now = time.monotonic() - self._started
+        _, chat_ids, methods = zip(*pending)
+        allowed, retry_after, _ = self.rate_limiter.decide(
+            [now] * len(pending), chat_ids, methods
+        )
+        for (future, _, _), ok, wait in zip(pending, allowed, retry_after.tolist()):
+            if not future.done():
+                future.set_result(0 if ok else wait)
+
+
+async def serve(server, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    await server.start(host, port)
+    print(f"Serving {len(server._results)} methods on {server.base_url}", flush=True)
+    await server.serve_forever()
+
+
+def main(argv=None):
+    """Serves a mock Bot API for every method of spec-extended.json."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--spec", default=spec_merge.OUTPUT_PATH)
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--token", action="append", help="accept only these bot tokens")
+    parser.add_argument(
+        "--no-rate-limits", action="store_true", help="never answer with a 429"
+    )
+    args = parser.parse_args([] if argv is None else argv)
+    kwargs = {"tokens": args.token}
+    if args.no_rate_limits:
+        kwargs["rate_limiter"] = None
+    server = MockServer.from_file(args.spec, **kwargs)
+    try:
+        asyncio.run(serve(server, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,423 @@
+"""
+Generates models.py, a module of __slots__ classes for every type of the
+spec.
+
+Every concrete type becomes a class with one slot per field and a keyword-only
+__init__; a field that is a Python keyword gets a trailing underscore (from_).
+Abstract types (those with subtypes) become base classes without slots, so
+isinstance(message, MaybeInaccessibleMessage) holds.
+
+Every concrete class gets a from_dict that assigns its required fields
+directly, decoding the objects and arrays of objects among them, and then,
+when the object has more keys than that, sets its optional fields from a
+table generated next to the class:
+
+    _fields(Message, {"message_id": None, "from": User, "photo": _list(PhotoSize), ...})
+
+The table maps every optional key to its slot and the decoder of its type,
+so decoding touches only the keys present and skips the keys it does not
+know. from_dict expects the required fields and raises KeyError without
+them. to_dict emits only the slots that are set, and optional fields that
+are not set read as None.
+
+Abstract types decode to one of their subtypes: by their discriminator field
+("type", "status" or "source") when the subtypes have one, and otherwise,
+or when several subtypes share a value (InlineQueryResultAudio and
+InlineQueryResultCachedAudio), by the first candidate whose required fields
+are present and whose fixed fields ("date" of InaccessibleMessage is always 0)
+match.
+
+``python spec_merge.py`` regenerates models.py with the spec, so the daily
+spec update keeps it current; ``python model_codegen.py`` regenerates it from
+spec-extended.json.
+"""
+
+import argparse
+import json
+import keyword
+import re
+import sys
+
+import output
+import spec_merge
+import type_graph
+import validators
+
+MODELS_PATH = spec_merge.MODELS_PATH
+# The value documented for a field that is not a discriminator, as in "Always
+# 0. The field can be used to differentiate regular and inaccessible messages".
+FIXED = re.compile(r'^Always "?(\w+)"?\.')
+PRIMITIVES = {"Integer", "Float", "Boolean", "String", "InputFile"}
+
+HEADER = '''"""
+Model classes of the Telegram {version} types.
+
+Generated from {source} by model_codegen.py; do not edit.
+"""
+
+import functools
+
+_new = object.__new__
+
+
+class Model:
+    """
+    Base class of the models. from_dict decodes the JSON object of a type and
+    to_dict encodes it back; optional fields that are not set read as None.
+    """
+
+    __slots__ = ()
+    _slots = frozenset()
+    _optional = {{}}
+    _encoders = ()
+    _required = frozenset()
+    _fixed = {{}}
+
+    def __getattr__(self, name):
+        if name in type(self)._slots:
+            return None
+        raise AttributeError(
+            f"{{type(self).__name__!r}} object has no attribute {{name!r}}"
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        """Decodes the JSON object of an abstract type as one of its subtypes."""
+        return cls._choose(data).from_dict(data)
+
+    def to_dict(self):
+        data = {{}}
+        for key, get, encode in self._encoders:
+            try:
+                value = get(self)
+            except AttributeError:
+                continue
+            data[key] = value if encode is None else encode(value)
+        return data
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        fields = []
+        for key, get, _ in self._encoders:
+            try:
+                fields.append(f"{{key}}={{get(self)!r}}")
+            except AttributeError:
+                pass
+        return f"{{type(self).__name__}}({{', '.join(fields)}})"
+
+
+def _set_optional(self, data, optional):
+    for key, value in data.items():
+        field = optional.get(key)
+        if field is not None:
+            slot, decode = field
+            setattr(self, slot, value if decode is None else decode(value))
+
+
+def _encode(value):
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decoder(kind):
+    """The function that decodes a value of kind: None, a class or a decoder."""
+    return kind.from_dict if isinstance(kind, type) else kind
+
+
+def _list(kind):
+    decode = _decoder(kind)
+    if decode is None:
+        return None
+    return lambda value: [decode(item) for item in value]
+
+
+def _fields(cls, kinds, required=(), fixed=None):
+    """Builds the tables of a class from the kinds of its fields."""
+    optional, encoders = {{}}, []
+    for key, kind in kinds.items():
+        slot = _SLOTS.get(key, key)
+        if key not in required:
+            optional[key] = (slot, _decoder(kind))
+        encode = None if kind is None else _encode
+        encoders.append((key, cls.__dict__[slot].__get__, encode))
+    cls._optional = optional
+    cls._encoders = tuple(encoders)
+    cls._required = frozenset(required)
+    cls._fixed = fixed or {{}}
+
+
+def _shapes(*classes):
+    """
+    Chooses the first class whose fixed fields match and whose required fields
+    are present, trying the classes with fixed fields and more required fields
+    first.
+    """
+    candidates = sorted(classes, key=lambda cls: (not cls._fixed, -len(cls._required)))
+
+    def choose(data):
+        for cls in candidates:
+            if cls._required <= data.keys() and all(
+                data.get(key) == value for key, value in cls._fixed.items()
+            ):
+                return cls
+        names = [cls.__name__ for cls in classes]
+        raise ValueError(f"no type of {{names}} has the fields {{sorted(data)}}")
+
+    return choose
+
+
+def _discriminated(cls, field, choices):
+    def choose(data):
+        found = choices[data[field]]
+        return found if isinstance(found, type) else found(data)
+
+    cls._choose = choose
+
+
+def _structural(cls, *classes):
+    cls._choose = _shapes(*classes)
+
+
+@functools.lru_cache(maxsize=None)
+def _union(*classes):
+    choose = _shapes(*classes)
+
+    def decode(value):
+        return choose(value).from_dict(value) if isinstance(value, dict) else value
+
+    return decode
+
+
+# Fields whose names are Python keywords, and their slots.
+_SLOTS = {slots}
+'''
+
+
+def _slot(name):
+    return name + "_" if keyword.iskeyword(name) else name
+
+
+def _docstring(entry, indent):
+    text = entry.get("description", [""])[0] or entry["name"]
+    text = text.replace("\\", "\\\\").replace('"', '\\"')
+    return f'{indent}"""{text}"""'
+
+
+def fixed_value(field):
+    """Returns the value documented for a field ("Always 0"), or None."""
+    match = FIXED.match(field["description"])
+    if match is None:
+        return None
+    value = match.group(1)
+    if field["types"] == ["Integer"] and value.isdigit():
+        return int(value)
+    return value
+
+
+class _Generator:
+    def __init__(self, spec):
+        self.spec = spec
+        self.types = spec.get("types", {})
+        self.graph = type_graph.TypeGraph.from_spec(spec)
+        self.keywords = set()
+
+    def _bases(self, name):
+        supertypes = self.types[name].get("subtype_of", [])
+        return ", ".join(supertypes) or "Model"
+
+    def _order(self):
+        """The type names, every supertype before its subtypes."""
+        ordered = {}
+
+        def visit(name):
+            if name not in ordered:
+                for supertype in self.types[name].get("subtype_of", []):
+                    visit(supertype)
+                ordered[name] = None
+
+        for name, entry in self.types.items():
+            for subtype in entry.get("subtypes", []):
+                self.types[subtype].setdefault("subtype_of", [])
+                if name not in self.types[subtype]["subtype_of"]:
+                    self.types[subtype]["subtype_of"].append(name)
+        for name in self.types:
+            visit(name)
+        return list(ordered)
+
+    def _class(self, name):
+        entry = self.types[name]
+        lines = [f"class {name}({self._bases(name)}):", _docstring(entry, "    "), ""]
+        fields = entry.get("fields", [])
+        if entry.get("subtypes"):
+            lines.append("    __slots__ = ()")
+            return lines
+        if not fields:
+            lines.append("    __slots__ = ()")
+            lines.extend(["", "    @classmethod", "    def from_dict(cls, data):"])
+            lines.append("        return _new(cls)")
+            return lines
+        slots = [_slot(field["name"]) for field in fields]
+        self.keywords.update(
+            field["name"] for field in fields if keyword.iskeyword(field["name"])
+        )
+        lines.append("    __slots__ = (")
+        lines.extend(f'        "{slot}",' for slot in slots)
+        lines.append("    )")
+        lines.append("    _slots = frozenset(__slots__)")
+        lines.append("")
+        required = [f for f in fields if f["required"]]
+        optional = [f for f in fields if not f["required"]]
+        lines.append("    def __init__(")
+        lines.append("        self,")
+        lines.append("        *,")
+        lines.extend(f"        {_slot(f['name'])}," for f in required)
+        lines.extend(f"        {_slot(f['name'])}=None," for f in optional)
+        lines.append("    ):")
+        for field in required:
+            lines.append(
+                f"        self.{_slot(field['name'])} = {_slot(field['name'])}"
+            )
+        for field in optional:
+            slot = _slot(field["name"])
+            lines.append(f"        if {slot} is not None:")
+            lines.append(f"            self.{slot} = {slot}")
+        lines.extend(["", "    @classmethod", "    def from_dict(cls, data):"])
+        lines.append("        self = _new(cls)")
+        for field in required:
+            value = self._expr(field["types"], f'data["{field["name"]}"]')
+            lines.append(f"        self.{_slot(field['name'])} = {value}")
+        if optional:
+            lines.append(f"        if len(data) > {len(required)}:")
+            lines.append("            _set_optional(self, data, cls._optional)")
+        lines.append("        return self")
+        return lines
+
+    def _expr(self, type_refs, value, depth=0):
+        """The expression that decodes the value of a required field."""
+        objects = [
+            type_ref
+            for type_ref in type_refs
+            if type_graph.element_type(type_ref) not in PRIMITIVES
+        ]
+        if not objects:
+            return value
+        if len(type_refs) > 1:
+            return f"_union({', '.join(objects)})({value})"
+        type_ref = type_refs[0]
+        if type_ref.startswith(type_graph.ARRAY_PREFIX):
+            item = f"item{depth or ''}"
+            item_type = type_ref.removeprefix(type_graph.ARRAY_PREFIX)
+            return f"[{self._expr([item_type], item, depth + 1)} for {item} in {value}]"
+        return f"{type_ref}.from_dict({value})"
+
+    def _kind(self, type_refs):
+        """The expression for the kind of a field (see _fields in the header)."""
+        objects = [
+            type_ref
+            for type_ref in type_refs
+            if type_graph.element_type(type_ref) not in PRIMITIVES
+        ]
+        if not objects:
+            return "None"
+        if len(type_refs) > 1:
+            return f"_union({', '.join(objects)})"
+        type_ref = type_refs[0]
+        wrappers = 0
+        while type_ref.startswith(type_graph.ARRAY_PREFIX):
+            type_ref = type_ref.removeprefix(type_graph.ARRAY_PREFIX)
+            wrappers += 1
+        return "_list(" * wrappers + type_ref + ")" * wrappers
+
+    def _fields(self, name):
+        fields = self.types[name].get("fields", [])
+        lines = [f"_fields({name}, {{"]
+        for field in fields:
+            lines.append(f'    "{field["name"]}": {self._kind(field["types"])},')
+        required = [field["name"] for field in fields if field["required"]]
+        fixed = {}
+        for field in fields:
+            value = fixed_value(field)
+            if value is not None:
+                fixed[field["name"]] = value
+        tail = f"}}, required={json.dumps(required)}"
+        if fixed:
+            tail += f", fixed={json.dumps(fixed)}"
+        lines.append(tail + ")")
+        return lines
+
+    def _chooser(self, name):
+        """Decodes an abstract type by discriminator or by shape."""
+        concrete = sorted(self.graph.concrete_types(name))
+        values = {}
+        field = None
+        for subtype in concrete:
+            fields = self.types[subtype].get("fields", [])
+            match = fields and validators.DISCRIMINATOR.search(fields[0]["description"])
+            if not match or field not in (None, fields[0]["name"]):
+                return [f"_structural({name}, {', '.join(concrete)})"]
+            field = fields[0]["name"]
+            values.setdefault(match.group(1), []).append(subtype)
+        lines = [f'_discriminated({name}, "{field}", {{']
+        for value, classes in values.items():
+            choice = (
+                classes[0] if len(classes) == 1 else f"_shapes({', '.join(classes)})"
+            )
+            lines.append(f'    "{value}": {choice},')
+        lines.append("})")
+        return lines
+
+    def source(self):
+        order = self._order()
+        body = []
+        for name in order:
+            body.extend(["", ""])
+            body.extend(self._class(name))
+        tables = ["", ""]
+        concrete = [name for name in order if not self.types[name].get("subtypes")]
+        for name in concrete:
+            if self.types[name].get("fields"):
+                tables.extend(self._fields(name))
+            else:
+                tables.append(f"_fields({name}, {{}})")
+        for name in order:
+            if self.types[name].get("subtypes"):
+                tables.extend(self._chooser(name))
+        slots = ", ".join(
+            f'"{name}": "{_slot(name)}"' for name in sorted(self.keywords)
+        )
+        header = HEADER.format(
+            version=self.spec.get("version", ""),
+            source=spec_merge.OUTPUT_PATH,
+            slots=f"{{{slots}}}",
+        )
+        return header + "\n".join(body + tables) + "\n"
+
+
+def generate(spec):
+    """Returns the source of the models module of a spec."""
+    return _Generator(json.loads(json.dumps(spec))).source()
+
+
+def write(spec, path=MODELS_PATH):
+    """Writes the models module of a spec; unchanged files are not written."""
+    output.write_text(path, generate(spec))
+
+
+def main(argv=None):
+    """Generates models.py from spec-extended.json."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--spec", default=spec_merge.OUTPUT_PATH)
+    parser.add_argument("--output", default=MODELS_PATH)
+    args = parser.parse_args([] if argv is None else argv)
+    write(spec_merge.load_json(args.spec), args.output)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
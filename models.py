@@ -0,0 +1,12911 @@
+"""
+Model classes of the Telegram Bot API 9.2 types.
+
+Generated from spec-extended.json by model_codegen.py; do not edit.
+"""
+
+import functools
+
+_new = object.__new__
+
+
+class Model:
+    """
+    Base class of the models. from_dict decodes the JSON object of a type and
+    to_dict encodes it back; optional fields that are not set read as None.
+    """
+
+    __slots__ = ()
+    _slots = frozenset()
+    _optional = {}
+    _encoders = ()
+    _required = frozenset()
+    _fixed = {}
+
+    def __getattr__(self, name):
+        if name in type(self)._slots:
+            return None
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        """Decodes the JSON object of an abstract type as one of its subtypes."""
+        return cls._choose(data).from_dict(data)
+
+    def to_dict(self):
+        data = {}
+        for key, get, encode in self._encoders:
+            try:
+                value = get(self)
+            except AttributeError:
+                continue
+            data[key] = value if encode is None else encode(value)
+        return data
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        fields = []
+        for key, get, _ in self._encoders:
+            try:
+                fields.append(f"{key}={get(self)!r}")
+            except AttributeError:
+                pass
+        return f"{type(self).__name__}({', '.join(fields)})"
+
+
+def _set_optional(self, data, optional):
+    for key, value in data.items():
+        field = optional.get(key)
+        if field is not None:
+            slot, decode = field
+            setattr(self, slot, value if decode is None else decode(value))
+
+
+def _encode(value):
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decoder(kind):
+    """The function that decodes a value of kind: None, a class or a decoder."""
+    return kind.from_dict if isinstance(kind, type) else kind
+
+
+def _list(kind):
+    decode = _decoder(kind)
+    if decode is None:
+        return None
+    return lambda value: [decode(item) for item in value]
+
+
+def _fields(cls, kinds, required=(), fixed=None):
+    """Builds the tables of a class from the kinds of its fields."""
+    optional, encoders = {}, []
+    for key, kind in kinds.items():
+        slot = _SLOTS.get(key, key)
+        if key not in required:
+            optional[key] = (slot, _decoder(kind))
+        encode = None if kind is None else _encode
+        encoders.append((key, cls.__dict__[slot].__get__, encode))
+    cls._optional = optional
+    cls._encoders = tuple(encoders)
+    cls._required = frozenset(required)
+    cls._fixed = fixed or {}
+
+
+def _shapes(*classes):
+    """
+    Chooses the first class whose fixed fields match and whose required fields
+    are present, trying the classes with fixed fields and more required fields
+    first.
+    """
+    candidates = sorted(classes, key=lambda cls: (not cls._fixed, -len(cls._required)))
+
+    def choose(data):
+        for cls in candidates:
+            if cls._required <= data.keys() and all(
+                data.get(key) == value for key, value in cls._fixed.items()
+            ):
+                return cls
+        names = [cls.__name__ for cls in classes]
+        raise ValueError(f"no type of {names} has the fields {sorted(data)}")
+
+    return choose
+
+
+def _discriminated(cls, field, choices):
+    def choose(data):
+        found = choices[data[field]]
+        return found if isinstance(found, type) else found(data)
+
+    cls._choose = choose
+
+
+def _structural(cls, *classes):
+    cls._choose = _shapes(*classes)
+
+
+@functools.lru_cache(maxsize=None)
+def _union(*classes):
+    choose = _shapes(*classes)
+
+    def decode(value):
+        return choose(value).from_dict(value) if isinstance(value, dict) else value
+
+    return decode
+
+
+# Fields whose names are Python keywords, and their slots.
+_SLOTS = {"from": "from_"}
+
+
+class Update(Model):
+    """This object represents an incoming update."""
+
+    __slots__ = (
+        "update_id",
+        "message",
+        "edited_message",
+        "channel_post",
+        "edited_channel_post",
+        "business_connection",
+        "business_message",
+        "edited_business_message",
+        "deleted_business_messages",
+        "message_reaction",
+        "message_reaction_count",
+        "inline_query",
+        "chosen_inline_result",
+        "callback_query",
+        "shipping_query",
+        "pre_checkout_query",
+        "purchased_paid_media",
+        "poll",
+        "poll_answer",
+        "my_chat_member",
+        "chat_member",
+        "chat_join_request",
+        "chat_boost",
+        "removed_chat_boost",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        update_id,
+        message=None,
+        edited_message=None,
+        channel_post=None,
+        edited_channel_post=None,
+        business_connection=None,
+        business_message=None,
+        edited_business_message=None,
+        deleted_business_messages=None,
+        message_reaction=None,
+        message_reaction_count=None,
+        inline_query=None,
+        chosen_inline_result=None,
+        callback_query=None,
+        shipping_query=None,
+        pre_checkout_query=None,
+        purchased_paid_media=None,
+        poll=None,
+        poll_answer=None,
+        my_chat_member=None,
+        chat_member=None,
+        chat_join_request=None,
+        chat_boost=None,
+        removed_chat_boost=None,
+    ):
+        self.update_id = update_id
+        if message is not None:
+            self.message = message
+        if edited_message is not None:
+            self.edited_message = edited_message
+        if channel_post is not None:
+            self.channel_post = channel_post
+        if edited_channel_post is not None:
+            self.edited_channel_post = edited_channel_post
+        if business_connection is not None:
+            self.business_connection = business_connection
+        if business_message is not None:
+            self.business_message = business_message
+        if edited_business_message is not None:
+            self.edited_business_message = edited_business_message
+        if deleted_business_messages is not None:
+            self.deleted_business_messages = deleted_business_messages
+        if message_reaction is not None:
+            self.message_reaction = message_reaction
+        if message_reaction_count is not None:
+            self.message_reaction_count = message_reaction_count
+        if inline_query is not None:
+            self.inline_query = inline_query
+        if chosen_inline_result is not None:
+            self.chosen_inline_result = chosen_inline_result
+        if callback_query is not None:
+            self.callback_query = callback_query
+        if shipping_query is not None:
+            self.shipping_query = shipping_query
+        if pre_checkout_query is not None:
+            self.pre_checkout_query = pre_checkout_query
+        if purchased_paid_media is not None:
+            self.purchased_paid_media = purchased_paid_media
+        if poll is not None:
+            self.poll = poll
+        if poll_answer is not None:
+            self.poll_answer = poll_answer
+        if my_chat_member is not None:
+            self.my_chat_member = my_chat_member
+        if chat_member is not None:
+            self.chat_member = chat_member
+        if chat_join_request is not None:
+            self.chat_join_request = chat_join_request
+        if chat_boost is not None:
+            self.chat_boost = chat_boost
+        if removed_chat_boost is not None:
+            self.removed_chat_boost = removed_chat_boost
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.update_id = data["update_id"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class WebhookInfo(Model):
+    """Describes the current status of a webhook."""
+
+    __slots__ = (
+        "url",
+        "has_custom_certificate",
+        "pending_update_count",
+        "ip_address",
+        "last_error_date",
+        "last_error_message",
+        "last_synchronization_error_date",
+        "max_connections",
+        "allowed_updates",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        url,
+        has_custom_certificate,
+        pending_update_count,
+        ip_address=None,
+        last_error_date=None,
+        last_error_message=None,
+        last_synchronization_error_date=None,
+        max_connections=None,
+        allowed_updates=None,
+    ):
+        self.url = url
+        self.has_custom_certificate = has_custom_certificate
+        self.pending_update_count = pending_update_count
+        if ip_address is not None:
+            self.ip_address = ip_address
+        if last_error_date is not None:
+            self.last_error_date = last_error_date
+        if last_error_message is not None:
+            self.last_error_message = last_error_message
+        if last_synchronization_error_date is not None:
+            self.last_synchronization_error_date = last_synchronization_error_date
+        if max_connections is not None:
+            self.max_connections = max_connections
+        if allowed_updates is not None:
+            self.allowed_updates = allowed_updates
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.url = data["url"]
+        self.has_custom_certificate = data["has_custom_certificate"]
+        self.pending_update_count = data["pending_update_count"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class User(Model):
+    """This object represents a Telegram user or bot."""
+
+    __slots__ = (
+        "id",
+        "is_bot",
+        "first_name",
+        "last_name",
+        "username",
+        "language_code",
+        "is_premium",
+        "added_to_attachment_menu",
+        "can_join_groups",
+        "can_read_all_group_messages",
+        "supports_inline_queries",
+        "can_connect_to_business",
+        "has_main_web_app",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        id,
+        is_bot,
+        first_name,
+        last_name=None,
+        username=None,
+        language_code=None,
+        is_premium=None,
+        added_to_attachment_menu=None,
+        can_join_groups=None,
+        can_read_all_group_messages=None,
+        supports_inline_queries=None,
+        can_connect_to_business=None,
+        has_main_web_app=None,
+    ):
+        self.id = id
+        self.is_bot = is_bot
+        self.first_name = first_name
+        if last_name is not None:
+            self.last_name = last_name
+        if username is not None:
+            self.username = username
+        if language_code is not None:
+            self.language_code = language_code
+        if is_premium is not None:
+            self.is_premium = is_premium
+        if added_to_attachment_menu is not None:
+            self.added_to_attachment_menu = added_to_attachment_menu
+        if can_join_groups is not None:
+            self.can_join_groups = can_join_groups
+        if can_read_all_group_messages is not None:
+            self.can_read_all_group_messages = can_read_all_group_messages
+        if supports_inline_queries is not None:
+            self.supports_inline_queries = supports_inline_queries
+        if can_connect_to_business is not None:
+            self.can_connect_to_business = can_connect_to_business
+        if has_main_web_app is not None:
+            self.has_main_web_app = has_main_web_app
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.id = data["id"]
+        self.is_bot = data["is_bot"]
+        self.first_name = data["first_name"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class Chat(Model):
+    """This object represents a chat."""
+
+    __slots__ = (
+        "id",
+        "type",
+        "title",
+        "username",
+        "first_name",
+        "last_name",
+        "is_forum",
+        "is_direct_messages",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        id,
+        type,
+        title=None,
+        username=None,
+        first_name=None,
+        last_name=None,
+        is_forum=None,
+        is_direct_messages=None,
+    ):
+        self.id = id
+        self.type = type
+        if title is not None:
+            self.title = title
+        if username is not None:
+            self.username = username
+        if first_name is not None:
+            self.first_name = first_name
+        if last_name is not None:
+            self.last_name = last_name
+        if is_forum is not None:
+            self.is_forum = is_forum
+        if is_direct_messages is not None:
+            self.is_direct_messages = is_direct_messages
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.id = data["id"]
+        self.type = data["type"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ChatFullInfo(Model):
+    """This object contains full information about a chat."""
+
+    __slots__ = (
+        "id",
+        "type",
+        "title",
+        "username",
+        "first_name",
+        "last_name",
+        "is_forum",
+        "is_direct_messages",
+        "accent_color_id",
+        "max_reaction_count",
+        "photo",
+        "active_usernames",
+        "birthdate",
+        "business_intro",
+        "business_location",
+        "business_opening_hours",
+        "personal_chat",
+        "parent_chat",
+        "available_reactions",
+        "background_custom_emoji_id",
+        "profile_accent_color_id",
+        "profile_background_custom_emoji_id",
+        "emoji_status_custom_emoji_id",
+        "emoji_status_expiration_date",
+        "bio",
+        "has_private_forwards",
+        "has_restricted_voice_and_video_messages",
+        "join_to_send_messages",
+        "join_by_request",
+        "description",
+        "invite_link",
+        "pinned_message",
+        "permissions",
+        "accepted_gift_types",
+        "can_send_paid_media",
+        "slow_mode_delay",
+        "unrestrict_boost_count",
+        "message_auto_delete_time",
+        "has_aggressive_anti_spam_enabled",
+        "has_hidden_members",
+        "has_protected_content",
+        "has_visible_history",
+        "sticker_set_name",
+        "can_set_sticker_set",
+        "custom_emoji_sticker_set_name",
+        "linked_chat_id",
+        "location",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        id,
+        type,
+        accent_color_id,
+        max_reaction_count,
+        accepted_gift_types,
+        title=None,
+        username=None,
+        first_name=None,
+        last_name=None,
+        is_forum=None,
+        is_direct_messages=None,
+        photo=None,
+        active_usernames=None,
+        birthdate=None,
+        business_intro=None,
+        business_location=None,
+        business_opening_hours=None,
+        personal_chat=None,
+        parent_chat=None,
+        available_reactions=None,
+        background_custom_emoji_id=None,
+        profile_accent_color_id=None,
+        profile_background_custom_emoji_id=None,
+        emoji_status_custom_emoji_id=None,
+        emoji_status_expiration_date=None,
+        bio=None,
+        has_private_forwards=None,
+        has_restricted_voice_and_video_messages=None,
+        join_to_send_messages=None,
+        join_by_request=None,
+        description=None,
+        invite_link=None,
+        pinned_message=None,
+        permissions=None,
+        can_send_paid_media=None,
+        slow_mode_delay=None,
+        unrestrict_boost_count=None,
+        message_auto_delete_time=None,
+        has_aggressive_anti_spam_enabled=None,
+        has_hidden_members=None,
+        has_protected_content=None,
+        has_visible_history=None,
+        sticker_set_name=None,
+        can_set_sticker_set=None,
+        custom_emoji_sticker_set_name=None,
+        linked_chat_id=None,
+        location=None,
+    ):
+        self.id = id
+        self.type = type
+        self.accent_color_id = accent_color_id
+        self.max_reaction_count = max_reaction_count
+        self.accepted_gift_types = accepted_gift_types
+        if title is not None:
+            self.title = title
+        if username is not None:
+            self.username = username
+        if first_name is not None:
+            self.first_name = first_name
+        if last_name is not None:
+            self.last_name = last_name
+        if is_forum is not None:
+            self.is_forum = is_forum
+        if is_direct_messages is not None:
+            self.is_direct_messages = is_direct_messages
+        if photo is not None:
+            self.photo = photo
+        if active_usernames is not None:
+            self.active_usernames = active_usernames
+        if birthdate is not None:
+            self.birthdate = birthdate
+        if business_intro is not None:
+            self.business_intro = business_intro
+        if business_location is not None:
+            self.business_location = business_location
+        if business_opening_hours is not None:
+            self.business_opening_hours = business_opening_hours
+        if personal_chat is not None:
+            self.personal_chat = personal_chat
+        if parent_chat is not None:
+            self.parent_chat = parent_chat
+        if available_reactions is not None:
+            self.available_reactions = available_reactions
+        if background_custom_emoji_id is not None:
+            self.background_custom_emoji_id = background_custom_emoji_id
+        if profile_accent_color_id is not None:
+            self.profile_accent_color_id = profile_accent_color_id
+        if profile_background_custom_emoji_id is not None:
+            self.profile_background_custom_emoji_id = profile_background_custom_emoji_id
+        if emoji_status_custom_emoji_id is not None:
+            self.emoji_status_custom_emoji_id = emoji_status_custom_emoji_id
+        if emoji_status_expiration_date is not None:
+            self.emoji_status_expiration_date = emoji_status_expiration_date
+        if bio is not None:
+            self.bio = bio
+        if has_private_forwards is not None:
+            self.has_private_forwards = has_private_forwards
+        if has_restricted_voice_and_video_messages is not None:
+            self.has_restricted_voice_and_video_messages = has_restricted_voice_and_video_messages
+        if join_to_send_messages is not None:
+            self.join_to_send_messages = join_to_send_messages
+        if join_by_request is not None:
+            self.join_by_request = join_by_request
+        if description is not None:
+            self.description = description
+        if invite_link is not None:
+            self.invite_link = invite_link
+        if pinned_message is not None:
+            self.pinned_message = pinned_message
+        if permissions is not None:
+            self.permissions = permissions
+        if can_send_paid_media is not None:
+            self.can_send_paid_media = can_send_paid_media
+        if slow_mode_delay is not None:
+            self.slow_mode_delay = slow_mode_delay
+        if unrestrict_boost_count is not None:
+            self.unrestrict_boost_count = unrestrict_boost_count
+        if message_auto_delete_time is not None:
+            self.message_auto_delete_time = message_auto_delete_time
+        if has_aggressive_anti_spam_enabled is not None:
+            self.has_aggressive_anti_spam_enabled = has_aggressive_anti_spam_enabled
+        if has_hidden_members is not None:
+            self.has_hidden_members = has_hidden_members
+        if has_protected_content is not None:
+            self.has_protected_content = has_protected_content
+        if has_visible_history is not None:
+            self.has_visible_history = has_visible_history
+        if sticker_set_name is not None:
+            self.sticker_set_name = sticker_set_name
+        if can_set_sticker_set is not None:
+            self.can_set_sticker_set = can_set_sticker_set
+        if custom_emoji_sticker_set_name is not None:
+            self.custom_emoji_sticker_set_name = custom_emoji_sticker_set_name
+        if linked_chat_id is not None:
+            self.linked_chat_id = linked_chat_id
+        if location is not None:
+            self.location = location
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.id = data["id"]
+        self.type = data["type"]
+        self.accent_color_id = data["accent_color_id"]
+        self.max_reaction_count = data["max_reaction_count"]
+        self.accepted_gift_types = AcceptedGiftTypes.from_dict(data["accepted_gift_types"])
+        if len(data) > 5:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class MaybeInaccessibleMessage(Model):
+    """This object describes a message that can be inaccessible to the bot. It can be one of"""
+
+    __slots__ = ()
+
+
+class Message(MaybeInaccessibleMessage):
+    """This object represents a message."""
+
+    __slots__ = (
+        "message_id",
+        "message_thread_id",
+        "direct_messages_topic",
+        "from_",
+        "sender_chat",
+        "sender_boost_count",
+        "sender_business_bot",
+        "date",
+        "business_connection_id",
+        "chat",
+        "forward_origin",
+        "is_topic_message",
+        "is_automatic_forward",
+        "reply_to_message",
+        "external_reply",
+        "quote",
+        "reply_to_story",
+        "reply_to_checklist_task_id",
+        "via_bot",
+        "edit_date",
+        "has_protected_content",
+        "is_from_offline",
+        "is_paid_post",
+        "media_group_id",
+        "author_signature",
+        "paid_star_count",
+        "text",
+        "entities",
+        "link_preview_options",
+        "suggested_post_info",
+        "effect_id",
+        "animation",
+        "audio",
+        "document",
+        "paid_media",
+        "photo",
+        "sticker",
+        "story",
+        "video",
+        "video_note",
+        "voice",
+        "caption",
+        "caption_entities",
+        "show_caption_above_media",
+        "has_media_spoiler",
+        "checklist",
+        "contact",
+        "dice",
+        "game",
+        "poll",
+        "venue",
+        "location",
+        "new_chat_members",
+        "left_chat_member",
+        "new_chat_title",
+        "new_chat_photo",
+        "delete_chat_photo",
+        "group_chat_created",
+        "supergroup_chat_created",
+        "channel_chat_created",
+        "message_auto_delete_timer_changed",
+        "migrate_to_chat_id",
+        "migrate_from_chat_id",
+        "pinned_message",
+        "invoice",
+        "successful_payment",
+        "refunded_payment",
+        "users_shared",
+        "chat_shared",
+        "gift",
+        "unique_gift",
+        "connected_website",
+        "write_access_allowed",
+        "passport_data",
+        "proximity_alert_triggered",
+        "boost_added",
+        "chat_background_set",
+        "checklist_tasks_done",
+        "checklist_tasks_added",
+        "direct_message_price_changed",
+        "forum_topic_created",
+        "forum_topic_edited",
+        "forum_topic_closed",
+        "forum_topic_reopened",
+        "general_forum_topic_hidden",
+        "general_forum_topic_unhidden",
+        "giveaway_created",
+        "giveaway",
+        "giveaway_winners",
+        "giveaway_completed",
+        "paid_message_price_changed",
+        "suggested_post_approved",
+        "suggested_post_approval_failed",
+        "suggested_post_declined",
+        "suggested_post_paid",
+        "suggested_post_refunded",
+        "video_chat_scheduled",
+        "video_chat_started",
+        "video_chat_ended",
+        "video_chat_participants_invited",
+        "web_app_data",
+        "reply_markup",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        message_id,
+        date,
+        chat,
+        message_thread_id=None,
+        direct_messages_topic=None,
+        from_=None,
+        sender_chat=None,
+        sender_boost_count=None,
+        sender_business_bot=None,
+        business_connection_id=None,
+        forward_origin=None,
+        is_topic_message=None,
+        is_automatic_forward=None,
+        reply_to_message=None,
+        external_reply=None,
+        quote=None,
+        reply_to_story=None,
+        reply_to_checklist_task_id=None,
+        via_bot=None,
+        edit_date=None,
+        has_protected_content=None,
+        is_from_offline=None,
+        is_paid_post=None,
+        media_group_id=None,
+        author_signature=None,
+        paid_star_count=None,
+        text=None,
+        entities=None,
+        link_preview_options=None,
+        suggested_post_info=None,
+        effect_id=None,
+        animation=None,
+        audio=None,
+        document=None,
+        paid_media=None,
+        photo=None,
+        sticker=None,
+        story=None,
+        video=None,
+        video_note=None,
+        voice=None,
+        caption=None,
+        caption_entities=None,
+        show_caption_above_media=None,
+        has_media_spoiler=None,
+        checklist=None,
+        contact=None,
+        dice=None,
+        game=None,
+        poll=None,
+        venue=None,
+        location=None,
+        new_chat_members=None,
+        left_chat_member=None,
+        new_chat_title=None,
+        new_chat_photo=None,
+        delete_chat_photo=None,
+        group_chat_created=None,
+        supergroup_chat_created=None,
+        channel_chat_created=None,
+        message_auto_delete_timer_changed=None,
+        migrate_to_chat_id=None,
+        migrate_from_chat_id=None,
+        pinned_message=None,
+        invoice=None,
+        successful_payment=None,
+        refunded_payment=None,
+        users_shared=None,
+        chat_shared=None,
+        gift=None,
+        unique_gift=None,
+        connected_website=None,
+        write_access_allowed=None,
+        passport_data=None,
+        proximity_alert_triggered=None,
+        boost_added=None,
+        chat_background_set=None,
+        checklist_tasks_done=None,
+        checklist_tasks_added=None,
+        direct_message_price_changed=None,
+        forum_topic_created=None,
+        forum_topic_edited=None,
+        forum_topic_closed=None,
+        forum_topic_reopened=None,
+        general_forum_topic_hidden=None,
+        general_forum_topic_unhidden=None,
+        giveaway_created=None,
+        giveaway=None,
+        giveaway_winners=None,
+        giveaway_completed=None,
+        paid_message_price_changed=None,
+        suggested_post_approved=None,
+        suggested_post_approval_failed=None,
+        suggested_post_declined=None,
+        suggested_post_paid=None,
+        suggested_post_refunded=None,
+        video_chat_scheduled=None,
+        video_chat_started=None,
+        video_chat_ended=None,
+        video_chat_participants_invited=None,
+        web_app_data=None,
+        reply_markup=None,
+    ):
+        self.message_id = message_id
+        self.date = date
+        self.chat = chat
+        if message_thread_id is not None:
+            self.message_thread_id = message_thread_id
+        if direct_messages_topic is not None:
+            self.direct_messages_topic = direct_messages_topic
+        if from_ is not None:
+            self.from_ = from_
+        if sender_chat is not None:
+            self.sender_chat = sender_chat
+        if sender_boost_count is not None:
+            self.sender_boost_count = sender_boost_count
+        if sender_business_bot is not None:
+            self.sender_business_bot = sender_business_bot
+        if business_connection_id is not None:
+            self.business_connection_id = business_connection_id
+        if forward_origin is not None:
+            self.forward_origin = forward_origin
+        if is_topic_message is not None:
+            self.is_topic_message = is_topic_message
+        if is_automatic_forward is not None:
+            self.is_automatic_forward = is_automatic_forward
+        if reply_to_message is not None:
+            self.reply_to_message = reply_to_message
+        if external_reply is not None:
+            self.external_reply = external_reply
+        if quote is not None:
+            self.quote = quote
+        if reply_to_story is not None:
+            self.reply_to_story = reply_to_story
+        if reply_to_checklist_task_id is not None:
+            self.reply_to_checklist_task_id = reply_to_checklist_task_id
+        if via_bot is not None:
+            self.via_bot = via_bot
+        if edit_date is not None:
+            self.edit_date = edit_date
+        if has_protected_content is not None:
+            self.has_protected_content = has_protected_content
+        if is_from_offline is not None:
+            self.is_from_offline = is_from_offline
+        if is_paid_post is not None:
+            self.is_paid_post = is_paid_post
+        if media_group_id is not None:
+            self.media_group_id = media_group_id
+        if author_signature is not None:
+            self.author_signature = author_signature
+        if paid_star_count is not None:
+            self.paid_star_count = paid_star_count
+        if text is not None:
+            self.text = text
+        if entities is not None:
+            self.entities = entities
+        if link_preview_options is not None:
+            self.link_preview_options = link_preview_options
+        if suggested_post_info is not None:
+            self.suggested_post_info = suggested_post_info
+        if effect_id is not None:
+            self.effect_id = effect_id
+        if animation is not None:
+            self.animation = animation
+        if audio is not None:
+            self.audio = audio
+        if document is not None:
+            self.document = document
+        if paid_media is not None:
+            self.paid_media = paid_media
+        if photo is not None:
+            self.photo = photo
+        if sticker is not None:
+            self.sticker = sticker
+        if story is not None:
+            self.story = story
+        if video is not None:
+            self.video = video
+        if video_note is not None:
+            self.video_note = video_note
+        if voice is not None:
+            self.voice = voice
+        if caption is not None:
+            self.caption = caption
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if show_caption_above_media is not None:
+            self.show_caption_above_media = show_caption_above_media
+        if has_media_spoiler is not None:
+            self.has_media_spoiler = has_media_spoiler
+        if checklist is not None:
+            self.checklist = checklist
+        if contact is not None:
+            self.contact = contact
+        if dice is not None:
+            self.dice = dice
+        if game is not None:
+            self.game = game
+        if poll is not None:
+            self.poll = poll
+        if venue is not None:
+            self.venue = venue
+        if location is not None:
+            self.location = location
+        if new_chat_members is not None:
+            self.new_chat_members = new_chat_members
+        if left_chat_member is not None:
+            self.left_chat_member = left_chat_member
+        if new_chat_title is not None:
+            self.new_chat_title = new_chat_title
+        if new_chat_photo is not None:
+            self.new_chat_photo = new_chat_photo
+        if delete_chat_photo is not None:
+            self.delete_chat_photo = delete_chat_photo
+        if group_chat_created is not None:
+            self.group_chat_created = group_chat_created
+        if supergroup_chat_created is not None:
+            self.supergroup_chat_created = supergroup_chat_created
+        if channel_chat_created is not None:
+            self.channel_chat_created = channel_chat_created
+        if message_auto_delete_timer_changed is not None:
+            self.message_auto_delete_timer_changed = message_auto_delete_timer_changed
+        if migrate_to_chat_id is not None:
+            self.migrate_to_chat_id = migrate_to_chat_id
+        if migrate_from_chat_id is not None:
+            self.migrate_from_chat_id = migrate_from_chat_id
+        if pinned_message is not None:
+            self.pinned_message = pinned_message
+        if invoice is not None:
+            self.invoice = invoice
+        if successful_payment is not None:
+            self.successful_payment = successful_payment
+        if refunded_payment is not None:
+            self.refunded_payment = refunded_payment
+        if users_shared is not None:
+            self.users_shared = users_shared
+        if chat_shared is not None:
+            self.chat_shared = chat_shared
+        if gift is not None:
+            self.gift = gift
+        if unique_gift is not None:
+            self.unique_gift = unique_gift
+        if connected_website is not None:
+            self.connected_website = connected_website
+        if write_access_allowed is not None:
+            self.write_access_allowed = write_access_allowed
+        if passport_data is not None:
+            self.passport_data = passport_data
+        if proximity_alert_triggered is not None:
+            self.proximity_alert_triggered = proximity_alert_triggered
+        if boost_added is not None:
+            self.boost_added = boost_added
+        if chat_background_set is not None:
+            self.chat_background_set = chat_background_set
+        if checklist_tasks_done is not None:
+            self.checklist_tasks_done = checklist_tasks_done
+        if checklist_tasks_added is not None:
+            self.checklist_tasks_added = checklist_tasks_added
+        if direct_message_price_changed is not None:
+            self.direct_message_price_changed = direct_message_price_changed
+        if forum_topic_created is not None:
+            self.forum_topic_created = forum_topic_created
+        if forum_topic_edited is not None:
+            self.forum_topic_edited = forum_topic_edited
+        if forum_topic_closed is not None:
+            self.forum_topic_closed = forum_topic_closed
+        if forum_topic_reopened is not None:
+            self.forum_topic_reopened = forum_topic_reopened
+        if general_forum_topic_hidden is not None:
+            self.general_forum_topic_hidden = general_forum_topic_hidden
+        if general_forum_topic_unhidden is not None:
+            self.general_forum_topic_unhidden = general_forum_topic_unhidden
+        if giveaway_created is not None:
+            self.giveaway_created = giveaway_created
+        if giveaway is not None:
+            self.giveaway = giveaway
+        if giveaway_winners is not None:
+            self.giveaway_winners = giveaway_winners
+        if giveaway_completed is not None:
+            self.giveaway_completed = giveaway_completed
+        if paid_message_price_changed is not None:
+            self.paid_message_price_changed = paid_message_price_changed
+        if suggested_post_approved is not None:
+            self.suggested_post_approved = suggested_post_approved
+        if suggested_post_approval_failed is not None:
+            self.suggested_post_approval_failed = suggested_post_approval_failed
+        if suggested_post_declined is not None:
+            self.suggested_post_declined = suggested_post_declined
+        if suggested_post_paid is not None:
+            self.suggested_post_paid = suggested_post_paid
+        if suggested_post_refunded is not None:
+            self.suggested_post_refunded = suggested_post_refunded
+        if video_chat_scheduled is not None:
+            self.video_chat_scheduled = video_chat_scheduled
+        if video_chat_started is not None:
+            self.video_chat_started = video_chat_started
+        if video_chat_ended is not None:
+            self.video_chat_ended = video_chat_ended
+        if video_chat_participants_invited is not None:
+            self.video_chat_participants_invited = video_chat_participants_invited
+        if web_app_data is not None:
+            self.web_app_data = web_app_data
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.message_id = data["message_id"]
+        self.date = data["date"]
+        self.chat = Chat.from_dict(data["chat"])
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class MessageId(Model):
+    """This object represents a unique message identifier."""
+
+    __slots__ = (
+        "message_id",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        message_id,
+    ):
+        self.message_id = message_id
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.message_id = data["message_id"]
+        return self
+
+
+class InaccessibleMessage(MaybeInaccessibleMessage):
+    """This object describes a message that was deleted or is otherwise inaccessible to the bot."""
+
+    __slots__ = (
+        "chat",
+        "message_id",
+        "date",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        chat,
+        message_id,
+        date,
+    ):
+        self.chat = chat
+        self.message_id = message_id
+        self.date = date
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.chat = Chat.from_dict(data["chat"])
+        self.message_id = data["message_id"]
+        self.date = data["date"]
+        return self
+
+
+class MessageEntity(Model):
+    """This object represents one special entity in a text message. For example, hashtags, usernames, URLs, etc."""
+
+    __slots__ = (
+        "type",
+        "offset",
+        "length",
+        "url",
+        "user",
+        "language",
+        "custom_emoji_id",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        offset,
+        length,
+        url=None,
+        user=None,
+        language=None,
+        custom_emoji_id=None,
+    ):
+        self.type = type
+        self.offset = offset
+        self.length = length
+        if url is not None:
+            self.url = url
+        if user is not None:
+            self.user = user
+        if language is not None:
+            self.language = language
+        if custom_emoji_id is not None:
+            self.custom_emoji_id = custom_emoji_id
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.offset = data["offset"]
+        self.length = data["length"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class TextQuote(Model):
+    """This object contains information about the quoted part of a message that is replied to by the given message."""
+
+    __slots__ = (
+        "text",
+        "entities",
+        "position",
+        "is_manual",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        text,
+        position,
+        entities=None,
+        is_manual=None,
+    ):
+        self.text = text
+        self.position = position
+        if entities is not None:
+            self.entities = entities
+        if is_manual is not None:
+            self.is_manual = is_manual
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.text = data["text"]
+        self.position = data["position"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ExternalReplyInfo(Model):
+    """This object contains information about a message that is being replied to, which may come from another chat or forum topic."""
+
+    __slots__ = (
+        "origin",
+        "chat",
+        "message_id",
+        "link_preview_options",
+        "animation",
+        "audio",
+        "document",
+        "paid_media",
+        "photo",
+        "sticker",
+        "story",
+        "video",
+        "video_note",
+        "voice",
+        "has_media_spoiler",
+        "checklist",
+        "contact",
+        "dice",
+        "game",
+        "giveaway",
+        "giveaway_winners",
+        "invoice",
+        "location",
+        "poll",
+        "venue",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        origin,
+        chat=None,
+        message_id=None,
+        link_preview_options=None,
+        animation=None,
+        audio=None,
+        document=None,
+        paid_media=None,
+        photo=None,
+        sticker=None,
+        story=None,
+        video=None,
+        video_note=None,
+        voice=None,
+        has_media_spoiler=None,
+        checklist=None,
+        contact=None,
+        dice=None,
+        game=None,
+        giveaway=None,
+        giveaway_winners=None,
+        invoice=None,
+        location=None,
+        poll=None,
+        venue=None,
+    ):
+        self.origin = origin
+        if chat is not None:
+            self.chat = chat
+        if message_id is not None:
+            self.message_id = message_id
+        if link_preview_options is not None:
+            self.link_preview_options = link_preview_options
+        if animation is not None:
+            self.animation = animation
+        if audio is not None:
+            self.audio = audio
+        if document is not None:
+            self.document = document
+        if paid_media is not None:
+            self.paid_media = paid_media
+        if photo is not None:
+            self.photo = photo
+        if sticker is not None:
+            self.sticker = sticker
+        if story is not None:
+            self.story = story
+        if video is not None:
+            self.video = video
+        if video_note is not None:
+            self.video_note = video_note
+        if voice is not None:
+            self.voice = voice
+        if has_media_spoiler is not None:
+            self.has_media_spoiler = has_media_spoiler
+        if checklist is not None:
+            self.checklist = checklist
+        if contact is not None:
+            self.contact = contact
+        if dice is not None:
+            self.dice = dice
+        if game is not None:
+            self.game = game
+        if giveaway is not None:
+            self.giveaway = giveaway
+        if giveaway_winners is not None:
+            self.giveaway_winners = giveaway_winners
+        if invoice is not None:
+            self.invoice = invoice
+        if location is not None:
+            self.location = location
+        if poll is not None:
+            self.poll = poll
+        if venue is not None:
+            self.venue = venue
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.origin = MessageOrigin.from_dict(data["origin"])
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ReplyParameters(Model):
+    """Describes reply parameters for the message that is being sent."""
+
+    __slots__ = (
+        "message_id",
+        "chat_id",
+        "allow_sending_without_reply",
+        "quote",
+        "quote_parse_mode",
+        "quote_entities",
+        "quote_position",
+        "checklist_task_id",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        message_id,
+        chat_id=None,
+        allow_sending_without_reply=None,
+        quote=None,
+        quote_parse_mode=None,
+        quote_entities=None,
+        quote_position=None,
+        checklist_task_id=None,
+    ):
+        self.message_id = message_id
+        if chat_id is not None:
+            self.chat_id = chat_id
+        if allow_sending_without_reply is not None:
+            self.allow_sending_without_reply = allow_sending_without_reply
+        if quote is not None:
+            self.quote = quote
+        if quote_parse_mode is not None:
+            self.quote_parse_mode = quote_parse_mode
+        if quote_entities is not None:
+            self.quote_entities = quote_entities
+        if quote_position is not None:
+            self.quote_position = quote_position
+        if checklist_task_id is not None:
+            self.checklist_task_id = checklist_task_id
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.message_id = data["message_id"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class MessageOrigin(Model):
+    """This object describes the origin of a message. It can be one of"""
+
+    __slots__ = ()
+
+
+class MessageOriginUser(MessageOrigin):
+    """The message was originally sent by a known user."""
+
+    __slots__ = (
+        "type",
+        "date",
+        "sender_user",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        date,
+        sender_user,
+    ):
+        self.type = type
+        self.date = date
+        self.sender_user = sender_user
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.date = data["date"]
+        self.sender_user = User.from_dict(data["sender_user"])
+        return self
+
+
+class MessageOriginHiddenUser(MessageOrigin):
+    """The message was originally sent by an unknown user."""
+
+    __slots__ = (
+        "type",
+        "date",
+        "sender_user_name",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        date,
+        sender_user_name,
+    ):
+        self.type = type
+        self.date = date
+        self.sender_user_name = sender_user_name
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.date = data["date"]
+        self.sender_user_name = data["sender_user_name"]
+        return self
+
+
+class MessageOriginChat(MessageOrigin):
+    """The message was originally sent on behalf of a chat to a group chat."""
+
+    __slots__ = (
+        "type",
+        "date",
+        "sender_chat",
+        "author_signature",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        date,
+        sender_chat,
+        author_signature=None,
+    ):
+        self.type = type
+        self.date = date
+        self.sender_chat = sender_chat
+        if author_signature is not None:
+            self.author_signature = author_signature
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.date = data["date"]
+        self.sender_chat = Chat.from_dict(data["sender_chat"])
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class MessageOriginChannel(MessageOrigin):
+    """The message was originally sent to a channel chat."""
+
+    __slots__ = (
+        "type",
+        "date",
+        "chat",
+        "message_id",
+        "author_signature",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        date,
+        chat,
+        message_id,
+        author_signature=None,
+    ):
+        self.type = type
+        self.date = date
+        self.chat = chat
+        self.message_id = message_id
+        if author_signature is not None:
+            self.author_signature = author_signature
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.date = data["date"]
+        self.chat = Chat.from_dict(data["chat"])
+        self.message_id = data["message_id"]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class PhotoSize(Model):
+    """This object represents one size of a photo or a file / sticker thumbnail."""
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "width",
+        "height",
+        "file_size",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        file_id,
+        file_unique_id,
+        width,
+        height,
+        file_size=None,
+    ):
+        self.file_id = file_id
+        self.file_unique_id = file_unique_id
+        self.width = width
+        self.height = height
+        if file_size is not None:
+            self.file_size = file_size
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.file_id = data["file_id"]
+        self.file_unique_id = data["file_unique_id"]
+        self.width = data["width"]
+        self.height = data["height"]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class Animation(Model):
+    """This object represents an animation file (GIF or H.264/MPEG-4 AVC video without sound)."""
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "width",
+        "height",
+        "duration",
+        "thumbnail",
+        "file_name",
+        "mime_type",
+        "file_size",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        file_id,
+        file_unique_id,
+        width,
+        height,
+        duration,
+        thumbnail=None,
+        file_name=None,
+        mime_type=None,
+        file_size=None,
+    ):
+        self.file_id = file_id
+        self.file_unique_id = file_unique_id
+        self.width = width
+        self.height = height
+        self.duration = duration
+        if thumbnail is not None:
+            self.thumbnail = thumbnail
+        if file_name is not None:
+            self.file_name = file_name
+        if mime_type is not None:
+            self.mime_type = mime_type
+        if file_size is not None:
+            self.file_size = file_size
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.file_id = data["file_id"]
+        self.file_unique_id = data["file_unique_id"]
+        self.width = data["width"]
+        self.height = data["height"]
+        self.duration = data["duration"]
+        if len(data) > 5:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class Audio(Model):
+    """This object represents an audio file to be treated as music by the Telegram clients."""
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "duration",
+        "performer",
+        "title",
+        "file_name",
+        "mime_type",
+        "file_size",
+        "thumbnail",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        file_id,
+        file_unique_id,
+        duration,
+        performer=None,
+        title=None,
+        file_name=None,
+        mime_type=None,
+        file_size=None,
+        thumbnail=None,
+    ):
+        self.file_id = file_id
+        self.file_unique_id = file_unique_id
+        self.duration = duration
+        if performer is not None:
+            self.performer = performer
+        if title is not None:
+            self.title = title
+        if file_name is not None:
+            self.file_name = file_name
+        if mime_type is not None:
+            self.mime_type = mime_type
+        if file_size is not None:
+            self.file_size = file_size
+        if thumbnail is not None:
+            self.thumbnail = thumbnail
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.file_id = data["file_id"]
+        self.file_unique_id = data["file_unique_id"]
+        self.duration = data["duration"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class Document(Model):
+    """This object represents a general file (as opposed to photos, voice messages and audio files)."""
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "thumbnail",
+        "file_name",
+        "mime_type",
+        "file_size",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        file_id,
+        file_unique_id,
+        thumbnail=None,
+        file_name=None,
+        mime_type=None,
+        file_size=None,
+    ):
+        self.file_id = file_id
+        self.file_unique_id = file_unique_id
+        if thumbnail is not None:
+            self.thumbnail = thumbnail
+        if file_name is not None:
+            self.file_name = file_name
+        if mime_type is not None:
+            self.mime_type = mime_type
+        if file_size is not None:
+            self.file_size = file_size
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.file_id = data["file_id"]
+        self.file_unique_id = data["file_unique_id"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class Story(Model):
+    """This object represents a story."""
+
+    __slots__ = (
+        "chat",
+        "id",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        chat,
+        id,
+    ):
+        self.chat = chat
+        self.id = id
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.chat = Chat.from_dict(data["chat"])
+        self.id = data["id"]
+        return self
+
+
+class Video(Model):
+    """This object represents a video file."""
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "width",
+        "height",
+        "duration",
+        "thumbnail",
+        "cover",
+        "start_timestamp",
+        "file_name",
+        "mime_type",
+        "file_size",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        file_id,
+        file_unique_id,
+        width,
+        height,
+        duration,
+        thumbnail=None,
+        cover=None,
+        start_timestamp=None,
+        file_name=None,
+        mime_type=None,
+        file_size=None,
+    ):
+        self.file_id = file_id
+        self.file_unique_id = file_unique_id
+        self.width = width
+        self.height = height
+        self.duration = duration
+        if thumbnail is not None:
+            self.thumbnail = thumbnail
+        if cover is not None:
+            self.cover = cover
+        if start_timestamp is not None:
+            self.start_timestamp = start_timestamp
+        if file_name is not None:
+            self.file_name = file_name
+        if mime_type is not None:
+            self.mime_type = mime_type
+        if file_size is not None:
+            self.file_size = file_size
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.file_id = data["file_id"]
+        self.file_unique_id = data["file_unique_id"]
+        self.width = data["width"]
+        self.height = data["height"]
+        self.duration = data["duration"]
+        if len(data) > 5:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class VideoNote(Model):
+    """This object represents a video message (available in Telegram apps as of v.4.0)."""
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "length",
+        "duration",
+        "thumbnail",
+        "file_size",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        file_id,
+        file_unique_id,
+        length,
+        duration,
+        thumbnail=None,
+        file_size=None,
+    ):
+        self.file_id = file_id
+        self.file_unique_id = file_unique_id
+        self.length = length
+        self.duration = duration
+        if thumbnail is not None:
+            self.thumbnail = thumbnail
+        if file_size is not None:
+            self.file_size = file_size
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.file_id = data["file_id"]
+        self.file_unique_id = data["file_unique_id"]
+        self.length = data["length"]
+        self.duration = data["duration"]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class Voice(Model):
+    """This object represents a voice note."""
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "duration",
+        "mime_type",
+        "file_size",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        file_id,
+        file_unique_id,
+        duration,
+        mime_type=None,
+        file_size=None,
+    ):
+        self.file_id = file_id
+        self.file_unique_id = file_unique_id
+        self.duration = duration
+        if mime_type is not None:
+            self.mime_type = mime_type
+        if file_size is not None:
+            self.file_size = file_size
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.file_id = data["file_id"]
+        self.file_unique_id = data["file_unique_id"]
+        self.duration = data["duration"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class PaidMediaInfo(Model):
+    """Describes the paid media added to a message."""
+
+    __slots__ = (
+        "star_count",
+        "paid_media",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        star_count,
+        paid_media,
+    ):
+        self.star_count = star_count
+        self.paid_media = paid_media
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.star_count = data["star_count"]
+        self.paid_media = [PaidMedia.from_dict(item) for item in data["paid_media"]]
+        return self
+
+
+class PaidMedia(Model):
+    """This object describes paid media. Currently, it can be one of"""
+
+    __slots__ = ()
+
+
+class PaidMediaPreview(PaidMedia):
+    """The paid media isn't available before the payment."""
+
+    __slots__ = (
+        "type",
+        "width",
+        "height",
+        "duration",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        width=None,
+        height=None,
+        duration=None,
+    ):
+        self.type = type
+        if width is not None:
+            self.width = width
+        if height is not None:
+            self.height = height
+        if duration is not None:
+            self.duration = duration
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class PaidMediaPhoto(PaidMedia):
+    """The paid media is a photo."""
+
+    __slots__ = (
+        "type",
+        "photo",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        photo,
+    ):
+        self.type = type
+        self.photo = photo
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.photo = [PhotoSize.from_dict(item) for item in data["photo"]]
+        return self
+
+
+class PaidMediaVideo(PaidMedia):
+    """The paid media is a video."""
+
+    __slots__ = (
+        "type",
+        "video",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        video,
+    ):
+        self.type = type
+        self.video = video
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.video = Video.from_dict(data["video"])
+        return self
+
+
+class Contact(Model):
+    """This object represents a phone contact."""
+
+    __slots__ = (
+        "phone_number",
+        "first_name",
+        "last_name",
+        "user_id",
+        "vcard",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        phone_number,
+        first_name,
+        last_name=None,
+        user_id=None,
+        vcard=None,
+    ):
+        self.phone_number = phone_number
+        self.first_name = first_name
+        if last_name is not None:
+            self.last_name = last_name
+        if user_id is not None:
+            self.user_id = user_id
+        if vcard is not None:
+            self.vcard = vcard
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.phone_number = data["phone_number"]
+        self.first_name = data["first_name"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class Dice(Model):
+    """This object represents an animated emoji that displays a random value."""
+
+    __slots__ = (
+        "emoji",
+        "value",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        emoji,
+        value,
+    ):
+        self.emoji = emoji
+        self.value = value
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.emoji = data["emoji"]
+        self.value = data["value"]
+        return self
+
+
+class PollOption(Model):
+    """This object contains information about one answer option in a poll."""
+
+    __slots__ = (
+        "text",
+        "text_entities",
+        "voter_count",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        text,
+        voter_count,
+        text_entities=None,
+    ):
+        self.text = text
+        self.voter_count = voter_count
+        if text_entities is not None:
+            self.text_entities = text_entities
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.text = data["text"]
+        self.voter_count = data["voter_count"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InputPollOption(Model):
+    """This object contains information about one answer option in a poll to be sent."""
+
+    __slots__ = (
+        "text",
+        "text_parse_mode",
+        "text_entities",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        text,
+        text_parse_mode=None,
+        text_entities=None,
+    ):
+        self.text = text
+        if text_parse_mode is not None:
+            self.text_parse_mode = text_parse_mode
+        if text_entities is not None:
+            self.text_entities = text_entities
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.text = data["text"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class PollAnswer(Model):
+    """This object represents an answer of a user in a non-anonymous poll."""
+
+    __slots__ = (
+        "poll_id",
+        "voter_chat",
+        "user",
+        "option_ids",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        poll_id,
+        option_ids,
+        voter_chat=None,
+        user=None,
+    ):
+        self.poll_id = poll_id
+        self.option_ids = option_ids
+        if voter_chat is not None:
+            self.voter_chat = voter_chat
+        if user is not None:
+            self.user = user
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.poll_id = data["poll_id"]
+        self.option_ids = data["option_ids"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class Poll(Model):
+    """This object contains information about a poll."""
+
+    __slots__ = (
+        "id",
+        "question",
+        "question_entities",
+        "options",
+        "total_voter_count",
+        "is_closed",
+        "is_anonymous",
+        "type",
+        "allows_multiple_answers",
+        "correct_option_id",
+        "explanation",
+        "explanation_entities",
+        "open_period",
+        "close_date",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        id,
+        question,
+        options,
+        total_voter_count,
+        is_closed,
+        is_anonymous,
+        type,
+        allows_multiple_answers,
+        question_entities=None,
+        correct_option_id=None,
+        explanation=None,
+        explanation_entities=None,
+        open_period=None,
+        close_date=None,
+    ):
+        self.id = id
+        self.question = question
+        self.options = options
+        self.total_voter_count = total_voter_count
+        self.is_closed = is_closed
+        self.is_anonymous = is_anonymous
+        self.type = type
+        self.allows_multiple_answers = allows_multiple_answers
+        if question_entities is not None:
+            self.question_entities = question_entities
+        if correct_option_id is not None:
+            self.correct_option_id = correct_option_id
+        if explanation is not None:
+            self.explanation = explanation
+        if explanation_entities is not None:
+            self.explanation_entities = explanation_entities
+        if open_period is not None:
+            self.open_period = open_period
+        if close_date is not None:
+            self.close_date = close_date
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.id = data["id"]
+        self.question = data["question"]
+        self.options = [PollOption.from_dict(item) for item in data["options"]]
+        self.total_voter_count = data["total_voter_count"]
+        self.is_closed = data["is_closed"]
+        self.is_anonymous = data["is_anonymous"]
+        self.type = data["type"]
+        self.allows_multiple_answers = data["allows_multiple_answers"]
+        if len(data) > 8:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ChecklistTask(Model):
+    """Describes a task in a checklist."""
+
+    __slots__ = (
+        "id",
+        "text",
+        "text_entities",
+        "completed_by_user",
+        "completion_date",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        id,
+        text,
+        text_entities=None,
+        completed_by_user=None,
+        completion_date=None,
+    ):
+        self.id = id
+        self.text = text
+        if text_entities is not None:
+            self.text_entities = text_entities
+        if completed_by_user is not None:
+            self.completed_by_user = completed_by_user
+        if completion_date is not None:
+            self.completion_date = completion_date
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.id = data["id"]
+        self.text = data["text"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class Checklist(Model):
+    """Describes a checklist."""
+
+    __slots__ = (
+        "title",
+        "title_entities",
+        "tasks",
+        "others_can_add_tasks",
+        "others_can_mark_tasks_as_done",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        title,
+        tasks,
+        title_entities=None,
+        others_can_add_tasks=None,
+        others_can_mark_tasks_as_done=None,
+    ):
+        self.title = title
+        self.tasks = tasks
+        if title_entities is not None:
+            self.title_entities = title_entities
+        if others_can_add_tasks is not None:
+            self.others_can_add_tasks = others_can_add_tasks
+        if others_can_mark_tasks_as_done is not None:
+            self.others_can_mark_tasks_as_done = others_can_mark_tasks_as_done
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.title = data["title"]
+        self.tasks = [ChecklistTask.from_dict(item) for item in data["tasks"]]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InputChecklistTask(Model):
+    """Describes a task to add to a checklist."""
+
+    __slots__ = (
+        "id",
+        "text",
+        "parse_mode",
+        "text_entities",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        id,
+        text,
+        parse_mode=None,
+        text_entities=None,
+    ):
+        self.id = id
+        self.text = text
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if text_entities is not None:
+            self.text_entities = text_entities
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.id = data["id"]
+        self.text = data["text"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InputChecklist(Model):
+    """Describes a checklist to create."""
+
+    __slots__ = (
+        "title",
+        "parse_mode",
+        "title_entities",
+        "tasks",
+        "others_can_add_tasks",
+        "others_can_mark_tasks_as_done",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        title,
+        tasks,
+        parse_mode=None,
+        title_entities=None,
+        others_can_add_tasks=None,
+        others_can_mark_tasks_as_done=None,
+    ):
+        self.title = title
+        self.tasks = tasks
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if title_entities is not None:
+            self.title_entities = title_entities
+        if others_can_add_tasks is not None:
+            self.others_can_add_tasks = others_can_add_tasks
+        if others_can_mark_tasks_as_done is not None:
+            self.others_can_mark_tasks_as_done = others_can_mark_tasks_as_done
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.title = data["title"]
+        self.tasks = [InputChecklistTask.from_dict(item) for item in data["tasks"]]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ChecklistTasksDone(Model):
+    """Describes a service message about checklist tasks marked as done or not done."""
+
+    __slots__ = (
+        "checklist_message",
+        "marked_as_done_task_ids",
+        "marked_as_not_done_task_ids",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        checklist_message=None,
+        marked_as_done_task_ids=None,
+        marked_as_not_done_task_ids=None,
+    ):
+        if checklist_message is not None:
+            self.checklist_message = checklist_message
+        if marked_as_done_task_ids is not None:
+            self.marked_as_done_task_ids = marked_as_done_task_ids
+        if marked_as_not_done_task_ids is not None:
+            self.marked_as_not_done_task_ids = marked_as_not_done_task_ids
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        if len(data) > 0:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ChecklistTasksAdded(Model):
+    """Describes a service message about tasks added to a checklist."""
+
+    __slots__ = (
+        "checklist_message",
+        "tasks",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        tasks,
+        checklist_message=None,
+    ):
+        self.tasks = tasks
+        if checklist_message is not None:
+            self.checklist_message = checklist_message
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.tasks = [ChecklistTask.from_dict(item) for item in data["tasks"]]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class Location(Model):
+    """This object represents a point on the map."""
+
+    __slots__ = (
+        "latitude",
+        "longitude",
+        "horizontal_accuracy",
+        "live_period",
+        "heading",
+        "proximity_alert_radius",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        latitude,
+        longitude,
+        horizontal_accuracy=None,
+        live_period=None,
+        heading=None,
+        proximity_alert_radius=None,
+    ):
+        self.latitude = latitude
+        self.longitude = longitude
+        if horizontal_accuracy is not None:
+            self.horizontal_accuracy = horizontal_accuracy
+        if live_period is not None:
+            self.live_period = live_period
+        if heading is not None:
+            self.heading = heading
+        if proximity_alert_radius is not None:
+            self.proximity_alert_radius = proximity_alert_radius
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.latitude = data["latitude"]
+        self.longitude = data["longitude"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class Venue(Model):
+    """This object represents a venue."""
+
+    __slots__ = (
+        "location",
+        "title",
+        "address",
+        "foursquare_id",
+        "foursquare_type",
+        "google_place_id",
+        "google_place_type",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        location,
+        title,
+        address,
+        foursquare_id=None,
+        foursquare_type=None,
+        google_place_id=None,
+        google_place_type=None,
+    ):
+        self.location = location
+        self.title = title
+        self.address = address
+        if foursquare_id is not None:
+            self.foursquare_id = foursquare_id
+        if foursquare_type is not None:
+            self.foursquare_type = foursquare_type
+        if google_place_id is not None:
+            self.google_place_id = google_place_id
+        if google_place_type is not None:
+            self.google_place_type = google_place_type
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.location = Location.from_dict(data["location"])
+        self.title = data["title"]
+        self.address = data["address"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class WebAppData(Model):
+    """Describes data sent from a Web App to the bot."""
+
+    __slots__ = (
+        "data",
+        "button_text",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        data,
+        button_text,
+    ):
+        self.data = data
+        self.button_text = button_text
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.data = data["data"]
+        self.button_text = data["button_text"]
+        return self
+
+
+class ProximityAlertTriggered(Model):
+    """This object represents the content of a service message, sent whenever a user in the chat triggers a proximity alert set by another user."""
+
+    __slots__ = (
+        "traveler",
+        "watcher",
+        "distance",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        traveler,
+        watcher,
+        distance,
+    ):
+        self.traveler = traveler
+        self.watcher = watcher
+        self.distance = distance
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.traveler = User.from_dict(data["traveler"])
+        self.watcher = User.from_dict(data["watcher"])
+        self.distance = data["distance"]
+        return self
+
+
+class MessageAutoDeleteTimerChanged(Model):
+    """This object represents a service message about a change in auto-delete timer settings."""
+
+    __slots__ = (
+        "message_auto_delete_time",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        message_auto_delete_time,
+    ):
+        self.message_auto_delete_time = message_auto_delete_time
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.message_auto_delete_time = data["message_auto_delete_time"]
+        return self
+
+
+class ChatBoostAdded(Model):
+    """This object represents a service message about a user boosting a chat."""
+
+    __slots__ = (
+        "boost_count",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        boost_count,
+    ):
+        self.boost_count = boost_count
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.boost_count = data["boost_count"]
+        return self
+
+
+class BackgroundFill(Model):
+    """This object describes the way a background is filled based on the selected colors. Currently, it can be one of"""
+
+    __slots__ = ()
+
+
+class BackgroundFillSolid(BackgroundFill):
+    """The background is filled using the selected color."""
+
+    __slots__ = (
+        "type",
+        "color",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        color,
+    ):
+        self.type = type
+        self.color = color
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.color = data["color"]
+        return self
+
+
+class BackgroundFillGradient(BackgroundFill):
+    """The background is a gradient fill."""
+
+    __slots__ = (
+        "type",
+        "top_color",
+        "bottom_color",
+        "rotation_angle",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        top_color,
+        bottom_color,
+        rotation_angle,
+    ):
+        self.type = type
+        self.top_color = top_color
+        self.bottom_color = bottom_color
+        self.rotation_angle = rotation_angle
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.top_color = data["top_color"]
+        self.bottom_color = data["bottom_color"]
+        self.rotation_angle = data["rotation_angle"]
+        return self
+
+
+class BackgroundFillFreeformGradient(BackgroundFill):
+    """The background is a freeform gradient that rotates after every message in the chat."""
+
+    __slots__ = (
+        "type",
+        "colors",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        colors,
+    ):
+        self.type = type
+        self.colors = colors
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.colors = data["colors"]
+        return self
+
+
+class BackgroundType(Model):
+    """This object describes the type of a background. Currently, it can be one of"""
+
+    __slots__ = ()
+
+
+class BackgroundTypeFill(BackgroundType):
+    """The background is automatically filled based on the selected colors."""
+
+    __slots__ = (
+        "type",
+        "fill",
+        "dark_theme_dimming",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        fill,
+        dark_theme_dimming,
+    ):
+        self.type = type
+        self.fill = fill
+        self.dark_theme_dimming = dark_theme_dimming
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.fill = BackgroundFill.from_dict(data["fill"])
+        self.dark_theme_dimming = data["dark_theme_dimming"]
+        return self
+
+
+class BackgroundTypeWallpaper(BackgroundType):
+    """The background is a wallpaper in the JPEG format."""
+
+    __slots__ = (
+        "type",
+        "document",
+        "dark_theme_dimming",
+        "is_blurred",
+        "is_moving",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        document,
+        dark_theme_dimming,
+        is_blurred=None,
+        is_moving=None,
+    ):
+        self.type = type
+        self.document = document
+        self.dark_theme_dimming = dark_theme_dimming
+        if is_blurred is not None:
+            self.is_blurred = is_blurred
+        if is_moving is not None:
+            self.is_moving = is_moving
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.document = Document.from_dict(data["document"])
+        self.dark_theme_dimming = data["dark_theme_dimming"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class BackgroundTypePattern(BackgroundType):
+    """The background is a .PNG or .TGV (gzipped subset of SVG with MIME type \"application/x-tgwallpattern\") pattern to be combined with the background fill chosen by the user."""
+
+    __slots__ = (
+        "type",
+        "document",
+        "fill",
+        "intensity",
+        "is_inverted",
+        "is_moving",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        document,
+        fill,
+        intensity,
+        is_inverted=None,
+        is_moving=None,
+    ):
+        self.type = type
+        self.document = document
+        self.fill = fill
+        self.intensity = intensity
+        if is_inverted is not None:
+            self.is_inverted = is_inverted
+        if is_moving is not None:
+            self.is_moving = is_moving
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.document = Document.from_dict(data["document"])
+        self.fill = BackgroundFill.from_dict(data["fill"])
+        self.intensity = data["intensity"]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class BackgroundTypeChatTheme(BackgroundType):
+    """The background is taken directly from a built-in chat theme."""
+
+    __slots__ = (
+        "type",
+        "theme_name",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        theme_name,
+    ):
+        self.type = type
+        self.theme_name = theme_name
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.theme_name = data["theme_name"]
+        return self
+
+
+class ChatBackground(Model):
+    """This object represents a chat background."""
+
+    __slots__ = (
+        "type",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+    ):
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = BackgroundType.from_dict(data["type"])
+        return self
+
+
+class ForumTopicCreated(Model):
+    """This object represents a service message about a new forum topic created in the chat."""
+
+    __slots__ = (
+        "name",
+        "icon_color",
+        "icon_custom_emoji_id",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        name,
+        icon_color,
+        icon_custom_emoji_id=None,
+    ):
+        self.name = name
+        self.icon_color = icon_color
+        if icon_custom_emoji_id is not None:
+            self.icon_custom_emoji_id = icon_custom_emoji_id
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.name = data["name"]
+        self.icon_color = data["icon_color"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ForumTopicClosed(Model):
+    """This object represents a service message about a forum topic closed in the chat. Currently holds no information."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data):
+        return _new(cls)
+
+
+class ForumTopicEdited(Model):
+    """This object represents a service message about an edited forum topic."""
+
+    __slots__ = (
+        "name",
+        "icon_custom_emoji_id",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        name=None,
+        icon_custom_emoji_id=None,
+    ):
+        if name is not None:
+            self.name = name
+        if icon_custom_emoji_id is not None:
+            self.icon_custom_emoji_id = icon_custom_emoji_id
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        if len(data) > 0:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ForumTopicReopened(Model):
+    """This object represents a service message about a forum topic reopened in the chat. Currently holds no information."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data):
+        return _new(cls)
+
+
+class GeneralForumTopicHidden(Model):
+    """This object represents a service message about General forum topic hidden in the chat. Currently holds no information."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data):
+        return _new(cls)
+
+
+class GeneralForumTopicUnhidden(Model):
+    """This object represents a service message about General forum topic unhidden in the chat. Currently holds no information."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data):
+        return _new(cls)
+
+
+class SharedUser(Model):
+    """This object contains information about a user that was shared with the bot using a KeyboardButtonRequestUsers button."""
+
+    __slots__ = (
+        "user_id",
+        "first_name",
+        "last_name",
+        "username",
+        "photo",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        user_id,
+        first_name=None,
+        last_name=None,
+        username=None,
+        photo=None,
+    ):
+        self.user_id = user_id
+        if first_name is not None:
+            self.first_name = first_name
+        if last_name is not None:
+            self.last_name = last_name
+        if username is not None:
+            self.username = username
+        if photo is not None:
+            self.photo = photo
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.user_id = data["user_id"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class UsersShared(Model):
+    """This object contains information about the users whose identifiers were shared with the bot using a KeyboardButtonRequestUsers button."""
+
+    __slots__ = (
+        "request_id",
+        "users",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        request_id,
+        users,
+    ):
+        self.request_id = request_id
+        self.users = users
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.request_id = data["request_id"]
+        self.users = [SharedUser.from_dict(item) for item in data["users"]]
+        return self
+
+
+class ChatShared(Model):
+    """This object contains information about a chat that was shared with the bot using a KeyboardButtonRequestChat button."""
+
+    __slots__ = (
+        "request_id",
+        "chat_id",
+        "title",
+        "username",
+        "photo",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        request_id,
+        chat_id,
+        title=None,
+        username=None,
+        photo=None,
+    ):
+        self.request_id = request_id
+        self.chat_id = chat_id
+        if title is not None:
+            self.title = title
+        if username is not None:
+            self.username = username
+        if photo is not None:
+            self.photo = photo
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.request_id = data["request_id"]
+        self.chat_id = data["chat_id"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class WriteAccessAllowed(Model):
+    """This object represents a service message about a user allowing a bot to write messages after adding it to the attachment menu, launching a Web App from a link, or accepting an explicit request from a Web App sent by the method requestWriteAccess."""
+
+    __slots__ = (
+        "from_request",
+        "web_app_name",
+        "from_attachment_menu",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        from_request=None,
+        web_app_name=None,
+        from_attachment_menu=None,
+    ):
+        if from_request is not None:
+            self.from_request = from_request
+        if web_app_name is not None:
+            self.web_app_name = web_app_name
+        if from_attachment_menu is not None:
+            self.from_attachment_menu = from_attachment_menu
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        if len(data) > 0:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class VideoChatScheduled(Model):
+    """This object represents a service message about a video chat scheduled in the chat."""
+
+    __slots__ = (
+        "start_date",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        start_date,
+    ):
+        self.start_date = start_date
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.start_date = data["start_date"]
+        return self
+
+
+class VideoChatStarted(Model):
+    """This object represents a service message about a video chat started in the chat. Currently holds no information."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data):
+        return _new(cls)
+
+
+class VideoChatEnded(Model):
+    """This object represents a service message about a video chat ended in the chat."""
+
+    __slots__ = (
+        "duration",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        duration,
+    ):
+        self.duration = duration
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.duration = data["duration"]
+        return self
+
+
+class VideoChatParticipantsInvited(Model):
+    """This object represents a service message about new members invited to a video chat."""
+
+    __slots__ = (
+        "users",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        users,
+    ):
+        self.users = users
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.users = [User.from_dict(item) for item in data["users"]]
+        return self
+
+
+class PaidMessagePriceChanged(Model):
+    """Describes a service message about a change in the price of paid messages within a chat."""
+
+    __slots__ = (
+        "paid_message_star_count",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        paid_message_star_count,
+    ):
+        self.paid_message_star_count = paid_message_star_count
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.paid_message_star_count = data["paid_message_star_count"]
+        return self
+
+
+class DirectMessagePriceChanged(Model):
+    """Describes a service message about a change in the price of direct messages sent to a channel chat."""
+
+    __slots__ = (
+        "are_direct_messages_enabled",
+        "direct_message_star_count",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        are_direct_messages_enabled,
+        direct_message_star_count=None,
+    ):
+        self.are_direct_messages_enabled = are_direct_messages_enabled
+        if direct_message_star_count is not None:
+            self.direct_message_star_count = direct_message_star_count
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.are_direct_messages_enabled = data["are_direct_messages_enabled"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class SuggestedPostApproved(Model):
+    """Describes a service message about the approval of a suggested post."""
+
+    __slots__ = (
+        "suggested_post_message",
+        "price",
+        "send_date",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        send_date,
+        suggested_post_message=None,
+        price=None,
+    ):
+        self.send_date = send_date
+        if suggested_post_message is not None:
+            self.suggested_post_message = suggested_post_message
+        if price is not None:
+            self.price = price
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.send_date = data["send_date"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class SuggestedPostApprovalFailed(Model):
+    """Describes a service message about the failed approval of a suggested post. Currently, only caused by insufficient user funds at the time of approval."""
+
+    __slots__ = (
+        "suggested_post_message",
+        "price",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        price,
+        suggested_post_message=None,
+    ):
+        self.price = price
+        if suggested_post_message is not None:
+            self.suggested_post_message = suggested_post_message
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.price = SuggestedPostPrice.from_dict(data["price"])
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class SuggestedPostDeclined(Model):
+    """Describes a service message about the rejection of a suggested post."""
+
+    __slots__ = (
+        "suggested_post_message",
+        "comment",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        suggested_post_message=None,
+        comment=None,
+    ):
+        if suggested_post_message is not None:
+            self.suggested_post_message = suggested_post_message
+        if comment is not None:
+            self.comment = comment
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        if len(data) > 0:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class SuggestedPostPaid(Model):
+    """Describes a service message about a successful payment for a suggested post."""
+
+    __slots__ = (
+        "suggested_post_message",
+        "currency",
+        "amount",
+        "star_amount",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        currency,
+        suggested_post_message=None,
+        amount=None,
+        star_amount=None,
+    ):
+        self.currency = currency
+        if suggested_post_message is not None:
+            self.suggested_post_message = suggested_post_message
+        if amount is not None:
+            self.amount = amount
+        if star_amount is not None:
+            self.star_amount = star_amount
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.currency = data["currency"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class SuggestedPostRefunded(Model):
+    """Describes a service message about a payment refund for a suggested post."""
+
+    __slots__ = (
+        "suggested_post_message",
+        "reason",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        reason,
+        suggested_post_message=None,
+    ):
+        self.reason = reason
+        if suggested_post_message is not None:
+            self.suggested_post_message = suggested_post_message
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.reason = data["reason"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class GiveawayCreated(Model):
+    """This object represents a service message about the creation of a scheduled giveaway."""
+
+    __slots__ = (
+        "prize_star_count",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        prize_star_count=None,
+    ):
+        if prize_star_count is not None:
+            self.prize_star_count = prize_star_count
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        if len(data) > 0:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class Giveaway(Model):
+    """This object represents a message about a scheduled giveaway."""
+
+    __slots__ = (
+        "chats",
+        "winners_selection_date",
+        "winner_count",
+        "only_new_members",
+        "has_public_winners",
+        "prize_description",
+        "country_codes",
+        "prize_star_count",
+        "premium_subscription_month_count",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        chats,
+        winners_selection_date,
+        winner_count,
+        only_new_members=None,
+        has_public_winners=None,
+        prize_description=None,
+        country_codes=None,
+        prize_star_count=None,
+        premium_subscription_month_count=None,
+    ):
+        self.chats = chats
+        self.winners_selection_date = winners_selection_date
+        self.winner_count = winner_count
+        if only_new_members is not None:
+            self.only_new_members = only_new_members
+        if has_public_winners is not None:
+            self.has_public_winners = has_public_winners
+        if prize_description is not None:
+            self.prize_description = prize_description
+        if country_codes is not None:
+            self.country_codes = country_codes
+        if prize_star_count is not None:
+            self.prize_star_count = prize_star_count
+        if premium_subscription_month_count is not None:
+            self.premium_subscription_month_count = premium_subscription_month_count
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.chats = [Chat.from_dict(item) for item in data["chats"]]
+        self.winners_selection_date = data["winners_selection_date"]
+        self.winner_count = data["winner_count"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class GiveawayWinners(Model):
+    """This object represents a message about the completion of a giveaway with public winners."""
+
+    __slots__ = (
+        "chat",
+        "giveaway_message_id",
+        "winners_selection_date",
+        "winner_count",
+        "winners",
+        "additional_chat_count",
+        "prize_star_count",
+        "premium_subscription_month_count",
+        "unclaimed_prize_count",
+        "only_new_members",
+        "was_refunded",
+        "prize_description",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        chat,
+        giveaway_message_id,
+        winners_selection_date,
+        winner_count,
+        winners,
+        additional_chat_count=None,
+        prize_star_count=None,
+        premium_subscription_month_count=None,
+        unclaimed_prize_count=None,
+        only_new_members=None,
+        was_refunded=None,
+        prize_description=None,
+    ):
+        self.chat = chat
+        self.giveaway_message_id = giveaway_message_id
+        self.winners_selection_date = winners_selection_date
+        self.winner_count = winner_count
+        self.winners = winners
+        if additional_chat_count is not None:
+            self.additional_chat_count = additional_chat_count
+        if prize_star_count is not None:
+            self.prize_star_count = prize_star_count
+        if premium_subscription_month_count is not None:
+            self.premium_subscription_month_count = premium_subscription_month_count
+        if unclaimed_prize_count is not None:
+            self.unclaimed_prize_count = unclaimed_prize_count
+        if only_new_members is not None:
+            self.only_new_members = only_new_members
+        if was_refunded is not None:
+            self.was_refunded = was_refunded
+        if prize_description is not None:
+            self.prize_description = prize_description
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.chat = Chat.from_dict(data["chat"])
+        self.giveaway_message_id = data["giveaway_message_id"]
+        self.winners_selection_date = data["winners_selection_date"]
+        self.winner_count = data["winner_count"]
+        self.winners = [User.from_dict(item) for item in data["winners"]]
+        if len(data) > 5:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class GiveawayCompleted(Model):
+    """This object represents a service message about the completion of a giveaway without public winners."""
+
+    __slots__ = (
+        "winner_count",
+        "unclaimed_prize_count",
+        "giveaway_message",
+        "is_star_giveaway",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        winner_count,
+        unclaimed_prize_count=None,
+        giveaway_message=None,
+        is_star_giveaway=None,
+    ):
+        self.winner_count = winner_count
+        if unclaimed_prize_count is not None:
+            self.unclaimed_prize_count = unclaimed_prize_count
+        if giveaway_message is not None:
+            self.giveaway_message = giveaway_message
+        if is_star_giveaway is not None:
+            self.is_star_giveaway = is_star_giveaway
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.winner_count = data["winner_count"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class LinkPreviewOptions(Model):
+    """Describes the options used for link preview generation."""
+
+    __slots__ = (
+        "is_disabled",
+        "url",
+        "prefer_small_media",
+        "prefer_large_media",
+        "show_above_text",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        is_disabled=None,
+        url=None,
+        prefer_small_media=None,
+        prefer_large_media=None,
+        show_above_text=None,
+    ):
+        if is_disabled is not None:
+            self.is_disabled = is_disabled
+        if url is not None:
+            self.url = url
+        if prefer_small_media is not None:
+            self.prefer_small_media = prefer_small_media
+        if prefer_large_media is not None:
+            self.prefer_large_media = prefer_large_media
+        if show_above_text is not None:
+            self.show_above_text = show_above_text
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        if len(data) > 0:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class SuggestedPostPrice(Model):
+    """Describes the price of a suggested post."""
+
+    __slots__ = (
+        "currency",
+        "amount",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        currency,
+        amount,
+    ):
+        self.currency = currency
+        self.amount = amount
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.currency = data["currency"]
+        self.amount = data["amount"]
+        return self
+
+
+class SuggestedPostInfo(Model):
+    """Contains information about a suggested post."""
+
+    __slots__ = (
+        "state",
+        "price",
+        "send_date",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        state,
+        price=None,
+        send_date=None,
+    ):
+        self.state = state
+        if price is not None:
+            self.price = price
+        if send_date is not None:
+            self.send_date = send_date
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.state = data["state"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class SuggestedPostParameters(Model):
+    """Contains parameters of a post that is being suggested by the bot."""
+
+    __slots__ = (
+        "price",
+        "send_date",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        price=None,
+        send_date=None,
+    ):
+        if price is not None:
+            self.price = price
+        if send_date is not None:
+            self.send_date = send_date
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        if len(data) > 0:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class DirectMessagesTopic(Model):
+    """Describes a topic of a direct messages chat."""
+
+    __slots__ = (
+        "topic_id",
+        "user",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        topic_id,
+        user=None,
+    ):
+        self.topic_id = topic_id
+        if user is not None:
+            self.user = user
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.topic_id = data["topic_id"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class UserProfilePhotos(Model):
+    """This object represent a user's profile pictures."""
+
+    __slots__ = (
+        "total_count",
+        "photos",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        total_count,
+        photos,
+    ):
+        self.total_count = total_count
+        self.photos = photos
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.total_count = data["total_count"]
+        self.photos = [[PhotoSize.from_dict(item1) for item1 in item] for item in data["photos"]]
+        return self
+
+
+class File(Model):
+    """This object represents a file ready to be downloaded. The file can be downloaded via the link https://api.telegram.org/file/bot<token>/<file_path>. It is guaranteed that the link will be valid for at least 1 hour. When the link expires, a new one can be requested by calling getFile."""
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "file_size",
+        "file_path",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        file_id,
+        file_unique_id,
+        file_size=None,
+        file_path=None,
+    ):
+        self.file_id = file_id
+        self.file_unique_id = file_unique_id
+        if file_size is not None:
+            self.file_size = file_size
+        if file_path is not None:
+            self.file_path = file_path
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.file_id = data["file_id"]
+        self.file_unique_id = data["file_unique_id"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class WebAppInfo(Model):
+    """Describes a Web App."""
+
+    __slots__ = (
+        "url",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        url,
+    ):
+        self.url = url
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.url = data["url"]
+        return self
+
+
+class ReplyKeyboardMarkup(Model):
+    """This object represents a custom keyboard with reply options (see Introduction to bots for details and examples). Not supported in channels and for messages sent on behalf of a Telegram Business account."""
+
+    __slots__ = (
+        "keyboard",
+        "is_persistent",
+        "resize_keyboard",
+        "one_time_keyboard",
+        "input_field_placeholder",
+        "selective",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        keyboard,
+        is_persistent=None,
+        resize_keyboard=None,
+        one_time_keyboard=None,
+        input_field_placeholder=None,
+        selective=None,
+    ):
+        self.keyboard = keyboard
+        if is_persistent is not None:
+            self.is_persistent = is_persistent
+        if resize_keyboard is not None:
+            self.resize_keyboard = resize_keyboard
+        if one_time_keyboard is not None:
+            self.one_time_keyboard = one_time_keyboard
+        if input_field_placeholder is not None:
+            self.input_field_placeholder = input_field_placeholder
+        if selective is not None:
+            self.selective = selective
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.keyboard = [[KeyboardButton.from_dict(item1) for item1 in item] for item in data["keyboard"]]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class KeyboardButton(Model):
+    """This object represents one button of the reply keyboard. At most one of the optional fields must be used to specify type of the button. For simple text buttons, String can be used instead of this object to specify the button text."""
+
+    __slots__ = (
+        "text",
+        "request_users",
+        "request_chat",
+        "request_contact",
+        "request_location",
+        "request_poll",
+        "web_app",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        text,
+        request_users=None,
+        request_chat=None,
+        request_contact=None,
+        request_location=None,
+        request_poll=None,
+        web_app=None,
+    ):
+        self.text = text
+        if request_users is not None:
+            self.request_users = request_users
+        if request_chat is not None:
+            self.request_chat = request_chat
+        if request_contact is not None:
+            self.request_contact = request_contact
+        if request_location is not None:
+            self.request_location = request_location
+        if request_poll is not None:
+            self.request_poll = request_poll
+        if web_app is not None:
+            self.web_app = web_app
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.text = data["text"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class KeyboardButtonRequestUsers(Model):
+    """This object defines the criteria used to request suitable users. Information about the selected users will be shared with the bot when the corresponding button is pressed. More about requesting users: https://core.telegram.org/bots/features#chat-and-user-selection"""
+
+    __slots__ = (
+        "request_id",
+        "user_is_bot",
+        "user_is_premium",
+        "max_quantity",
+        "request_name",
+        "request_username",
+        "request_photo",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        request_id,
+        user_is_bot=None,
+        user_is_premium=None,
+        max_quantity=None,
+        request_name=None,
+        request_username=None,
+        request_photo=None,
+    ):
+        self.request_id = request_id
+        if user_is_bot is not None:
+            self.user_is_bot = user_is_bot
+        if user_is_premium is not None:
+            self.user_is_premium = user_is_premium
+        if max_quantity is not None:
+            self.max_quantity = max_quantity
+        if request_name is not None:
+            self.request_name = request_name
+        if request_username is not None:
+            self.request_username = request_username
+        if request_photo is not None:
+            self.request_photo = request_photo
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.request_id = data["request_id"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class KeyboardButtonRequestChat(Model):
+    """This object defines the criteria used to request a suitable chat. Information about the selected chat will be shared with the bot when the corresponding button is pressed. The bot will be granted requested rights in the chat if appropriate. More about requesting chats: https://core.telegram.org/bots/features#chat-and-user-selection."""
+
+    __slots__ = (
+        "request_id",
+        "chat_is_channel",
+        "chat_is_forum",
+        "chat_has_username",
+        "chat_is_created",
+        "user_administrator_rights",
+        "bot_administrator_rights",
+        "bot_is_member",
+        "request_title",
+        "request_username",
+        "request_photo",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        request_id,
+        chat_is_channel,
+        chat_is_forum=None,
+        chat_has_username=None,
+        chat_is_created=None,
+        user_administrator_rights=None,
+        bot_administrator_rights=None,
+        bot_is_member=None,
+        request_title=None,
+        request_username=None,
+        request_photo=None,
+    ):
+        self.request_id = request_id
+        self.chat_is_channel = chat_is_channel
+        if chat_is_forum is not None:
+            self.chat_is_forum = chat_is_forum
+        if chat_has_username is not None:
+            self.chat_has_username = chat_has_username
+        if chat_is_created is not None:
+            self.chat_is_created = chat_is_created
+        if user_administrator_rights is not None:
+            self.user_administrator_rights = user_administrator_rights
+        if bot_administrator_rights is not None:
+            self.bot_administrator_rights = bot_administrator_rights
+        if bot_is_member is not None:
+            self.bot_is_member = bot_is_member
+        if request_title is not None:
+            self.request_title = request_title
+        if request_username is not None:
+            self.request_username = request_username
+        if request_photo is not None:
+            self.request_photo = request_photo
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.request_id = data["request_id"]
+        self.chat_is_channel = data["chat_is_channel"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class KeyboardButtonPollType(Model):
+    """This object represents type of a poll, which is allowed to be created and sent when the corresponding button is pressed."""
+
+    __slots__ = (
+        "type",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type=None,
+    ):
+        if type is not None:
+            self.type = type
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        if len(data) > 0:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ReplyKeyboardRemove(Model):
+    """Upon receiving a message with this object, Telegram clients will remove the current custom keyboard and display the default letter-keyboard. By default, custom keyboards are displayed until a new keyboard is sent by a bot. An exception is made for one-time keyboards that are hidden immediately after the user presses a button (see ReplyKeyboardMarkup). Not supported in channels and for messages sent on behalf of a Telegram Business account."""
+
+    __slots__ = (
+        "remove_keyboard",
+        "selective",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        remove_keyboard,
+        selective=None,
+    ):
+        self.remove_keyboard = remove_keyboard
+        if selective is not None:
+            self.selective = selective
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.remove_keyboard = data["remove_keyboard"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineKeyboardMarkup(Model):
+    """This object represents an inline keyboard that appears right next to the message it belongs to."""
+
+    __slots__ = (
+        "inline_keyboard",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        inline_keyboard,
+    ):
+        self.inline_keyboard = inline_keyboard
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.inline_keyboard = [[InlineKeyboardButton.from_dict(item1) for item1 in item] for item in data["inline_keyboard"]]
+        return self
+
+
+class InlineKeyboardButton(Model):
+    """This object represents one button of an inline keyboard. Exactly one of the optional fields must be used to specify type of the button."""
+
+    __slots__ = (
+        "text",
+        "url",
+        "callback_data",
+        "web_app",
+        "login_url",
+        "switch_inline_query",
+        "switch_inline_query_current_chat",
+        "switch_inline_query_chosen_chat",
+        "copy_text",
+        "callback_game",
+        "pay",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        text,
+        url=None,
+        callback_data=None,
+        web_app=None,
+        login_url=None,
+        switch_inline_query=None,
+        switch_inline_query_current_chat=None,
+        switch_inline_query_chosen_chat=None,
+        copy_text=None,
+        callback_game=None,
+        pay=None,
+    ):
+        self.text = text
+        if url is not None:
+            self.url = url
+        if callback_data is not None:
+            self.callback_data = callback_data
+        if web_app is not None:
+            self.web_app = web_app
+        if login_url is not None:
+            self.login_url = login_url
+        if switch_inline_query is not None:
+            self.switch_inline_query = switch_inline_query
+        if switch_inline_query_current_chat is not None:
+            self.switch_inline_query_current_chat = switch_inline_query_current_chat
+        if switch_inline_query_chosen_chat is not None:
+            self.switch_inline_query_chosen_chat = switch_inline_query_chosen_chat
+        if copy_text is not None:
+            self.copy_text = copy_text
+        if callback_game is not None:
+            self.callback_game = callback_game
+        if pay is not None:
+            self.pay = pay
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.text = data["text"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class LoginUrl(Model):
+    """This object represents a parameter of the inline keyboard button used to automatically authorize a user. Serves as a great replacement for the Telegram Login Widget when the user is coming from Telegram. All the user needs to do is tap/click a button and confirm that they want to log in:"""
+
+    __slots__ = (
+        "url",
+        "forward_text",
+        "bot_username",
+        "request_write_access",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        url,
+        forward_text=None,
+        bot_username=None,
+        request_write_access=None,
+    ):
+        self.url = url
+        if forward_text is not None:
+            self.forward_text = forward_text
+        if bot_username is not None:
+            self.bot_username = bot_username
+        if request_write_access is not None:
+            self.request_write_access = request_write_access
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.url = data["url"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class SwitchInlineQueryChosenChat(Model):
+    """This object represents an inline button that switches the current user to inline mode in a chosen chat, with an optional default inline query."""
+
+    __slots__ = (
+        "query",
+        "allow_user_chats",
+        "allow_bot_chats",
+        "allow_group_chats",
+        "allow_channel_chats",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        query=None,
+        allow_user_chats=None,
+        allow_bot_chats=None,
+        allow_group_chats=None,
+        allow_channel_chats=None,
+    ):
+        if query is not None:
+            self.query = query
+        if allow_user_chats is not None:
+            self.allow_user_chats = allow_user_chats
+        if allow_bot_chats is not None:
+            self.allow_bot_chats = allow_bot_chats
+        if allow_group_chats is not None:
+            self.allow_group_chats = allow_group_chats
+        if allow_channel_chats is not None:
+            self.allow_channel_chats = allow_channel_chats
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        if len(data) > 0:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class CopyTextButton(Model):
+    """This object represents an inline keyboard button that copies specified text to the clipboard."""
+
+    __slots__ = (
+        "text",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        text,
+    ):
+        self.text = text
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.text = data["text"]
+        return self
+
+
+class CallbackQuery(Model):
+    """This object represents an incoming callback query from a callback button in an inline keyboard. If the button that originated the query was attached to a message sent by the bot, the field message will be present. If the button was attached to a message sent via the bot (in inline mode), the field inline_message_id will be present. Exactly one of the fields data or game_short_name will be present."""
+
+    __slots__ = (
+        "id",
+        "from_",
+        "message",
+        "inline_message_id",
+        "chat_instance",
+        "data",
+        "game_short_name",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        id,
+        from_,
+        chat_instance,
+        message=None,
+        inline_message_id=None,
+        data=None,
+        game_short_name=None,
+    ):
+        self.id = id
+        self.from_ = from_
+        self.chat_instance = chat_instance
+        if message is not None:
+            self.message = message
+        if inline_message_id is not None:
+            self.inline_message_id = inline_message_id
+        if data is not None:
+            self.data = data
+        if game_short_name is not None:
+            self.game_short_name = game_short_name
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.id = data["id"]
+        self.from_ = User.from_dict(data["from"])
+        self.chat_instance = data["chat_instance"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ForceReply(Model):
+    """Upon receiving a message with this object, Telegram clients will display a reply interface to the user (act as if the user has selected the bot's message and tapped 'Reply'). This can be extremely useful if you want to create user-friendly step-by-step interfaces without having to sacrifice privacy mode. Not supported in channels and for messages sent on behalf of a Telegram Business account."""
+
+    __slots__ = (
+        "force_reply",
+        "input_field_placeholder",
+        "selective",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        force_reply,
+        input_field_placeholder=None,
+        selective=None,
+    ):
+        self.force_reply = force_reply
+        if input_field_placeholder is not None:
+            self.input_field_placeholder = input_field_placeholder
+        if selective is not None:
+            self.selective = selective
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.force_reply = data["force_reply"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ChatPhoto(Model):
+    """This object represents a chat photo."""
+
+    __slots__ = (
+        "small_file_id",
+        "small_file_unique_id",
+        "big_file_id",
+        "big_file_unique_id",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        small_file_id,
+        small_file_unique_id,
+        big_file_id,
+        big_file_unique_id,
+    ):
+        self.small_file_id = small_file_id
+        self.small_file_unique_id = small_file_unique_id
+        self.big_file_id = big_file_id
+        self.big_file_unique_id = big_file_unique_id
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.small_file_id = data["small_file_id"]
+        self.small_file_unique_id = data["small_file_unique_id"]
+        self.big_file_id = data["big_file_id"]
+        self.big_file_unique_id = data["big_file_unique_id"]
+        return self
+
+
+class ChatInviteLink(Model):
+    """Represents an invite link for a chat."""
+
+    __slots__ = (
+        "invite_link",
+        "creator",
+        "creates_join_request",
+        "is_primary",
+        "is_revoked",
+        "name",
+        "expire_date",
+        "member_limit",
+        "pending_join_request_count",
+        "subscription_period",
+        "subscription_price",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        invite_link,
+        creator,
+        creates_join_request,
+        is_primary,
+        is_revoked,
+        name=None,
+        expire_date=None,
+        member_limit=None,
+        pending_join_request_count=None,
+        subscription_period=None,
+        subscription_price=None,
+    ):
+        self.invite_link = invite_link
+        self.creator = creator
+        self.creates_join_request = creates_join_request
+        self.is_primary = is_primary
+        self.is_revoked = is_revoked
+        if name is not None:
+            self.name = name
+        if expire_date is not None:
+            self.expire_date = expire_date
+        if member_limit is not None:
+            self.member_limit = member_limit
+        if pending_join_request_count is not None:
+            self.pending_join_request_count = pending_join_request_count
+        if subscription_period is not None:
+            self.subscription_period = subscription_period
+        if subscription_price is not None:
+            self.subscription_price = subscription_price
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.invite_link = data["invite_link"]
+        self.creator = User.from_dict(data["creator"])
+        self.creates_join_request = data["creates_join_request"]
+        self.is_primary = data["is_primary"]
+        self.is_revoked = data["is_revoked"]
+        if len(data) > 5:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ChatAdministratorRights(Model):
+    """Represents the rights of an administrator in a chat."""
+
+    __slots__ = (
+        "is_anonymous",
+        "can_manage_chat",
+        "can_delete_messages",
+        "can_manage_video_chats",
+        "can_restrict_members",
+        "can_promote_members",
+        "can_change_info",
+        "can_invite_users",
+        "can_post_stories",
+        "can_edit_stories",
+        "can_delete_stories",
+        "can_post_messages",
+        "can_edit_messages",
+        "can_pin_messages",
+        "can_manage_topics",
+        "can_manage_direct_messages",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        is_anonymous,
+        can_manage_chat,
+        can_delete_messages,
+        can_manage_video_chats,
+        can_restrict_members,
+        can_promote_members,
+        can_change_info,
+        can_invite_users,
+        can_post_stories,
+        can_edit_stories,
+        can_delete_stories,
+        can_post_messages=None,
+        can_edit_messages=None,
+        can_pin_messages=None,
+        can_manage_topics=None,
+        can_manage_direct_messages=None,
+    ):
+        self.is_anonymous = is_anonymous
+        self.can_manage_chat = can_manage_chat
+        self.can_delete_messages = can_delete_messages
+        self.can_manage_video_chats = can_manage_video_chats
+        self.can_restrict_members = can_restrict_members
+        self.can_promote_members = can_promote_members
+        self.can_change_info = can_change_info
+        self.can_invite_users = can_invite_users
+        self.can_post_stories = can_post_stories
+        self.can_edit_stories = can_edit_stories
+        self.can_delete_stories = can_delete_stories
+        if can_post_messages is not None:
+            self.can_post_messages = can_post_messages
+        if can_edit_messages is not None:
+            self.can_edit_messages = can_edit_messages
+        if can_pin_messages is not None:
+            self.can_pin_messages = can_pin_messages
+        if can_manage_topics is not None:
+            self.can_manage_topics = can_manage_topics
+        if can_manage_direct_messages is not None:
+            self.can_manage_direct_messages = can_manage_direct_messages
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.is_anonymous = data["is_anonymous"]
+        self.can_manage_chat = data["can_manage_chat"]
+        self.can_delete_messages = data["can_delete_messages"]
+        self.can_manage_video_chats = data["can_manage_video_chats"]
+        self.can_restrict_members = data["can_restrict_members"]
+        self.can_promote_members = data["can_promote_members"]
+        self.can_change_info = data["can_change_info"]
+        self.can_invite_users = data["can_invite_users"]
+        self.can_post_stories = data["can_post_stories"]
+        self.can_edit_stories = data["can_edit_stories"]
+        self.can_delete_stories = data["can_delete_stories"]
+        if len(data) > 11:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ChatMemberUpdated(Model):
+    """This object represents changes in the status of a chat member."""
+
+    __slots__ = (
+        "chat",
+        "from_",
+        "date",
+        "old_chat_member",
+        "new_chat_member",
+        "invite_link",
+        "via_join_request",
+        "via_chat_folder_invite_link",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        chat,
+        from_,
+        date,
+        old_chat_member,
+        new_chat_member,
+        invite_link=None,
+        via_join_request=None,
+        via_chat_folder_invite_link=None,
+    ):
+        self.chat = chat
+        self.from_ = from_
+        self.date = date
+        self.old_chat_member = old_chat_member
+        self.new_chat_member = new_chat_member
+        if invite_link is not None:
+            self.invite_link = invite_link
+        if via_join_request is not None:
+            self.via_join_request = via_join_request
+        if via_chat_folder_invite_link is not None:
+            self.via_chat_folder_invite_link = via_chat_folder_invite_link
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.chat = Chat.from_dict(data["chat"])
+        self.from_ = User.from_dict(data["from"])
+        self.date = data["date"]
+        self.old_chat_member = ChatMember.from_dict(data["old_chat_member"])
+        self.new_chat_member = ChatMember.from_dict(data["new_chat_member"])
+        if len(data) > 5:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ChatMember(Model):
+    """This object contains information about one member of a chat. Currently, the following 6 types of chat members are supported:"""
+
+    __slots__ = ()
+
+
+class ChatMemberOwner(ChatMember):
+    """Represents a chat member that owns the chat and has all administrator privileges."""
+
+    __slots__ = (
+        "status",
+        "user",
+        "is_anonymous",
+        "custom_title",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        status,
+        user,
+        is_anonymous,
+        custom_title=None,
+    ):
+        self.status = status
+        self.user = user
+        self.is_anonymous = is_anonymous
+        if custom_title is not None:
+            self.custom_title = custom_title
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.status = data["status"]
+        self.user = User.from_dict(data["user"])
+        self.is_anonymous = data["is_anonymous"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ChatMemberAdministrator(ChatMember):
+    """Represents a chat member that has some additional privileges."""
+
+    __slots__ = (
+        "status",
+        "user",
+        "can_be_edited",
+        "is_anonymous",
+        "can_manage_chat",
+        "can_delete_messages",
+        "can_manage_video_chats",
+        "can_restrict_members",
+        "can_promote_members",
+        "can_change_info",
+        "can_invite_users",
+        "can_post_stories",
+        "can_edit_stories",
+        "can_delete_stories",
+        "can_post_messages",
+        "can_edit_messages",
+        "can_pin_messages",
+        "can_manage_topics",
+        "can_manage_direct_messages",
+        "custom_title",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        status,
+        user,
+        can_be_edited,
+        is_anonymous,
+        can_manage_chat,
+        can_delete_messages,
+        can_manage_video_chats,
+        can_restrict_members,
+        can_promote_members,
+        can_change_info,
+        can_invite_users,
+        can_post_stories,
+        can_edit_stories,
+        can_delete_stories,
+        can_post_messages=None,
+        can_edit_messages=None,
+        can_pin_messages=None,
+        can_manage_topics=None,
+        can_manage_direct_messages=None,
+        custom_title=None,
+    ):
+        self.status = status
+        self.user = user
+        self.can_be_edited = can_be_edited
+        self.is_anonymous = is_anonymous
+        self.can_manage_chat = can_manage_chat
+        self.can_delete_messages = can_delete_messages
+        self.can_manage_video_chats = can_manage_video_chats
+        self.can_restrict_members = can_restrict_members
+        self.can_promote_members = can_promote_members
+        self.can_change_info = can_change_info
+        self.can_invite_users = can_invite_users
+        self.can_post_stories = can_post_stories
+        self.can_edit_stories = can_edit_stories
+        self.can_delete_stories = can_delete_stories
+        if can_post_messages is not None:
+            self.can_post_messages = can_post_messages
+        if can_edit_messages is not None:
+            self.can_edit_messages = can_edit_messages
+        if can_pin_messages is not None:
+            self.can_pin_messages = can_pin_messages
+        if can_manage_topics is not None:
+            self.can_manage_topics = can_manage_topics
+        if can_manage_direct_messages is not None:
+            self.can_manage_direct_messages = can_manage_direct_messages
+        if custom_title is not None:
+            self.custom_title = custom_title
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.status = data["status"]
+        self.user = User.from_dict(data["user"])
+        self.can_be_edited = data["can_be_edited"]
+        self.is_anonymous = data["is_anonymous"]
+        self.can_manage_chat = data["can_manage_chat"]
+        self.can_delete_messages = data["can_delete_messages"]
+        self.can_manage_video_chats = data["can_manage_video_chats"]
+        self.can_restrict_members = data["can_restrict_members"]
+        self.can_promote_members = data["can_promote_members"]
+        self.can_change_info = data["can_change_info"]
+        self.can_invite_users = data["can_invite_users"]
+        self.can_post_stories = data["can_post_stories"]
+        self.can_edit_stories = data["can_edit_stories"]
+        self.can_delete_stories = data["can_delete_stories"]
+        if len(data) > 14:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ChatMemberMember(ChatMember):
+    """Represents a chat member that has no additional privileges or restrictions."""
+
+    __slots__ = (
+        "status",
+        "user",
+        "until_date",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        status,
+        user,
+        until_date=None,
+    ):
+        self.status = status
+        self.user = user
+        if until_date is not None:
+            self.until_date = until_date
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.status = data["status"]
+        self.user = User.from_dict(data["user"])
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ChatMemberRestricted(ChatMember):
+    """Represents a chat member that is under certain restrictions in the chat. Supergroups only."""
+
+    __slots__ = (
+        "status",
+        "user",
+        "is_member",
+        "can_send_messages",
+        "can_send_audios",
+        "can_send_documents",
+        "can_send_photos",
+        "can_send_videos",
+        "can_send_video_notes",
+        "can_send_voice_notes",
+        "can_send_polls",
+        "can_send_other_messages",
+        "can_add_web_page_previews",
+        "can_change_info",
+        "can_invite_users",
+        "can_pin_messages",
+        "can_manage_topics",
+        "until_date",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        status,
+        user,
+        is_member,
+        can_send_messages,
+        can_send_audios,
+        can_send_documents,
+        can_send_photos,
+        can_send_videos,
+        can_send_video_notes,
+        can_send_voice_notes,
+        can_send_polls,
+        can_send_other_messages,
+        can_add_web_page_previews,
+        can_change_info,
+        can_invite_users,
+        can_pin_messages,
+        can_manage_topics,
+        until_date,
+    ):
+        self.status = status
+        self.user = user
+        self.is_member = is_member
+        self.can_send_messages = can_send_messages
+        self.can_send_audios = can_send_audios
+        self.can_send_documents = can_send_documents
+        self.can_send_photos = can_send_photos
+        self.can_send_videos = can_send_videos
+        self.can_send_video_notes = can_send_video_notes
+        self.can_send_voice_notes = can_send_voice_notes
+        self.can_send_polls = can_send_polls
+        self.can_send_other_messages = can_send_other_messages
+        self.can_add_web_page_previews = can_add_web_page_previews
+        self.can_change_info = can_change_info
+        self.can_invite_users = can_invite_users
+        self.can_pin_messages = can_pin_messages
+        self.can_manage_topics = can_manage_topics
+        self.until_date = until_date
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.status = data["status"]
+        self.user = User.from_dict(data["user"])
+        self.is_member = data["is_member"]
+        self.can_send_messages = data["can_send_messages"]
+        self.can_send_audios = data["can_send_audios"]
+        self.can_send_documents = data["can_send_documents"]
+        self.can_send_photos = data["can_send_photos"]
+        self.can_send_videos = data["can_send_videos"]
+        self.can_send_video_notes = data["can_send_video_notes"]
+        self.can_send_voice_notes = data["can_send_voice_notes"]
+        self.can_send_polls = data["can_send_polls"]
+        self.can_send_other_messages = data["can_send_other_messages"]
+        self.can_add_web_page_previews = data["can_add_web_page_previews"]
+        self.can_change_info = data["can_change_info"]
+        self.can_invite_users = data["can_invite_users"]
+        self.can_pin_messages = data["can_pin_messages"]
+        self.can_manage_topics = data["can_manage_topics"]
+        self.until_date = data["until_date"]
+        return self
+
+
+class ChatMemberLeft(ChatMember):
+    """Represents a chat member that isn't currently a member of the chat, but may join it themselves."""
+
+    __slots__ = (
+        "status",
+        "user",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        status,
+        user,
+    ):
+        self.status = status
+        self.user = user
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.status = data["status"]
+        self.user = User.from_dict(data["user"])
+        return self
+
+
+class ChatMemberBanned(ChatMember):
+    """Represents a chat member that was banned in the chat and can't return to the chat or view chat messages."""
+
+    __slots__ = (
+        "status",
+        "user",
+        "until_date",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        status,
+        user,
+        until_date,
+    ):
+        self.status = status
+        self.user = user
+        self.until_date = until_date
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.status = data["status"]
+        self.user = User.from_dict(data["user"])
+        self.until_date = data["until_date"]
+        return self
+
+
+class ChatJoinRequest(Model):
+    """Represents a join request sent to a chat."""
+
+    __slots__ = (
+        "chat",
+        "from_",
+        "user_chat_id",
+        "date",
+        "bio",
+        "invite_link",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        chat,
+        from_,
+        user_chat_id,
+        date,
+        bio=None,
+        invite_link=None,
+    ):
+        self.chat = chat
+        self.from_ = from_
+        self.user_chat_id = user_chat_id
+        self.date = date
+        if bio is not None:
+            self.bio = bio
+        if invite_link is not None:
+            self.invite_link = invite_link
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.chat = Chat.from_dict(data["chat"])
+        self.from_ = User.from_dict(data["from"])
+        self.user_chat_id = data["user_chat_id"]
+        self.date = data["date"]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ChatPermissions(Model):
+    """Describes actions that a non-administrator user is allowed to take in a chat."""
+
+    __slots__ = (
+        "can_send_messages",
+        "can_send_audios",
+        "can_send_documents",
+        "can_send_photos",
+        "can_send_videos",
+        "can_send_video_notes",
+        "can_send_voice_notes",
+        "can_send_polls",
+        "can_send_other_messages",
+        "can_add_web_page_previews",
+        "can_change_info",
+        "can_invite_users",
+        "can_pin_messages",
+        "can_manage_topics",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        can_send_messages=None,
+        can_send_audios=None,
+        can_send_documents=None,
+        can_send_photos=None,
+        can_send_videos=None,
+        can_send_video_notes=None,
+        can_send_voice_notes=None,
+        can_send_polls=None,
+        can_send_other_messages=None,
+        can_add_web_page_previews=None,
+        can_change_info=None,
+        can_invite_users=None,
+        can_pin_messages=None,
+        can_manage_topics=None,
+    ):
+        if can_send_messages is not None:
+            self.can_send_messages = can_send_messages
+        if can_send_audios is not None:
+            self.can_send_audios = can_send_audios
+        if can_send_documents is not None:
+            self.can_send_documents = can_send_documents
+        if can_send_photos is not None:
+            self.can_send_photos = can_send_photos
+        if can_send_videos is not None:
+            self.can_send_videos = can_send_videos
+        if can_send_video_notes is not None:
+            self.can_send_video_notes = can_send_video_notes
+        if can_send_voice_notes is not None:
+            self.can_send_voice_notes = can_send_voice_notes
+        if can_send_polls is not None:
+            self.can_send_polls = can_send_polls
+        if can_send_other_messages is not None:
+            self.can_send_other_messages = can_send_other_messages
+        if can_add_web_page_previews is not None:
+            self.can_add_web_page_previews = can_add_web_page_previews
+        if can_change_info is not None:
+            self.can_change_info = can_change_info
+        if can_invite_users is not None:
+            self.can_invite_users = can_invite_users
+        if can_pin_messages is not None:
+            self.can_pin_messages = can_pin_messages
+        if can_manage_topics is not None:
+            self.can_manage_topics = can_manage_topics
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        if len(data) > 0:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class Birthdate(Model):
+    """Describes the birthdate of a user."""
+
+    __slots__ = (
+        "day",
+        "month",
+        "year",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        day,
+        month,
+        year=None,
+    ):
+        self.day = day
+        self.month = month
+        if year is not None:
+            self.year = year
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.day = data["day"]
+        self.month = data["month"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class BusinessIntro(Model):
+    """Contains information about the start page settings of a Telegram Business account."""
+
+    __slots__ = (
+        "title",
+        "message",
+        "sticker",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        title=None,
+        message=None,
+        sticker=None,
+    ):
+        if title is not None:
+            self.title = title
+        if message is not None:
+            self.message = message
+        if sticker is not None:
+            self.sticker = sticker
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        if len(data) > 0:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class BusinessLocation(Model):
+    """Contains information about the location of a Telegram Business account."""
+
+    __slots__ = (
+        "address",
+        "location",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        address,
+        location=None,
+    ):
+        self.address = address
+        if location is not None:
+            self.location = location
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.address = data["address"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class BusinessOpeningHoursInterval(Model):
+    """Describes an interval of time during which a business is open."""
+
+    __slots__ = (
+        "opening_minute",
+        "closing_minute",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        opening_minute,
+        closing_minute,
+    ):
+        self.opening_minute = opening_minute
+        self.closing_minute = closing_minute
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.opening_minute = data["opening_minute"]
+        self.closing_minute = data["closing_minute"]
+        return self
+
+
+class BusinessOpeningHours(Model):
+    """Describes the opening hours of a business."""
+
+    __slots__ = (
+        "time_zone_name",
+        "opening_hours",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        time_zone_name,
+        opening_hours,
+    ):
+        self.time_zone_name = time_zone_name
+        self.opening_hours = opening_hours
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.time_zone_name = data["time_zone_name"]
+        self.opening_hours = [BusinessOpeningHoursInterval.from_dict(item) for item in data["opening_hours"]]
+        return self
+
+
+class StoryAreaPosition(Model):
+    """Describes the position of a clickable area within a story."""
+
+    __slots__ = (
+        "x_percentage",
+        "y_percentage",
+        "width_percentage",
+        "height_percentage",
+        "rotation_angle",
+        "corner_radius_percentage",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        x_percentage,
+        y_percentage,
+        width_percentage,
+        height_percentage,
+        rotation_angle,
+        corner_radius_percentage,
+    ):
+        self.x_percentage = x_percentage
+        self.y_percentage = y_percentage
+        self.width_percentage = width_percentage
+        self.height_percentage = height_percentage
+        self.rotation_angle = rotation_angle
+        self.corner_radius_percentage = corner_radius_percentage
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.x_percentage = data["x_percentage"]
+        self.y_percentage = data["y_percentage"]
+        self.width_percentage = data["width_percentage"]
+        self.height_percentage = data["height_percentage"]
+        self.rotation_angle = data["rotation_angle"]
+        self.corner_radius_percentage = data["corner_radius_percentage"]
+        return self
+
+
+class LocationAddress(Model):
+    """Describes the physical address of a location."""
+
+    __slots__ = (
+        "country_code",
+        "state",
+        "city",
+        "street",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        country_code,
+        state=None,
+        city=None,
+        street=None,
+    ):
+        self.country_code = country_code
+        if state is not None:
+            self.state = state
+        if city is not None:
+            self.city = city
+        if street is not None:
+            self.street = street
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.country_code = data["country_code"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class StoryAreaType(Model):
+    """Describes the type of a clickable area on a story. Currently, it can be one of"""
+
+    __slots__ = ()
+
+
+class StoryAreaTypeLocation(StoryAreaType):
+    """Describes a story area pointing to a location. Currently, a story can have up to 10 location areas."""
+
+    __slots__ = (
+        "type",
+        "latitude",
+        "longitude",
+        "address",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        latitude,
+        longitude,
+        address=None,
+    ):
+        self.type = type
+        self.latitude = latitude
+        self.longitude = longitude
+        if address is not None:
+            self.address = address
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.latitude = data["latitude"]
+        self.longitude = data["longitude"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class StoryAreaTypeSuggestedReaction(StoryAreaType):
+    """Describes a story area pointing to a suggested reaction. Currently, a story can have up to 5 suggested reaction areas."""
+
+    __slots__ = (
+        "type",
+        "reaction_type",
+        "is_dark",
+        "is_flipped",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        reaction_type,
+        is_dark=None,
+        is_flipped=None,
+    ):
+        self.type = type
+        self.reaction_type = reaction_type
+        if is_dark is not None:
+            self.is_dark = is_dark
+        if is_flipped is not None:
+            self.is_flipped = is_flipped
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.reaction_type = ReactionType.from_dict(data["reaction_type"])
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class StoryAreaTypeLink(StoryAreaType):
+    """Describes a story area pointing to an HTTP or tg:// link. Currently, a story can have up to 3 link areas."""
+
+    __slots__ = (
+        "type",
+        "url",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        url,
+    ):
+        self.type = type
+        self.url = url
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.url = data["url"]
+        return self
+
+
+class StoryAreaTypeWeather(StoryAreaType):
+    """Describes a story area containing weather information. Currently, a story can have up to 3 weather areas."""
+
+    __slots__ = (
+        "type",
+        "temperature",
+        "emoji",
+        "background_color",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        temperature,
+        emoji,
+        background_color,
+    ):
+        self.type = type
+        self.temperature = temperature
+        self.emoji = emoji
+        self.background_color = background_color
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.temperature = data["temperature"]
+        self.emoji = data["emoji"]
+        self.background_color = data["background_color"]
+        return self
+
+
+class StoryAreaTypeUniqueGift(StoryAreaType):
+    """Describes a story area pointing to a unique gift. Currently, a story can have at most 1 unique gift area."""
+
+    __slots__ = (
+        "type",
+        "name",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        name,
+    ):
+        self.type = type
+        self.name = name
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.name = data["name"]
+        return self
+
+
+class StoryArea(Model):
+    """Describes a clickable area on a story media."""
+
+    __slots__ = (
+        "position",
+        "type",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        position,
+        type,
+    ):
+        self.position = position
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.position = StoryAreaPosition.from_dict(data["position"])
+        self.type = StoryAreaType.from_dict(data["type"])
+        return self
+
+
+class ChatLocation(Model):
+    """Represents a location to which a chat is connected."""
+
+    __slots__ = (
+        "location",
+        "address",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        location,
+        address,
+    ):
+        self.location = location
+        self.address = address
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.location = Location.from_dict(data["location"])
+        self.address = data["address"]
+        return self
+
+
+class ReactionType(Model):
+    """This object describes the type of a reaction. Currently, it can be one of"""
+
+    __slots__ = ()
+
+
+class ReactionTypeEmoji(ReactionType):
+    """The reaction is based on an emoji."""
+
+    __slots__ = (
+        "type",
+        "emoji",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        emoji,
+    ):
+        self.type = type
+        self.emoji = emoji
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.emoji = data["emoji"]
+        return self
+
+
+class ReactionTypeCustomEmoji(ReactionType):
+    """The reaction is based on a custom emoji."""
+
+    __slots__ = (
+        "type",
+        "custom_emoji_id",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        custom_emoji_id,
+    ):
+        self.type = type
+        self.custom_emoji_id = custom_emoji_id
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.custom_emoji_id = data["custom_emoji_id"]
+        return self
+
+
+class ReactionTypePaid(ReactionType):
+    """The reaction is paid."""
+
+    __slots__ = (
+        "type",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+    ):
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        return self
+
+
+class ReactionCount(Model):
+    """Represents a reaction added to a message along with the number of times it was added."""
+
+    __slots__ = (
+        "type",
+        "total_count",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        total_count,
+    ):
+        self.type = type
+        self.total_count = total_count
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = ReactionType.from_dict(data["type"])
+        self.total_count = data["total_count"]
+        return self
+
+
+class MessageReactionUpdated(Model):
+    """This object represents a change of a reaction on a message performed by a user."""
+
+    __slots__ = (
+        "chat",
+        "message_id",
+        "user",
+        "actor_chat",
+        "date",
+        "old_reaction",
+        "new_reaction",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        chat,
+        message_id,
+        date,
+        old_reaction,
+        new_reaction,
+        user=None,
+        actor_chat=None,
+    ):
+        self.chat = chat
+        self.message_id = message_id
+        self.date = date
+        self.old_reaction = old_reaction
+        self.new_reaction = new_reaction
+        if user is not None:
+            self.user = user
+        if actor_chat is not None:
+            self.actor_chat = actor_chat
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.chat = Chat.from_dict(data["chat"])
+        self.message_id = data["message_id"]
+        self.date = data["date"]
+        self.old_reaction = [ReactionType.from_dict(item) for item in data["old_reaction"]]
+        self.new_reaction = [ReactionType.from_dict(item) for item in data["new_reaction"]]
+        if len(data) > 5:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class MessageReactionCountUpdated(Model):
+    """This object represents reaction changes on a message with anonymous reactions."""
+
+    __slots__ = (
+        "chat",
+        "message_id",
+        "date",
+        "reactions",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        chat,
+        message_id,
+        date,
+        reactions,
+    ):
+        self.chat = chat
+        self.message_id = message_id
+        self.date = date
+        self.reactions = reactions
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.chat = Chat.from_dict(data["chat"])
+        self.message_id = data["message_id"]
+        self.date = data["date"]
+        self.reactions = [ReactionCount.from_dict(item) for item in data["reactions"]]
+        return self
+
+
+class ForumTopic(Model):
+    """This object represents a forum topic."""
+
+    __slots__ = (
+        "message_thread_id",
+        "name",
+        "icon_color",
+        "icon_custom_emoji_id",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        message_thread_id,
+        name,
+        icon_color,
+        icon_custom_emoji_id=None,
+    ):
+        self.message_thread_id = message_thread_id
+        self.name = name
+        self.icon_color = icon_color
+        if icon_custom_emoji_id is not None:
+            self.icon_custom_emoji_id = icon_custom_emoji_id
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.message_thread_id = data["message_thread_id"]
+        self.name = data["name"]
+        self.icon_color = data["icon_color"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class Gift(Model):
+    """This object represents a gift that can be sent by the bot."""
+
+    __slots__ = (
+        "id",
+        "sticker",
+        "star_count",
+        "upgrade_star_count",
+        "total_count",
+        "remaining_count",
+        "publisher_chat",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        id,
+        sticker,
+        star_count,
+        upgrade_star_count=None,
+        total_count=None,
+        remaining_count=None,
+        publisher_chat=None,
+    ):
+        self.id = id
+        self.sticker = sticker
+        self.star_count = star_count
+        if upgrade_star_count is not None:
+            self.upgrade_star_count = upgrade_star_count
+        if total_count is not None:
+            self.total_count = total_count
+        if remaining_count is not None:
+            self.remaining_count = remaining_count
+        if publisher_chat is not None:
+            self.publisher_chat = publisher_chat
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.id = data["id"]
+        self.sticker = Sticker.from_dict(data["sticker"])
+        self.star_count = data["star_count"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class Gifts(Model):
+    """This object represent a list of gifts."""
+
+    __slots__ = (
+        "gifts",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        gifts,
+    ):
+        self.gifts = gifts
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.gifts = [Gift.from_dict(item) for item in data["gifts"]]
+        return self
+
+
+class UniqueGiftModel(Model):
+    """This object describes the model of a unique gift."""
+
+    __slots__ = (
+        "name",
+        "sticker",
+        "rarity_per_mille",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        name,
+        sticker,
+        rarity_per_mille,
+    ):
+        self.name = name
+        self.sticker = sticker
+        self.rarity_per_mille = rarity_per_mille
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.name = data["name"]
+        self.sticker = Sticker.from_dict(data["sticker"])
+        self.rarity_per_mille = data["rarity_per_mille"]
+        return self
+
+
+class UniqueGiftSymbol(Model):
+    """This object describes the symbol shown on the pattern of a unique gift."""
+
+    __slots__ = (
+        "name",
+        "sticker",
+        "rarity_per_mille",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        name,
+        sticker,
+        rarity_per_mille,
+    ):
+        self.name = name
+        self.sticker = sticker
+        self.rarity_per_mille = rarity_per_mille
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.name = data["name"]
+        self.sticker = Sticker.from_dict(data["sticker"])
+        self.rarity_per_mille = data["rarity_per_mille"]
+        return self
+
+
+class UniqueGiftBackdropColors(Model):
+    """This object describes the colors of the backdrop of a unique gift."""
+
+    __slots__ = (
+        "center_color",
+        "edge_color",
+        "symbol_color",
+        "text_color",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        center_color,
+        edge_color,
+        symbol_color,
+        text_color,
+    ):
+        self.center_color = center_color
+        self.edge_color = edge_color
+        self.symbol_color = symbol_color
+        self.text_color = text_color
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.center_color = data["center_color"]
+        self.edge_color = data["edge_color"]
+        self.symbol_color = data["symbol_color"]
+        self.text_color = data["text_color"]
+        return self
+
+
+class UniqueGiftBackdrop(Model):
+    """This object describes the backdrop of a unique gift."""
+
+    __slots__ = (
+        "name",
+        "colors",
+        "rarity_per_mille",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        name,
+        colors,
+        rarity_per_mille,
+    ):
+        self.name = name
+        self.colors = colors
+        self.rarity_per_mille = rarity_per_mille
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.name = data["name"]
+        self.colors = UniqueGiftBackdropColors.from_dict(data["colors"])
+        self.rarity_per_mille = data["rarity_per_mille"]
+        return self
+
+
+class UniqueGift(Model):
+    """This object describes a unique gift that was upgraded from a regular gift."""
+
+    __slots__ = (
+        "base_name",
+        "name",
+        "number",
+        "model",
+        "symbol",
+        "backdrop",
+        "publisher_chat",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        base_name,
+        name,
+        number,
+        model,
+        symbol,
+        backdrop,
+        publisher_chat=None,
+    ):
+        self.base_name = base_name
+        self.name = name
+        self.number = number
+        self.model = model
+        self.symbol = symbol
+        self.backdrop = backdrop
+        if publisher_chat is not None:
+            self.publisher_chat = publisher_chat
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.base_name = data["base_name"]
+        self.name = data["name"]
+        self.number = data["number"]
+        self.model = UniqueGiftModel.from_dict(data["model"])
+        self.symbol = UniqueGiftSymbol.from_dict(data["symbol"])
+        self.backdrop = UniqueGiftBackdrop.from_dict(data["backdrop"])
+        if len(data) > 6:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class GiftInfo(Model):
+    """Describes a service message about a regular gift that was sent or received."""
+
+    __slots__ = (
+        "gift",
+        "owned_gift_id",
+        "convert_star_count",
+        "prepaid_upgrade_star_count",
+        "can_be_upgraded",
+        "text",
+        "entities",
+        "is_private",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        gift,
+        owned_gift_id=None,
+        convert_star_count=None,
+        prepaid_upgrade_star_count=None,
+        can_be_upgraded=None,
+        text=None,
+        entities=None,
+        is_private=None,
+    ):
+        self.gift = gift
+        if owned_gift_id is not None:
+            self.owned_gift_id = owned_gift_id
+        if convert_star_count is not None:
+            self.convert_star_count = convert_star_count
+        if prepaid_upgrade_star_count is not None:
+            self.prepaid_upgrade_star_count = prepaid_upgrade_star_count
+        if can_be_upgraded is not None:
+            self.can_be_upgraded = can_be_upgraded
+        if text is not None:
+            self.text = text
+        if entities is not None:
+            self.entities = entities
+        if is_private is not None:
+            self.is_private = is_private
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.gift = Gift.from_dict(data["gift"])
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class UniqueGiftInfo(Model):
+    """Describes a service message about a unique gift that was sent or received."""
+
+    __slots__ = (
+        "gift",
+        "origin",
+        "last_resale_star_count",
+        "owned_gift_id",
+        "transfer_star_count",
+        "next_transfer_date",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        gift,
+        origin,
+        last_resale_star_count=None,
+        owned_gift_id=None,
+        transfer_star_count=None,
+        next_transfer_date=None,
+    ):
+        self.gift = gift
+        self.origin = origin
+        if last_resale_star_count is not None:
+            self.last_resale_star_count = last_resale_star_count
+        if owned_gift_id is not None:
+            self.owned_gift_id = owned_gift_id
+        if transfer_star_count is not None:
+            self.transfer_star_count = transfer_star_count
+        if next_transfer_date is not None:
+            self.next_transfer_date = next_transfer_date
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.gift = UniqueGift.from_dict(data["gift"])
+        self.origin = data["origin"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class OwnedGift(Model):
+    """This object describes a gift received and owned by a user or a chat. Currently, it can be one of"""
+
+    __slots__ = ()
+
+
+class OwnedGiftRegular(OwnedGift):
+    """Describes a regular gift owned by a user or a chat."""
+
+    __slots__ = (
+        "type",
+        "gift",
+        "owned_gift_id",
+        "sender_user",
+        "send_date",
+        "text",
+        "entities",
+        "is_private",
+        "is_saved",
+        "can_be_upgraded",
+        "was_refunded",
+        "convert_star_count",
+        "prepaid_upgrade_star_count",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        gift,
+        send_date,
+        owned_gift_id=None,
+        sender_user=None,
+        text=None,
+        entities=None,
+        is_private=None,
+        is_saved=None,
+        can_be_upgraded=None,
+        was_refunded=None,
+        convert_star_count=None,
+        prepaid_upgrade_star_count=None,
+    ):
+        self.type = type
+        self.gift = gift
+        self.send_date = send_date
+        if owned_gift_id is not None:
+            self.owned_gift_id = owned_gift_id
+        if sender_user is not None:
+            self.sender_user = sender_user
+        if text is not None:
+            self.text = text
+        if entities is not None:
+            self.entities = entities
+        if is_private is not None:
+            self.is_private = is_private
+        if is_saved is not None:
+            self.is_saved = is_saved
+        if can_be_upgraded is not None:
+            self.can_be_upgraded = can_be_upgraded
+        if was_refunded is not None:
+            self.was_refunded = was_refunded
+        if convert_star_count is not None:
+            self.convert_star_count = convert_star_count
+        if prepaid_upgrade_star_count is not None:
+            self.prepaid_upgrade_star_count = prepaid_upgrade_star_count
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.gift = Gift.from_dict(data["gift"])
+        self.send_date = data["send_date"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class OwnedGiftUnique(OwnedGift):
+    """Describes a unique gift received and owned by a user or a chat."""
+
+    __slots__ = (
+        "type",
+        "gift",
+        "owned_gift_id",
+        "sender_user",
+        "send_date",
+        "is_saved",
+        "can_be_transferred",
+        "transfer_star_count",
+        "next_transfer_date",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        gift,
+        send_date,
+        owned_gift_id=None,
+        sender_user=None,
+        is_saved=None,
+        can_be_transferred=None,
+        transfer_star_count=None,
+        next_transfer_date=None,
+    ):
+        self.type = type
+        self.gift = gift
+        self.send_date = send_date
+        if owned_gift_id is not None:
+            self.owned_gift_id = owned_gift_id
+        if sender_user is not None:
+            self.sender_user = sender_user
+        if is_saved is not None:
+            self.is_saved = is_saved
+        if can_be_transferred is not None:
+            self.can_be_transferred = can_be_transferred
+        if transfer_star_count is not None:
+            self.transfer_star_count = transfer_star_count
+        if next_transfer_date is not None:
+            self.next_transfer_date = next_transfer_date
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.gift = UniqueGift.from_dict(data["gift"])
+        self.send_date = data["send_date"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class OwnedGifts(Model):
+    """Contains the list of gifts received and owned by a user or a chat."""
+
+    __slots__ = (
+        "total_count",
+        "gifts",
+        "next_offset",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        total_count,
+        gifts,
+        next_offset=None,
+    ):
+        self.total_count = total_count
+        self.gifts = gifts
+        if next_offset is not None:
+            self.next_offset = next_offset
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.total_count = data["total_count"]
+        self.gifts = [OwnedGift.from_dict(item) for item in data["gifts"]]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class AcceptedGiftTypes(Model):
+    """This object describes the types of gifts that can be gifted to a user or a chat."""
+
+    __slots__ = (
+        "unlimited_gifts",
+        "limited_gifts",
+        "unique_gifts",
+        "premium_subscription",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        unlimited_gifts,
+        limited_gifts,
+        unique_gifts,
+        premium_subscription,
+    ):
+        self.unlimited_gifts = unlimited_gifts
+        self.limited_gifts = limited_gifts
+        self.unique_gifts = unique_gifts
+        self.premium_subscription = premium_subscription
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.unlimited_gifts = data["unlimited_gifts"]
+        self.limited_gifts = data["limited_gifts"]
+        self.unique_gifts = data["unique_gifts"]
+        self.premium_subscription = data["premium_subscription"]
+        return self
+
+
+class StarAmount(Model):
+    """Describes an amount of Telegram Stars."""
+
+    __slots__ = (
+        "amount",
+        "nanostar_amount",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        amount,
+        nanostar_amount=None,
+    ):
+        self.amount = amount
+        if nanostar_amount is not None:
+            self.nanostar_amount = nanostar_amount
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.amount = data["amount"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class BotCommand(Model):
+    """This object represents a bot command."""
+
+    __slots__ = (
+        "command",
+        "description",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        command,
+        description,
+    ):
+        self.command = command
+        self.description = description
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.command = data["command"]
+        self.description = data["description"]
+        return self
+
+
+class BotCommandScope(Model):
+    """This object represents the scope to which bot commands are applied. Currently, the following 7 scopes are supported:"""
+
+    __slots__ = ()
+
+
+class BotCommandScopeDefault(BotCommandScope):
+    """Represents the default scope of bot commands. Default commands are used if no commands with a narrower scope are specified for the user."""
+
+    __slots__ = (
+        "type",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+    ):
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        return self
+
+
+class BotCommandScopeAllPrivateChats(BotCommandScope):
+    """Represents the scope of bot commands, covering all private chats."""
+
+    __slots__ = (
+        "type",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+    ):
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        return self
+
+
+class BotCommandScopeAllGroupChats(BotCommandScope):
+    """Represents the scope of bot commands, covering all group and supergroup chats."""
+
+    __slots__ = (
+        "type",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+    ):
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        return self
+
+
+class BotCommandScopeAllChatAdministrators(BotCommandScope):
+    """Represents the scope of bot commands, covering all group and supergroup chat administrators."""
+
+    __slots__ = (
+        "type",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+    ):
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        return self
+
+
+class BotCommandScopeChat(BotCommandScope):
+    """Represents the scope of bot commands, covering a specific chat."""
+
+    __slots__ = (
+        "type",
+        "chat_id",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        chat_id,
+    ):
+        self.type = type
+        self.chat_id = chat_id
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.chat_id = data["chat_id"]
+        return self
+
+
+class BotCommandScopeChatAdministrators(BotCommandScope):
+    """Represents the scope of bot commands, covering all administrators of a specific group or supergroup chat."""
+
+    __slots__ = (
+        "type",
+        "chat_id",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        chat_id,
+    ):
+        self.type = type
+        self.chat_id = chat_id
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.chat_id = data["chat_id"]
+        return self
+
+
+class BotCommandScopeChatMember(BotCommandScope):
+    """Represents the scope of bot commands, covering a specific member of a group or supergroup chat."""
+
+    __slots__ = (
+        "type",
+        "chat_id",
+        "user_id",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        chat_id,
+        user_id,
+    ):
+        self.type = type
+        self.chat_id = chat_id
+        self.user_id = user_id
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.chat_id = data["chat_id"]
+        self.user_id = data["user_id"]
+        return self
+
+
+class BotName(Model):
+    """This object represents the bot's name."""
+
+    __slots__ = (
+        "name",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        name,
+    ):
+        self.name = name
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.name = data["name"]
+        return self
+
+
+class BotDescription(Model):
+    """This object represents the bot's description."""
+
+    __slots__ = (
+        "description",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        description,
+    ):
+        self.description = description
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.description = data["description"]
+        return self
+
+
+class BotShortDescription(Model):
+    """This object represents the bot's short description."""
+
+    __slots__ = (
+        "short_description",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        short_description,
+    ):
+        self.short_description = short_description
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.short_description = data["short_description"]
+        return self
+
+
+class MenuButton(Model):
+    """This object describes the bot's menu button in a private chat. It should be one of"""
+
+    __slots__ = ()
+
+
+class MenuButtonCommands(MenuButton):
+    """Represents a menu button, which opens the bot's list of commands."""
+
+    __slots__ = (
+        "type",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+    ):
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        return self
+
+
+class MenuButtonWebApp(MenuButton):
+    """Represents a menu button, which launches a Web App."""
+
+    __slots__ = (
+        "type",
+        "text",
+        "web_app",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        text,
+        web_app,
+    ):
+        self.type = type
+        self.text = text
+        self.web_app = web_app
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.text = data["text"]
+        self.web_app = WebAppInfo.from_dict(data["web_app"])
+        return self
+
+
+class MenuButtonDefault(MenuButton):
+    """Describes that no specific value for the menu button was set."""
+
+    __slots__ = (
+        "type",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+    ):
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        return self
+
+
+class ChatBoostSource(Model):
+    """This object describes the source of a chat boost. It can be one of"""
+
+    __slots__ = ()
+
+
+class ChatBoostSourcePremium(ChatBoostSource):
+    """The boost was obtained by subscribing to Telegram Premium or by gifting a Telegram Premium subscription to another user."""
+
+    __slots__ = (
+        "source",
+        "user",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        source,
+        user,
+    ):
+        self.source = source
+        self.user = user
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.source = data["source"]
+        self.user = User.from_dict(data["user"])
+        return self
+
+
+class ChatBoostSourceGiftCode(ChatBoostSource):
+    """The boost was obtained by the creation of Telegram Premium gift codes to boost a chat. Each such code boosts the chat 4 times for the duration of the corresponding Telegram Premium subscription."""
+
+    __slots__ = (
+        "source",
+        "user",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        source,
+        user,
+    ):
+        self.source = source
+        self.user = user
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.source = data["source"]
+        self.user = User.from_dict(data["user"])
+        return self
+
+
+class ChatBoostSourceGiveaway(ChatBoostSource):
+    """The boost was obtained by the creation of a Telegram Premium or a Telegram Star giveaway. This boosts the chat 4 times for the duration of the corresponding Telegram Premium subscription for Telegram Premium giveaways and prize_star_count / 500 times for one year for Telegram Star giveaways."""
+
+    __slots__ = (
+        "source",
+        "giveaway_message_id",
+        "user",
+        "prize_star_count",
+        "is_unclaimed",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        source,
+        giveaway_message_id,
+        user=None,
+        prize_star_count=None,
+        is_unclaimed=None,
+    ):
+        self.source = source
+        self.giveaway_message_id = giveaway_message_id
+        if user is not None:
+            self.user = user
+        if prize_star_count is not None:
+            self.prize_star_count = prize_star_count
+        if is_unclaimed is not None:
+            self.is_unclaimed = is_unclaimed
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.source = data["source"]
+        self.giveaway_message_id = data["giveaway_message_id"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ChatBoost(Model):
+    """This object contains information about a chat boost."""
+
+    __slots__ = (
+        "boost_id",
+        "add_date",
+        "expiration_date",
+        "source",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        boost_id,
+        add_date,
+        expiration_date,
+        source,
+    ):
+        self.boost_id = boost_id
+        self.add_date = add_date
+        self.expiration_date = expiration_date
+        self.source = source
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.boost_id = data["boost_id"]
+        self.add_date = data["add_date"]
+        self.expiration_date = data["expiration_date"]
+        self.source = ChatBoostSource.from_dict(data["source"])
+        return self
+
+
+class ChatBoostUpdated(Model):
+    """This object represents a boost added to a chat or changed."""
+
+    __slots__ = (
+        "chat",
+        "boost",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        chat,
+        boost,
+    ):
+        self.chat = chat
+        self.boost = boost
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.chat = Chat.from_dict(data["chat"])
+        self.boost = ChatBoost.from_dict(data["boost"])
+        return self
+
+
+class ChatBoostRemoved(Model):
+    """This object represents a boost removed from a chat."""
+
+    __slots__ = (
+        "chat",
+        "boost_id",
+        "remove_date",
+        "source",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        chat,
+        boost_id,
+        remove_date,
+        source,
+    ):
+        self.chat = chat
+        self.boost_id = boost_id
+        self.remove_date = remove_date
+        self.source = source
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.chat = Chat.from_dict(data["chat"])
+        self.boost_id = data["boost_id"]
+        self.remove_date = data["remove_date"]
+        self.source = ChatBoostSource.from_dict(data["source"])
+        return self
+
+
+class UserChatBoosts(Model):
+    """This object represents a list of boosts added to a chat by a user."""
+
+    __slots__ = (
+        "boosts",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        boosts,
+    ):
+        self.boosts = boosts
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.boosts = [ChatBoost.from_dict(item) for item in data["boosts"]]
+        return self
+
+
+class BusinessBotRights(Model):
+    """Represents the rights of a business bot."""
+
+    __slots__ = (
+        "can_reply",
+        "can_read_messages",
+        "can_delete_sent_messages",
+        "can_delete_all_messages",
+        "can_edit_name",
+        "can_edit_bio",
+        "can_edit_profile_photo",
+        "can_edit_username",
+        "can_change_gift_settings",
+        "can_view_gifts_and_stars",
+        "can_convert_gifts_to_stars",
+        "can_transfer_and_upgrade_gifts",
+        "can_transfer_stars",
+        "can_manage_stories",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        can_reply=None,
+        can_read_messages=None,
+        can_delete_sent_messages=None,
+        can_delete_all_messages=None,
+        can_edit_name=None,
+        can_edit_bio=None,
+        can_edit_profile_photo=None,
+        can_edit_username=None,
+        can_change_gift_settings=None,
+        can_view_gifts_and_stars=None,
+        can_convert_gifts_to_stars=None,
+        can_transfer_and_upgrade_gifts=None,
+        can_transfer_stars=None,
+        can_manage_stories=None,
+    ):
+        if can_reply is not None:
+            self.can_reply = can_reply
+        if can_read_messages is not None:
+            self.can_read_messages = can_read_messages
+        if can_delete_sent_messages is not None:
+            self.can_delete_sent_messages = can_delete_sent_messages
+        if can_delete_all_messages is not None:
+            self.can_delete_all_messages = can_delete_all_messages
+        if can_edit_name is not None:
+            self.can_edit_name = can_edit_name
+        if can_edit_bio is not None:
+            self.can_edit_bio = can_edit_bio
+        if can_edit_profile_photo is not None:
+            self.can_edit_profile_photo = can_edit_profile_photo
+        if can_edit_username is not None:
+            self.can_edit_username = can_edit_username
+        if can_change_gift_settings is not None:
+            self.can_change_gift_settings = can_change_gift_settings
+        if can_view_gifts_and_stars is not None:
+            self.can_view_gifts_and_stars = can_view_gifts_and_stars
+        if can_convert_gifts_to_stars is not None:
+            self.can_convert_gifts_to_stars = can_convert_gifts_to_stars
+        if can_transfer_and_upgrade_gifts is not None:
+            self.can_transfer_and_upgrade_gifts = can_transfer_and_upgrade_gifts
+        if can_transfer_stars is not None:
+            self.can_transfer_stars = can_transfer_stars
+        if can_manage_stories is not None:
+            self.can_manage_stories = can_manage_stories
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        if len(data) > 0:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class BusinessConnection(Model):
+    """Describes the connection of the bot with a business account."""
+
+    __slots__ = (
+        "id",
+        "user",
+        "user_chat_id",
+        "date",
+        "rights",
+        "is_enabled",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        id,
+        user,
+        user_chat_id,
+        date,
+        is_enabled,
+        rights=None,
+    ):
+        self.id = id
+        self.user = user
+        self.user_chat_id = user_chat_id
+        self.date = date
+        self.is_enabled = is_enabled
+        if rights is not None:
+            self.rights = rights
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.id = data["id"]
+        self.user = User.from_dict(data["user"])
+        self.user_chat_id = data["user_chat_id"]
+        self.date = data["date"]
+        self.is_enabled = data["is_enabled"]
+        if len(data) > 5:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class BusinessMessagesDeleted(Model):
+    """This object is received when messages are deleted from a connected business account."""
+
+    __slots__ = (
+        "business_connection_id",
+        "chat",
+        "message_ids",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        business_connection_id,
+        chat,
+        message_ids,
+    ):
+        self.business_connection_id = business_connection_id
+        self.chat = chat
+        self.message_ids = message_ids
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.business_connection_id = data["business_connection_id"]
+        self.chat = Chat.from_dict(data["chat"])
+        self.message_ids = data["message_ids"]
+        return self
+
+
+class ResponseParameters(Model):
+    """Describes why a request was unsuccessful."""
+
+    __slots__ = (
+        "migrate_to_chat_id",
+        "retry_after",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        migrate_to_chat_id=None,
+        retry_after=None,
+    ):
+        if migrate_to_chat_id is not None:
+            self.migrate_to_chat_id = migrate_to_chat_id
+        if retry_after is not None:
+            self.retry_after = retry_after
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        if len(data) > 0:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InputMedia(Model):
+    """This object represents the content of a media message to be sent. It should be one of"""
+
+    __slots__ = ()
+
+
+class InputMediaPhoto(InputMedia):
+    """Represents a photo to be sent."""
+
+    __slots__ = (
+        "type",
+        "media",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "show_caption_above_media",
+        "has_spoiler",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        media,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        show_caption_above_media=None,
+        has_spoiler=None,
+    ):
+        self.type = type
+        self.media = media
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if show_caption_above_media is not None:
+            self.show_caption_above_media = show_caption_above_media
+        if has_spoiler is not None:
+            self.has_spoiler = has_spoiler
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.media = data["media"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InputMediaVideo(InputMedia):
+    """Represents a video to be sent."""
+
+    __slots__ = (
+        "type",
+        "media",
+        "thumbnail",
+        "cover",
+        "start_timestamp",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "show_caption_above_media",
+        "width",
+        "height",
+        "duration",
+        "supports_streaming",
+        "has_spoiler",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        media,
+        thumbnail=None,
+        cover=None,
+        start_timestamp=None,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        show_caption_above_media=None,
+        width=None,
+        height=None,
+        duration=None,
+        supports_streaming=None,
+        has_spoiler=None,
+    ):
+        self.type = type
+        self.media = media
+        if thumbnail is not None:
+            self.thumbnail = thumbnail
+        if cover is not None:
+            self.cover = cover
+        if start_timestamp is not None:
+            self.start_timestamp = start_timestamp
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if show_caption_above_media is not None:
+            self.show_caption_above_media = show_caption_above_media
+        if width is not None:
+            self.width = width
+        if height is not None:
+            self.height = height
+        if duration is not None:
+            self.duration = duration
+        if supports_streaming is not None:
+            self.supports_streaming = supports_streaming
+        if has_spoiler is not None:
+            self.has_spoiler = has_spoiler
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.media = data["media"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InputMediaAnimation(InputMedia):
+    """Represents an animation file (GIF or H.264/MPEG-4 AVC video without sound) to be sent."""
+
+    __slots__ = (
+        "type",
+        "media",
+        "thumbnail",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "show_caption_above_media",
+        "width",
+        "height",
+        "duration",
+        "has_spoiler",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        media,
+        thumbnail=None,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        show_caption_above_media=None,
+        width=None,
+        height=None,
+        duration=None,
+        has_spoiler=None,
+    ):
+        self.type = type
+        self.media = media
+        if thumbnail is not None:
+            self.thumbnail = thumbnail
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if show_caption_above_media is not None:
+            self.show_caption_above_media = show_caption_above_media
+        if width is not None:
+            self.width = width
+        if height is not None:
+            self.height = height
+        if duration is not None:
+            self.duration = duration
+        if has_spoiler is not None:
+            self.has_spoiler = has_spoiler
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.media = data["media"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InputMediaAudio(InputMedia):
+    """Represents an audio file to be treated as music to be sent."""
+
+    __slots__ = (
+        "type",
+        "media",
+        "thumbnail",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "duration",
+        "performer",
+        "title",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        media,
+        thumbnail=None,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        duration=None,
+        performer=None,
+        title=None,
+    ):
+        self.type = type
+        self.media = media
+        if thumbnail is not None:
+            self.thumbnail = thumbnail
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if duration is not None:
+            self.duration = duration
+        if performer is not None:
+            self.performer = performer
+        if title is not None:
+            self.title = title
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.media = data["media"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InputMediaDocument(InputMedia):
+    """Represents a general file to be sent."""
+
+    __slots__ = (
+        "type",
+        "media",
+        "thumbnail",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "disable_content_type_detection",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        media,
+        thumbnail=None,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        disable_content_type_detection=None,
+    ):
+        self.type = type
+        self.media = media
+        if thumbnail is not None:
+            self.thumbnail = thumbnail
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if disable_content_type_detection is not None:
+            self.disable_content_type_detection = disable_content_type_detection
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.media = data["media"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InputFile(Model):
+    """This object represents the contents of a file to be uploaded. Must be posted using multipart/form-data in the usual way that files are uploaded via the browser."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data):
+        return _new(cls)
+
+
+class InputPaidMedia(Model):
+    """This object describes the paid media to be sent. Currently, it can be one of"""
+
+    __slots__ = ()
+
+
+class InputPaidMediaPhoto(InputPaidMedia):
+    """The paid media to send is a photo."""
+
+    __slots__ = (
+        "type",
+        "media",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        media,
+    ):
+        self.type = type
+        self.media = media
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.media = data["media"]
+        return self
+
+
+class InputPaidMediaVideo(InputPaidMedia):
+    """The paid media to send is a video."""
+
+    __slots__ = (
+        "type",
+        "media",
+        "thumbnail",
+        "cover",
+        "start_timestamp",
+        "width",
+        "height",
+        "duration",
+        "supports_streaming",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        media,
+        thumbnail=None,
+        cover=None,
+        start_timestamp=None,
+        width=None,
+        height=None,
+        duration=None,
+        supports_streaming=None,
+    ):
+        self.type = type
+        self.media = media
+        if thumbnail is not None:
+            self.thumbnail = thumbnail
+        if cover is not None:
+            self.cover = cover
+        if start_timestamp is not None:
+            self.start_timestamp = start_timestamp
+        if width is not None:
+            self.width = width
+        if height is not None:
+            self.height = height
+        if duration is not None:
+            self.duration = duration
+        if supports_streaming is not None:
+            self.supports_streaming = supports_streaming
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.media = data["media"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InputProfilePhoto(Model):
+    """This object describes a profile photo to set. Currently, it can be one of"""
+
+    __slots__ = ()
+
+
+class InputProfilePhotoStatic(InputProfilePhoto):
+    """A static profile photo in the .JPG format."""
+
+    __slots__ = (
+        "type",
+        "photo",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        photo,
+    ):
+        self.type = type
+        self.photo = photo
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.photo = data["photo"]
+        return self
+
+
+class InputProfilePhotoAnimated(InputProfilePhoto):
+    """An animated profile photo in the MPEG4 format."""
+
+    __slots__ = (
+        "type",
+        "animation",
+        "main_frame_timestamp",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        animation,
+        main_frame_timestamp=None,
+    ):
+        self.type = type
+        self.animation = animation
+        if main_frame_timestamp is not None:
+            self.main_frame_timestamp = main_frame_timestamp
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.animation = data["animation"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InputStoryContent(Model):
+    """This object describes the content of a story to post. Currently, it can be one of"""
+
+    __slots__ = ()
+
+
+class InputStoryContentPhoto(InputStoryContent):
+    """Describes a photo to post as a story."""
+
+    __slots__ = (
+        "type",
+        "photo",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        photo,
+    ):
+        self.type = type
+        self.photo = photo
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.photo = data["photo"]
+        return self
+
+
+class InputStoryContentVideo(InputStoryContent):
+    """Describes a video to post as a story."""
+
+    __slots__ = (
+        "type",
+        "video",
+        "duration",
+        "cover_frame_timestamp",
+        "is_animation",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        video,
+        duration=None,
+        cover_frame_timestamp=None,
+        is_animation=None,
+    ):
+        self.type = type
+        self.video = video
+        if duration is not None:
+            self.duration = duration
+        if cover_frame_timestamp is not None:
+            self.cover_frame_timestamp = cover_frame_timestamp
+        if is_animation is not None:
+            self.is_animation = is_animation
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.video = data["video"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class Sticker(Model):
+    """This object represents a sticker."""
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "type",
+        "width",
+        "height",
+        "is_animated",
+        "is_video",
+        "thumbnail",
+        "emoji",
+        "set_name",
+        "premium_animation",
+        "mask_position",
+        "custom_emoji_id",
+        "needs_repainting",
+        "file_size",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        file_id,
+        file_unique_id,
+        type,
+        width,
+        height,
+        is_animated,
+        is_video,
+        thumbnail=None,
+        emoji=None,
+        set_name=None,
+        premium_animation=None,
+        mask_position=None,
+        custom_emoji_id=None,
+        needs_repainting=None,
+        file_size=None,
+    ):
+        self.file_id = file_id
+        self.file_unique_id = file_unique_id
+        self.type = type
+        self.width = width
+        self.height = height
+        self.is_animated = is_animated
+        self.is_video = is_video
+        if thumbnail is not None:
+            self.thumbnail = thumbnail
+        if emoji is not None:
+            self.emoji = emoji
+        if set_name is not None:
+            self.set_name = set_name
+        if premium_animation is not None:
+            self.premium_animation = premium_animation
+        if mask_position is not None:
+            self.mask_position = mask_position
+        if custom_emoji_id is not None:
+            self.custom_emoji_id = custom_emoji_id
+        if needs_repainting is not None:
+            self.needs_repainting = needs_repainting
+        if file_size is not None:
+            self.file_size = file_size
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.file_id = data["file_id"]
+        self.file_unique_id = data["file_unique_id"]
+        self.type = data["type"]
+        self.width = data["width"]
+        self.height = data["height"]
+        self.is_animated = data["is_animated"]
+        self.is_video = data["is_video"]
+        if len(data) > 7:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class StickerSet(Model):
+    """This object represents a sticker set."""
+
+    __slots__ = (
+        "name",
+        "title",
+        "sticker_type",
+        "stickers",
+        "thumbnail",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        name,
+        title,
+        sticker_type,
+        stickers,
+        thumbnail=None,
+    ):
+        self.name = name
+        self.title = title
+        self.sticker_type = sticker_type
+        self.stickers = stickers
+        if thumbnail is not None:
+            self.thumbnail = thumbnail
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.name = data["name"]
+        self.title = data["title"]
+        self.sticker_type = data["sticker_type"]
+        self.stickers = [Sticker.from_dict(item) for item in data["stickers"]]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class MaskPosition(Model):
+    """This object describes the position on faces where a mask should be placed by default."""
+
+    __slots__ = (
+        "point",
+        "x_shift",
+        "y_shift",
+        "scale",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        point,
+        x_shift,
+        y_shift,
+        scale,
+    ):
+        self.point = point
+        self.x_shift = x_shift
+        self.y_shift = y_shift
+        self.scale = scale
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.point = data["point"]
+        self.x_shift = data["x_shift"]
+        self.y_shift = data["y_shift"]
+        self.scale = data["scale"]
+        return self
+
+
+class InputSticker(Model):
+    """This object describes a sticker to be added to a sticker set."""
+
+    __slots__ = (
+        "sticker",
+        "format",
+        "emoji_list",
+        "mask_position",
+        "keywords",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        sticker,
+        format,
+        emoji_list,
+        mask_position=None,
+        keywords=None,
+    ):
+        self.sticker = sticker
+        self.format = format
+        self.emoji_list = emoji_list
+        if mask_position is not None:
+            self.mask_position = mask_position
+        if keywords is not None:
+            self.keywords = keywords
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.sticker = data["sticker"]
+        self.format = data["format"]
+        self.emoji_list = data["emoji_list"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQuery(Model):
+    """This object represents an incoming inline query. When the user sends an empty query, your bot could return some default or trending results."""
+
+    __slots__ = (
+        "id",
+        "from_",
+        "query",
+        "offset",
+        "chat_type",
+        "location",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        id,
+        from_,
+        query,
+        offset,
+        chat_type=None,
+        location=None,
+    ):
+        self.id = id
+        self.from_ = from_
+        self.query = query
+        self.offset = offset
+        if chat_type is not None:
+            self.chat_type = chat_type
+        if location is not None:
+            self.location = location
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.id = data["id"]
+        self.from_ = User.from_dict(data["from"])
+        self.query = data["query"]
+        self.offset = data["offset"]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultsButton(Model):
+    """This object represents a button to be shown above inline query results. You must use exactly one of the optional fields."""
+
+    __slots__ = (
+        "text",
+        "web_app",
+        "start_parameter",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        text,
+        web_app=None,
+        start_parameter=None,
+    ):
+        self.text = text
+        if web_app is not None:
+            self.web_app = web_app
+        if start_parameter is not None:
+            self.start_parameter = start_parameter
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.text = data["text"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResult(Model):
+    """This object represents one result of an inline query. Telegram clients currently support results of the following 20 types:"""
+
+    __slots__ = ()
+
+
+class InlineQueryResultArticle(InlineQueryResult):
+    """Represents a link to an article or web page."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "title",
+        "input_message_content",
+        "reply_markup",
+        "url",
+        "description",
+        "thumbnail_url",
+        "thumbnail_width",
+        "thumbnail_height",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        title,
+        input_message_content,
+        reply_markup=None,
+        url=None,
+        description=None,
+        thumbnail_url=None,
+        thumbnail_width=None,
+        thumbnail_height=None,
+    ):
+        self.type = type
+        self.id = id
+        self.title = title
+        self.input_message_content = input_message_content
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if url is not None:
+            self.url = url
+        if description is not None:
+            self.description = description
+        if thumbnail_url is not None:
+            self.thumbnail_url = thumbnail_url
+        if thumbnail_width is not None:
+            self.thumbnail_width = thumbnail_width
+        if thumbnail_height is not None:
+            self.thumbnail_height = thumbnail_height
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.title = data["title"]
+        self.input_message_content = InputMessageContent.from_dict(data["input_message_content"])
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultPhoto(InlineQueryResult):
+    """Represents a link to a photo. By default, this photo will be sent by the user with optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the photo."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "photo_url",
+        "thumbnail_url",
+        "photo_width",
+        "photo_height",
+        "title",
+        "description",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "show_caption_above_media",
+        "reply_markup",
+        "input_message_content",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        photo_url,
+        thumbnail_url,
+        photo_width=None,
+        photo_height=None,
+        title=None,
+        description=None,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        show_caption_above_media=None,
+        reply_markup=None,
+        input_message_content=None,
+    ):
+        self.type = type
+        self.id = id
+        self.photo_url = photo_url
+        self.thumbnail_url = thumbnail_url
+        if photo_width is not None:
+            self.photo_width = photo_width
+        if photo_height is not None:
+            self.photo_height = photo_height
+        if title is not None:
+            self.title = title
+        if description is not None:
+            self.description = description
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if show_caption_above_media is not None:
+            self.show_caption_above_media = show_caption_above_media
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.photo_url = data["photo_url"]
+        self.thumbnail_url = data["thumbnail_url"]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultGif(InlineQueryResult):
+    """Represents a link to an animated GIF file. By default, this animated GIF file will be sent by the user with optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the animation."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "gif_url",
+        "gif_width",
+        "gif_height",
+        "gif_duration",
+        "thumbnail_url",
+        "thumbnail_mime_type",
+        "title",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "show_caption_above_media",
+        "reply_markup",
+        "input_message_content",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        gif_url,
+        thumbnail_url,
+        gif_width=None,
+        gif_height=None,
+        gif_duration=None,
+        thumbnail_mime_type=None,
+        title=None,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        show_caption_above_media=None,
+        reply_markup=None,
+        input_message_content=None,
+    ):
+        self.type = type
+        self.id = id
+        self.gif_url = gif_url
+        self.thumbnail_url = thumbnail_url
+        if gif_width is not None:
+            self.gif_width = gif_width
+        if gif_height is not None:
+            self.gif_height = gif_height
+        if gif_duration is not None:
+            self.gif_duration = gif_duration
+        if thumbnail_mime_type is not None:
+            self.thumbnail_mime_type = thumbnail_mime_type
+        if title is not None:
+            self.title = title
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if show_caption_above_media is not None:
+            self.show_caption_above_media = show_caption_above_media
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.gif_url = data["gif_url"]
+        self.thumbnail_url = data["thumbnail_url"]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultMpeg4Gif(InlineQueryResult):
+    """Represents a link to a video animation (H.264/MPEG-4 AVC video without sound). By default, this animated MPEG-4 file will be sent by the user with optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the animation."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "mpeg4_url",
+        "mpeg4_width",
+        "mpeg4_height",
+        "mpeg4_duration",
+        "thumbnail_url",
+        "thumbnail_mime_type",
+        "title",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "show_caption_above_media",
+        "reply_markup",
+        "input_message_content",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        mpeg4_url,
+        thumbnail_url,
+        mpeg4_width=None,
+        mpeg4_height=None,
+        mpeg4_duration=None,
+        thumbnail_mime_type=None,
+        title=None,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        show_caption_above_media=None,
+        reply_markup=None,
+        input_message_content=None,
+    ):
+        self.type = type
+        self.id = id
+        self.mpeg4_url = mpeg4_url
+        self.thumbnail_url = thumbnail_url
+        if mpeg4_width is not None:
+            self.mpeg4_width = mpeg4_width
+        if mpeg4_height is not None:
+            self.mpeg4_height = mpeg4_height
+        if mpeg4_duration is not None:
+            self.mpeg4_duration = mpeg4_duration
+        if thumbnail_mime_type is not None:
+            self.thumbnail_mime_type = thumbnail_mime_type
+        if title is not None:
+            self.title = title
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if show_caption_above_media is not None:
+            self.show_caption_above_media = show_caption_above_media
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.mpeg4_url = data["mpeg4_url"]
+        self.thumbnail_url = data["thumbnail_url"]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultVideo(InlineQueryResult):
+    """Represents a link to a page containing an embedded video player or a video file. By default, this video file will be sent by the user with an optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the video."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "video_url",
+        "mime_type",
+        "thumbnail_url",
+        "title",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "show_caption_above_media",
+        "video_width",
+        "video_height",
+        "video_duration",
+        "description",
+        "reply_markup",
+        "input_message_content",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        video_url,
+        mime_type,
+        thumbnail_url,
+        title,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        show_caption_above_media=None,
+        video_width=None,
+        video_height=None,
+        video_duration=None,
+        description=None,
+        reply_markup=None,
+        input_message_content=None,
+    ):
+        self.type = type
+        self.id = id
+        self.video_url = video_url
+        self.mime_type = mime_type
+        self.thumbnail_url = thumbnail_url
+        self.title = title
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if show_caption_above_media is not None:
+            self.show_caption_above_media = show_caption_above_media
+        if video_width is not None:
+            self.video_width = video_width
+        if video_height is not None:
+            self.video_height = video_height
+        if video_duration is not None:
+            self.video_duration = video_duration
+        if description is not None:
+            self.description = description
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.video_url = data["video_url"]
+        self.mime_type = data["mime_type"]
+        self.thumbnail_url = data["thumbnail_url"]
+        self.title = data["title"]
+        if len(data) > 6:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultAudio(InlineQueryResult):
+    """Represents a link to an MP3 audio file. By default, this audio file will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the audio."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "audio_url",
+        "title",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "performer",
+        "audio_duration",
+        "reply_markup",
+        "input_message_content",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        audio_url,
+        title,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        performer=None,
+        audio_duration=None,
+        reply_markup=None,
+        input_message_content=None,
+    ):
+        self.type = type
+        self.id = id
+        self.audio_url = audio_url
+        self.title = title
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if performer is not None:
+            self.performer = performer
+        if audio_duration is not None:
+            self.audio_duration = audio_duration
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.audio_url = data["audio_url"]
+        self.title = data["title"]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultVoice(InlineQueryResult):
+    """Represents a link to a voice recording in an .OGG container encoded with OPUS. By default, this voice recording will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the the voice message."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "voice_url",
+        "title",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "voice_duration",
+        "reply_markup",
+        "input_message_content",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        voice_url,
+        title,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        voice_duration=None,
+        reply_markup=None,
+        input_message_content=None,
+    ):
+        self.type = type
+        self.id = id
+        self.voice_url = voice_url
+        self.title = title
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if voice_duration is not None:
+            self.voice_duration = voice_duration
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.voice_url = data["voice_url"]
+        self.title = data["title"]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultDocument(InlineQueryResult):
+    """Represents a link to a file. By default, this file will be sent by the user with an optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the file. Currently, only .PDF and .ZIP files can be sent using this method."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "title",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "document_url",
+        "mime_type",
+        "description",
+        "reply_markup",
+        "input_message_content",
+        "thumbnail_url",
+        "thumbnail_width",
+        "thumbnail_height",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        title,
+        document_url,
+        mime_type,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        description=None,
+        reply_markup=None,
+        input_message_content=None,
+        thumbnail_url=None,
+        thumbnail_width=None,
+        thumbnail_height=None,
+    ):
+        self.type = type
+        self.id = id
+        self.title = title
+        self.document_url = document_url
+        self.mime_type = mime_type
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if description is not None:
+            self.description = description
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+        if thumbnail_url is not None:
+            self.thumbnail_url = thumbnail_url
+        if thumbnail_width is not None:
+            self.thumbnail_width = thumbnail_width
+        if thumbnail_height is not None:
+            self.thumbnail_height = thumbnail_height
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.title = data["title"]
+        self.document_url = data["document_url"]
+        self.mime_type = data["mime_type"]
+        if len(data) > 5:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultLocation(InlineQueryResult):
+    """Represents a location on a map. By default, the location will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the location."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "latitude",
+        "longitude",
+        "title",
+        "horizontal_accuracy",
+        "live_period",
+        "heading",
+        "proximity_alert_radius",
+        "reply_markup",
+        "input_message_content",
+        "thumbnail_url",
+        "thumbnail_width",
+        "thumbnail_height",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        latitude,
+        longitude,
+        title,
+        horizontal_accuracy=None,
+        live_period=None,
+        heading=None,
+        proximity_alert_radius=None,
+        reply_markup=None,
+        input_message_content=None,
+        thumbnail_url=None,
+        thumbnail_width=None,
+        thumbnail_height=None,
+    ):
+        self.type = type
+        self.id = id
+        self.latitude = latitude
+        self.longitude = longitude
+        self.title = title
+        if horizontal_accuracy is not None:
+            self.horizontal_accuracy = horizontal_accuracy
+        if live_period is not None:
+            self.live_period = live_period
+        if heading is not None:
+            self.heading = heading
+        if proximity_alert_radius is not None:
+            self.proximity_alert_radius = proximity_alert_radius
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+        if thumbnail_url is not None:
+            self.thumbnail_url = thumbnail_url
+        if thumbnail_width is not None:
+            self.thumbnail_width = thumbnail_width
+        if thumbnail_height is not None:
+            self.thumbnail_height = thumbnail_height
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.latitude = data["latitude"]
+        self.longitude = data["longitude"]
+        self.title = data["title"]
+        if len(data) > 5:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultVenue(InlineQueryResult):
+    """Represents a venue. By default, the venue will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the venue."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "latitude",
+        "longitude",
+        "title",
+        "address",
+        "foursquare_id",
+        "foursquare_type",
+        "google_place_id",
+        "google_place_type",
+        "reply_markup",
+        "input_message_content",
+        "thumbnail_url",
+        "thumbnail_width",
+        "thumbnail_height",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        latitude,
+        longitude,
+        title,
+        address,
+        foursquare_id=None,
+        foursquare_type=None,
+        google_place_id=None,
+        google_place_type=None,
+        reply_markup=None,
+        input_message_content=None,
+        thumbnail_url=None,
+        thumbnail_width=None,
+        thumbnail_height=None,
+    ):
+        self.type = type
+        self.id = id
+        self.latitude = latitude
+        self.longitude = longitude
+        self.title = title
+        self.address = address
+        if foursquare_id is not None:
+            self.foursquare_id = foursquare_id
+        if foursquare_type is not None:
+            self.foursquare_type = foursquare_type
+        if google_place_id is not None:
+            self.google_place_id = google_place_id
+        if google_place_type is not None:
+            self.google_place_type = google_place_type
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+        if thumbnail_url is not None:
+            self.thumbnail_url = thumbnail_url
+        if thumbnail_width is not None:
+            self.thumbnail_width = thumbnail_width
+        if thumbnail_height is not None:
+            self.thumbnail_height = thumbnail_height
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.latitude = data["latitude"]
+        self.longitude = data["longitude"]
+        self.title = data["title"]
+        self.address = data["address"]
+        if len(data) > 6:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultContact(InlineQueryResult):
+    """Represents a contact with a phone number. By default, this contact will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the contact."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "phone_number",
+        "first_name",
+        "last_name",
+        "vcard",
+        "reply_markup",
+        "input_message_content",
+        "thumbnail_url",
+        "thumbnail_width",
+        "thumbnail_height",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        phone_number,
+        first_name,
+        last_name=None,
+        vcard=None,
+        reply_markup=None,
+        input_message_content=None,
+        thumbnail_url=None,
+        thumbnail_width=None,
+        thumbnail_height=None,
+    ):
+        self.type = type
+        self.id = id
+        self.phone_number = phone_number
+        self.first_name = first_name
+        if last_name is not None:
+            self.last_name = last_name
+        if vcard is not None:
+            self.vcard = vcard
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+        if thumbnail_url is not None:
+            self.thumbnail_url = thumbnail_url
+        if thumbnail_width is not None:
+            self.thumbnail_width = thumbnail_width
+        if thumbnail_height is not None:
+            self.thumbnail_height = thumbnail_height
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.phone_number = data["phone_number"]
+        self.first_name = data["first_name"]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultGame(InlineQueryResult):
+    """Represents a Game."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "game_short_name",
+        "reply_markup",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        game_short_name,
+        reply_markup=None,
+    ):
+        self.type = type
+        self.id = id
+        self.game_short_name = game_short_name
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.game_short_name = data["game_short_name"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultCachedPhoto(InlineQueryResult):
+    """Represents a link to a photo stored on the Telegram servers. By default, this photo will be sent by the user with an optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the photo."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "photo_file_id",
+        "title",
+        "description",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "show_caption_above_media",
+        "reply_markup",
+        "input_message_content",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        photo_file_id,
+        title=None,
+        description=None,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        show_caption_above_media=None,
+        reply_markup=None,
+        input_message_content=None,
+    ):
+        self.type = type
+        self.id = id
+        self.photo_file_id = photo_file_id
+        if title is not None:
+            self.title = title
+        if description is not None:
+            self.description = description
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if show_caption_above_media is not None:
+            self.show_caption_above_media = show_caption_above_media
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.photo_file_id = data["photo_file_id"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultCachedGif(InlineQueryResult):
+    """Represents a link to an animated GIF file stored on the Telegram servers. By default, this animated GIF file will be sent by the user with an optional caption. Alternatively, you can use input_message_content to send a message with specified content instead of the animation."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "gif_file_id",
+        "title",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "show_caption_above_media",
+        "reply_markup",
+        "input_message_content",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        gif_file_id,
+        title=None,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        show_caption_above_media=None,
+        reply_markup=None,
+        input_message_content=None,
+    ):
+        self.type = type
+        self.id = id
+        self.gif_file_id = gif_file_id
+        if title is not None:
+            self.title = title
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if show_caption_above_media is not None:
+            self.show_caption_above_media = show_caption_above_media
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.gif_file_id = data["gif_file_id"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultCachedMpeg4Gif(InlineQueryResult):
+    """Represents a link to a video animation (H.264/MPEG-4 AVC video without sound) stored on the Telegram servers. By default, this animated MPEG-4 file will be sent by the user with an optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the animation."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "mpeg4_file_id",
+        "title",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "show_caption_above_media",
+        "reply_markup",
+        "input_message_content",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        mpeg4_file_id,
+        title=None,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        show_caption_above_media=None,
+        reply_markup=None,
+        input_message_content=None,
+    ):
+        self.type = type
+        self.id = id
+        self.mpeg4_file_id = mpeg4_file_id
+        if title is not None:
+            self.title = title
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if show_caption_above_media is not None:
+            self.show_caption_above_media = show_caption_above_media
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.mpeg4_file_id = data["mpeg4_file_id"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultCachedSticker(InlineQueryResult):
+    """Represents a link to a sticker stored on the Telegram servers. By default, this sticker will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the sticker."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "sticker_file_id",
+        "reply_markup",
+        "input_message_content",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        sticker_file_id,
+        reply_markup=None,
+        input_message_content=None,
+    ):
+        self.type = type
+        self.id = id
+        self.sticker_file_id = sticker_file_id
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.sticker_file_id = data["sticker_file_id"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultCachedDocument(InlineQueryResult):
+    """Represents a link to a file stored on the Telegram servers. By default, this file will be sent by the user with an optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the file."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "title",
+        "document_file_id",
+        "description",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "reply_markup",
+        "input_message_content",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        title,
+        document_file_id,
+        description=None,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        reply_markup=None,
+        input_message_content=None,
+    ):
+        self.type = type
+        self.id = id
+        self.title = title
+        self.document_file_id = document_file_id
+        if description is not None:
+            self.description = description
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.title = data["title"]
+        self.document_file_id = data["document_file_id"]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultCachedVideo(InlineQueryResult):
+    """Represents a link to a video file stored on the Telegram servers. By default, this video file will be sent by the user with an optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the video."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "video_file_id",
+        "title",
+        "description",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "show_caption_above_media",
+        "reply_markup",
+        "input_message_content",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        video_file_id,
+        title,
+        description=None,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        show_caption_above_media=None,
+        reply_markup=None,
+        input_message_content=None,
+    ):
+        self.type = type
+        self.id = id
+        self.video_file_id = video_file_id
+        self.title = title
+        if description is not None:
+            self.description = description
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if show_caption_above_media is not None:
+            self.show_caption_above_media = show_caption_above_media
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.video_file_id = data["video_file_id"]
+        self.title = data["title"]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultCachedVoice(InlineQueryResult):
+    """Represents a link to a voice message stored on the Telegram servers. By default, this voice message will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the voice message."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "voice_file_id",
+        "title",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "reply_markup",
+        "input_message_content",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        voice_file_id,
+        title,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        reply_markup=None,
+        input_message_content=None,
+    ):
+        self.type = type
+        self.id = id
+        self.voice_file_id = voice_file_id
+        self.title = title
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.voice_file_id = data["voice_file_id"]
+        self.title = data["title"]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InlineQueryResultCachedAudio(InlineQueryResult):
+    """Represents a link to an MP3 audio file stored on the Telegram servers. By default, this audio file will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the audio."""
+
+    __slots__ = (
+        "type",
+        "id",
+        "audio_file_id",
+        "caption",
+        "parse_mode",
+        "caption_entities",
+        "reply_markup",
+        "input_message_content",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        id,
+        audio_file_id,
+        caption=None,
+        parse_mode=None,
+        caption_entities=None,
+        reply_markup=None,
+        input_message_content=None,
+    ):
+        self.type = type
+        self.id = id
+        self.audio_file_id = audio_file_id
+        if caption is not None:
+            self.caption = caption
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if caption_entities is not None:
+            self.caption_entities = caption_entities
+        if reply_markup is not None:
+            self.reply_markup = reply_markup
+        if input_message_content is not None:
+            self.input_message_content = input_message_content
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.id = data["id"]
+        self.audio_file_id = data["audio_file_id"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InputMessageContent(Model):
+    """This object represents the content of a message to be sent as a result of an inline query. Telegram clients currently support the following 5 types:"""
+
+    __slots__ = ()
+
+
+class InputTextMessageContent(InputMessageContent):
+    """Represents the content of a text message to be sent as the result of an inline query."""
+
+    __slots__ = (
+        "message_text",
+        "parse_mode",
+        "entities",
+        "link_preview_options",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        message_text,
+        parse_mode=None,
+        entities=None,
+        link_preview_options=None,
+    ):
+        self.message_text = message_text
+        if parse_mode is not None:
+            self.parse_mode = parse_mode
+        if entities is not None:
+            self.entities = entities
+        if link_preview_options is not None:
+            self.link_preview_options = link_preview_options
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.message_text = data["message_text"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InputLocationMessageContent(InputMessageContent):
+    """Represents the content of a location message to be sent as the result of an inline query."""
+
+    __slots__ = (
+        "latitude",
+        "longitude",
+        "horizontal_accuracy",
+        "live_period",
+        "heading",
+        "proximity_alert_radius",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        latitude,
+        longitude,
+        horizontal_accuracy=None,
+        live_period=None,
+        heading=None,
+        proximity_alert_radius=None,
+    ):
+        self.latitude = latitude
+        self.longitude = longitude
+        if horizontal_accuracy is not None:
+            self.horizontal_accuracy = horizontal_accuracy
+        if live_period is not None:
+            self.live_period = live_period
+        if heading is not None:
+            self.heading = heading
+        if proximity_alert_radius is not None:
+            self.proximity_alert_radius = proximity_alert_radius
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.latitude = data["latitude"]
+        self.longitude = data["longitude"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InputVenueMessageContent(InputMessageContent):
+    """Represents the content of a venue message to be sent as the result of an inline query."""
+
+    __slots__ = (
+        "latitude",
+        "longitude",
+        "title",
+        "address",
+        "foursquare_id",
+        "foursquare_type",
+        "google_place_id",
+        "google_place_type",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        latitude,
+        longitude,
+        title,
+        address,
+        foursquare_id=None,
+        foursquare_type=None,
+        google_place_id=None,
+        google_place_type=None,
+    ):
+        self.latitude = latitude
+        self.longitude = longitude
+        self.title = title
+        self.address = address
+        if foursquare_id is not None:
+            self.foursquare_id = foursquare_id
+        if foursquare_type is not None:
+            self.foursquare_type = foursquare_type
+        if google_place_id is not None:
+            self.google_place_id = google_place_id
+        if google_place_type is not None:
+            self.google_place_type = google_place_type
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.latitude = data["latitude"]
+        self.longitude = data["longitude"]
+        self.title = data["title"]
+        self.address = data["address"]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InputContactMessageContent(InputMessageContent):
+    """Represents the content of a contact message to be sent as the result of an inline query."""
+
+    __slots__ = (
+        "phone_number",
+        "first_name",
+        "last_name",
+        "vcard",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        phone_number,
+        first_name,
+        last_name=None,
+        vcard=None,
+    ):
+        self.phone_number = phone_number
+        self.first_name = first_name
+        if last_name is not None:
+            self.last_name = last_name
+        if vcard is not None:
+            self.vcard = vcard
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.phone_number = data["phone_number"]
+        self.first_name = data["first_name"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class InputInvoiceMessageContent(InputMessageContent):
+    """Represents the content of an invoice message to be sent as the result of an inline query."""
+
+    __slots__ = (
+        "title",
+        "description",
+        "payload",
+        "provider_token",
+        "currency",
+        "prices",
+        "max_tip_amount",
+        "suggested_tip_amounts",
+        "provider_data",
+        "photo_url",
+        "photo_size",
+        "photo_width",
+        "photo_height",
+        "need_name",
+        "need_phone_number",
+        "need_email",
+        "need_shipping_address",
+        "send_phone_number_to_provider",
+        "send_email_to_provider",
+        "is_flexible",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        title,
+        description,
+        payload,
+        currency,
+        prices,
+        provider_token=None,
+        max_tip_amount=None,
+        suggested_tip_amounts=None,
+        provider_data=None,
+        photo_url=None,
+        photo_size=None,
+        photo_width=None,
+        photo_height=None,
+        need_name=None,
+        need_phone_number=None,
+        need_email=None,
+        need_shipping_address=None,
+        send_phone_number_to_provider=None,
+        send_email_to_provider=None,
+        is_flexible=None,
+    ):
+        self.title = title
+        self.description = description
+        self.payload = payload
+        self.currency = currency
+        self.prices = prices
+        if provider_token is not None:
+            self.provider_token = provider_token
+        if max_tip_amount is not None:
+            self.max_tip_amount = max_tip_amount
+        if suggested_tip_amounts is not None:
+            self.suggested_tip_amounts = suggested_tip_amounts
+        if provider_data is not None:
+            self.provider_data = provider_data
+        if photo_url is not None:
+            self.photo_url = photo_url
+        if photo_size is not None:
+            self.photo_size = photo_size
+        if photo_width is not None:
+            self.photo_width = photo_width
+        if photo_height is not None:
+            self.photo_height = photo_height
+        if need_name is not None:
+            self.need_name = need_name
+        if need_phone_number is not None:
+            self.need_phone_number = need_phone_number
+        if need_email is not None:
+            self.need_email = need_email
+        if need_shipping_address is not None:
+            self.need_shipping_address = need_shipping_address
+        if send_phone_number_to_provider is not None:
+            self.send_phone_number_to_provider = send_phone_number_to_provider
+        if send_email_to_provider is not None:
+            self.send_email_to_provider = send_email_to_provider
+        if is_flexible is not None:
+            self.is_flexible = is_flexible
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.title = data["title"]
+        self.description = data["description"]
+        self.payload = data["payload"]
+        self.currency = data["currency"]
+        self.prices = [LabeledPrice.from_dict(item) for item in data["prices"]]
+        if len(data) > 5:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ChosenInlineResult(Model):
+    """Represents a result of an inline query that was chosen by the user and sent to their chat partner."""
+
+    __slots__ = (
+        "result_id",
+        "from_",
+        "location",
+        "inline_message_id",
+        "query",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        result_id,
+        from_,
+        query,
+        location=None,
+        inline_message_id=None,
+    ):
+        self.result_id = result_id
+        self.from_ = from_
+        self.query = query
+        if location is not None:
+            self.location = location
+        if inline_message_id is not None:
+            self.inline_message_id = inline_message_id
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.result_id = data["result_id"]
+        self.from_ = User.from_dict(data["from"])
+        self.query = data["query"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class SentWebAppMessage(Model):
+    """Describes an inline message sent by a Web App on behalf of a user."""
+
+    __slots__ = (
+        "inline_message_id",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        inline_message_id=None,
+    ):
+        if inline_message_id is not None:
+            self.inline_message_id = inline_message_id
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        if len(data) > 0:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class PreparedInlineMessage(Model):
+    """Describes an inline message to be sent by a user of a Mini App."""
+
+    __slots__ = (
+        "id",
+        "expiration_date",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        id,
+        expiration_date,
+    ):
+        self.id = id
+        self.expiration_date = expiration_date
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.id = data["id"]
+        self.expiration_date = data["expiration_date"]
+        return self
+
+
+class LabeledPrice(Model):
+    """This object represents a portion of the price for goods or services."""
+
+    __slots__ = (
+        "label",
+        "amount",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        label,
+        amount,
+    ):
+        self.label = label
+        self.amount = amount
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.label = data["label"]
+        self.amount = data["amount"]
+        return self
+
+
+class Invoice(Model):
+    """This object contains basic information about an invoice."""
+
+    __slots__ = (
+        "title",
+        "description",
+        "start_parameter",
+        "currency",
+        "total_amount",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        title,
+        description,
+        start_parameter,
+        currency,
+        total_amount,
+    ):
+        self.title = title
+        self.description = description
+        self.start_parameter = start_parameter
+        self.currency = currency
+        self.total_amount = total_amount
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.title = data["title"]
+        self.description = data["description"]
+        self.start_parameter = data["start_parameter"]
+        self.currency = data["currency"]
+        self.total_amount = data["total_amount"]
+        return self
+
+
+class ShippingAddress(Model):
+    """This object represents a shipping address."""
+
+    __slots__ = (
+        "country_code",
+        "state",
+        "city",
+        "street_line1",
+        "street_line2",
+        "post_code",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        country_code,
+        state,
+        city,
+        street_line1,
+        street_line2,
+        post_code,
+    ):
+        self.country_code = country_code
+        self.state = state
+        self.city = city
+        self.street_line1 = street_line1
+        self.street_line2 = street_line2
+        self.post_code = post_code
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.country_code = data["country_code"]
+        self.state = data["state"]
+        self.city = data["city"]
+        self.street_line1 = data["street_line1"]
+        self.street_line2 = data["street_line2"]
+        self.post_code = data["post_code"]
+        return self
+
+
+class OrderInfo(Model):
+    """This object represents information about an order."""
+
+    __slots__ = (
+        "name",
+        "phone_number",
+        "email",
+        "shipping_address",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        name=None,
+        phone_number=None,
+        email=None,
+        shipping_address=None,
+    ):
+        if name is not None:
+            self.name = name
+        if phone_number is not None:
+            self.phone_number = phone_number
+        if email is not None:
+            self.email = email
+        if shipping_address is not None:
+            self.shipping_address = shipping_address
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        if len(data) > 0:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ShippingOption(Model):
+    """This object represents one shipping option."""
+
+    __slots__ = (
+        "id",
+        "title",
+        "prices",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        id,
+        title,
+        prices,
+    ):
+        self.id = id
+        self.title = title
+        self.prices = prices
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.id = data["id"]
+        self.title = data["title"]
+        self.prices = [LabeledPrice.from_dict(item) for item in data["prices"]]
+        return self
+
+
+class SuccessfulPayment(Model):
+    """This object contains basic information about a successful payment. Note that if the buyer initiates a chargeback with the relevant payment provider following this transaction, the funds may be debited from your balance. This is outside of Telegram's control."""
+
+    __slots__ = (
+        "currency",
+        "total_amount",
+        "invoice_payload",
+        "subscription_expiration_date",
+        "is_recurring",
+        "is_first_recurring",
+        "shipping_option_id",
+        "order_info",
+        "telegram_payment_charge_id",
+        "provider_payment_charge_id",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        currency,
+        total_amount,
+        invoice_payload,
+        telegram_payment_charge_id,
+        provider_payment_charge_id,
+        subscription_expiration_date=None,
+        is_recurring=None,
+        is_first_recurring=None,
+        shipping_option_id=None,
+        order_info=None,
+    ):
+        self.currency = currency
+        self.total_amount = total_amount
+        self.invoice_payload = invoice_payload
+        self.telegram_payment_charge_id = telegram_payment_charge_id
+        self.provider_payment_charge_id = provider_payment_charge_id
+        if subscription_expiration_date is not None:
+            self.subscription_expiration_date = subscription_expiration_date
+        if is_recurring is not None:
+            self.is_recurring = is_recurring
+        if is_first_recurring is not None:
+            self.is_first_recurring = is_first_recurring
+        if shipping_option_id is not None:
+            self.shipping_option_id = shipping_option_id
+        if order_info is not None:
+            self.order_info = order_info
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.currency = data["currency"]
+        self.total_amount = data["total_amount"]
+        self.invoice_payload = data["invoice_payload"]
+        self.telegram_payment_charge_id = data["telegram_payment_charge_id"]
+        self.provider_payment_charge_id = data["provider_payment_charge_id"]
+        if len(data) > 5:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class RefundedPayment(Model):
+    """This object contains basic information about a refunded payment."""
+
+    __slots__ = (
+        "currency",
+        "total_amount",
+        "invoice_payload",
+        "telegram_payment_charge_id",
+        "provider_payment_charge_id",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        currency,
+        total_amount,
+        invoice_payload,
+        telegram_payment_charge_id,
+        provider_payment_charge_id=None,
+    ):
+        self.currency = currency
+        self.total_amount = total_amount
+        self.invoice_payload = invoice_payload
+        self.telegram_payment_charge_id = telegram_payment_charge_id
+        if provider_payment_charge_id is not None:
+            self.provider_payment_charge_id = provider_payment_charge_id
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.currency = data["currency"]
+        self.total_amount = data["total_amount"]
+        self.invoice_payload = data["invoice_payload"]
+        self.telegram_payment_charge_id = data["telegram_payment_charge_id"]
+        if len(data) > 4:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class ShippingQuery(Model):
+    """This object contains information about an incoming shipping query."""
+
+    __slots__ = (
+        "id",
+        "from_",
+        "invoice_payload",
+        "shipping_address",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        id,
+        from_,
+        invoice_payload,
+        shipping_address,
+    ):
+        self.id = id
+        self.from_ = from_
+        self.invoice_payload = invoice_payload
+        self.shipping_address = shipping_address
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.id = data["id"]
+        self.from_ = User.from_dict(data["from"])
+        self.invoice_payload = data["invoice_payload"]
+        self.shipping_address = ShippingAddress.from_dict(data["shipping_address"])
+        return self
+
+
+class PreCheckoutQuery(Model):
+    """This object contains information about an incoming pre-checkout query."""
+
+    __slots__ = (
+        "id",
+        "from_",
+        "currency",
+        "total_amount",
+        "invoice_payload",
+        "shipping_option_id",
+        "order_info",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        id,
+        from_,
+        currency,
+        total_amount,
+        invoice_payload,
+        shipping_option_id=None,
+        order_info=None,
+    ):
+        self.id = id
+        self.from_ = from_
+        self.currency = currency
+        self.total_amount = total_amount
+        self.invoice_payload = invoice_payload
+        if shipping_option_id is not None:
+            self.shipping_option_id = shipping_option_id
+        if order_info is not None:
+            self.order_info = order_info
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.id = data["id"]
+        self.from_ = User.from_dict(data["from"])
+        self.currency = data["currency"]
+        self.total_amount = data["total_amount"]
+        self.invoice_payload = data["invoice_payload"]
+        if len(data) > 5:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class PaidMediaPurchased(Model):
+    """This object contains information about a paid media purchase."""
+
+    __slots__ = (
+        "from_",
+        "paid_media_payload",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        from_,
+        paid_media_payload,
+    ):
+        self.from_ = from_
+        self.paid_media_payload = paid_media_payload
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.from_ = User.from_dict(data["from"])
+        self.paid_media_payload = data["paid_media_payload"]
+        return self
+
+
+class RevenueWithdrawalState(Model):
+    """This object describes the state of a revenue withdrawal operation. Currently, it can be one of"""
+
+    __slots__ = ()
+
+
+class RevenueWithdrawalStatePending(RevenueWithdrawalState):
+    """The withdrawal is in progress."""
+
+    __slots__ = (
+        "type",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+    ):
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        return self
+
+
+class RevenueWithdrawalStateSucceeded(RevenueWithdrawalState):
+    """The withdrawal succeeded."""
+
+    __slots__ = (
+        "type",
+        "date",
+        "url",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        date,
+        url,
+    ):
+        self.type = type
+        self.date = date
+        self.url = url
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.date = data["date"]
+        self.url = data["url"]
+        return self
+
+
+class RevenueWithdrawalStateFailed(RevenueWithdrawalState):
+    """The withdrawal failed and the transaction was refunded."""
+
+    __slots__ = (
+        "type",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+    ):
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        return self
+
+
+class AffiliateInfo(Model):
+    """Contains information about the affiliate that received a commission via this transaction."""
+
+    __slots__ = (
+        "affiliate_user",
+        "affiliate_chat",
+        "commission_per_mille",
+        "amount",
+        "nanostar_amount",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        commission_per_mille,
+        amount,
+        affiliate_user=None,
+        affiliate_chat=None,
+        nanostar_amount=None,
+    ):
+        self.commission_per_mille = commission_per_mille
+        self.amount = amount
+        if affiliate_user is not None:
+            self.affiliate_user = affiliate_user
+        if affiliate_chat is not None:
+            self.affiliate_chat = affiliate_chat
+        if nanostar_amount is not None:
+            self.nanostar_amount = nanostar_amount
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.commission_per_mille = data["commission_per_mille"]
+        self.amount = data["amount"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class TransactionPartner(Model):
+    """This object describes the source of a transaction, or its recipient for outgoing transactions. Currently, it can be one of"""
+
+    __slots__ = ()
+
+
+class TransactionPartnerUser(TransactionPartner):
+    """Describes a transaction with a user."""
+
+    __slots__ = (
+        "type",
+        "transaction_type",
+        "user",
+        "affiliate",
+        "invoice_payload",
+        "subscription_period",
+        "paid_media",
+        "paid_media_payload",
+        "gift",
+        "premium_subscription_duration",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        transaction_type,
+        user,
+        affiliate=None,
+        invoice_payload=None,
+        subscription_period=None,
+        paid_media=None,
+        paid_media_payload=None,
+        gift=None,
+        premium_subscription_duration=None,
+    ):
+        self.type = type
+        self.transaction_type = transaction_type
+        self.user = user
+        if affiliate is not None:
+            self.affiliate = affiliate
+        if invoice_payload is not None:
+            self.invoice_payload = invoice_payload
+        if subscription_period is not None:
+            self.subscription_period = subscription_period
+        if paid_media is not None:
+            self.paid_media = paid_media
+        if paid_media_payload is not None:
+            self.paid_media_payload = paid_media_payload
+        if gift is not None:
+            self.gift = gift
+        if premium_subscription_duration is not None:
+            self.premium_subscription_duration = premium_subscription_duration
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.transaction_type = data["transaction_type"]
+        self.user = User.from_dict(data["user"])
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class TransactionPartnerChat(TransactionPartner):
+    """Describes a transaction with a chat."""
+
+    __slots__ = (
+        "type",
+        "chat",
+        "gift",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        chat,
+        gift=None,
+    ):
+        self.type = type
+        self.chat = chat
+        if gift is not None:
+            self.gift = gift
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.chat = Chat.from_dict(data["chat"])
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class TransactionPartnerAffiliateProgram(TransactionPartner):
+    """Describes the affiliate program that issued the affiliate commission received via this transaction."""
+
+    __slots__ = (
+        "type",
+        "sponsor_user",
+        "commission_per_mille",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        commission_per_mille,
+        sponsor_user=None,
+    ):
+        self.type = type
+        self.commission_per_mille = commission_per_mille
+        if sponsor_user is not None:
+            self.sponsor_user = sponsor_user
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.commission_per_mille = data["commission_per_mille"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class TransactionPartnerFragment(TransactionPartner):
+    """Describes a withdrawal transaction with Fragment."""
+
+    __slots__ = (
+        "type",
+        "withdrawal_state",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        withdrawal_state=None,
+    ):
+        self.type = type
+        if withdrawal_state is not None:
+            self.withdrawal_state = withdrawal_state
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        if len(data) > 1:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class TransactionPartnerTelegramAds(TransactionPartner):
+    """Describes a withdrawal transaction to the Telegram Ads platform."""
+
+    __slots__ = (
+        "type",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+    ):
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        return self
+
+
+class TransactionPartnerTelegramApi(TransactionPartner):
+    """Describes a transaction with payment for paid broadcasting."""
+
+    __slots__ = (
+        "type",
+        "request_count",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        request_count,
+    ):
+        self.type = type
+        self.request_count = request_count
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.request_count = data["request_count"]
+        return self
+
+
+class TransactionPartnerOther(TransactionPartner):
+    """Describes a transaction with an unknown source or recipient."""
+
+    __slots__ = (
+        "type",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+    ):
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        return self
+
+
+class StarTransaction(Model):
+    """Describes a Telegram Star transaction. Note that if the buyer initiates a chargeback with the payment provider from whom they acquired Stars (e.g., Apple, Google) following this transaction, the refunded Stars will be deducted from the bot's balance. This is outside of Telegram's control."""
+
+    __slots__ = (
+        "id",
+        "amount",
+        "nanostar_amount",
+        "date",
+        "source",
+        "receiver",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        id,
+        amount,
+        date,
+        nanostar_amount=None,
+        source=None,
+        receiver=None,
+    ):
+        self.id = id
+        self.amount = amount
+        self.date = date
+        if nanostar_amount is not None:
+            self.nanostar_amount = nanostar_amount
+        if source is not None:
+            self.source = source
+        if receiver is not None:
+            self.receiver = receiver
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.id = data["id"]
+        self.amount = data["amount"]
+        self.date = data["date"]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class StarTransactions(Model):
+    """Contains a list of Telegram Star transactions."""
+
+    __slots__ = (
+        "transactions",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        transactions,
+    ):
+        self.transactions = transactions
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.transactions = [StarTransaction.from_dict(item) for item in data["transactions"]]
+        return self
+
+
+class PassportData(Model):
+    """Describes Telegram Passport data shared with the bot by the user."""
+
+    __slots__ = (
+        "data",
+        "credentials",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        data,
+        credentials,
+    ):
+        self.data = data
+        self.credentials = credentials
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.data = [EncryptedPassportElement.from_dict(item) for item in data["data"]]
+        self.credentials = EncryptedCredentials.from_dict(data["credentials"])
+        return self
+
+
+class PassportFile(Model):
+    """This object represents a file uploaded to Telegram Passport. Currently all Telegram Passport files are in JPEG format when decrypted and don't exceed 10MB."""
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "file_size",
+        "file_date",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        file_id,
+        file_unique_id,
+        file_size,
+        file_date,
+    ):
+        self.file_id = file_id
+        self.file_unique_id = file_unique_id
+        self.file_size = file_size
+        self.file_date = file_date
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.file_id = data["file_id"]
+        self.file_unique_id = data["file_unique_id"]
+        self.file_size = data["file_size"]
+        self.file_date = data["file_date"]
+        return self
+
+
+class EncryptedPassportElement(Model):
+    """Describes documents or other Telegram Passport elements shared with the bot by the user."""
+
+    __slots__ = (
+        "type",
+        "data",
+        "phone_number",
+        "email",
+        "files",
+        "front_side",
+        "reverse_side",
+        "selfie",
+        "translation",
+        "hash",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        type,
+        hash,
+        data=None,
+        phone_number=None,
+        email=None,
+        files=None,
+        front_side=None,
+        reverse_side=None,
+        selfie=None,
+        translation=None,
+    ):
+        self.type = type
+        self.hash = hash
+        if data is not None:
+            self.data = data
+        if phone_number is not None:
+            self.phone_number = phone_number
+        if email is not None:
+            self.email = email
+        if files is not None:
+            self.files = files
+        if front_side is not None:
+            self.front_side = front_side
+        if reverse_side is not None:
+            self.reverse_side = reverse_side
+        if selfie is not None:
+            self.selfie = selfie
+        if translation is not None:
+            self.translation = translation
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.type = data["type"]
+        self.hash = data["hash"]
+        if len(data) > 2:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class EncryptedCredentials(Model):
+    """Describes data required for decrypting and authenticating EncryptedPassportElement. See the Telegram Passport Documentation for a complete description of the data decryption and authentication processes."""
+
+    __slots__ = (
+        "data",
+        "hash",
+        "secret",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        data,
+        hash,
+        secret,
+    ):
+        self.data = data
+        self.hash = hash
+        self.secret = secret
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.data = data["data"]
+        self.hash = data["hash"]
+        self.secret = data["secret"]
+        return self
+
+
+class PassportElementError(Model):
+    """This object represents an error in the Telegram Passport element which was submitted that should be resolved by the user. It should be one of:"""
+
+    __slots__ = ()
+
+
+class PassportElementErrorDataField(PassportElementError):
+    """Represents an issue in one of the data fields that was provided by the user. The error is considered resolved when the field's value changes."""
+
+    __slots__ = (
+        "source",
+        "type",
+        "field_name",
+        "data_hash",
+        "message",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        source,
+        type,
+        field_name,
+        data_hash,
+        message,
+    ):
+        self.source = source
+        self.type = type
+        self.field_name = field_name
+        self.data_hash = data_hash
+        self.message = message
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.source = data["source"]
+        self.type = data["type"]
+        self.field_name = data["field_name"]
+        self.data_hash = data["data_hash"]
+        self.message = data["message"]
+        return self
+
+
+class PassportElementErrorFrontSide(PassportElementError):
+    """Represents an issue with the front side of a document. The error is considered resolved when the file with the front side of the document changes."""
+
+    __slots__ = (
+        "source",
+        "type",
+        "file_hash",
+        "message",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        source,
+        type,
+        file_hash,
+        message,
+    ):
+        self.source = source
+        self.type = type
+        self.file_hash = file_hash
+        self.message = message
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.source = data["source"]
+        self.type = data["type"]
+        self.file_hash = data["file_hash"]
+        self.message = data["message"]
+        return self
+
+
+class PassportElementErrorReverseSide(PassportElementError):
+    """Represents an issue with the reverse side of a document. The error is considered resolved when the file with reverse side of the document changes."""
+
+    __slots__ = (
+        "source",
+        "type",
+        "file_hash",
+        "message",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        source,
+        type,
+        file_hash,
+        message,
+    ):
+        self.source = source
+        self.type = type
+        self.file_hash = file_hash
+        self.message = message
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.source = data["source"]
+        self.type = data["type"]
+        self.file_hash = data["file_hash"]
+        self.message = data["message"]
+        return self
+
+
+class PassportElementErrorSelfie(PassportElementError):
+    """Represents an issue with the selfie with a document. The error is considered resolved when the file with the selfie changes."""
+
+    __slots__ = (
+        "source",
+        "type",
+        "file_hash",
+        "message",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        source,
+        type,
+        file_hash,
+        message,
+    ):
+        self.source = source
+        self.type = type
+        self.file_hash = file_hash
+        self.message = message
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.source = data["source"]
+        self.type = data["type"]
+        self.file_hash = data["file_hash"]
+        self.message = data["message"]
+        return self
+
+
+class PassportElementErrorFile(PassportElementError):
+    """Represents an issue with a document scan. The error is considered resolved when the file with the document scan changes."""
+
+    __slots__ = (
+        "source",
+        "type",
+        "file_hash",
+        "message",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        source,
+        type,
+        file_hash,
+        message,
+    ):
+        self.source = source
+        self.type = type
+        self.file_hash = file_hash
+        self.message = message
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.source = data["source"]
+        self.type = data["type"]
+        self.file_hash = data["file_hash"]
+        self.message = data["message"]
+        return self
+
+
+class PassportElementErrorFiles(PassportElementError):
+    """Represents an issue with a list of scans. The error is considered resolved when the list of files containing the scans changes."""
+
+    __slots__ = (
+        "source",
+        "type",
+        "file_hashes",
+        "message",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        source,
+        type,
+        file_hashes,
+        message,
+    ):
+        self.source = source
+        self.type = type
+        self.file_hashes = file_hashes
+        self.message = message
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.source = data["source"]
+        self.type = data["type"]
+        self.file_hashes = data["file_hashes"]
+        self.message = data["message"]
+        return self
+
+
+class PassportElementErrorTranslationFile(PassportElementError):
+    """Represents an issue with one of the files that constitute the translation of a document. The error is considered resolved when the file changes."""
+
+    __slots__ = (
+        "source",
+        "type",
+        "file_hash",
+        "message",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        source,
+        type,
+        file_hash,
+        message,
+    ):
+        self.source = source
+        self.type = type
+        self.file_hash = file_hash
+        self.message = message
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.source = data["source"]
+        self.type = data["type"]
+        self.file_hash = data["file_hash"]
+        self.message = data["message"]
+        return self
+
+
+class PassportElementErrorTranslationFiles(PassportElementError):
+    """Represents an issue with the translated version of a document. The error is considered resolved when a file with the document translation change."""
+
+    __slots__ = (
+        "source",
+        "type",
+        "file_hashes",
+        "message",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        source,
+        type,
+        file_hashes,
+        message,
+    ):
+        self.source = source
+        self.type = type
+        self.file_hashes = file_hashes
+        self.message = message
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.source = data["source"]
+        self.type = data["type"]
+        self.file_hashes = data["file_hashes"]
+        self.message = data["message"]
+        return self
+
+
+class PassportElementErrorUnspecified(PassportElementError):
+    """Represents an issue in an unspecified place. The error is considered resolved when new data is added."""
+
+    __slots__ = (
+        "source",
+        "type",
+        "element_hash",
+        "message",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        source,
+        type,
+        element_hash,
+        message,
+    ):
+        self.source = source
+        self.type = type
+        self.element_hash = element_hash
+        self.message = message
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.source = data["source"]
+        self.type = data["type"]
+        self.element_hash = data["element_hash"]
+        self.message = data["message"]
+        return self
+
+
+class Game(Model):
+    """This object represents a game. Use BotFather to create and edit games, their short names will act as unique identifiers."""
+
+    __slots__ = (
+        "title",
+        "description",
+        "photo",
+        "text",
+        "text_entities",
+        "animation",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        title,
+        description,
+        photo,
+        text=None,
+        text_entities=None,
+        animation=None,
+    ):
+        self.title = title
+        self.description = description
+        self.photo = photo
+        if text is not None:
+            self.text = text
+        if text_entities is not None:
+            self.text_entities = text_entities
+        if animation is not None:
+            self.animation = animation
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.title = data["title"]
+        self.description = data["description"]
+        self.photo = [PhotoSize.from_dict(item) for item in data["photo"]]
+        if len(data) > 3:
+            _set_optional(self, data, cls._optional)
+        return self
+
+
+class CallbackGame(Model):
+    """A placeholder, currently holds no information. Use BotFather to set up your game."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data):
+        return _new(cls)
+
+
+class GameHighScore(Model):
+    """This object represents one row of the high scores table for a game."""
+
+    __slots__ = (
+        "position",
+        "user",
+        "score",
+    )
+    _slots = frozenset(__slots__)
+
+    def __init__(
+        self,
+        *,
+        position,
+        user,
+        score,
+    ):
+        self.position = position
+        self.user = user
+        self.score = score
+
+    @classmethod
+    def from_dict(cls, data):
+        self = _new(cls)
+        self.position = data["position"]
+        self.user = User.from_dict(data["user"])
+        self.score = data["score"]
+        return self
+
+
+_fields(Update, {
+    "update_id": None,
+    "message": Message,
+    "edited_message": Message,
+    "channel_post": Message,
+    "edited_channel_post": Message,
+    "business_connection": BusinessConnection,
+    "business_message": Message,
+    "edited_business_message": Message,
+    "deleted_business_messages": BusinessMessagesDeleted,
+    "message_reaction": MessageReactionUpdated,
+    "message_reaction_count": MessageReactionCountUpdated,
+    "inline_query": InlineQuery,
+    "chosen_inline_result": ChosenInlineResult,
+    "callback_query": CallbackQuery,
+    "shipping_query": ShippingQuery,
+    "pre_checkout_query": PreCheckoutQuery,
+    "purchased_paid_media": PaidMediaPurchased,
+    "poll": Poll,
+    "poll_answer": PollAnswer,
+    "my_chat_member": ChatMemberUpdated,
+    "chat_member": ChatMemberUpdated,
+    "chat_join_request": ChatJoinRequest,
+    "chat_boost": ChatBoostUpdated,
+    "removed_chat_boost": ChatBoostRemoved,
+}, required=["update_id"])
+_fields(WebhookInfo, {
+    "url": None,
+    "has_custom_certificate": None,
+    "pending_update_count": None,
+    "ip_address": None,
+    "last_error_date": None,
+    "last_error_message": None,
+    "last_synchronization_error_date": None,
+    "max_connections": None,
+    "allowed_updates": None,
+}, required=["url", "has_custom_certificate", "pending_update_count"])
+_fields(User, {
+    "id": None,
+    "is_bot": None,
+    "first_name": None,
+    "last_name": None,
+    "username": None,
+    "language_code": None,
+    "is_premium": None,
+    "added_to_attachment_menu": None,
+    "can_join_groups": None,
+    "can_read_all_group_messages": None,
+    "supports_inline_queries": None,
+    "can_connect_to_business": None,
+    "has_main_web_app": None,
+}, required=["id", "is_bot", "first_name"])
+_fields(Chat, {
+    "id": None,
+    "type": None,
+    "title": None,
+    "username": None,
+    "first_name": None,
+    "last_name": None,
+    "is_forum": None,
+    "is_direct_messages": None,
+}, required=["id", "type"])
+_fields(ChatFullInfo, {
+    "id": None,
+    "type": None,
+    "title": None,
+    "username": None,
+    "first_name": None,
+    "last_name": None,
+    "is_forum": None,
+    "is_direct_messages": None,
+    "accent_color_id": None,
+    "max_reaction_count": None,
+    "photo": ChatPhoto,
+    "active_usernames": None,
+    "birthdate": Birthdate,
+    "business_intro": BusinessIntro,
+    "business_location": BusinessLocation,
+    "business_opening_hours": BusinessOpeningHours,
+    "personal_chat": Chat,
+    "parent_chat": Chat,
+    "available_reactions": _list(ReactionType),
+    "background_custom_emoji_id": None,
+    "profile_accent_color_id": None,
+    "profile_background_custom_emoji_id": None,
+    "emoji_status_custom_emoji_id": None,
+    "emoji_status_expiration_date": None,
+    "bio": None,
+    "has_private_forwards": None,
+    "has_restricted_voice_and_video_messages": None,
+    "join_to_send_messages": None,
+    "join_by_request": None,
+    "description": None,
+    "invite_link": None,
+    "pinned_message": Message,
+    "permissions": ChatPermissions,
+    "accepted_gift_types": AcceptedGiftTypes,
+    "can_send_paid_media": None,
+    "slow_mode_delay": None,
+    "unrestrict_boost_count": None,
+    "message_auto_delete_time": None,
+    "has_aggressive_anti_spam_enabled": None,
+    "has_hidden_members": None,
+    "has_protected_content": None,
+    "has_visible_history": None,
+    "sticker_set_name": None,
+    "can_set_sticker_set": None,
+    "custom_emoji_sticker_set_name": None,
+    "linked_chat_id": None,
+    "location": ChatLocation,
+}, required=["id", "type", "accent_color_id", "max_reaction_count", "accepted_gift_types"])
+_fields(Message, {
+    "message_id": None,
+    "message_thread_id": None,
+    "direct_messages_topic": DirectMessagesTopic,
+    "from": User,
+    "sender_chat": Chat,
+    "sender_boost_count": None,
+    "sender_business_bot": User,
+    "date": None,
+    "business_connection_id": None,
+    "chat": Chat,
+    "forward_origin": MessageOrigin,
+    "is_topic_message": None,
+    "is_automatic_forward": None,
+    "reply_to_message": Message,
+    "external_reply": ExternalReplyInfo,
+    "quote": TextQuote,
+    "reply_to_story": Story,
+    "reply_to_checklist_task_id": None,
+    "via_bot": User,
+    "edit_date": None,
+    "has_protected_content": None,
+    "is_from_offline": None,
+    "is_paid_post": None,
+    "media_group_id": None,
+    "author_signature": None,
+    "paid_star_count": None,
+    "text": None,
+    "entities": _list(MessageEntity),
+    "link_preview_options": LinkPreviewOptions,
+    "suggested_post_info": SuggestedPostInfo,
+    "effect_id": None,
+    "animation": Animation,
+    "audio": Audio,
+    "document": Document,
+    "paid_media": PaidMediaInfo,
+    "photo": _list(PhotoSize),
+    "sticker": Sticker,
+    "story": Story,
+    "video": Video,
+    "video_note": VideoNote,
+    "voice": Voice,
+    "caption": None,
+    "caption_entities": _list(MessageEntity),
+    "show_caption_above_media": None,
+    "has_media_spoiler": None,
+    "checklist": Checklist,
+    "contact": Contact,
+    "dice": Dice,
+    "game": Game,
+    "poll": Poll,
+    "venue": Venue,
+    "location": Location,
+    "new_chat_members": _list(User),
+    "left_chat_member": User,
+    "new_chat_title": None,
+    "new_chat_photo": _list(PhotoSize),
+    "delete_chat_photo": None,
+    "group_chat_created": None,
+    "supergroup_chat_created": None,
+    "channel_chat_created": None,
+    "message_auto_delete_timer_changed": MessageAutoDeleteTimerChanged,
+    "migrate_to_chat_id": None,
+    "migrate_from_chat_id": None,
+    "pinned_message": MaybeInaccessibleMessage,
+    "invoice": Invoice,
+    "successful_payment": SuccessfulPayment,
+    "refunded_payment": RefundedPayment,
+    "users_shared": UsersShared,
+    "chat_shared": ChatShared,
+    "gift": GiftInfo,
+    "unique_gift": UniqueGiftInfo,
+    "connected_website": None,
+    "write_access_allowed": WriteAccessAllowed,
+    "passport_data": PassportData,
+    "proximity_alert_triggered": ProximityAlertTriggered,
+    "boost_added": ChatBoostAdded,
+    "chat_background_set": ChatBackground,
+    "checklist_tasks_done": ChecklistTasksDone,
+    "checklist_tasks_added": ChecklistTasksAdded,
+    "direct_message_price_changed": DirectMessagePriceChanged,
+    "forum_topic_created": ForumTopicCreated,
+    "forum_topic_edited": ForumTopicEdited,
+    "forum_topic_closed": ForumTopicClosed,
+    "forum_topic_reopened": ForumTopicReopened,
+    "general_forum_topic_hidden": GeneralForumTopicHidden,
+    "general_forum_topic_unhidden": GeneralForumTopicUnhidden,
+    "giveaway_created": GiveawayCreated,
+    "giveaway": Giveaway,
+    "giveaway_winners": GiveawayWinners,
+    "giveaway_completed": GiveawayCompleted,
+    "paid_message_price_changed": PaidMessagePriceChanged,
+    "suggested_post_approved": SuggestedPostApproved,
+    "suggested_post_approval_failed": SuggestedPostApprovalFailed,
+    "suggested_post_declined": SuggestedPostDeclined,
+    "suggested_post_paid": SuggestedPostPaid,
+    "suggested_post_refunded": SuggestedPostRefunded,
+    "video_chat_scheduled": VideoChatScheduled,
+    "video_chat_started": VideoChatStarted,
+    "video_chat_ended": VideoChatEnded,
+    "video_chat_participants_invited": VideoChatParticipantsInvited,
+    "web_app_data": WebAppData,
+    "reply_markup": InlineKeyboardMarkup,
+}, required=["message_id", "date", "chat"])
+_fields(MessageId, {
+    "message_id": None,
+}, required=["message_id"])
+_fields(InaccessibleMessage, {
+    "chat": Chat,
+    "message_id": None,
+    "date": None,
+}, required=["chat", "message_id", "date"], fixed={"date": 0})
+_fields(MessageEntity, {
+    "type": None,
+    "offset": None,
+    "length": None,
+    "url": None,
+    "user": User,
+    "language": None,
+    "custom_emoji_id": None,
+}, required=["type", "offset", "length"])
+_fields(TextQuote, {
+    "text": None,
+    "entities": _list(MessageEntity),
+    "position": None,
+    "is_manual": None,
+}, required=["text", "position"])
+_fields(ExternalReplyInfo, {
+    "origin": MessageOrigin,
+    "chat": Chat,
+    "message_id": None,
+    "link_preview_options": LinkPreviewOptions,
+    "animation": Animation,
+    "audio": Audio,
+    "document": Document,
+    "paid_media": PaidMediaInfo,
+    "photo": _list(PhotoSize),
+    "sticker": Sticker,
+    "story": Story,
+    "video": Video,
+    "video_note": VideoNote,
+    "voice": Voice,
+    "has_media_spoiler": None,
+    "checklist": Checklist,
+    "contact": Contact,
+    "dice": Dice,
+    "game": Game,
+    "giveaway": Giveaway,
+    "giveaway_winners": GiveawayWinners,
+    "invoice": Invoice,
+    "location": Location,
+    "poll": Poll,
+    "venue": Venue,
+}, required=["origin"])
+_fields(ReplyParameters, {
+    "message_id": None,
+    "chat_id": None,
+    "allow_sending_without_reply": None,
+    "quote": None,
+    "quote_parse_mode": None,
+    "quote_entities": _list(MessageEntity),
+    "quote_position": None,
+    "checklist_task_id": None,
+}, required=["message_id"])
+_fields(MessageOriginUser, {
+    "type": None,
+    "date": None,
+    "sender_user": User,
+}, required=["type", "date", "sender_user"])
+_fields(MessageOriginHiddenUser, {
+    "type": None,
+    "date": None,
+    "sender_user_name": None,
+}, required=["type", "date", "sender_user_name"])
+_fields(MessageOriginChat, {
+    "type": None,
+    "date": None,
+    "sender_chat": Chat,
+    "author_signature": None,
+}, required=["type", "date", "sender_chat"])
+_fields(MessageOriginChannel, {
+    "type": None,
+    "date": None,
+    "chat": Chat,
+    "message_id": None,
+    "author_signature": None,
+}, required=["type", "date", "chat", "message_id"])
+_fields(PhotoSize, {
+    "file_id": None,
+    "file_unique_id": None,
+    "width": None,
+    "height": None,
+    "file_size": None,
+}, required=["file_id", "file_unique_id", "width", "height"])
+_fields(Animation, {
+    "file_id": None,
+    "file_unique_id": None,
+    "width": None,
+    "height": None,
+    "duration": None,
+    "thumbnail": PhotoSize,
+    "file_name": None,
+    "mime_type": None,
+    "file_size": None,
+}, required=["file_id", "file_unique_id", "width", "height", "duration"])
+_fields(Audio, {
+    "file_id": None,
+    "file_unique_id": None,
+    "duration": None,
+    "performer": None,
+    "title": None,
+    "file_name": None,
+    "mime_type": None,
+    "file_size": None,
+    "thumbnail": PhotoSize,
+}, required=["file_id", "file_unique_id", "duration"])
+_fields(Document, {
+    "file_id": None,
+    "file_unique_id": None,
+    "thumbnail": PhotoSize,
+    "file_name": None,
+    "mime_type": None,
+    "file_size": None,
+}, required=["file_id", "file_unique_id"])
+_fields(Story, {
+    "chat": Chat,
+    "id": None,
+}, required=["chat", "id"])
+_fields(Video, {
+    "file_id": None,
+    "file_unique_id": None,
+    "width": None,
+    "height": None,
+    "duration": None,
+    "thumbnail": PhotoSize,
+    "cover": _list(PhotoSize),
+    "start_timestamp": None,
+    "file_name": None,
+    "mime_type": None,
+    "file_size": None,
+}, required=["file_id", "file_unique_id", "width", "height", "duration"])
+_fields(VideoNote, {
+    "file_id": None,
+    "file_unique_id": None,
+    "length": None,
+    "duration": None,
+    "thumbnail": PhotoSize,
+    "file_size": None,
+}, required=["file_id", "file_unique_id", "length", "duration"])
+_fields(Voice, {
+    "file_id": None,
+    "file_unique_id": None,
+    "duration": None,
+    "mime_type": None,
+    "file_size": None,
+}, required=["file_id", "file_unique_id", "duration"])
+_fields(PaidMediaInfo, {
+    "star_count": None,
+    "paid_media": _list(PaidMedia),
+}, required=["star_count", "paid_media"])
+_fields(PaidMediaPreview, {
+    "type": None,
+    "width": None,
+    "height": None,
+    "duration": None,
+}, required=["type"])
+_fields(PaidMediaPhoto, {
+    "type": None,
+    "photo": _list(PhotoSize),
+}, required=["type", "photo"])
+_fields(PaidMediaVideo, {
+    "type": None,
+    "video": Video,
+}, required=["type", "video"])
+_fields(Contact, {
+    "phone_number": None,
+    "first_name": None,
+    "last_name": None,
+    "user_id": None,
+    "vcard": None,
+}, required=["phone_number", "first_name"])
+_fields(Dice, {
+    "emoji": None,
+    "value": None,
+}, required=["emoji", "value"])
+_fields(PollOption, {
+    "text": None,
+    "text_entities": _list(MessageEntity),
+    "voter_count": None,
+}, required=["text", "voter_count"])
+_fields(InputPollOption, {
+    "text": None,
+    "text_parse_mode": None,
+    "text_entities": _list(MessageEntity),
+}, required=["text"])
+_fields(PollAnswer, {
+    "poll_id": None,
+    "voter_chat": Chat,
+    "user": User,
+    "option_ids": None,
+}, required=["poll_id", "option_ids"])
+_fields(Poll, {
+    "id": None,
+    "question": None,
+    "question_entities": _list(MessageEntity),
+    "options": _list(PollOption),
+    "total_voter_count": None,
+    "is_closed": None,
+    "is_anonymous": None,
+    "type": None,
+    "allows_multiple_answers": None,
+    "correct_option_id": None,
+    "explanation": None,
+    "explanation_entities": _list(MessageEntity),
+    "open_period": None,
+    "close_date": None,
+}, required=["id", "question", "options", "total_voter_count", "is_closed", "is_anonymous", "type", "allows_multiple_answers"])
+_fields(ChecklistTask, {
+    "id": None,
+    "text": None,
+    "text_entities": _list(MessageEntity),
+    "completed_by_user": User,
+    "completion_date": None,
+}, required=["id", "text"])
+_fields(Checklist, {
+    "title": None,
+    "title_entities": _list(MessageEntity),
+    "tasks": _list(ChecklistTask),
+    "others_can_add_tasks": None,
+    "others_can_mark_tasks_as_done": None,
+}, required=["title", "tasks"])
+_fields(InputChecklistTask, {
+    "id": None,
+    "text": None,
+    "parse_mode": None,
+    "text_entities": _list(MessageEntity),
+}, required=["id", "text"])
+_fields(InputChecklist, {
+    "title": None,
+    "parse_mode": None,
+    "title_entities": _list(MessageEntity),
+    "tasks": _list(InputChecklistTask),
+    "others_can_add_tasks": None,
+    "others_can_mark_tasks_as_done": None,
+}, required=["title", "tasks"])
+_fields(ChecklistTasksDone, {
+    "checklist_message": Message,
+    "marked_as_done_task_ids": None,
+    "marked_as_not_done_task_ids": None,
+}, required=[])
+_fields(ChecklistTasksAdded, {
+    "checklist_message": Message,
+    "tasks": _list(ChecklistTask),
+}, required=["tasks"])
+_fields(Location, {
+    "latitude": None,
+    "longitude": None,
+    "horizontal_accuracy": None,
+    "live_period": None,
+    "heading": None,
+    "proximity_alert_radius": None,
+}, required=["latitude", "longitude"])
+_fields(Venue, {
+    "location": Location,
+    "title": None,
+    "address": None,
+    "foursquare_id": None,
+    "foursquare_type": None,
+    "google_place_id": None,
+    "google_place_type": None,
+}, required=["location", "title", "address"])
+_fields(WebAppData, {
+    "data": None,
+    "button_text": None,
+}, required=["data", "button_text"])
+_fields(ProximityAlertTriggered, {
+    "traveler": User,
+    "watcher": User,
+    "distance": None,
+}, required=["traveler", "watcher", "distance"])
+_fields(MessageAutoDeleteTimerChanged, {
+    "message_auto_delete_time": None,
+}, required=["message_auto_delete_time"])
+_fields(ChatBoostAdded, {
+    "boost_count": None,
+}, required=["boost_count"])
+_fields(BackgroundFillSolid, {
+    "type": None,
+    "color": None,
+}, required=["type", "color"])
+_fields(BackgroundFillGradient, {
+    "type": None,
+    "top_color": None,
+    "bottom_color": None,
+    "rotation_angle": None,
+}, required=["type", "top_color", "bottom_color", "rotation_angle"])
+_fields(BackgroundFillFreeformGradient, {
+    "type": None,
+    "colors": None,
+}, required=["type", "colors"])
+_fields(BackgroundTypeFill, {
+    "type": None,
+    "fill": BackgroundFill,
+    "dark_theme_dimming": None,
+}, required=["type", "fill", "dark_theme_dimming"])
+_fields(BackgroundTypeWallpaper, {
+    "type": None,
+    "document": Document,
+    "dark_theme_dimming": None,
+    "is_blurred": None,
+    "is_moving": None,
+}, required=["type", "document", "dark_theme_dimming"])
+_fields(BackgroundTypePattern, {
+    "type": None,
+    "document": Document,
+    "fill": BackgroundFill,
+    "intensity": None,
+    "is_inverted": None,
+    "is_moving": None,
+}, required=["type", "document", "fill", "intensity"])
+_fields(BackgroundTypeChatTheme, {
+    "type": None,
+    "theme_name": None,
+}, required=["type", "theme_name"])
+_fields(ChatBackground, {
+    "type": BackgroundType,
+}, required=["type"])
+_fields(ForumTopicCreated, {
+    "name": None,
+    "icon_color": None,
+    "icon_custom_emoji_id": None,
+}, required=["name", "icon_color"])
+_fields(ForumTopicClosed, {})
+_fields(ForumTopicEdited, {
+    "name": None,
+    "icon_custom_emoji_id": None,
+}, required=[])
+_fields(ForumTopicReopened, {})
+_fields(GeneralForumTopicHidden, {})
+_fields(GeneralForumTopicUnhidden, {})
+_fields(SharedUser, {
+    "user_id": None,
+    "first_name": None,
+    "last_name": None,
+    "username": None,
+    "photo": _list(PhotoSize),
+}, required=["user_id"])
+_fields(UsersShared, {
+    "request_id": None,
+    "users": _list(SharedUser),
+}, required=["request_id", "users"])
+_fields(ChatShared, {
+    "request_id": None,
+    "chat_id": None,
+    "title": None,
+    "username": None,
+    "photo": _list(PhotoSize),
+}, required=["request_id", "chat_id"])
+_fields(WriteAccessAllowed, {
+    "from_request": None,
+    "web_app_name": None,
+    "from_attachment_menu": None,
+}, required=[])
+_fields(VideoChatScheduled, {
+    "start_date": None,
+}, required=["start_date"])
+_fields(VideoChatStarted, {})
+_fields(VideoChatEnded, {
+    "duration": None,
+}, required=["duration"])
+_fields(VideoChatParticipantsInvited, {
+    "users": _list(User),
+}, required=["users"])
+_fields(PaidMessagePriceChanged, {
+    "paid_message_star_count": None,
+}, required=["paid_message_star_count"])
+_fields(DirectMessagePriceChanged, {
+    "are_direct_messages_enabled": None,
+    "direct_message_star_count": None,
+}, required=["are_direct_messages_enabled"])
+_fields(SuggestedPostApproved, {
+    "suggested_post_message": Message,
+    "price": SuggestedPostPrice,
+    "send_date": None,
+}, required=["send_date"])
+_fields(SuggestedPostApprovalFailed, {
+    "suggested_post_message": Message,
+    "price": SuggestedPostPrice,
+}, required=["price"])
+_fields(SuggestedPostDeclined, {
+    "suggested_post_message": Message,
+    "comment": None,
+}, required=[])
+_fields(SuggestedPostPaid, {
+    "suggested_post_message": Message,
+    "currency": None,
+    "amount": None,
+    "star_amount": StarAmount,
+}, required=["currency"])
+_fields(SuggestedPostRefunded, {
+    "suggested_post_message": Message,
+    "reason": None,
+}, required=["reason"])
+_fields(GiveawayCreated, {
+    "prize_star_count": None,
+}, required=[])
+_fields(Giveaway, {
+    "chats": _list(Chat),
+    "winners_selection_date": None,
+    "winner_count": None,
+    "only_new_members": None,
+    "has_public_winners": None,
+    "prize_description": None,
+    "country_codes": None,
+    "prize_star_count": None,
+    "premium_subscription_month_count": None,
+}, required=["chats", "winners_selection_date", "winner_count"])
+_fields(GiveawayWinners, {
+    "chat": Chat,
+    "giveaway_message_id": None,
+    "winners_selection_date": None,
+    "winner_count": None,
+    "winners": _list(User),
+    "additional_chat_count": None,
+    "prize_star_count": None,
+    "premium_subscription_month_count": None,
+    "unclaimed_prize_count": None,
+    "only_new_members": None,
+    "was_refunded": None,
+    "prize_description": None,
+}, required=["chat", "giveaway_message_id", "winners_selection_date", "winner_count", "winners"])
+_fields(GiveawayCompleted, {
+    "winner_count": None,
+    "unclaimed_prize_count": None,
+    "giveaway_message": Message,
+    "is_star_giveaway": None,
+}, required=["winner_count"])
+_fields(LinkPreviewOptions, {
+    "is_disabled": None,
+    "url": None,
+    "prefer_small_media": None,
+    "prefer_large_media": None,
+    "show_above_text": None,
+}, required=[])
+_fields(SuggestedPostPrice, {
+    "currency": None,
+    "amount": None,
+}, required=["currency", "amount"])
+_fields(SuggestedPostInfo, {
+    "state": None,
+    "price": SuggestedPostPrice,
+    "send_date": None,
+}, required=["state"])
+_fields(SuggestedPostParameters, {
+    "price": SuggestedPostPrice,
+    "send_date": None,
+}, required=[])
+_fields(DirectMessagesTopic, {
+    "topic_id": None,
+    "user": User,
+}, required=["topic_id"])
+_fields(UserProfilePhotos, {
+    "total_count": None,
+    "photos": _list(_list(PhotoSize)),
+}, required=["total_count", "photos"])
+_fields(File, {
+    "file_id": None,
+    "file_unique_id": None,
+    "file_size": None,
+    "file_path": None,
+}, required=["file_id", "file_unique_id"])
+_fields(WebAppInfo, {
+    "url": None,
+}, required=["url"])
+_fields(ReplyKeyboardMarkup, {
+    "keyboard": _list(_list(KeyboardButton)),
+    "is_persistent": None,
+    "resize_keyboard": None,
+    "one_time_keyboard": None,
+    "input_field_placeholder": None,
+    "selective": None,
+}, required=["keyboard"])
+_fields(KeyboardButton, {
+    "text": None,
+    "request_users": KeyboardButtonRequestUsers,
+    "request_chat": KeyboardButtonRequestChat,
+    "request_contact": None,
+    "request_location": None,
+    "request_poll": KeyboardButtonPollType,
+    "web_app": WebAppInfo,
+}, required=["text"])
+_fields(KeyboardButtonRequestUsers, {
+    "request_id": None,
+    "user_is_bot": None,
+    "user_is_premium": None,
+    "max_quantity": None,
+    "request_name": None,
+    "request_username": None,
+    "request_photo": None,
+}, required=["request_id"])
+_fields(KeyboardButtonRequestChat, {
+    "request_id": None,
+    "chat_is_channel": None,
+    "chat_is_forum": None,
+    "chat_has_username": None,
+    "chat_is_created": None,
+    "user_administrator_rights": ChatAdministratorRights,
+    "bot_administrator_rights": ChatAdministratorRights,
+    "bot_is_member": None,
+    "request_title": None,
+    "request_username": None,
+    "request_photo": None,
+}, required=["request_id", "chat_is_channel"])
+_fields(KeyboardButtonPollType, {
+    "type": None,
+}, required=[])
+_fields(ReplyKeyboardRemove, {
+    "remove_keyboard": None,
+    "selective": None,
+}, required=["remove_keyboard"])
+_fields(InlineKeyboardMarkup, {
+    "inline_keyboard": _list(_list(InlineKeyboardButton)),
+}, required=["inline_keyboard"])
+_fields(InlineKeyboardButton, {
+    "text": None,
+    "url": None,
+    "callback_data": None,
+    "web_app": WebAppInfo,
+    "login_url": LoginUrl,
+    "switch_inline_query": None,
+    "switch_inline_query_current_chat": None,
+    "switch_inline_query_chosen_chat": SwitchInlineQueryChosenChat,
+    "copy_text": CopyTextButton,
+    "callback_game": CallbackGame,
+    "pay": None,
+}, required=["text"])
+_fields(LoginUrl, {
+    "url": None,
+    "forward_text": None,
+    "bot_username": None,
+    "request_write_access": None,
+}, required=["url"])
+_fields(SwitchInlineQueryChosenChat, {
+    "query": None,
+    "allow_user_chats": None,
+    "allow_bot_chats": None,
+    "allow_group_chats": None,
+    "allow_channel_chats": None,
+}, required=[])
+_fields(CopyTextButton, {
+    "text": None,
+}, required=["text"])
+_fields(CallbackQuery, {
+    "id": None,
+    "from": User,
+    "message": MaybeInaccessibleMessage,
+    "inline_message_id": None,
+    "chat_instance": None,
+    "data": None,
+    "game_short_name": None,
+}, required=["id", "from", "chat_instance"])
+_fields(ForceReply, {
+    "force_reply": None,
+    "input_field_placeholder": None,
+    "selective": None,
+}, required=["force_reply"])
+_fields(ChatPhoto, {
+    "small_file_id": None,
+    "small_file_unique_id": None,
+    "big_file_id": None,
+    "big_file_unique_id": None,
+}, required=["small_file_id", "small_file_unique_id", "big_file_id", "big_file_unique_id"])
+_fields(ChatInviteLink, {
+    "invite_link": None,
+    "creator": User,
+    "creates_join_request": None,
+    "is_primary": None,
+    "is_revoked": None,
+    "name": None,
+    "expire_date": None,
+    "member_limit": None,
+    "pending_join_request_count": None,
+    "subscription_period": None,
+    "subscription_price": None,
+}, required=["invite_link", "creator", "creates_join_request", "is_primary", "is_revoked"])
+_fields(ChatAdministratorRights, {
+    "is_anonymous": None,
+    "can_manage_chat": None,
+    "can_delete_messages": None,
+    "can_manage_video_chats": None,
+    "can_restrict_members": None,
+    "can_promote_members": None,
+    "can_change_info": None,
+    "can_invite_users": None,
+    "can_post_stories": None,
+    "can_edit_stories": None,
+    "can_delete_stories": None,
+    "can_post_messages": None,
+    "can_edit_messages": None,
+    "can_pin_messages": None,
+    "can_manage_topics": None,
+    "can_manage_direct_messages": None,
+}, required=["is_anonymous", "can_manage_chat", "can_delete_messages", "can_manage_video_chats", "can_restrict_members", "can_promote_members", "can_change_info", "can_invite_users", "can_post_stories", "can_edit_stories", "can_delete_stories"])
+_fields(ChatMemberUpdated, {
+    "chat": Chat,
+    "from": User,
+    "date": None,
+    "old_chat_member": ChatMember,
+    "new_chat_member": ChatMember,
+    "invite_link": ChatInviteLink,
+    "via_join_request": None,
+    "via_chat_folder_invite_link": None,
+}, required=["chat", "from", "date", "old_chat_member", "new_chat_member"])
+_fields(ChatMemberOwner, {
+    "status": None,
+    "user": User,
+    "is_anonymous": None,
+    "custom_title": None,
+}, required=["status", "user", "is_anonymous"])
+_fields(ChatMemberAdministrator, {
+    "status": None,
+    "user": User,
+    "can_be_edited": None,
+    "is_anonymous": None,
+    "can_manage_chat": None,
+    "can_delete_messages": None,
+    "can_manage_video_chats": None,
+    "can_restrict_members": None,
+    "can_promote_members": None,
+    "can_change_info": None,
+    "can_invite_users": None,
+    "can_post_stories": None,
+    "can_edit_stories": None,
+    "can_delete_stories": None,
+    "can_post_messages": None,
+    "can_edit_messages": None,
+    "can_pin_messages": None,
+    "can_manage_topics": None,
+    "can_manage_direct_messages": None,
+    "custom_title": None,
+}, required=["status", "user", "can_be_edited", "is_anonymous", "can_manage_chat", "can_delete_messages", "can_manage_video_chats", "can_restrict_members", "can_promote_members", "can_change_info", "can_invite_users", "can_post_stories", "can_edit_stories", "can_delete_stories"])
+_fields(ChatMemberMember, {
+    "status": None,
+    "user": User,
+    "until_date": None,
+}, required=["status", "user"])
+_fields(ChatMemberRestricted, {
+    "status": None,
+    "user": User,
+    "is_member": None,
+    "can_send_messages": None,
+    "can_send_audios": None,
+    "can_send_documents": None,
+    "can_send_photos": None,
+    "can_send_videos": None,
+    "can_send_video_notes": None,
+    "can_send_voice_notes": None,
+    "can_send_polls": None,
+    "can_send_other_messages": None,
+    "can_add_web_page_previews": None,
+    "can_change_info": None,
+    "can_invite_users": None,
+    "can_pin_messages": None,
+    "can_manage_topics": None,
+    "until_date": None,
+}, required=["status", "user", "is_member", "can_send_messages", "can_send_audios", "can_send_documents", "can_send_photos", "can_send_videos", "can_send_video_notes", "can_send_voice_notes", "can_send_polls", "can_send_other_messages", "can_add_web_page_previews", "can_change_info", "can_invite_users", "can_pin_messages", "can_manage_topics", "until_date"])
+_fields(ChatMemberLeft, {
+    "status": None,
+    "user": User,
+}, required=["status", "user"])
+_fields(ChatMemberBanned, {
+    "status": None,
+    "user": User,
+    "until_date": None,
+}, required=["status", "user", "until_date"])
+_fields(ChatJoinRequest, {
+    "chat": Chat,
+    "from": User,
+    "user_chat_id": None,
+    "date": None,
+    "bio": None,
+    "invite_link": ChatInviteLink,
+}, required=["chat", "from", "user_chat_id", "date"])
+_fields(ChatPermissions, {
+    "can_send_messages": None,
+    "can_send_audios": None,
+    "can_send_documents": None,
+    "can_send_photos": None,
+    "can_send_videos": None,
+    "can_send_video_notes": None,
+    "can_send_voice_notes": None,
+    "can_send_polls": None,
+    "can_send_other_messages": None,
+    "can_add_web_page_previews": None,
+    "can_change_info": None,
+    "can_invite_users": None,
+    "can_pin_messages": None,
+    "can_manage_topics": None,
+}, required=[])
+_fields(Birthdate, {
+    "day": None,
+    "month": None,
+    "year": None,
+}, required=["day", "month"])
+_fields(BusinessIntro, {
+    "title": None,
+    "message": None,
+    "sticker": Sticker,
+}, required=[])
+_fields(BusinessLocation, {
+    "address": None,
+    "location": Location,
+}, required=["address"])
+_fields(BusinessOpeningHoursInterval, {
+    "opening_minute": None,
+    "closing_minute": None,
+}, required=["opening_minute", "closing_minute"])
+_fields(BusinessOpeningHours, {
+    "time_zone_name": None,
+    "opening_hours": _list(BusinessOpeningHoursInterval),
+}, required=["time_zone_name", "opening_hours"])
+_fields(StoryAreaPosition, {
+    "x_percentage": None,
+    "y_percentage": None,
+    "width_percentage": None,
+    "height_percentage": None,
+    "rotation_angle": None,
+    "corner_radius_percentage": None,
+}, required=["x_percentage", "y_percentage", "width_percentage", "height_percentage", "rotation_angle", "corner_radius_percentage"])
+_fields(LocationAddress, {
+    "country_code": None,
+    "state": None,
+    "city": None,
+    "street": None,
+}, required=["country_code"])
+_fields(StoryAreaTypeLocation, {
+    "type": None,
+    "latitude": None,
+    "longitude": None,
+    "address": LocationAddress,
+}, required=["type", "latitude", "longitude"])
+_fields(StoryAreaTypeSuggestedReaction, {
+    "type": None,
+    "reaction_type": ReactionType,
+    "is_dark": None,
+    "is_flipped": None,
+}, required=["type", "reaction_type"])
+_fields(StoryAreaTypeLink, {
+    "type": None,
+    "url": None,
+}, required=["type", "url"])
+_fields(StoryAreaTypeWeather, {
+    "type": None,
+    "temperature": None,
+    "emoji": None,
+    "background_color": None,
+}, required=["type", "temperature", "emoji", "background_color"])
+_fields(StoryAreaTypeUniqueGift, {
+    "type": None,
+    "name": None,
+}, required=["type", "name"])
+_fields(StoryArea, {
+    "position": StoryAreaPosition,
+    "type": StoryAreaType,
+}, required=["position", "type"])
+_fields(ChatLocation, {
+    "location": Location,
+    "address": None,
+}, required=["location", "address"])
+_fields(ReactionTypeEmoji, {
+    "type": None,
+    "emoji": None,
+}, required=["type", "emoji"])
+_fields(ReactionTypeCustomEmoji, {
+    "type": None,
+    "custom_emoji_id": None,
+}, required=["type", "custom_emoji_id"])
+_fields(ReactionTypePaid, {
+    "type": None,
+}, required=["type"])
+_fields(ReactionCount, {
+    "type": ReactionType,
+    "total_count": None,
+}, required=["type", "total_count"])
+_fields(MessageReactionUpdated, {
+    "chat": Chat,
+    "message_id": None,
+    "user": User,
+    "actor_chat": Chat,
+    "date": None,
+    "old_reaction": _list(ReactionType),
+    "new_reaction": _list(ReactionType),
+}, required=["chat", "message_id", "date", "old_reaction", "new_reaction"])
+_fields(MessageReactionCountUpdated, {
+    "chat": Chat,
+    "message_id": None,
+    "date": None,
+    "reactions": _list(ReactionCount),
+}, required=["chat", "message_id", "date", "reactions"])
+_fields(ForumTopic, {
+    "message_thread_id": None,
+    "name": None,
+    "icon_color": None,
+    "icon_custom_emoji_id": None,
+}, required=["message_thread_id", "name", "icon_color"])
+_fields(Gift, {
+    "id": None,
+    "sticker": Sticker,
+    "star_count": None,
+    "upgrade_star_count": None,
+    "total_count": None,
+    "remaining_count": None,
+    "publisher_chat": Chat,
+}, required=["id", "sticker", "star_count"])
+_fields(Gifts, {
+    "gifts": _list(Gift),
+}, required=["gifts"])
+_fields(UniqueGiftModel, {
+    "name": None,
+    "sticker": Sticker,
+    "rarity_per_mille": None,
+}, required=["name", "sticker", "rarity_per_mille"])
+_fields(UniqueGiftSymbol, {
+    "name": None,
+    "sticker": Sticker,
+    "rarity_per_mille": None,
+}, required=["name", "sticker", "rarity_per_mille"])
+_fields(UniqueGiftBackdropColors, {
+    "center_color": None,
+    "edge_color": None,
+    "symbol_color": None,
+    "text_color": None,
+}, required=["center_color", "edge_color", "symbol_color", "text_color"])
+_fields(UniqueGiftBackdrop, {
+    "name": None,
+    "colors": UniqueGiftBackdropColors,
+    "rarity_per_mille": None,
+}, required=["name", "colors", "rarity_per_mille"])
+_fields(UniqueGift, {
+    "base_name": None,
+    "name": None,
+    "number": None,
+    "model": UniqueGiftModel,
+    "symbol": UniqueGiftSymbol,
+    "backdrop": UniqueGiftBackdrop,
+    "publisher_chat": Chat,
+}, required=["base_name", "name", "number", "model", "symbol", "backdrop"])
+_fields(GiftInfo, {
+    "gift": Gift,
+    "owned_gift_id": None,
+    "convert_star_count": None,
+    "prepaid_upgrade_star_count": None,
+    "can_be_upgraded": None,
+    "text": None,
+    "entities": _list(MessageEntity),
+    "is_private": None,
+}, required=["gift"])
+_fields(UniqueGiftInfo, {
+    "gift": UniqueGift,
+    "origin": None,
+    "last_resale_star_count": None,
+    "owned_gift_id": None,
+    "transfer_star_count": None,
+    "next_transfer_date": None,
+}, required=["gift", "origin"])
+_fields(OwnedGiftRegular, {
+    "type": None,
+    "gift": Gift,
+    "owned_gift_id": None,
+    "sender_user": User,
+    "send_date": None,
+    "text": None,
+    "entities": _list(MessageEntity),
+    "is_private": None,
+    "is_saved": None,
+    "can_be_upgraded": None,
+    "was_refunded": None,
+    "convert_star_count": None,
+    "prepaid_upgrade_star_count": None,
+}, required=["type", "gift", "send_date"])
+_fields(OwnedGiftUnique, {
+    "type": None,
+    "gift": UniqueGift,
+    "owned_gift_id": None,
+    "sender_user": User,
+    "send_date": None,
+    "is_saved": None,
+    "can_be_transferred": None,
+    "transfer_star_count": None,
+    "next_transfer_date": None,
+}, required=["type", "gift", "send_date"])
+_fields(OwnedGifts, {
+    "total_count": None,
+    "gifts": _list(OwnedGift),
+    "next_offset": None,
+}, required=["total_count", "gifts"])
+_fields(AcceptedGiftTypes, {
+    "unlimited_gifts": None,
+    "limited_gifts": None,
+    "unique_gifts": None,
+    "premium_subscription": None,
+}, required=["unlimited_gifts", "limited_gifts", "unique_gifts", "premium_subscription"])
+_fields(StarAmount, {
+    "amount": None,
+    "nanostar_amount": None,
+}, required=["amount"])
+_fields(BotCommand, {
+    "command": None,
+    "description": None,
+}, required=["command", "description"])
+_fields(BotCommandScopeDefault, {
+    "type": None,
+}, required=["type"])
+_fields(BotCommandScopeAllPrivateChats, {
+    "type": None,
+}, required=["type"])
+_fields(BotCommandScopeAllGroupChats, {
+    "type": None,
+}, required=["type"])
+_fields(BotCommandScopeAllChatAdministrators, {
+    "type": None,
+}, required=["type"])
+_fields(BotCommandScopeChat, {
+    "type": None,
+    "chat_id": None,
+}, required=["type", "chat_id"])
+_fields(BotCommandScopeChatAdministrators, {
+    "type": None,
+    "chat_id": None,
+}, required=["type", "chat_id"])
+_fields(BotCommandScopeChatMember, {
+    "type": None,
+    "chat_id": None,
+    "user_id": None,
+}, required=["type", "chat_id", "user_id"])
+_fields(BotName, {
+    "name": None,
+}, required=["name"])
+_fields(BotDescription, {
+    "description": None,
+}, required=["description"])
+_fields(BotShortDescription, {
+    "short_description": None,
+}, required=["short_description"])
+_fields(MenuButtonCommands, {
+    "type": None,
+}, required=["type"])
+_fields(MenuButtonWebApp, {
+    "type": None,
+    "text": None,
+    "web_app": WebAppInfo,
+}, required=["type", "text", "web_app"])
+_fields(MenuButtonDefault, {
+    "type": None,
+}, required=["type"])
+_fields(ChatBoostSourcePremium, {
+    "source": None,
+    "user": User,
+}, required=["source", "user"])
+_fields(ChatBoostSourceGiftCode, {
+    "source": None,
+    "user": User,
+}, required=["source", "user"])
+_fields(ChatBoostSourceGiveaway, {
+    "source": None,
+    "giveaway_message_id": None,
+    "user": User,
+    "prize_star_count": None,
+    "is_unclaimed": None,
+}, required=["source", "giveaway_message_id"])
+_fields(ChatBoost, {
+    "boost_id": None,
+    "add_date": None,
+    "expiration_date": None,
+    "source": ChatBoostSource,
+}, required=["boost_id", "add_date", "expiration_date", "source"])
+_fields(ChatBoostUpdated, {
+    "chat": Chat,
+    "boost": ChatBoost,
+}, required=["chat", "boost"])
+_fields(ChatBoostRemoved, {
+    "chat": Chat,
+    "boost_id": None,
+    "remove_date": None,
+    "source": ChatBoostSource,
+}, required=["chat", "boost_id", "remove_date", "source"])
+_fields(UserChatBoosts, {
+    "boosts": _list(ChatBoost),
+}, required=["boosts"])
+_fields(BusinessBotRights, {
+    "can_reply": None,
+    "can_read_messages": None,
+    "can_delete_sent_messages": None,
+    "can_delete_all_messages": None,
+    "can_edit_name": None,
+    "can_edit_bio": None,
+    "can_edit_profile_photo": None,
+    "can_edit_username": None,
+    "can_change_gift_settings": None,
+    "can_view_gifts_and_stars": None,
+    "can_convert_gifts_to_stars": None,
+    "can_transfer_and_upgrade_gifts": None,
+    "can_transfer_stars": None,
+    "can_manage_stories": None,
+}, required=[])
+_fields(BusinessConnection, {
+    "id": None,
+    "user": User,
+    "user_chat_id": None,
+    "date": None,
+    "rights": BusinessBotRights,
+    "is_enabled": None,
+}, required=["id", "user", "user_chat_id", "date", "is_enabled"])
+_fields(BusinessMessagesDeleted, {
+    "business_connection_id": None,
+    "chat": Chat,
+    "message_ids": None,
+}, required=["business_connection_id", "chat", "message_ids"])
+_fields(ResponseParameters, {
+    "migrate_to_chat_id": None,
+    "retry_after": None,
+}, required=[])
+_fields(InputMediaPhoto, {
+    "type": None,
+    "media": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "show_caption_above_media": None,
+    "has_spoiler": None,
+}, required=["type", "media"])
+_fields(InputMediaVideo, {
+    "type": None,
+    "media": None,
+    "thumbnail": None,
+    "cover": None,
+    "start_timestamp": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "show_caption_above_media": None,
+    "width": None,
+    "height": None,
+    "duration": None,
+    "supports_streaming": None,
+    "has_spoiler": None,
+}, required=["type", "media"])
+_fields(InputMediaAnimation, {
+    "type": None,
+    "media": None,
+    "thumbnail": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "show_caption_above_media": None,
+    "width": None,
+    "height": None,
+    "duration": None,
+    "has_spoiler": None,
+}, required=["type", "media"])
+_fields(InputMediaAudio, {
+    "type": None,
+    "media": None,
+    "thumbnail": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "duration": None,
+    "performer": None,
+    "title": None,
+}, required=["type", "media"])
+_fields(InputMediaDocument, {
+    "type": None,
+    "media": None,
+    "thumbnail": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "disable_content_type_detection": None,
+}, required=["type", "media"])
+_fields(InputFile, {})
+_fields(InputPaidMediaPhoto, {
+    "type": None,
+    "media": None,
+}, required=["type", "media"])
+_fields(InputPaidMediaVideo, {
+    "type": None,
+    "media": None,
+    "thumbnail": None,
+    "cover": None,
+    "start_timestamp": None,
+    "width": None,
+    "height": None,
+    "duration": None,
+    "supports_streaming": None,
+}, required=["type", "media"])
+_fields(InputProfilePhotoStatic, {
+    "type": None,
+    "photo": None,
+}, required=["type", "photo"])
+_fields(InputProfilePhotoAnimated, {
+    "type": None,
+    "animation": None,
+    "main_frame_timestamp": None,
+}, required=["type", "animation"])
+_fields(InputStoryContentPhoto, {
+    "type": None,
+    "photo": None,
+}, required=["type", "photo"])
+_fields(InputStoryContentVideo, {
+    "type": None,
+    "video": None,
+    "duration": None,
+    "cover_frame_timestamp": None,
+    "is_animation": None,
+}, required=["type", "video"])
+_fields(Sticker, {
+    "file_id": None,
+    "file_unique_id": None,
+    "type": None,
+    "width": None,
+    "height": None,
+    "is_animated": None,
+    "is_video": None,
+    "thumbnail": PhotoSize,
+    "emoji": None,
+    "set_name": None,
+    "premium_animation": File,
+    "mask_position": MaskPosition,
+    "custom_emoji_id": None,
+    "needs_repainting": None,
+    "file_size": None,
+}, required=["file_id", "file_unique_id", "type", "width", "height", "is_animated", "is_video"])
+_fields(StickerSet, {
+    "name": None,
+    "title": None,
+    "sticker_type": None,
+    "stickers": _list(Sticker),
+    "thumbnail": PhotoSize,
+}, required=["name", "title", "sticker_type", "stickers"])
+_fields(MaskPosition, {
+    "point": None,
+    "x_shift": None,
+    "y_shift": None,
+    "scale": None,
+}, required=["point", "x_shift", "y_shift", "scale"])
+_fields(InputSticker, {
+    "sticker": None,
+    "format": None,
+    "emoji_list": None,
+    "mask_position": MaskPosition,
+    "keywords": None,
+}, required=["sticker", "format", "emoji_list"])
+_fields(InlineQuery, {
+    "id": None,
+    "from": User,
+    "query": None,
+    "offset": None,
+    "chat_type": None,
+    "location": Location,
+}, required=["id", "from", "query", "offset"])
+_fields(InlineQueryResultsButton, {
+    "text": None,
+    "web_app": WebAppInfo,
+    "start_parameter": None,
+}, required=["text"])
+_fields(InlineQueryResultArticle, {
+    "type": None,
+    "id": None,
+    "title": None,
+    "input_message_content": InputMessageContent,
+    "reply_markup": InlineKeyboardMarkup,
+    "url": None,
+    "description": None,
+    "thumbnail_url": None,
+    "thumbnail_width": None,
+    "thumbnail_height": None,
+}, required=["type", "id", "title", "input_message_content"])
+_fields(InlineQueryResultPhoto, {
+    "type": None,
+    "id": None,
+    "photo_url": None,
+    "thumbnail_url": None,
+    "photo_width": None,
+    "photo_height": None,
+    "title": None,
+    "description": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "show_caption_above_media": None,
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+}, required=["type", "id", "photo_url", "thumbnail_url"])
+_fields(InlineQueryResultGif, {
+    "type": None,
+    "id": None,
+    "gif_url": None,
+    "gif_width": None,
+    "gif_height": None,
+    "gif_duration": None,
+    "thumbnail_url": None,
+    "thumbnail_mime_type": None,
+    "title": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "show_caption_above_media": None,
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+}, required=["type", "id", "gif_url", "thumbnail_url"])
+_fields(InlineQueryResultMpeg4Gif, {
+    "type": None,
+    "id": None,
+    "mpeg4_url": None,
+    "mpeg4_width": None,
+    "mpeg4_height": None,
+    "mpeg4_duration": None,
+    "thumbnail_url": None,
+    "thumbnail_mime_type": None,
+    "title": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "show_caption_above_media": None,
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+}, required=["type", "id", "mpeg4_url", "thumbnail_url"])
+_fields(InlineQueryResultVideo, {
+    "type": None,
+    "id": None,
+    "video_url": None,
+    "mime_type": None,
+    "thumbnail_url": None,
+    "title": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "show_caption_above_media": None,
+    "video_width": None,
+    "video_height": None,
+    "video_duration": None,
+    "description": None,
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+}, required=["type", "id", "video_url", "mime_type", "thumbnail_url", "title"])
+_fields(InlineQueryResultAudio, {
+    "type": None,
+    "id": None,
+    "audio_url": None,
+    "title": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "performer": None,
+    "audio_duration": None,
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+}, required=["type", "id", "audio_url", "title"])
+_fields(InlineQueryResultVoice, {
+    "type": None,
+    "id": None,
+    "voice_url": None,
+    "title": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "voice_duration": None,
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+}, required=["type", "id", "voice_url", "title"])
+_fields(InlineQueryResultDocument, {
+    "type": None,
+    "id": None,
+    "title": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "document_url": None,
+    "mime_type": None,
+    "description": None,
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+    "thumbnail_url": None,
+    "thumbnail_width": None,
+    "thumbnail_height": None,
+}, required=["type", "id", "title", "document_url", "mime_type"])
+_fields(InlineQueryResultLocation, {
+    "type": None,
+    "id": None,
+    "latitude": None,
+    "longitude": None,
+    "title": None,
+    "horizontal_accuracy": None,
+    "live_period": None,
+    "heading": None,
+    "proximity_alert_radius": None,
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+    "thumbnail_url": None,
+    "thumbnail_width": None,
+    "thumbnail_height": None,
+}, required=["type", "id", "latitude", "longitude", "title"])
+_fields(InlineQueryResultVenue, {
+    "type": None,
+    "id": None,
+    "latitude": None,
+    "longitude": None,
+    "title": None,
+    "address": None,
+    "foursquare_id": None,
+    "foursquare_type": None,
+    "google_place_id": None,
+    "google_place_type": None,
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+    "thumbnail_url": None,
+    "thumbnail_width": None,
+    "thumbnail_height": None,
+}, required=["type", "id", "latitude", "longitude", "title", "address"])
+_fields(InlineQueryResultContact, {
+    "type": None,
+    "id": None,
+    "phone_number": None,
+    "first_name": None,
+    "last_name": None,
+    "vcard": None,
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+    "thumbnail_url": None,
+    "thumbnail_width": None,
+    "thumbnail_height": None,
+}, required=["type", "id", "phone_number", "first_name"])
+_fields(InlineQueryResultGame, {
+    "type": None,
+    "id": None,
+    "game_short_name": None,
+    "reply_markup": InlineKeyboardMarkup,
+}, required=["type", "id", "game_short_name"])
+_fields(InlineQueryResultCachedPhoto, {
+    "type": None,
+    "id": None,
+    "photo_file_id": None,
+    "title": None,
+    "description": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "show_caption_above_media": None,
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+}, required=["type", "id", "photo_file_id"])
+_fields(InlineQueryResultCachedGif, {
+    "type": None,
+    "id": None,
+    "gif_file_id": None,
+    "title": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "show_caption_above_media": None,
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+}, required=["type", "id", "gif_file_id"])
+_fields(InlineQueryResultCachedMpeg4Gif, {
+    "type": None,
+    "id": None,
+    "mpeg4_file_id": None,
+    "title": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "show_caption_above_media": None,
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+}, required=["type", "id", "mpeg4_file_id"])
+_fields(InlineQueryResultCachedSticker, {
+    "type": None,
+    "id": None,
+    "sticker_file_id": None,
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+}, required=["type", "id", "sticker_file_id"])
+_fields(InlineQueryResultCachedDocument, {
+    "type": None,
+    "id": None,
+    "title": None,
+    "document_file_id": None,
+    "description": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+}, required=["type", "id", "title", "document_file_id"])
+_fields(InlineQueryResultCachedVideo, {
+    "type": None,
+    "id": None,
+    "video_file_id": None,
+    "title": None,
+    "description": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "show_caption_above_media": None,
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+}, required=["type", "id", "video_file_id", "title"])
+_fields(InlineQueryResultCachedVoice, {
+    "type": None,
+    "id": None,
+    "voice_file_id": None,
+    "title": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+}, required=["type", "id", "voice_file_id", "title"])
+_fields(InlineQueryResultCachedAudio, {
+    "type": None,
+    "id": None,
+    "audio_file_id": None,
+    "caption": None,
+    "parse_mode": None,
+    "caption_entities": _list(MessageEntity),
+    "reply_markup": InlineKeyboardMarkup,
+    "input_message_content": InputMessageContent,
+}, required=["type", "id", "audio_file_id"])
+_fields(InputTextMessageContent, {
+    "message_text": None,
+    "parse_mode": None,
+    "entities": _list(MessageEntity),
+    "link_preview_options": LinkPreviewOptions,
+}, required=["message_text"])
+_fields(InputLocationMessageContent, {
+    "latitude": None,
+    "longitude": None,
+    "horizontal_accuracy": None,
+    "live_period": None,
+    "heading": None,
+    "proximity_alert_radius": None,
+}, required=["latitude", "longitude"])
+_fields(InputVenueMessageContent, {
+    "latitude": None,
+    "longitude": None,
+    "title": None,
+    "address": None,
+    "foursquare_id": None,
+    "foursquare_type": None,
+    "google_place_id": None,
+    "google_place_type": None,
+}, required=["latitude", "longitude", "title", "address"])
+_fields(InputContactMessageContent, {
+    "phone_number": None,
+    "first_name": None,
+    "last_name": None,
+    "vcard": None,
+}, required=["phone_number", "first_name"])
+_fields(InputInvoiceMessageContent, {
+    "title": None,
+    "description": None,
+    "payload": None,
+    "provider_token": None,
+    "currency": None,
+    "prices": _list(LabeledPrice),
+    "max_tip_amount": None,
+    "suggested_tip_amounts": None,
+    "provider_data": None,
+    "photo_url": None,
+    "photo_size": None,
+    "photo_width": None,
+    "photo_height": None,
+    "need_name": None,
+    "need_phone_number": None,
+    "need_email": None,
+    "need_shipping_address": None,
+    "send_phone_number_to_provider": None,
+    "send_email_to_provider": None,
+    "is_flexible": None,
+}, required=["title", "description", "payload", "currency", "prices"])
+_fields(ChosenInlineResult, {
+    "result_id": None,
+    "from": User,
+    "location": Location,
+    "inline_message_id": None,
+    "query": None,
+}, required=["result_id", "from", "query"])
+_fields(SentWebAppMessage, {
+    "inline_message_id": None,
+}, required=[])
+_fields(PreparedInlineMessage, {
+    "id": None,
+    "expiration_date": None,
+}, required=["id", "expiration_date"])
+_fields(LabeledPrice, {
+    "label": None,
+    "amount": None,
+}, required=["label", "amount"])
+_fields(Invoice, {
+    "title": None,
+    "description": None,
+    "start_parameter": None,
+    "currency": None,
+    "total_amount": None,
+}, required=["title", "description", "start_parameter", "currency", "total_amount"])
+_fields(ShippingAddress, {
+    "country_code": None,
+    "state": None,
+    "city": None,
+    "street_line1": None,
+    "street_line2": None,
+    "post_code": None,
+}, required=["country_code", "state", "city", "street_line1", "street_line2", "post_code"])
+_fields(OrderInfo, {
+    "name": None,
+    "phone_number": None,
+    "email": None,
+    "shipping_address": ShippingAddress,
+}, required=[])
+_fields(ShippingOption, {
+    "id": None,
+    "title": None,
+    "prices": _list(LabeledPrice),
+}, required=["id", "title", "prices"])
+_fields(SuccessfulPayment, {
+    "currency": None,
+    "total_amount": None,
+    "invoice_payload": None,
+    "subscription_expiration_date": None,
+    "is_recurring": None,
+    "is_first_recurring": None,
+    "shipping_option_id": None,
+    "order_info": OrderInfo,
+    "telegram_payment_charge_id": None,
+    "provider_payment_charge_id": None,
+}, required=["currency", "total_amount", "invoice_payload", "telegram_payment_charge_id", "provider_payment_charge_id"])
+_fields(RefundedPayment, {
+    "currency": None,
+    "total_amount": None,
+    "invoice_payload": None,
+    "telegram_payment_charge_id": None,
+    "provider_payment_charge_id": None,
+}, required=["currency", "total_amount", "invoice_payload", "telegram_payment_charge_id"])
+_fields(ShippingQuery, {
+    "id": None,
+    "from": User,
+    "invoice_payload": None,
+    "shipping_address": ShippingAddress,
+}, required=["id", "from", "invoice_payload", "shipping_address"])
+_fields(PreCheckoutQuery, {
+    "id": None,
+    "from": User,
+    "currency": None,
+    "total_amount": None,
+    "invoice_payload": None,
+    "shipping_option_id": None,
+    "order_info": OrderInfo,
+}, required=["id", "from", "currency", "total_amount", "invoice_payload"])
+_fields(PaidMediaPurchased, {
+    "from": User,
+    "paid_media_payload": None,
+}, required=["from", "paid_media_payload"])
+_fields(RevenueWithdrawalStatePending, {
+    "type": None,
+}, required=["type"])
+_fields(RevenueWithdrawalStateSucceeded, {
+    "type": None,
+    "date": None,
+    "url": None,
+}, required=["type", "date", "url"])
+_fields(RevenueWithdrawalStateFailed, {
+    "type": None,
+}, required=["type"])
+_fields(AffiliateInfo, {
+    "affiliate_user": User,
+    "affiliate_chat": Chat,
+    "commission_per_mille": None,
+    "amount": None,
+    "nanostar_amount": None,
+}, required=["commission_per_mille", "amount"])
+_fields(TransactionPartnerUser, {
+    "type": None,
+    "transaction_type": None,
+    "user": User,
+    "affiliate": AffiliateInfo,
+    "invoice_payload": None,
+    "subscription_period": None,
+    "paid_media": _list(PaidMedia),
+    "paid_media_payload": None,
+    "gift": Gift,
+    "premium_subscription_duration": None,
+}, required=["type", "transaction_type", "user"])
+_fields(TransactionPartnerChat, {
+    "type": None,
+    "chat": Chat,
+    "gift": Gift,
+}, required=["type", "chat"])
+_fields(TransactionPartnerAffiliateProgram, {
+    "type": None,
+    "sponsor_user": User,
+    "commission_per_mille": None,
+}, required=["type", "commission_per_mille"])
+_fields(TransactionPartnerFragment, {
+    "type": None,
+    "withdrawal_state": RevenueWithdrawalState,
+}, required=["type"])
+_fields(TransactionPartnerTelegramAds, {
+    "type": None,
+}, required=["type"])
+_fields(TransactionPartnerTelegramApi, {
+    "type": None,
+    "request_count": None,
+}, required=["type", "request_count"])
+_fields(TransactionPartnerOther, {
+    "type": None,
+}, required=["type"])
+_fields(StarTransaction, {
+    "id": None,
+    "amount": None,
+    "nanostar_amount": None,
+    "date": None,
+    "source": TransactionPartner,
+    "receiver": TransactionPartner,
+}, required=["id", "amount", "date"])
+_fields(StarTransactions, {
+    "transactions": _list(StarTransaction),
+}, required=["transactions"])
+_fields(PassportData, {
+    "data": _list(EncryptedPassportElement),
+    "credentials": EncryptedCredentials,
+}, required=["data", "credentials"])
+_fields(PassportFile, {
+    "file_id": None,
+    "file_unique_id": None,
+    "file_size": None,
+    "file_date": None,
+}, required=["file_id", "file_unique_id", "file_size", "file_date"])
+_fields(EncryptedPassportElement, {
+    "type": None,
+    "data": None,
+    "phone_number": None,
+    "email": None,
+    "files": _list(PassportFile),
+    "front_side": PassportFile,
+    "reverse_side": PassportFile,
+    "selfie": PassportFile,
+    "translation": _list(PassportFile),
+    "hash": None,
+}, required=["type", "hash"])
+_fields(EncryptedCredentials, {
+    "data": None,
+    "hash": None,
+    "secret": None,
+}, required=["data", "hash", "secret"])
+_fields(PassportElementErrorDataField, {
+    "source": None,
+    "type": None,
+    "field_name": None,
+    "data_hash": None,
+    "message": None,
+}, required=["source", "type", "field_name", "data_hash", "message"])
+_fields(PassportElementErrorFrontSide, {
+    "source": None,
+    "type": None,
+    "file_hash": None,
+    "message": None,
+}, required=["source", "type", "file_hash", "message"])
+_fields(PassportElementErrorReverseSide, {
+    "source": None,
+    "type": None,
+    "file_hash": None,
+    "message": None,
+}, required=["source", "type", "file_hash", "message"])
+_fields(PassportElementErrorSelfie, {
+    "source": None,
+    "type": None,
+    "file_hash": None,
+    "message": None,
+}, required=["source", "type", "file_hash", "message"])
+_fields(PassportElementErrorFile, {
+    "source": None,
+    "type": None,
+    "file_hash": None,
+    "message": None,
+}, required=["source", "type", "file_hash", "message"])
+_fields(PassportElementErrorFiles, {
+    "source": None,
+    "type": None,
+    "file_hashes": None,
+    "message": None,
+}, required=["source", "type", "file_hashes", "message"])
+_fields(PassportElementErrorTranslationFile, {
+    "source": None,
+    "type": None,
+    "file_hash": None,
+    "message": None,
+}, required=["source", "type", "file_hash", "message"])
+_fields(PassportElementErrorTranslationFiles, {
+    "source": None,
+    "type": None,
+    "file_hashes": None,
+    "message": None,
+}, required=["source", "type", "file_hashes", "message"])
+_fields(PassportElementErrorUnspecified, {
+    "source": None,
+    "type": None,
+    "element_hash": None,
+    "message": None,
+}, required=["source", "type", "element_hash", "message"])
+_fields(Game, {
+    "title": None,
+    "description": None,
+    "photo": _list(PhotoSize),
+    "text": None,
+    "text_entities": _list(MessageEntity),
+    "animation": Animation,
+}, required=["title", "description", "photo"])
+_fields(CallbackGame, {})
+_fields(GameHighScore, {
+    "position": None,
+    "user": User,
+    "score": None,
+}, required=["position", "user", "score"])
+_structural(MaybeInaccessibleMessage, InaccessibleMessage, Message)
+_discriminated(MessageOrigin, "type", {
+    "channel": MessageOriginChannel,
+    "chat": MessageOriginChat,
+    "hidden_user": MessageOriginHiddenUser,
+    "user": MessageOriginUser,
+})
+_discriminated(PaidMedia, "type", {
+    "photo": PaidMediaPhoto,
+    "preview": PaidMediaPreview,
+    "video": PaidMediaVideo,
+})
+_discriminated(BackgroundFill, "type", {
+    "freeform_gradient": BackgroundFillFreeformGradient,
+    "gradient": BackgroundFillGradient,
+    "solid": BackgroundFillSolid,
+})
+_discriminated(BackgroundType, "type", {
+    "chat_theme": BackgroundTypeChatTheme,
+    "fill": BackgroundTypeFill,
+    "pattern": BackgroundTypePattern,
+    "wallpaper": BackgroundTypeWallpaper,
+})
+_discriminated(ChatMember, "status", {
+    "administrator": ChatMemberAdministrator,
+    "kicked": ChatMemberBanned,
+    "left": ChatMemberLeft,
+    "member": ChatMemberMember,
+    "creator": ChatMemberOwner,
+    "restricted": ChatMemberRestricted,
+})
+_discriminated(StoryAreaType, "type", {
+    "link": StoryAreaTypeLink,
+    "location": StoryAreaTypeLocation,
+    "suggested_reaction": StoryAreaTypeSuggestedReaction,
+    "unique_gift": StoryAreaTypeUniqueGift,
+    "weather": StoryAreaTypeWeather,
+})
+_discriminated(ReactionType, "type", {
+    "custom_emoji": ReactionTypeCustomEmoji,
+    "emoji": ReactionTypeEmoji,
+    "paid": ReactionTypePaid,
+})
+_discriminated(OwnedGift, "type", {
+    "regular": OwnedGiftRegular,
+    "unique": OwnedGiftUnique,
+})
+_discriminated(BotCommandScope, "type", {
+    "all_chat_administrators": BotCommandScopeAllChatAdministrators,
+    "all_group_chats": BotCommandScopeAllGroupChats,
+    "all_private_chats": BotCommandScopeAllPrivateChats,
+    "chat": BotCommandScopeChat,
+    "chat_administrators": BotCommandScopeChatAdministrators,
+    "chat_member": BotCommandScopeChatMember,
+    "default": BotCommandScopeDefault,
+})
+_discriminated(MenuButton, "type", {
+    "commands": MenuButtonCommands,
+    "default": MenuButtonDefault,
+    "web_app": MenuButtonWebApp,
+})
+_discriminated(ChatBoostSource, "source", {
+    "gift_code": ChatBoostSourceGiftCode,
+    "giveaway": ChatBoostSourceGiveaway,
+    "premium": ChatBoostSourcePremium,
+})
+_discriminated(InputMedia, "type", {
+    "animation": InputMediaAnimation,
+    "audio": InputMediaAudio,
+    "document": InputMediaDocument,
+    "photo": InputMediaPhoto,
+    "video": InputMediaVideo,
+})
+_discriminated(InputPaidMedia, "type", {
+    "photo": InputPaidMediaPhoto,
+    "video": InputPaidMediaVideo,
+})
+_discriminated(InputProfilePhoto, "type", {
+    "animated": InputProfilePhotoAnimated,
+    "static": InputProfilePhotoStatic,
+})
+_discriminated(InputStoryContent, "type", {
+    "photo": InputStoryContentPhoto,
+    "video": InputStoryContentVideo,
+})
+_discriminated(InlineQueryResult, "type", {
+    "article": InlineQueryResultArticle,
+    "audio": _shapes(InlineQueryResultAudio, InlineQueryResultCachedAudio),
+    "document": _shapes(InlineQueryResultCachedDocument, InlineQueryResultDocument),
+    "gif": _shapes(InlineQueryResultCachedGif, InlineQueryResultGif),
+    "mpeg4_gif": _shapes(InlineQueryResultCachedMpeg4Gif, InlineQueryResultMpeg4Gif),
+    "photo": _shapes(InlineQueryResultCachedPhoto, InlineQueryResultPhoto),
+    "sticker": InlineQueryResultCachedSticker,
+    "video": _shapes(InlineQueryResultCachedVideo, InlineQueryResultVideo),
+    "voice": _shapes(InlineQueryResultCachedVoice, InlineQueryResultVoice),
+    "contact": InlineQueryResultContact,
+    "game": InlineQueryResultGame,
+    "location": InlineQueryResultLocation,
+    "venue": InlineQueryResultVenue,
+})
+_structural(InputMessageContent, InputContactMessageContent, InputInvoiceMessageContent, InputLocationMessageContent, InputTextMessageContent, InputVenueMessageContent)
+_discriminated(RevenueWithdrawalState, "type", {
+    "failed": RevenueWithdrawalStateFailed,
+    "pending": RevenueWithdrawalStatePending,
+    "succeeded": RevenueWithdrawalStateSucceeded,
+})
+_discriminated(TransactionPartner, "type", {
+    "affiliate_program": TransactionPartnerAffiliateProgram,
+    "chat": TransactionPartnerChat,
+    "fragment": TransactionPartnerFragment,
+    "other": TransactionPartnerOther,
+    "telegram_ads": TransactionPartnerTelegramAds,
+    "telegram_api": TransactionPartnerTelegramApi,
+    "user": TransactionPartnerUser,
+})
+_discriminated(PassportElementError, "source", {
+    "data": PassportElementErrorDataField,
+    "file": PassportElementErrorFile,
+    "files": PassportElementErrorFiles,
+    "front_side": PassportElementErrorFrontSide,
+    "reverse_side": PassportElementErrorReverseSide,
+    "selfie": PassportElementErrorSelfie,
+    "translation_file": PassportElementErrorTranslationFile,
+    "translation_files": PassportElementErrorTranslationFiles,
+    "unspecified": PassportElementErrorUnspecified,
+})
@@ -0,0 +1,162 @@
+"""
+Output stage for the JSON files the pipeline writes.
+
+Each tree is encoded in memory, with orjson when it is installed and the C
+encoder of the json module otherwise. The output is the same bytes as
+``json.dumps`` either way: trees with floats that orjson formats differently
+(exponents such as 1e+16 and 2.5e-05, NaN and Infinity) are encoded with the
+json module. Only the variants that are written, pretty, minified or both,
+are encoded. The text is written through a temporary file that replaces
+the target in one rename, so an interrupted run never leaves half-written
+JSON behind, and files whose content would not change are not written at
+all, so an unchanged output costs no disk write and no git churn.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+# json.dumps escapes everything outside printable ASCII; orjson does not.
+NON_ASCII = re.compile(r"[^\x00-\x7e]+")
+
+
+def _escape(match):
+    return json.dumps(match.group())[1:-1]
+
+
+def _ascii(data):
+    text = data.decode("utf-8")
+    return (
+        text if text.isascii() and "\x7f" not in text else NON_ASCII.sub(_escape, text)
+    )
+
+
+def canonical(tree):
+    """Returns a copy of tree with the keys of every object sorted."""
+    if isinstance(tree, dict):
+        return {key: canonical(tree[key]) for key in sorted(tree)}
+    if isinstance(tree, list):
+        return [canonical(value) for value in tree]
+    return tree
+
+
+def _orjson_floats(tree):
+    """
+    Returns whether orjson formats every float of a tree like json.dumps. It
+    writes exponents without "+" and leading zeros (1e16, 1e-7), some of them
+    without an exponent (0.000025), and NaN and Infinity as null.
+    """
+    stack = [tree]
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+        if kind is dict:
+            stack.extend(value.values())
+        elif kind is list:
+            stack.extend(value)
+        elif kind is float:
+            text = repr(value)
+            if "e" in text or "n" in text:
+                return False
+    return True
+
+
+def _encode(tree, variants, sort_keys):
+    """Returns the JSON text of a tree for every variant, True for pretty."""
+    if HAS_ORJSON and _orjson_floats(tree):
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        try:
+            encoded = [
+                orjson.dumps(
+                    tree, option=option | (orjson.OPT_INDENT_2 if pretty else 0)
+                )
+                for pretty in variants
+            ]
+        except TypeError:
+            # Integers wider than 64 bits and other values orjson rejects.
+            pass
+        else:
+            return [_ascii(data) for data in encoded]
+    return [
+        (
+            json.dumps(tree, indent=2, sort_keys=sort_keys)
+            if pretty
+            else json.dumps(tree, separators=(",", ":"), sort_keys=sort_keys)
+        )
+        for pretty in variants
+    ]
+
+
+def encode(tree, pretty=False, sort_keys=False):
+    """
+    Returns the pretty (indented by two spaces) or the minified JSON text of a
+    tree, byte for byte what json.dumps(indent=2) or
+    json.dumps(separators=(",", ":")) returns.
+    """
+    return _encode(tree, (pretty,), sort_keys)[0]
+
+
+def dumps(tree, sort_keys=False):
+    """Returns both the pretty and the minified JSON text of a tree (see encode)."""
+    pretty, minified = _encode(tree, (True, False), sort_keys)
+    return pretty, minified
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _unchanged(path, data):
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, "rb") as f:
+            return content_hash(f.read()) == content_hash(data)
+    except OSError:
+        return False
+
+
+def write_bytes(path, data):
+    """
+    Writes data to path atomically, unless the file already holds exactly
+    that content. Returns whether the file was written.
+    """
+    if _unchanged(path, data):
+        return False
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def write_text(path, text):
+    return write_bytes(path, text.encode("utf-8"))
+
+
+def write_json(tree, path, min_path=None, sort_keys=False):
+    """
+    Writes the pretty JSON of a tree to path and, when min_path is given, the
+    minified JSON to min_path. Returns the paths that were written.
+    """
+    if min_path:
+        pretty, minified = dumps(tree, sort_keys)
+    else:
+        pretty, minified = encode(tree, True, sort_keys), None
+    written = [path] if write_text(path, pretty) else []
+    if min_path and write_text(min_path, minified):
+        written.append(min_path)
+    return written
+
+
+def write_min_json(tree, path, sort_keys=False):
+    """Writes the minified JSON of a tree to path. Returns whether it was written."""
+    return write_text(path, encode(tree, False, sort_keys))
@@ -0,0 +1,156 @@
+import hashlib
+import json
+import os
+import threading
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "pages")
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+# Bump when the layout of the cache or of the cached parse results changes.
+CACHE_VERSION = 1
+
+
+class PageCache:
+    """
+    On-disk cache of downloaded pages.
+
+    Each entry stores the raw body of a page together with its ETag and
+    Last-Modified validators, and optionally the results of scraping it. The
+    total size of the cache is bounded by max_bytes; when it grows past that,
+    the least recently used entries are evicted first.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+
+    def _index_path(self):
+        return os.path.join(self.directory, "index.json")
+
+    def _path(self, key, suffix):
+        return os.path.join(self.directory, key + suffix)
+
+    def _load_index(self):
+        try:
+            with open(self._index_path()) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {"version": CACHE_VERSION, "clock": 0, "entries": {}}
+        if index.get("version") != CACHE_VERSION:
+            return {"version": CACHE_VERSION, "clock": 0, "entries": {}}
+        return index
+
+    def _save_index(self):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self._index_path() + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path())
+
+    def _touch(self, entry):
+        self._index["clock"] += 1
+        entry["used"] = self._index["clock"]
+
+    def _read(self, url, suffix):
+        with self._lock:
+            entry = self._index["entries"].get(url)
+            if not entry:
+                return None
+            self._touch(entry)
+            self._save_index()
+            path = self._path(entry["key"], suffix)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def __contains__(self, url):
+        entry = self._index["entries"].get(url)
+        return bool(entry) and os.path.exists(self._path(entry["key"], ".html"))
+
+    def conditional_headers(self, url):
+        """
+        Returns the If-None-Match/If-Modified-Since headers for a cached URL.
+        """
+        entry = self._index["entries"].get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def body(self, url):
+        """Returns the cached body of a URL, or None if it is not cached."""
+        return self._read(url, ".html")
+
+    def results(self, url, name):
+        """
+        Returns the cached results of scraping a URL with the scraper called
+        name, or None if they are not cached.
+        """
+        entry = self._index["entries"].get(url)
+        if not entry or entry.get("results") != name:
+            return None
+        text = self._read(url, ".json")
+        return json.loads(text) if text is not None else None
+
+    def store(self, url, body, headers, results=None, name=None):
+        """
+        Stores the body of a URL, the validators from its response headers and
+        optionally the results of scraping it with the scraper called name.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        key = hashlib.sha256(url.encode()).hexdigest()
+        body_bytes = body.encode("utf-8")
+        results_bytes = b""
+        if results is not None:
+            results_bytes = json.dumps(results).encode("utf-8")
+        size = len(body_bytes) + len(results_bytes)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self._path(key, ".html"), "wb") as f:
+                f.write(body_bytes)
+            if results is not None:
+                with open(self._path(key, ".json"), "wb") as f:
+                    f.write(results_bytes)
+            elif os.path.exists(self._path(key, ".json")):
+                os.remove(self._path(key, ".json"))
+            entry = {
+                "key": key,
+                "etag": etag,
+                "last_modified": last_modified,
+                "results": name if results is not None else None,
+                "size": size,
+            }
+            self._touch(entry)
+            self._index["entries"][url] = entry
+            self._evict()
+            self._save_index()
+
+    def _evict(self):
+        entries = self._index["entries"]
+        total = sum(entry["size"] for entry in entries.values())
+        for url in sorted(entries, key=lambda url: entries[url]["used"]):
+            if total <= self.max_bytes:
+                break
+            entry = entries.pop(url)
+            total -= entry["size"]
+            for suffix in (".html", ".json"):
+                path = self._path(entry["key"], suffix)
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def size(self):
+        """Returns the total number of bytes stored in the cache."""
+        return sum(entry["size"] for entry in self._index["entries"].values())
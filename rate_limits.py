@@ -0,0 +1,393 @@
+"""
+Simulates the rate limits of the x-rate-limit blocks of the extended spec.
+
+The FAQ limits are applied as three levels of token buckets, one after the
+other, to the events (timestamp, chat_id, method) of methods that have an
+x-rate-limit block:
+
+    per_chat_per_second   one bucket per chat
+    group_per_minute      one bucket per group (a negative chat_id)
+    broadcast_per_second  one bucket for the whole bot
+
+An event is allowed when every level it reaches has a token for it, and is
+rejected with a 429 and a retry_after otherwise. An event rejected by one
+level is not offered to the levels after it. Each level is a GCRA, the
+virtual scheduling form of a token bucket: a bucket is a single theoretical
+arrival time (TAT), and an event at t conforms when t >= TAT - tolerance.
+The bursts a bucket allows are set per level with the burst argument.
+
+The TATs of a level are kept in a pair of NumPy arrays sorted by key, rather
+than in a dictionary of bucket objects. A bucket whose TAT has passed is full
+again and indistinguishable from a chat that was never seen, so it is dropped
+after every batch: memory is bounded by the chats active within the last
+few seconds (the last minute for groups), however many chats a run sees.
+
+decide takes a whole batch of events. The n-th event of every key in the
+batch is decided in one vectorized step, and the few keys with many events
+in a batch, such as the single broadcast bucket, are finished in a plain
+loop.
+"""
+
+import numpy as np
+
+import definitions
+import spec_merge
+
+KEY = "x-rate-limit"
+# (x-rate-limit key, seconds its value is counted over), in the order the
+# levels are applied.
+LEVELS = [
+    ("per_chat_per_second", 1),
+    ("group_per_minute", 60),
+    ("broadcast_per_second", 1),
+]
+# How many events a full bucket of each level lets through at once. The FAQ
+# allows "short bursts" in a single chat.
+DEFAULT_BURST = {
+    "per_chat_per_second": 3,
+    "group_per_minute": 20,
+    "broadcast_per_second": 30,
+}
+# Below this many events per step, a level is finished in a plain loop.
+VECTOR_MIN_EVENTS = 32
+# Events the single bucket of a level decides per vectorized step, and in a
+# plain loop when the increments of its methods differ.
+CHUNK = 8192
+RUN = 64
+# Keys with at least this many events left in a batch are decided as single
+# buckets.
+BUSY_KEY_EVENTS = 256
+# Sums of increments are rounded differently in the vectorized steps and in
+# the loops; an event this close to its start is on time in both.
+EPSILON = 1e-9
+
+
+def _value(limit):
+    return limit["value"] if isinstance(limit, dict) else limit
+
+
+def _scan(state, slots, events, times, increments, tolerances, allowed, wait):
+    """
+    Decides the given events one after the other, updating the TATs of the
+    list state in place.
+    """
+    count = len(events)
+    ok = [False] * count
+    waits = [0.0] * count
+    for index, slot, t, increment, start in zip(
+        range(count),
+        slots[events].tolist(),
+        times[events].tolist(),
+        increments[events].tolist(),
+        (-tolerances[events] - EPSILON).tolist(),
+    ):
+        current = state[slot]
+        start += current
+        if t >= start:
+            state[slot] = (current if current > t else t) + increment
+            ok[index] = True
+        else:
+            waits[index] = start + EPSILON - t
+    allowed[events] = ok
+    wait[events] = waits
+
+
+def _saturated(state, position, stop, times, increment, tolerance, allowed, wait):
+    """
+    Decides the events from position, rejected by the single bucket of a
+    level, for as long as the bucket stays saturated. A saturated bucket
+    admits the first event at or after each of TAT - tolerance + m *
+    increment in turn, or the event after the previous admitted one if that
+    is later, so the admitted events are found with one binary search and a
+    cumulative maximum. Returns the position of the first event left
+    undecided.
+    """
+    t = times[slice(position, stop)]
+    start = state[0] - tolerance
+    steps = min(max(int((t[-1] - start) / increment) + 2, 1), len(t) + 1)
+    offsets = increment * np.arange(steps)
+    picks = np.searchsorted(t, start + offsets - EPSILON) - np.arange(steps)
+    picks = np.maximum.accumulate(picks) + np.arange(steps)
+    # The bucket stays saturated while every admitted event is before its
+    # TAT, which then moves by exactly one increment.
+    picked = t[np.minimum(picks, len(t) - 1)]
+    valid = (picks < len(t)) & (picked <= state[0] + offsets)
+    steps = steps if valid.all() else int(np.argmin(valid))
+    if not steps:
+        # The bucket is full again by the next event on time.
+        decided = slice(position, position + picks[0])
+        wait[decided] = start - times[decided]
+        return decided.stop
+    picks = picks[:steps]
+    decided = slice(position, position + picks[-1] + 1)
+    admitted = np.searchsorted(picks, np.arange(picks[-1] + 1))
+    wait[decided] = start + admitted * increment - times[decided]
+    wait[position + picks] = 0.0
+    allowed[position + picks] = True
+    state[0] += steps * increment
+    return decided.stop
+
+
+def _gcra_single(tat, times, increments, tolerances, allowed, wait):
+    """
+    Decides the events of a level with a single bucket. While every event is
+    allowed, the TAT after event i is C[i] + max(TAT, max(t[j] - C[j - 1]))
+    over j <= i, with C the running sum of the increments, so stretches of
+    traffic under the limit are decided with a cumulative sum and maximum.
+    After a rejection the bucket is saturated, see _saturated.
+    """
+    count = len(times)
+    zeros = np.zeros(count, dtype=np.intp)
+    position = 0
+    state = [float(tat[0])]
+    while position < count:
+        window = slice(position, min(position + CHUNK, count))
+        t = times[window]
+        totals = np.cumsum(increments[window])
+        peaks = np.maximum.accumulate(t - (totals - increments[window]))
+        after = totals + np.maximum(peaks, state[0])
+        before = np.r_[state[0], after[:-1]]
+        ok = t >= before - tolerances[window] - EPSILON
+        if ok.all():
+            allowed[window] = True
+            state[0] = after[-1]
+            position = window.stop
+            continue
+        first = int(np.argmin(ok))
+        allowed[slice(position, position + first)] = True
+        state[0] = before[first]
+        position += first
+        increment, tolerance = increments[position], tolerances[position]
+        if (increments[window] == increment).all() and (
+            tolerances[window] == tolerance
+        ).all():
+            position = _saturated(
+                state, position, window.stop, times, increment, tolerance, allowed, wait
+            )
+        else:
+            events = np.arange(position, min(position + RUN, count))
+            _scan(state, zeros, events, times, increments, tolerances, allowed, wait)
+            position = events[-1] + 1
+    tat[0] = state[0]
+
+
+def _gcra(tat, slots, times, increments, tolerances):
+    """
+    Decides the events of one level, sorted by time, and advances the TATs
+    of their slots in place. Returns the allowed mask and the seconds every
+    rejected event would have had to wait.
+    """
+    count = len(slots)
+    allowed = np.zeros(count, dtype=bool)
+    wait = np.zeros(count)
+    if len(tat) == 1:
+        _gcra_single(tat, times, increments, tolerances, allowed, wait)
+        return allowed, wait
+    # Group the events by slot, keeping their order in time, and number them
+    # within their slot.
+    order = np.argsort(slots, kind="stable")
+    sorted_slots = slots[order]
+    starts = np.flatnonzero(np.r_[True, sorted_slots[1:] != sorted_slots[:-1]])
+    ranks = np.empty(count, dtype=np.intp)
+    ranks[order] = np.arange(count) - np.repeat(starts, np.diff(np.r_[starts, count]))
+    by_rank = np.argsort(ranks, kind="stable")
+    bounds = np.searchsorted(ranks[by_rank], np.arange(count + 1))
+
+    rank = 0
+    while rank < count and bounds[rank + 1] - bounds[rank] >= VECTOR_MIN_EVENTS:
+        events = by_rank[slice(bounds[rank], bounds[rank + 1])]
+        event_slots = slots[events]
+        current = tat[event_slots]
+        start = current - tolerances[events]
+        ok = times[events] >= start - EPSILON
+        allowed[events] = ok
+        wait[events] = np.where(ok, 0.0, start - times[events])
+        tat[event_slots[ok]] = (
+            np.maximum(current[ok], times[events[ok]]) + increments[events[ok]]
+        )
+        rank += 1
+
+    # The events of the keys that have more left: the busiest keys one by
+    # one as single buckets, the others one event after the other.
+    rest = order[ranks[order] >= rank]
+    if len(rest):
+        rest_slots = slots[rest]
+        edges = np.flatnonzero(np.r_[True, rest_slots[1:] != rest_slots[:-1], True])
+        short = []
+        for first, stop in zip(edges[:-1].tolist(), edges[1:].tolist()):
+            events = rest[first:stop]
+            if stop - first < BUSY_KEY_EVENTS:
+                short.append(events)
+                continue
+            slot = int(rest_slots[first])
+            key_allowed = np.zeros(len(events), dtype=bool)
+            key_wait = np.zeros(len(events))
+            # A view, so that the bucket's TAT is advanced in place.
+            key_tat = tat[slice(slot, slot + 1)]
+            _gcra_single(
+                key_tat,
+                times[events],
+                increments[events],
+                tolerances[events],
+                key_allowed,
+                key_wait,
+            )
+            allowed[events] = key_allowed
+            wait[events] = key_wait
+        if short:
+            state = tat.tolist()
+            events = np.concatenate(short)
+            _scan(state, slots, events, times, increments, tolerances, allowed, wait)
+            tat[:] = state
+    return allowed, wait
+
+
+class _Buckets:
+    """The TATs of one level, as parallel arrays sorted by key."""
+
+    def __init__(self):
+        self.keys = np.empty(0, dtype=np.int64)
+        self.tat = np.empty(0)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def decide(self, keys, times, increments, tolerances):
+        unique, slots = np.unique(keys, return_inverse=True)
+        positions = np.searchsorted(self.keys, unique)
+        found = positions < len(self.keys)
+        found[found] = self.keys[positions[found]] == unique[found]
+        tat = np.full(len(unique), -np.inf)
+        tat[found] = self.tat[positions[found]]
+
+        allowed, wait = _gcra(tat, slots.ravel(), times, increments, tolerances)
+
+        self.tat[positions[found]] = tat[found]
+        keys = np.concatenate([self.keys, unique[~found]])
+        tat = np.concatenate([self.tat, tat[~found]])
+        # Full buckets are the same as no bucket.
+        live = tat > times[-1]
+        keys, tat = keys[live], tat[live]
+        if not found.all():
+            order = np.argsort(keys, kind="stable")
+            keys, tat = keys[order], tat[order]
+        self.keys, self.tat = keys, tat
+        return allowed, wait
+
+
+class RateLimiter:
+    """
+    Decides batches of events against the x-rate-limit blocks of a spec:
+
+        limiter = RateLimiter.from_file()
+        allowed, retry_after, level = limiter.decide(times, chat_ids, methods)
+
+    limits maps method names to their x-rate-limit blocks; methods without
+    one are never limited. Successive batches must not go back in time.
+    """
+
+    def __init__(self, limits, burst=None):
+        self.burst = dict(DEFAULT_BURST, **(burst or {}))
+        self.methods = sorted(limits)
+        self._index = {name: index for index, name in enumerate(self.methods)}
+        # The seconds every token of a level takes to come back, per method
+        # index; inf where the level does not apply. The last row is for
+        # methods without limits.
+        self._increments = np.full((len(self.methods) + 1, len(LEVELS)), np.inf)
+        for index, name in enumerate(self.methods):
+            for column, (key, seconds) in enumerate(LEVELS):
+                if key in limits[name]:
+                    self._increments[index, column] = seconds / _value(
+                        limits[name][key]
+                    )
+        self._buckets = [_Buckets() for _ in LEVELS]
+
+    @classmethod
+    def from_spec(cls, spec, burst=None):
+        resolver = definitions.Resolver(spec)
+        limits = {}
+        for name, entry in spec.get("methods", {}).items():
+            if KEY in entry:
+                limits[name] = resolver.get("methods", name, KEY)
+        return cls(limits, burst)
+
+    @classmethod
+    def from_file(cls, path=spec_merge.OUTPUT_PATH, burst=None):
+        return cls.from_spec(spec_merge.load_json(path), burst)
+
+    def live_buckets(self):
+        """Returns the number of buckets every level currently holds."""
+        return {key: len(buckets) for (key, _), buckets in zip(LEVELS, self._buckets)}
+
+    def _method_indexes(self, methods):
+        methods = np.asarray(methods)
+        if methods.dtype.kind in "iu":
+            return methods
+        names, inverse = np.unique(methods, return_inverse=True)
+        lookup = np.array(
+            [self._index.get(name, len(self.methods)) for name in names], dtype=np.intp
+        )
+        return lookup[inverse.ravel()]
+
+    def decide(self, times, chat_ids, methods):
+        """
+        Decides a batch of events. methods are method names, or indexes into
+        self.methods. Returns three arrays: whether each event is allowed,
+        the retry_after of each rejected event in whole seconds (0 for the
+        allowed ones), and the index into LEVELS of the level that rejected
+        it (-1 for the allowed ones).
+        """
+        times = np.asarray(times, dtype=np.float64)
+        chat_ids = np.asarray(chat_ids, dtype=np.int64)
+        increments = self._increments[self._method_indexes(methods)]
+        count = len(times)
+        allowed = np.ones(count, dtype=bool)
+        retry_after = np.zeros(count, dtype=np.int32)
+        level = np.full(count, -1, dtype=np.int8)
+        order = np.argsort(times, kind="stable")
+
+        for column, ((key, _), buckets) in enumerate(zip(LEVELS, self._buckets)):
+            events = order[np.isfinite(increments[order, column])]
+            if key == "group_per_minute":
+                events = events[chat_ids[events] < 0]
+            events = events[allowed[events]]
+            if not len(events):
+                continue
+            keys = np.zeros(len(events), dtype=np.int64)
+            if key != "broadcast_per_second":
+                keys = chat_ids[events]
+            increment = increments[events, column]
+            tolerance = (self.burst[key] - 1) * increment
+            ok, wait = buckets.decide(keys, times[events], increment, tolerance)
+            rejected = events[~ok]
+            allowed[rejected] = False
+            retry_after[rejected] = np.maximum(np.ceil(wait[~ok]), 1)
+            level[rejected] = column
+        return allowed, retry_after, level
+
+    def check(self, t, chat_id, method):
+        """Decides a single event; returns None if it is allowed."""
+        allowed, retry_after, _ = self.decide([t], [chat_id], [method])
+        return None if allowed[0] else int(retry_after[0])
+
+
+def replay(limiter, times, chat_ids, methods, window=60.0):
+    """
+    Decides recorded traffic, sorted by time, in batches of window seconds.
+    Returns the same three arrays as RateLimiter.decide.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    chat_ids = np.asarray(chat_ids, dtype=np.int64)
+    methods = np.asarray(methods)
+    if not len(times):
+        return limiter.decide(times, chat_ids, methods)
+    results = ([], [], [])
+    start = 0
+    while start < len(times):
+        end = np.searchsorted(times, times[start] + window)
+        batch = slice(start, end)
+        decided = limiter.decide(times[batch], chat_ids[batch], methods[batch])
+        for parts, part in zip(results, decided):
+            parts.append(part)
+        start = end
+    return tuple(np.concatenate(parts) for parts in results)
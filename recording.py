@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+import threading
+
+DEFAULT_RECORDING_DIR = os.path.join(".cache", "recording")
+# Bump when the layout of the recording or of the recorded results changes.
+RECORDING_VERSION = 1
+
+
+def body_hash(body):
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+class Recording:
+    """
+    Raw documentation pages saved by a recorded run, for offline replays.
+
+    Each entry stores the body of a page as it was downloaded, and optionally
+    the results of scraping it together with the hash of the body they were
+    scraped from. A replay (scraper.scrape_recorded) reuses those results as
+    long as the body has not been edited, and parses the page otherwise.
+    Unlike PageCache, a recording is never evicted and never revalidated.
+    """
+
+    def __init__(self, directory=DEFAULT_RECORDING_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+
+    def _index_path(self):
+        return os.path.join(self.directory, "index.json")
+
+    def _path(self, key, suffix):
+        return os.path.join(self.directory, key + suffix)
+
+    def _load_index(self):
+        try:
+            with open(self._index_path()) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {"version": RECORDING_VERSION, "pages": {}}
+        if index.get("version") != RECORDING_VERSION:
+            return {"version": RECORDING_VERSION, "pages": {}}
+        return index
+
+    def _write(self, path, text):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def __contains__(self, url):
+        entry = self._index["pages"].get(url)
+        return bool(entry) and os.path.exists(self._path(entry["key"], ".html"))
+
+    def urls(self):
+        return list(self._index["pages"])
+
+    def body(self, url):
+        """Returns the recorded body of a URL, or None if it was not recorded."""
+        entry = self._index["pages"].get(url)
+        if not entry:
+            return None
+        try:
+            with open(self._path(entry["key"], ".html"), encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def results(self, url, name, body):
+        """
+        Returns the recorded results of scraping body with the scraper called
+        name, or None if they were not recorded or body has changed since.
+        """
+        entry = self._index["pages"].get(url)
+        if not entry or entry.get("results") != name:
+            return None
+        if entry.get("sha256") != body_hash(body):
+            return None
+        try:
+            with open(self._path(entry["key"], ".json"), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def record(self, url, body, results=None, name=None):
+        """
+        Stores the body of a URL and optionally the results of scraping it
+        with the scraper called name.
+        """
+        key = hashlib.sha256(url.encode()).hexdigest()
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            self._write(self._path(key, ".html"), body)
+            if results is not None:
+                self._write(self._path(key, ".json"), json.dumps(results))
+            elif os.path.exists(self._path(key, ".json")):
+                os.remove(self._path(key, ".json"))
+            self._index["pages"][url] = {
+                "key": key,
+                "sha256": body_hash(body),
+                "results": name if results is not None else None,
+            }
+            self._write(self._index_path(), json.dumps(self._index))
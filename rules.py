@@ -0,0 +1,179 @@
+"""
+Declarative rules that map methods of the Bot API to x- extension blocks.
+
+Each rule is a dictionary of predicates and the extension block it adds to
+every method that satisfies all of them:
+
+    methods   names or fnmatch patterns ("send*") the method must match
+    params    name of a parameter the method must have
+    returns   types of which the method must return at least one
+    requires  key that must be present in the scraped reference data
+
+Values of the block that are FromRef markers are replaced with the value of
+that key in the reference data. Rules are listed from the most specific to
+the most general: a value set by an earlier rule is never overwritten by a
+later one.
+
+RuleEngine compiles the rules once against the methods of api.json, using
+indexes from parameter name and return type to methods, so generating the
+extensions is a single pass over the rules.
+"""
+
+import copy
+import fnmatch
+
+# The methods extensions.json has always described. They are listed even when
+# no other rule applies to them.
+KEY_METHODS = [
+    "sendMessage",
+    "sendPhoto",
+    "editMessageText",
+    "answerCallbackQuery",
+    "getUpdates",
+]
+
+
+class FromRef:
+    """Placeholder for the value of a key of the reference data."""
+
+    def __init__(self, key):
+        self.key = key
+
+
+RULES = [
+    {"methods": KEY_METHODS, "extension": {}},
+    {
+        "methods": KEY_METHODS,
+        "requires": "x-rate-limit",
+        "extension": {"x-rate-limit": FromRef("x-rate-limit")},
+    },
+    {
+        "returns": ["Message"],
+        "requires": "x-rate-limit",
+        "extension": {"x-rate-limit": FromRef("x-rate-limit")},
+    },
+    {
+        "methods": ["sendPhoto"],
+        "requires": "x-file-size-limits",
+        "extension": {
+            "x-restrictions": {
+                "photo": {
+                    "max_size_mb": 10,
+                    "max_dimensions_total": 10000,
+                    "max_ratio": 20,
+                },
+                "caption": {"max_length": 1024},
+            }
+        },
+    },
+    {
+        "methods": ["editMessageText"],
+        "extension": {
+            "x-restrictions": {
+                "edit": {"max_age_hours": 48},
+                "text": {"max_length": 4096},
+            }
+        },
+    },
+    {
+        "methods": ["answerCallbackQuery"],
+        "extension": {"x-restrictions": {"text": {"max_length": 200}}},
+    },
+    {
+        "methods": ["getUpdates"],
+        "extension": {
+            "x-restrictions": {
+                "limit": {"min_value": 1, "max_value": 100, "default_value": 100},
+                "timeout": {"default_value": 0},
+            }
+        },
+    },
+    {
+        "params": "text",
+        "returns": ["Message"],
+        "extension": {"x-restrictions": {"text": {"max_length": 4096}}},
+    },
+    {
+        "params": "caption",
+        "returns": ["Message", "MessageId"],
+        "requires": "x-file-size-limits",
+        "extension": {"x-restrictions": {"caption": {"max_length": 1024}}},
+    },
+]
+
+
+def _resolve(value, extensions_ref_data):
+    if isinstance(value, FromRef):
+        return copy.deepcopy(extensions_ref_data[value.key])
+    if isinstance(value, dict):
+        return {key: _resolve(item, extensions_ref_data) for key, item in value.items()}
+    return copy.deepcopy(value)
+
+
+def merge_missing(target, block):
+    """Adds the values of block that target does not have yet, recursively."""
+    for key, value in block.items():
+        if key not in target:
+            target[key] = value
+        elif isinstance(target[key], dict) and isinstance(value, dict):
+            merge_missing(target[key], value)
+
+
+class RuleEngine:
+    def __init__(self, methods, rules=RULES):
+        """
+        Compiles the rules against the methods of the spec, a dictionary
+        mapping method names to their api.json entries.
+        """
+        self._order = {name: position for position, name in enumerate(methods)}
+        self._by_param = {}
+        self._by_return = {}
+        for name, method in methods.items():
+            for field in method.get("fields", []):
+                self._by_param.setdefault(field["name"], set()).add(name)
+            for returns in method.get("returns", []):
+                self._by_return.setdefault(returns, set()).add(name)
+        self.rules = [(rule, self._match(rule)) for rule in rules]
+
+    def _match(self, rule):
+        """Returns the methods a rule applies to, in the order of the spec."""
+        explicit = []
+        candidates = None
+        if "methods" in rule:
+            candidates = set()
+            for pattern in rule["methods"]:
+                if any(char in pattern for char in "*?["):
+                    candidates.update(fnmatch.filter(self._order, pattern))
+                else:
+                    candidates.add(pattern)
+                    explicit.append(pattern)
+        if "params" in rule:
+            matches = self._by_param.get(rule["params"], set())
+            candidates = matches if candidates is None else candidates & matches
+        if "returns" in rule:
+            matches = set()
+            for returns in rule["returns"]:
+                matches |= self._by_return.get(returns, set())
+            candidates = matches if candidates is None else candidates & matches
+        if candidates is None:
+            candidates = set(self._order)
+        # Methods that are named explicitly keep the order of the rule, even
+        # when the spec does not know them.
+        ordered = [name for name in explicit if name in candidates]
+        ordered += sorted(
+            (name for name in candidates if name not in explicit),
+            key=self._order.__getitem__,
+        )
+        return ordered
+
+    def generate(self, extensions_ref_data):
+        """Returns the extension blocks of every method the rules apply to."""
+        extensions = {}
+        for rule, methods in self.rules:
+            requires = rule.get("requires")
+            if requires is not None and requires not in extensions_ref_data:
+                continue
+            for name in methods:
+                block = _resolve(rule["extension"], extensions_ref_data)
+                merge_missing(extensions.setdefault(name, {}), block)
+        return extensions
@@ -1,17 +1,126 @@
+import codecs
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+import instrumentation
+import scraper_lxml
 
-def get_soup(url):
-    """Fetches the content of a URL and returns a BeautifulSoup object."""
+FAQ_URL = "https://core.telegram.org/bots/faq"
+API_URL = "https://core.telegram.org/bots/api"
+FEATURES_URL = "https://core.telegram.org/bots/features"
+
+# (connect, read) timeout in seconds applied to every request.
+DEFAULT_TIMEOUT = (5, 30)
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Size of the chunks a page is read in when it is streamed.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Parser backends: BeautifulSoup with the pure-Python or the lxml tree builder,
+# or the direct lxml extraction path in scraper_lxml, which skips BeautifulSoup.
+PARSERS = ("html.parser", "lxml", "lxml-direct")
+DEFAULT_PARSER = "html.parser" if scraper_lxml.lxml is None else "lxml"
+
+
+def make_session(retries=DEFAULT_RETRIES, backoff_factor=DEFAULT_BACKOFF, pool_size=10):
+    """
+    Creates a requests session that keeps connections alive in a shared pool
+    and retries failed GET requests with exponential backoff.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=("GET",),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@instrumentation.timed("fetch")
+def _get(url, session, timeout, cache):
+    """
+    Sends a GET request, conditional when the URL is cached, and returns the
+    response (which may be a 304 Not Modified), or None if the request failed.
+    """
+    headers = cache.conditional_headers(url) if cache else {}
     try:
-        response = requests.get(url)
+        response = (session or requests).get(url, timeout=timeout, headers=headers)
+        if response.status_code == 304 and not (cache and url in cache):
+            # The cached body is gone, so the page has to be downloaded again.
+            response = (session or requests).get(url, timeout=timeout)
         response.raise_for_status()
-        return BeautifulSoup(response.text, "html.parser")
+        return response
     except requests.exceptions.RequestException:
         return None
 
 
+@instrumentation.timed()
+def get_soup(url, session=None, timeout=DEFAULT_TIMEOUT, cache=None, parser=None):
+    """Fetches the content of a URL and returns a BeautifulSoup object."""
+    response = _get(url, session, timeout, cache)
+    if response is None:
+        return None
+    if response.status_code == 304:
+        return BeautifulSoup(cache.body(url), parser or DEFAULT_PARSER)
+    if cache:
+        cache.store(url, response.text, response.headers)
+    return BeautifulSoup(response.text, parser or DEFAULT_PARSER)
+
+
+def _map_concurrently(func, urls, session, max_workers=None):
+    """
+    Calls func(url, session) for every URL in a thread pool sharing one
+    pooled session, and returns a dictionary mapping each URL to its result.
+    """
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+    own_session = session is None
+    if own_session:
+        session = make_session(pool_size=len(urls))
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers or len(urls)) as pool:
+            return dict(zip(urls, pool.map(lambda url: func(url, session), urls)))
+    finally:
+        if own_session:
+            session.close()
+
+
+def fetch_soups(
+    urls,
+    session=None,
+    timeout=DEFAULT_TIMEOUT,
+    max_workers=None,
+    cache=None,
+    parser=None,
+):
+    """
+    Fetches several URLs concurrently over one pooled session and returns a
+    dictionary mapping each URL to its BeautifulSoup object (or None).
+    """
+    return _map_concurrently(
+        lambda url, session: get_soup(url, session, timeout, cache, parser),
+        urls,
+        session,
+        max_workers,
+    )
+
+
 def get_ref(element):
     """Extracts the reference from a BeautifulSoup element."""
     if not element:
@@ -28,6 +137,7 @@ def get_ref(element):
     }
 
 
+@instrumentation.timed()
 def scrape_rate_limits(soup):
     """Scrapes rate limit information from the FAQ page."""
     rate_limits = {}
@@ -55,6 +165,7 @@ def scrape_rate_limits(soup):
     return {"x-rate-limit": rate_limits}
 
 
+@instrumentation.timed()
 def scrape_file_size_limits(soup):
     """Scrapes file size limit information from the FAQ page."""
     file_size_limits = {}
@@ -83,125 +194,421 @@ def scrape_file_size_limits(soup):
     return {"x-file-size-limits": file_size_limits}
 
 
-def scrape_methods(soup):
+class Section:
+    """A heading together with the paragraphs and tables that follow it."""
+
+    def __init__(self, heading):
+        self.heading = heading
+        self.paragraphs = []
+        self.tables = []
+
+    @property
+    def anchor(self):
+        """Returns the name of the anchor inside the heading, if any."""
+        anchor = self.heading.find("a", {"name": True})
+        return anchor.get("name") if anchor else None
+
+    @property
+    def description(self):
+        return "\n".join(p.get_text() for p in self.paragraphs).strip()
+
+    @property
+    def table(self):
+        return self.tables[0] if self.tables else None
+
+
+def split_sections(soup):
+    """
+    Splits the children of the element that holds the page's h3 headings into
+    sections in a single forward pass. Every h3 or h4 starts a new section,
+    which collects the paragraphs and tables up to the next heading.
+    """
+    first_h3 = soup.find("h3")
+    if not first_h3:
+        return []
+    sections = []
+    section = None
+    for child in first_h3.parent.children:
+        name = child.name
+        if name == "h3" or name == "h4":
+            section = Section(child)
+            sections.append(section)
+        elif section is None:
+            continue
+        elif name == "p":
+            section.paragraphs.append(child)
+        elif name == "table":
+            section.tables.append(child)
+    return sections
+
+
+def h4_sections_after(sections, h3_id):
+    """
+    Yields the anchored h4 sections that come after the h3 heading with the
+    given id.
+    """
+    found = False
+    for section in sections:
+        if not found:
+            found = section.heading.name == "h3" and section.heading.get("id") == h3_id
+            continue
+        if section.heading.name == "h4" and section.anchor:
+            yield section
+
+
+def scrape_table(table, columns):
+    """Returns the rows of a table with the given columns as dictionaries."""
+    rows = []
+    if table:
+        for tr in table.find_all("tr")[1:]:
+            tds = tr.find_all("td")
+            if len(tds) == len(columns):
+                rows.append({column: td.get_text() for column, td in zip(columns, tds)})
+    return rows
+
+
+@instrumentation.timed()
+def scrape_methods(soup, sections=None):
     """Scrapes method information from the API page."""
+    if sections is None:
+        sections = split_sections(soup)
     methods = {}
-    methods_section = soup.find("h3", {"id": "available-methods"})
-    if methods_section:
-        for h4 in methods_section.find_next_siblings("h4"):
-            anchor = h4.find("a", {"name": True})
-            if not anchor:
-                continue
-            method_name = anchor.get("name")
-            if not method_name:
-                continue
-
-            description = ""
-            for p in h4.find_next_siblings("p"):
-                if p.find_previous_sibling("h4") != h4:
-                    break
-                description += p.get_text() + "\n"
-
-            parameters = []
-            table = h4.find_next_sibling("table")
-            if table:
-                for tr in table.find_all("tr")[1:]:
-                    tds = tr.find_all("td")
-                    if len(tds) == 4:
-                        parameters.append(
-                            {
-                                "name": tds[0].get_text(),
-                                "type": tds[1].get_text(),
-                                "required": tds[2].get_text(),
-                                "description": tds[3].get_text(),
-                            }
-                        )
-            methods[method_name] = {
-                "description": description.strip(),
-                "parameters": parameters,
-            }
+    for section in h4_sections_after(sections, "available-methods"):
+        methods[section.anchor] = {
+            "description": section.description,
+            "parameters": scrape_table(
+                section.table, ("name", "type", "required", "description")
+            ),
+        }
     return methods
 
 
-def scrape_features(soup):
+@instrumentation.timed()
+def scrape_features(soup, sections=None):
     """Scrapes feature information from the features page."""
+    if sections is None:
+        sections = split_sections(soup)
     features = {}
-    features_section = soup.find("h3", {"id": "what-features-do-bots-have"})
-    if features_section:
-        for h4 in features_section.find_next_siblings("h4"):
-            anchor = h4.find("a", {"name": True})
-            if not anchor:
-                continue
-            feature_name = anchor.get("name")
-            if not feature_name:
-                continue
-
-            description = ""
-            for p in h4.find_next_siblings("p"):
-                if p.find_previous_sibling("h4") != h4:
-                    break
-                description += p.get_text() + "\n"
-
-            features[feature_name] = {"description": description.strip()}
+    for section in h4_sections_after(sections, "what-features-do-bots-have"):
+        features[section.anchor] = {"description": section.description}
     return features
 
 
-def scrape_types(soup):
+@instrumentation.timed()
+def scrape_types(soup, sections=None):
     """Scrapes type information from the API page."""
+    if sections is None:
+        sections = split_sections(soup)
     types = {}
-    types_section = soup.find("h3", {"id": "available-types"})
-    if types_section:
-        for h4 in types_section.find_next_siblings("h4"):
-            anchor = h4.find("a", {"name": True})
-            if not anchor:
-                continue
-            type_name = anchor.get("name")
-            if not type_name:
-                continue
-
-            description = ""
-            for p in h4.find_next_siblings("p"):
-                if p.find_previous_sibling("h4") != h4:
-                    break
-                description += p.get_text() + "\n"
-
-            fields = []
-            table = h4.find_next_sibling("table")
-            if table:
-                for tr in table.find_all("tr")[1:]:
-                    tds = tr.find_all("td")
-                    if len(tds) == 3:
-                        fields.append(
-                            {
-                                "name": tds[0].get_text(),
-                                "type": tds[1].get_text(),
-                                "description": tds[2].get_text(),
-                            }
-                        )
-            types[type_name] = {
-                "description": description.strip(),
-                "fields": fields,
-            }
+    for section in h4_sections_after(sections, "available-types"):
+        types[section.anchor] = {
+            "description": section.description,
+            "fields": scrape_table(section.table, ("name", "type", "description")),
+        }
     return types
 
 
-def scrape_all():
+def scrape_faq_page(soup, data):
+    """Adds the information scraped from the FAQ page to data."""
+    data.update(scrape_rate_limits(soup))
+    data.update(scrape_file_size_limits(soup))
+
+
+def scrape_api_page(soup, data):
+    """Adds the information scraped from the API page to data."""
+    sections = split_sections(soup)
+    data["methods"] = scrape_methods(soup, sections)
+    data["types"] = scrape_types(soup, sections)
+
+
+def scrape_features_page(soup, data):
+    """Adds the information scraped from the features page to data."""
+    data["features"] = scrape_features(soup)
+
+
+# Every documentation page that is scraped, paired with the function that
+# extracts its information. All pages are downloaded concurrently, and their
+# results are merged in this order.
+SOURCES = [
+    (FAQ_URL, scrape_faq_page),
+    (API_URL, scrape_api_page),
+    (FEATURES_URL, scrape_features_page),
+]
+
+
+# The scraper of each page in the direct lxml extraction path.
+DIRECT_SCRAPERS = {
+    scrape_faq_page: scraper_lxml.scrape_faq_page,
+    scrape_api_page: scraper_lxml.scrape_api_page,
+    scrape_features_page: scraper_lxml.scrape_features_page,
+}
+
+
+def scrape_body(body, scrape_page, parser=None):
+    """
+    Parses a page with the given parser backend and returns the dictionary
+    that scrape_page extracts from it.
+    """
+    parser = parser or DEFAULT_PARSER
+    if parser not in PARSERS:
+        raise ValueError(f"unknown parser {parser!r}, expected one of {PARSERS}")
+    results = {}
+    if parser == "lxml-direct":
+        with instrumentation.span("parse"):
+            doc = scraper_lxml.parse(body)
+        DIRECT_SCRAPERS[scrape_page](doc, results)
+    else:
+        with instrumentation.span("parse"):
+            soup = BeautifulSoup(body, parser)
+        scrape_page(soup, results)
+    return results
+
+
+# Pages whose information is extracted section by section, so that only the
+# sections that changed since the previous run have to be extracted again.
+INCREMENTAL_PAGES = (scrape_api_page, scrape_features_page)
+
+RAW_HEADING = re.compile(r"<h([34])\b", re.IGNORECASE)
+RAW_H3 = re.compile(r"<h3\b.*?</h3>", re.IGNORECASE | re.DOTALL)
+
+
+def iter_raw_sections(chunks):
+    """
+    Splits a stream of HTML text chunks at every h3 and h4 start tag and
+    yields (level, html) pairs. Each section is yielded as soon as the next
+    heading, or the end of the stream, closes it, so only the section being
+    read is held in memory. The HTML before the first heading is dropped.
+    """
+    buffer = ""
+    level = None
+    scan_from = 0
+    for chunk in chunks:
+        buffer += chunk
+        while True:
+            # The heading of the current section sits at the start of the buffer.
+            match = RAW_HEADING.search(buffer, max(scan_from, 1 if level else 0))
+            if not match:
+                break
+            start = match.start()
+            if level:
+                yield level, buffer[:start]
+            level = match.group(1)
+            buffer = buffer[start:]
+            scan_from = 1
+        # A start tag may be split between this chunk and the next one.
+        scan_from = max(len(buffer) - 3, scan_from)
+        if not level:
+            buffer = buffer[scan_from:]
+            scan_from = 0
+    if level:
+        yield level, buffer
+
+
+def split_raw_sections(body):
+    """
+    Splits the raw HTML of a page at every h3 and h4 start tag and returns a
+    list of (level, html) pairs. The HTML before the first heading is dropped.
+    """
+    return list(iter_raw_sections([body]))
+
+
+def scrape_sections(body, scrape_page, parser=None, manifest=None, url=None):
+    """
+    Extracts a page section by section; see scrape_raw_sections.
+    """
+    return scrape_raw_sections(
+        iter_raw_sections([body]), scrape_page, parser, manifest, url
+    )
+
+
+def scrape_raw_sections(sections, scrape_page, parser=None, manifest=None, url=None):
+    """
+    Extracts a page from its (level, html) sections. Each h4 section is hashed
+    together with the h3 headings before it; sections whose hash is in the
+    manifest reuse the records extracted on the previous run, and the others
+    are parsed and extracted on their own. The records are spliced back
+    together in page order, and the manifest is updated with the new sections.
+    """
+    previous = manifest.records(url) if manifest else {}
+    data = scrape_body("<div></div>", scrape_page, parser)
+    hashes = []
+    records = []
+    headings = ""
+    for level, html in sections:
+        if level == "3":
+            heading = RAW_H3.match(html)
+            headings += heading.group(0) if heading else html
+            continue
+        section_hash = hashlib.sha256((headings + html).encode("utf-8")).hexdigest()
+        results = previous.get(section_hash)
+        if results is None:
+            results = scrape_body(f"<div>{headings}{html}</div>", scrape_page, parser)
+        hashes.append(section_hash)
+        records.append(results)
+        for kind, entries in results.items():
+            data.setdefault(kind, {}).update(entries)
+    if manifest:
+        manifest.update(url, hashes, records)
+    return data
+
+
+def iter_text(response, chunk_size=STREAM_CHUNK_SIZE):
+    """Decodes the body of a streamed response chunk by chunk."""
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")("replace")
+    for chunk in response.iter_content(chunk_size):
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+def stream_source(
+    url,
+    scrape_page,
+    session=None,
+    timeout=DEFAULT_TIMEOUT,
+    parser=None,
+    manifest=None,
+    chunk_size=STREAM_CHUNK_SIZE,
+):
+    """
+    Streams a page in chunks and extracts each section as soon as it has been
+    read, so neither the whole body nor its full tree is ever held in memory.
+    Returns the dictionary that scrape_page extracts from the page, or None if
+    the page could not be fetched.
+    """
+    try:
+        response = (session or requests).get(url, timeout=timeout, stream=True)
+        with response:
+            response.raise_for_status()
+            return scrape_raw_sections(
+                iter_raw_sections(iter_text(response, chunk_size)),
+                scrape_page,
+                parser,
+                manifest,
+                url,
+            )
+    except requests.exceptions.RequestException:
+        return None
+
+
+def scrape_source(
+    url,
+    scrape_page,
+    session=None,
+    timeout=DEFAULT_TIMEOUT,
+    cache=None,
+    parser=None,
+    manifest=None,
+    stream=False,
+    recording=None,
+):
+    """
+    Fetches a page and returns the dictionary that scrape_page extracts from
+    it, or None if the page could not be fetched. When the page is cached and
+    has not changed, the cached results are returned without parsing it. With
+    a manifest, pages in INCREMENTAL_PAGES only have their changed sections
+    extracted. With stream, those pages are streamed instead, bypassing the
+    page cache. With a recording, the body of the page and its results are
+    stored in it for later replays; recording does not support streaming.
+    """
+    if stream and scrape_page in INCREMENTAL_PAGES:
+        if recording is not None:
+            raise ValueError("streamed pages cannot be recorded")
+        return stream_source(url, scrape_page, session, timeout, parser, manifest)
+    response = _get(url, session, timeout, cache)
+    if response is None:
+        return None
+    results = None
+    if response.status_code == 304:
+        results = cache.results(url, scrape_page.__name__)
+        body = cache.body(url)
+    else:
+        body = response.text
+
+    if results is None:
+        results = extract_source(body, scrape_page, parser, manifest, url)
+        if cache:
+            cache.store(url, body, response.headers, results, scrape_page.__name__)
+    if recording is not None:
+        recording.record(url, body, results, scrape_page.__name__)
+    return results
+
+
+def extract_source(body, scrape_page, parser=None, manifest=None, url=None):
+    """
+    Extracts the body of a page, section by section with a manifest when the
+    page is in INCREMENTAL_PAGES, and as a whole otherwise.
+    """
+    if manifest and scrape_page in INCREMENTAL_PAGES:
+        return scrape_sections(body, scrape_page, parser, manifest, url)
+    return scrape_body(body, scrape_page, parser)
+
+
+def replay_source(url, scrape_page, recording, parser=None, manifest=None):
+    """
+    Returns the dictionary that scrape_page extracts from the recorded body of
+    a page, or None if the page was not recorded. The recorded results are
+    reused when the body has not changed since it was recorded; otherwise the
+    body is extracted again, and the new results are recorded.
+    """
+    body = recording.body(url)
+    if body is None:
+        return None
+    results = recording.results(url, scrape_page.__name__, body)
+    if results is None:
+        results = extract_source(body, scrape_page, parser, manifest, url)
+        recording.record(url, body, results, scrape_page.__name__)
+    return results
+
+
+def scrape_all(
+    session=None,
+    timeout=DEFAULT_TIMEOUT,
+    cache=None,
+    parser=None,
+    manifest=None,
+    stream=False,
+    recording=None,
+):
     """
     Scrapes all the documentation pages and returns a combined dictionary.
+    With a recording, the pages are stored in it as they are downloaded.
     """
-    data = {}
-    faq_soup = get_soup("https://core.telegram.org/bots/faq")
-    if faq_soup:
-        data.update(scrape_rate_limits(faq_soup))
-        data.update(scrape_file_size_limits(faq_soup))
+    scrapers = dict(SOURCES)
+    results = _map_concurrently(
+        lambda url, session: scrape_source(
+            url,
+            scrapers[url],
+            session,
+            timeout,
+            cache,
+            parser,
+            manifest,
+            stream,
+            recording,
+        ),
+        scrapers,
+        session,
+    )
+    return _combine(results)
+
 
-    api_soup = get_soup("https://core.telegram.org/bots/api")
-    if api_soup:
-        data["methods"] = scrape_methods(api_soup)
-        data["types"] = scrape_types(api_soup)
+def scrape_recorded(recording, parser=None, manifest=None):
+    """
+    Scrapes all the documentation pages from a recording instead of the
+    network and returns the same combined dictionary as scrape_all. Pages
+    that were not recorded are left out.
+    """
+    return _combine(
+        {
+            url: replay_source(url, scrape_page, recording, parser, manifest)
+            for url, scrape_page in SOURCES
+        }
+    )
 
-    features_soup = get_soup("https://core.telegram.org/bots/features")
-    if features_soup:
-        data["features"] = scrape_features(features_soup)
 
+def _combine(results):
+    data = {}
+    for url, _ in SOURCES:
+        if results[url]:
+            data.update(results[url])
     return data
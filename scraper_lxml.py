@@ -0,0 +1,206 @@
+"""
+Direct lxml extraction path for the scraper.
+
+The functions here mirror the BeautifulSoup scrapers in scraper.py but work
+on lxml.html trees with XPath, skipping BeautifulSoup entirely. Their output
+must stay identical to the BeautifulSoup scrapers; tests/test_parsers.py
+checks this against the saved pages in tests/fixtures.
+"""
+
+import instrumentation
+
+try:
+    import lxml.html
+except ImportError:  # pragma: no cover - lxml is optional
+    lxml = None
+
+
+def parse(body):
+    """Parses an HTML document into an lxml tree."""
+    if lxml is None:
+        raise ImportError("the lxml-direct parser requires lxml to be installed")
+    return lxml.html.document_fromstring(body)
+
+
+def get_ref(element):
+    """Extracts the reference from an lxml element."""
+    if element is None:
+        return None
+    headers = element.xpath("(ancestor::h4 | preceding::h4)[last()]")
+    if not headers:
+        return None
+    anchors = headers[0].xpath(".//a[@name]")
+    if not anchors:
+        return None
+    return {
+        "url": f"https://core.telegram.org/bots/faq#{anchors[0].get('name')}",
+        "text": element.text_content(),
+    }
+
+
+def _heading_for(doc, string):
+    """Returns the h4 that contains a text node equal to string, if any."""
+    headers = doc.xpath("//text()[. = $string]/ancestor::h4[1]", string=string)
+    return headers[0] if headers else None
+
+
+def _next_sibling(element, tag):
+    return next(element.itersiblings(tag), None)
+
+
+@instrumentation.timed()
+def scrape_rate_limits(doc):
+    """Scrapes rate limit information from the FAQ page."""
+    rate_limits = {}
+    h4 = _heading_for(doc, "My bot is hitting limits, how do I avoid this?")
+    if h4 is not None:
+        ul = _next_sibling(h4, "ul")
+        if ul is not None:
+            for li in ul.iter("li"):
+                text = li.text_content()
+                if "one message per second" in text:
+                    rate_limits["per_chat_per_second"] = {
+                        "value": 1,
+                        "ref": get_ref(li),
+                    }
+                if "20 messages per minute" in text:
+                    rate_limits["group_per_minute"] = {
+                        "value": 20,
+                        "ref": get_ref(li),
+                    }
+                if "30 messages per second" in text:
+                    rate_limits["broadcast_per_second"] = {
+                        "value": 30,
+                        "ref": get_ref(li),
+                    }
+    return {"x-rate-limit": rate_limits}
+
+
+@instrumentation.timed()
+def scrape_file_size_limits(doc):
+    """Scrapes file size limit information from the FAQ page."""
+    file_size_limits = {}
+    for question, key, marker, value in [
+        ("How do I upload a large file?", "upload_mb", "50 MB", 50),
+        ("How do I download files?", "download_mb", "20 MB", 20),
+    ]:
+        h4 = _heading_for(doc, question)
+        if h4 is None:
+            continue
+        p = _next_sibling(h4, "p")
+        if p is not None and marker in p.text_content():
+            file_size_limits[key] = {"value": value, "ref": get_ref(p)}
+    return {"x-file-size-limits": file_size_limits}
+
+
+def split_sections(doc):
+    """
+    Splits the children of the element that holds the page's h3 headings into
+    (heading, paragraphs, tables) sections in a single forward pass.
+    """
+    first_h3 = next(doc.iter("h3"), None)
+    if first_h3 is None:
+        return []
+    sections = []
+    section = None
+    for child in first_h3.getparent():
+        tag = child.tag
+        if tag == "h3" or tag == "h4":
+            section = (child, [], [])
+            sections.append(section)
+        elif section is None:
+            continue
+        elif tag == "p":
+            section[1].append(child)
+        elif tag == "table":
+            section[2].append(child)
+    return sections
+
+
+def _h4_sections_after(sections, h3_id):
+    found = False
+    for heading, paragraphs, tables in sections:
+        if not found:
+            found = heading.tag == "h3" and heading.get("id") == h3_id
+            continue
+        if heading.tag != "h4":
+            continue
+        anchors = heading.xpath(".//a[@name]")
+        if anchors and anchors[0].get("name"):
+            description = "\n".join(p.text_content() for p in paragraphs).strip()
+            yield anchors[0].get("name"), description, tables[0] if tables else None
+
+
+def _scrape_table(table, columns):
+    rows = []
+    if table is not None:
+        for tr in list(table.iter("tr"))[1:]:
+            tds = list(tr.iter("td"))
+            if len(tds) == len(columns):
+                rows.append(
+                    {column: td.text_content() for column, td in zip(columns, tds)}
+                )
+    return rows
+
+
+@instrumentation.timed()
+def scrape_methods(doc, sections=None):
+    """Scrapes method information from the API page."""
+    if sections is None:
+        sections = split_sections(doc)
+    return {
+        name: {
+            "description": description,
+            "parameters": _scrape_table(
+                table, ("name", "type", "required", "description")
+            ),
+        }
+        for name, description, table in _h4_sections_after(
+            sections, "available-methods"
+        )
+    }
+
+
+@instrumentation.timed()
+def scrape_types(doc, sections=None):
+    """Scrapes type information from the API page."""
+    if sections is None:
+        sections = split_sections(doc)
+    return {
+        name: {
+            "description": description,
+            "fields": _scrape_table(table, ("name", "type", "description")),
+        }
+        for name, description, table in _h4_sections_after(sections, "available-types")
+    }
+
+
+@instrumentation.timed()
+def scrape_features(doc, sections=None):
+    """Scrapes feature information from the features page."""
+    if sections is None:
+        sections = split_sections(doc)
+    return {
+        name: {"description": description}
+        for name, description, _ in _h4_sections_after(
+            sections, "what-features-do-bots-have"
+        )
+    }
+
+
+def scrape_faq_page(doc, data):
+    """Adds the information scraped from the FAQ page to data."""
+    data.update(scrape_rate_limits(doc))
+    data.update(scrape_file_size_limits(doc))
+
+
+def scrape_api_page(doc, data):
+    """Adds the information scraped from the API page to data."""
+    sections = split_sections(doc)
+    data["methods"] = scrape_methods(doc, sections)
+    data["types"] = scrape_types(doc, sections)
+
+
+def scrape_features_page(doc, data):
+    """Adds the information scraped from the features page to data."""
+    data["features"] = scrape_features(doc)
@@ -0,0 +1,95 @@
+import json
+import os
+import threading
+
+DEFAULT_MANIFEST_PATH = os.path.join(".cache", "sections.json")
+# Bump when the layout of the manifest or of the extracted records changes.
+MANIFEST_VERSION = 1
+
+
+class SectionManifest:
+    """
+    Persisted manifest of the h4 sections of each scraped page.
+
+    For every page it stores the hash of each section, in page order, together
+    with the records that were extracted from that section. The scraper uses
+    it to re-extract only the sections whose hash changed since the last run,
+    and records which sections were added, modified or removed.
+    """
+
+    def __init__(self, path=DEFAULT_MANIFEST_PATH):
+        self.path = path
+        self.changed = []
+        self._lock = threading.Lock()
+        self._pages = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest["pages"]
+
+    def _save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "version": MANIFEST_VERSION,
+                    "pages": self._pages,
+                    "changed": self.changed,
+                },
+                f,
+            )
+        os.replace(tmp_path, self.path)
+
+    def records(self, url):
+        """
+        Returns a dictionary mapping the hash of each section of a page to the
+        records extracted from it on the previous run.
+        """
+        page = self._pages.get(url, {})
+        return dict(zip(page.get("hashes", []), page.get("records", [])))
+
+    def update(self, url, hashes, records):
+        """
+        Replaces the sections of a page with the given hashes and records, and
+        adds the sections that differ from the previous run to changed.
+        """
+        with self._lock:
+            previous = self._pages.get(url, {})
+            old = _section_hashes(
+                previous.get("hashes", []), previous.get("records", [])
+            )
+            new = _section_hashes(hashes, records)
+            for name, section_hash in new.items():
+                if name not in old:
+                    self.changed.append(_change(url, name, "added"))
+                elif old[name] != section_hash:
+                    self.changed.append(_change(url, name, "modified"))
+            for name in old:
+                if name not in new:
+                    self.changed.append(_change(url, name, "removed"))
+            self._pages[url] = {"hashes": list(hashes), "records": list(records)}
+            self._save()
+
+
+def _section_hashes(hashes, records):
+    """Maps every (kind, name) record of a page to the hash of its section."""
+    names = {}
+    for section_hash, results in zip(hashes, records):
+        for kind, entries in results.items():
+            for name in entries:
+                names[(kind, name)] = section_hash
+    return names
+
+
+def _change(url, name, change):
+    kind, entry = name
+    return {"url": url, "kind": kind, "name": entry, "change": change}
@@ -0,0 +1,122 @@
+"""
+Nearest-neighbour index that routes scraped sentences to x- extension keys.
+
+sentence_examples.json lists labelled example sentences for every x- key,
+plus a "none" class of ordinary documentation sentences. A sentence gets the
+key whose examples dominate its top-k cosine neighbours; its x-confidence is
+the mean similarity of those neighbours to the sentence, counting neighbours
+of other keys as zero. All sentences are classified with one sparse matrix
+product.
+"""
+
+import json
+import re
+
+import numpy as np
+import scipy.sparse
+
+DEFAULT_EXAMPLES_PATH = "sentence_examples.json"
+# The label of the examples that belong under no x- key.
+BACKGROUND = "none"
+TOP_K = 3
+# Below this, short generic sentences such as "Returned only in getMe." or
+# "Text of the notification." get routed on a single shared word.
+MIN_CONFIDENCE = 0.35
+
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9])")
+
+
+def split_sentences(text):
+    return [sentence for sentence in SENTENCE_END.split(text.strip()) if sentence]
+
+
+def iter_sentences(extensions_ref_data):
+    """
+    Yields (source, sentence) for every sentence of the scraped reference
+    data, where source is the dotted path of the text it was taken from.
+    """
+    texts = []
+    for key in ("x-rate-limit", "x-file-size-limits"):
+        for name, entry in extensions_ref_data.get(key, {}).items():
+            if entry.get("ref"):
+                texts.append((f"{key}.{name}", entry["ref"]["text"]))
+    for name, entry in extensions_ref_data.get("features", {}).items():
+        texts.append((f"features.{name}", entry["description"]))
+    for kind, fields_key in (("methods", "parameters"), ("types", "fields")):
+        for name, entry in extensions_ref_data.get(kind, {}).items():
+            texts.append((f"{kind}.{name}", entry["description"]))
+            for field in entry.get(fields_key, []):
+                source = f"{kind}.{name}.{fields_key}.{field['name']}"
+                texts.append((source, field["description"]))
+    for source, text in texts:
+        for sentence in split_sentences(text):
+            yield source, sentence
+
+
+def load_examples(path=DEFAULT_EXAMPLES_PATH):
+    """Returns the example sentences and their labels."""
+    with open(path) as f:
+        examples = json.load(f)
+    texts = []
+    labels = []
+    for label, sentences in examples.items():
+        texts += sentences
+        labels += [label] * len(sentences)
+    return texts, labels
+
+
+class SentenceIndex:
+    """
+    Index of labelled example sentences. The vectorizer must produce rows
+    with unit L2 norm, so that dot products are cosine similarities.
+    """
+
+    def __init__(self, texts, labels, vectorizer, vector_cache=None):
+        self.vectorizer = vectorizer
+        self.vector_cache = vector_cache
+        self.labels = sorted(set(labels))
+        label_ids = [self.labels.index(label) for label in labels]
+        self._one_hot = scipy.sparse.csr_matrix(
+            (np.ones(len(labels)), (np.arange(len(labels)), label_ids)),
+            shape=(len(labels), len(self.labels)),
+        )
+        self._examples = self._vectorize("examples", texts)
+
+    @classmethod
+    def from_file(cls, vectorizer, path=DEFAULT_EXAMPLES_PATH, vector_cache=None):
+        texts, labels = load_examples(path)
+        return cls(texts, labels, vectorizer, vector_cache)
+
+    def _vectorize(self, corpus, texts):
+        if self.vector_cache is None:
+            return self.vectorizer.transform(texts)
+        matrix, _ = self.vector_cache.vectorize(corpus, texts, self.vectorizer)
+        return matrix
+
+    def classify(self, sentences, k=TOP_K):
+        """
+        Returns a (label, confidence) pair for every sentence. The label is
+        None when the best match is the background class or the confidence
+        is below MIN_CONFIDENCE.
+        """
+        if not sentences:
+            return []
+        similarities = (
+            self._vectorize("sentences", sentences) @ self._examples.T
+        ).toarray()
+        k = min(k, similarities.shape[1])
+        rows = np.arange(len(sentences))[:, None]
+        top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        neighbours = np.zeros_like(similarities)
+        neighbours[rows, top] = similarities[rows, top]
+        scores = self._one_hot.T.dot(neighbours.T).T / k
+        best = scores.argmax(axis=1)
+        confidences = scores[rows[:, 0], best]
+
+        results = []
+        for label_id, confidence in zip(best.tolist(), confidences.tolist()):
+            label = self.labels[label_id]
+            if label == BACKGROUND or confidence < MIN_CONFIDENCE:
+                label = None
+            results.append((label, round(confidence, 3)))
+        return results
@@ -0,0 +1,240 @@
+"""
+Builds spec-extended.json and spec-extended.min.json by merging extensions.json
+and the x-type-graph index of api.json (see type_graph.py) into api.json,
+along with spec-extended.msgpack, the compact binary encoding of the same spec
+(see spec_binary.py), and the JSON Merge Patches from api.json to
+spec-extended.json (see spec_patch.py).
+
+The patches leave out what is derived from api.json itself, so that
+consumers who already have it download only the extensions: the x-type-graph
+index is rebuilt from api.json when the patches are applied, and the
+x-restrictions extracted from the field descriptions, which are larger than
+all the other extensions together, are in spec-extended.restrictions.json
+rather than in spec-extended.patch.json.
+"""
+
+import argparse
+import json
+import sys
+
+import definitions
+import instrumentation
+import output
+import spec_binary
+import type_graph
+
+API_PATH = "api.json"
+EXTENSIONS_PATH = "extensions.json"
+OUTPUT_PATH = "spec-extended.json"
+MIN_OUTPUT_PATH = "spec-extended.min.json"
+PATCH_PATH = "spec-extended.patch.json"
+RESTRICTIONS_PATH = "spec-extended.restrictions.json"
+BINARY_PATH = "spec-extended.msgpack"
+MODELS_PATH = "models.py"
+
+
+def load_json(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def deep_merge(target, overlay):
+    """
+    Recursively merges overlay into target in place: dictionaries are merged
+    key by key, and any other value in overlay replaces the one in target.
+    """
+    for key, value in overlay.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            deep_merge(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
+def route_extensions(spec, extensions):
+    """
+    Returns the extensions nested the way they are merged into the spec:
+    every entry under the method or type of the same name, and entries that
+    name neither at the root. The result is a JSON Merge Patch (RFC 7386)
+    from the spec to the extended spec, as long as it contains no nulls.
+    """
+    routed = {}
+    for name, entry in extensions.items():
+        if name in spec.get("methods", {}):
+            routed.setdefault("methods", {})[name] = entry
+        elif name in spec.get("types", {}):
+            routed.setdefault("types", {})[name] = entry
+        else:
+            routed[name] = entry
+    return routed
+
+
+def _references(node, found):
+    if isinstance(node, dict):
+        if definitions.REF in node:
+            found.add(node[definitions.REF])
+        for value in node.values():
+            _references(value, found)
+    elif isinstance(node, list):
+        for value in node:
+            _references(value, found)
+    return found
+
+
+def split_patch(patch, key="x-restrictions"):
+    """
+    Splits a routed extension patch into the patch without the blocks under
+    key in methods and types, and the patch of those blocks together with
+    the x-definitions that only they refer to. Both keep the order of patch.
+    """
+    rest = {}
+    split = {}
+    for name, value in patch.items():
+        if name not in ("methods", "types"):
+            rest[name] = value
+            continue
+        for owner, entry in value.items():
+            if key in entry:
+                split.setdefault(name, {})[owner] = {key: entry[key]}
+            others = {item: block for item, block in entry.items() if item != key}
+            if others:
+                rest.setdefault(name, {})[owner] = others
+
+    shared = rest.get(definitions.DEFINITIONS, {})
+    remaining = {
+        name: value for name, value in rest.items() if name != definitions.DEFINITIONS
+    }
+    moved = _references(split, set()) - _references(remaining, set())
+    if moved:
+        kept = {}
+        for name, value in shared.items():
+            if definitions.pointer(name) in moved:
+                split.setdefault(definitions.DEFINITIONS, {})[name] = value
+            else:
+                kept[name] = value
+        if kept:
+            rest[definitions.DEFINITIONS] = kept
+        else:
+            del rest[definitions.DEFINITIONS]
+    return rest, split
+
+
+def extension_patches(spec, extensions):
+    """
+    Returns the routed extensions as the patches of spec-extended.patch.json
+    and spec-extended.restrictions.json. An x-type-graph index in the
+    extensions is dropped: apply_patches builds it from the spec.
+    """
+    patch = route_extensions(spec, extensions)
+    patch.pop(type_graph.KEY, None)
+    return split_patch(patch)
+
+
+def apply_patches(spec, patches):
+    """
+    Merges the patches into the spec in place, in order, and adds the
+    x-type-graph index of the spec. The index is built here, from the spec
+    being extended, so that it follows every update of api.json.
+    """
+    index = output.canonical(type_graph.build(spec))
+    for patch in patches:
+        deep_merge(spec, patch)
+    spec[type_graph.KEY] = index
+    return spec
+
+
+def merge_extensions(spec, extensions):
+    """
+    Merges the extensions and the x-type-graph index into the spec in place.
+    Every extension entry is merged into the method or type of the same
+    name; entries that name neither are merged into the root of the spec.
+    Nodes that no extension touches are left as they are.
+    """
+    return apply_patches(spec, extension_patches(spec, extensions))
+
+
+def contains_null(value):
+    if value is None:
+        return True
+    if isinstance(value, dict):
+        return any(contains_null(item) for item in value.values())
+    if isinstance(value, list):
+        return any(contains_null(item) for item in value)
+    return False
+
+
+def dumps(spec):
+    """Returns the pretty and the minified JSON text of a spec."""
+    return output.dumps(spec)
+
+
+@instrumentation.timed("spec_merge.build")
+def build(
+    api_path=API_PATH,
+    extensions=None,
+    extensions_path=EXTENSIONS_PATH,
+    output_path=OUTPUT_PATH,
+    min_output_path=MIN_OUTPUT_PATH,
+    patch_path=PATCH_PATH,
+    binary_path=BINARY_PATH,
+    restrictions_path=RESTRICTIONS_PATH,
+):
+    """
+    Loads api.json once, merges the extensions and the x-type-graph index of
+    api.json into it and writes the pretty and the minified spec from the
+    same in-memory tree, together with the minified JSON Merge Patches that
+    turn api.json into the extended spec and, when msgpack is installed,
+    the binary encoding. The extensions are read from extensions_path unless
+    they are passed in directly.
+    """
+    spec = load_json(api_path)
+    if extensions is None:
+        extensions = load_json(extensions_path)
+    # The same extensions give the same spec whether they were read from
+    # extensions.json, which is written with sorted keys, or passed in.
+    patches = extension_patches(spec, output.canonical(extensions))
+    if any(contains_null(patch) for patch in patches):
+        raise ValueError("extensions must not contain null values")
+    apply_patches(spec, patches)
+    pretty, minified = dumps(spec)
+    output.write_text(output_path, pretty)
+    output.write_text(min_output_path, minified)
+    if patch_path:
+        output.write_min_json(patches[0], patch_path)
+    if restrictions_path:
+        output.write_min_json(patches[1], restrictions_path)
+    if binary_path and spec_binary.HAS_MSGPACK:
+        spec_binary.dump(spec, binary_path)
+    return spec
+
+
+def main(argv=None):
+    """Merges extensions.json into api.json."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--api", default=API_PATH)
+    parser.add_argument("--extensions", default=EXTENSIONS_PATH)
+    parser.add_argument("--output", default=OUTPUT_PATH)
+    parser.add_argument("--min-output", default=MIN_OUTPUT_PATH)
+    parser.add_argument("--patch", default=PATCH_PATH)
+    parser.add_argument("--binary", default=BINARY_PATH)
+    parser.add_argument("--restrictions", default=RESTRICTIONS_PATH)
+    parser.add_argument("--models", default=MODELS_PATH)
+    args = parser.parse_args([] if argv is None else argv)
+    spec = build(
+        args.api,
+        None,
+        args.extensions,
+        args.output,
+        args.min_output,
+        args.patch,
+        args.binary,
+        args.restrictions,
+    )
+    # model_codegen imports this module, so it is imported here.
+    import model_codegen
+
+    model_codegen.write(spec, args.models)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
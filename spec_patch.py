@@ -0,0 +1,114 @@
+"""
+JSON Merge Patch (RFC 7386) support for the extended spec.
+
+spec-extended.patch.json and spec-extended.restrictions.json turn api.json
+into spec-extended.json, so consumers that already have the upstream spec only
+need to download the patches:
+
+    python spec_patch.py apply api.json spec-extended.patch.json \
+        spec-extended.restrictions.json
+
+The x-type-graph index is not in the patches; extend builds it from api.json.
+Applying both patches and writing the result with spec_merge.dumps reproduces
+the committed spec-extended.json and spec-extended.min.json byte for byte.
+Without spec-extended.restrictions.json, the result has every extension but
+the x-restrictions limits.
+"""
+
+import argparse
+import copy
+import sys
+
+import output
+import spec_merge
+import type_graph
+
+
+def make_patch(source, target):
+    """
+    Returns the JSON Merge Patch that turns source into target. Raises
+    ValueError if target cannot be reached with a merge patch, which is the
+    case when it adds or changes a value to null.
+    """
+    if not isinstance(source, dict) or not isinstance(target, dict):
+        if spec_merge.contains_null(target):
+            raise ValueError("a merge patch cannot set a value to null")
+        return target
+    patch = {}
+    for key in source:
+        if key not in target:
+            patch[key] = None
+    for key, value in target.items():
+        if key not in source:
+            patch[key] = make_patch(None, value)
+        elif source[key] != value:
+            patch[key] = make_patch(source[key], value)
+    return patch
+
+
+def apply_patch(document, patch):
+    """
+    Applies a JSON Merge Patch to a document in place and returns the result.
+    New keys are added after the existing ones, so applying the patch made by
+    make_patch preserves the key order of the target.
+    """
+    if not isinstance(patch, dict):
+        return patch
+    if not isinstance(document, dict):
+        document = {}
+    for key, value in patch.items():
+        if value is None:
+            document.pop(key, None)
+        else:
+            document[key] = apply_patch(document.get(key), value)
+    return document
+
+
+def patched(document, patch):
+    """Returns a patched copy of a document, leaving the original untouched."""
+    return apply_patch(copy.deepcopy(document), patch)
+
+
+def extend(spec, patches):
+    """
+    Applies the patches to a spec in place, in order, and returns the result.
+    Unless one of them carries the x-type-graph index, the index of the spec
+    is added after them, as spec_merge.build does.
+    """
+    index = None
+    if not any(type_graph.KEY in patch for patch in patches):
+        index = output.canonical(type_graph.build(spec))
+    for patch in patches:
+        spec = apply_patch(spec, patch)
+    if index is not None:
+        spec[type_graph.KEY] = index
+    return spec
+
+
+def main(argv=None):
+    """Creates or applies JSON Merge Patches between spec files."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+    diff = commands.add_parser("diff", help="write the patch from source to target")
+    diff.add_argument("source")
+    diff.add_argument("target")
+    diff.add_argument("--output", default=spec_merge.PATCH_PATH)
+    apply = commands.add_parser("apply", help="apply patches to a spec")
+    apply.add_argument("source")
+    apply.add_argument("patches", nargs="+")
+    apply.add_argument("--output", default=spec_merge.OUTPUT_PATH)
+    apply.add_argument("--min", action="store_true", help="write minified JSON")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    source = spec_merge.load_json(args.source)
+    if args.command == "diff":
+        patch = make_patch(source, spec_merge.load_json(args.target))
+        output.write_min_json(patch, args.output)
+    else:
+        spec = extend(source, [spec_merge.load_json(path) for path in args.patches])
+        pretty, minified = spec_merge.dumps(spec)
+        output.write_text(args.output, minified if args.min else pretty)
+
+
+if __name__ == "__main__":
+    main()
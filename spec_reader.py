@@ -0,0 +1,162 @@
+"""
+Lazily decoded reader for api.json and spec-extended.json.
+
+The first time a spec file is opened, SpecReader records the byte offsets of
+every top-level value and of every entry under "methods" and "types", and
+saves them next to the file as <file>.index.json. Later readers load that
+index, memory-map the spec and decode only the entries that are asked for,
+keeping the most recently used ones in an LRU cache.
+
+Decoded entries are shared between callers and must be treated as read-only.
+"""
+
+import functools
+import json
+import mmap
+import os
+import re
+from json.decoder import scanstring
+
+# Bump when the layout of the index changes.
+INDEX_VERSION = 1
+DEFAULT_CACHE_SIZE = 256
+INDEXED_SECTIONS = ("methods", "types")
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def index_path_for(path):
+    return path + ".index.json"
+
+
+def _skip(text, pos, expected=None):
+    pos = WHITESPACE.match(text, pos).end()
+    if expected is not None:
+        if not text.startswith(expected, pos):
+            raise ValueError(f"expected {expected!r} at byte {pos}")
+        pos = WHITESPACE.match(text, pos + 1).end()
+    return pos
+
+
+def _iter_members(text, pos, decoder):
+    """
+    Yields the (key, start, end) byte offsets of the members of the JSON
+    object that starts at pos.
+    """
+    pos = _skip(text, pos, "{")
+    if text[pos] == "}":
+        return
+    while True:
+        if text[pos] != '"':
+            raise ValueError(f"expected a key at byte {pos}")
+        key, pos = scanstring(text, pos + 1)
+        start = _skip(text, pos, ":")
+        _, end = decoder.raw_decode(text, start)
+        yield key, start, end
+        pos = _skip(text, end)
+        if text[pos] == "}":
+            return
+        pos = _skip(text, pos, ",")
+
+
+def build_index(data):
+    """
+    Returns the offset index of a spec given its raw bytes. Decoding the bytes
+    as latin-1 maps every byte to one character, so string positions are byte
+    offsets; UTF-8 never uses ASCII bytes inside multi-byte characters, so the
+    JSON structure is unaffected.
+    """
+    text = data.decode("latin-1")
+    decoder = json.JSONDecoder()
+    index = {"root": {}}
+    for key, start, end in _iter_members(text, 0, decoder):
+        index["root"][key] = [start, end]
+        if key in INDEXED_SECTIONS:
+            index[key] = {
+                name: [entry_start, entry_end]
+                for name, entry_start, entry_end in _iter_members(text, start, decoder)
+            }
+    return index
+
+
+class SpecReader:
+    """Memory-mapped reader that decodes spec entries on demand."""
+
+    def __init__(self, path="api.json", cache_size=DEFAULT_CACHE_SIZE):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.index = self._load_index()
+        self._decode = functools.lru_cache(maxsize=cache_size)(self._decode_range)
+
+    def _load_index(self):
+        stat = os.stat(self.path)
+        stamp = {
+            "version": INDEX_VERSION,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        try:
+            with open(index_path_for(self.path)) as f:
+                index = json.load(f)
+            if index.get("stamp") == stamp:
+                return index
+        except (OSError, ValueError):
+            pass
+
+        index = build_index(self._map[:])
+        index["stamp"] = stamp
+        tmp_path = index_path_for(self.path) + ".tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(index, f, separators=(",", ":"))
+            os.replace(tmp_path, index_path_for(self.path))
+        except OSError:
+            pass
+        return index
+
+    def _decode_range(self, start, end):
+        return json.loads(self._map[start:end])
+
+    def close(self):
+        self._decode.cache_clear()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get(self, key):
+        """Returns a top-level value of the spec, such as "version"."""
+        return self._decode(*self.index["root"][key])
+
+    def keys(self):
+        """Returns the top-level keys of the spec."""
+        return list(self.index["root"])
+
+    def method(self, name):
+        """Returns the entry of a method; raises KeyError if there is none."""
+        return self._decode(*self.index["methods"][name])
+
+    def type(self, name):
+        """Returns the entry of a type; raises KeyError if there is none."""
+        return self._decode(*self.index["types"][name])
+
+    def method_names(self):
+        return list(self.index.get("methods", {}))
+
+    def type_names(self):
+        return list(self.index.get("types", {}))
+
+    def iter_methods(self):
+        """Yields (name, entry) for every method, in file order."""
+        for name in self.index.get("methods", {}):
+            yield name, self.method(name)
+
+    def iter_types(self):
+        """Yields (name, entry) for every type, in file order."""
+        for name in self.index.get("types", {}):
+            yield name, self.type(name)
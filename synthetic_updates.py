@@ -0,0 +1,320 @@
+"""
+Synthetic Update streams for load-testing bots, generated from the types of
+the spec.
+
+UpdateGenerator walks the type definitions once, starting from Update, and
+compiles a template for every type an Update can contain: the list of fields
+to fill and the function that produces each value. Generating an update only
+runs those functions, so streams of millions of updates are produced one at
+a time, in constant memory:
+
+    generator = UpdateGenerator.from_file(seed=1, mix={"message": 9, "callback_query": 1})
+    for line in generator.ndjson(1_000_000):
+        ...
+
+mix weighs the kinds of updates, by the name of their field in Update, and
+rate is the number of updates per second of simulated time, which the date
+fields follow. The same seed gives the same stream.
+
+A template fills the required fields of its type, the optional fields listed
+for it in fields (the sender and text of a message, by default), and every
+other optional field with probability optional, down to MAX_DEPTH levels.
+Abstract types such as MaybeInaccessibleMessage pick one of their concrete
+subtypes, discriminator fields and fields documented with a fixed value
+("Always 0", model_codegen.fixed_value) get that value and fields documented
+as one of a few values ("private", "group", ...) get one of them. Ids,
+dates, names and texts get plausible values based on the name of the field.
+
+Every line of ndjson is a webhook POST body, and get_updates_bodies joins the
+lines into getUpdates responses without encoding them again. Run with
+``python synthetic_updates.py --count 1000 --mix message=9,callback_query=1``.
+"""
+
+import argparse
+import bisect
+import itertools
+import json
+import random
+import re
+import sys
+import time
+
+import model_codegen
+import spec_merge
+import type_graph
+import validators
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DEFAULT_MIX = {
+    "message": 80,
+    "edited_message": 5,
+    "callback_query": 10,
+    "inline_query": 5,
+}
+# The optional fields every update fills, besides the required ones.
+DEFAULT_FIELDS = {
+    "Message": ["from", "text"],
+    "CallbackQuery": ["message", "data"],
+    "User": ["username", "language_code"],
+}
+# Optional fields are not filled below this many levels of nesting.
+MAX_DEPTH = 4
+MAX_ITEMS = 3
+# 2023-11-14T22:13:20Z, so that the same seed gives the same dates.
+DEFAULT_START = 1_700_000_000
+DEFAULT_USERS = 100_000
+CHOICES = re.compile(r"\b(?:can be|one of|either)\b")
+QUOTED = re.compile(r'"(\w+)"')
+TEXT_FIELDS = {"text", "caption", "data", "query", "question"}
+WORDS = (
+    "the bot sends a message to every chat and waits for the next update before"
+    " it answers with an inline keyboard or a photo of the new order today"
+).split()
+LANGUAGES = ["en", "de", "es", "fr", "it", "pt", "ru", "uk"]
+
+
+def _encode_json(update):
+    return json.dumps(update, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+encode = orjson.dumps if orjson is not None else _encode_json
+
+
+def _constant(value):
+    return lambda depth: value
+
+
+def get_updates_body(lines):
+    """The getUpdates response of encoded updates (lines without newlines)."""
+    return b'{"ok":true,"result":[' + b",".join(lines) + b"]}"
+
+
+def get_updates_bodies(lines, limit=100):
+    """Groups an NDJSON stream into getUpdates responses of up to limit updates."""
+    lines = iter(lines)
+    while True:
+        batch = [line.rstrip(b"\n") for line in itertools.islice(lines, limit)]
+        if not batch:
+            return
+        yield get_updates_body(batch)
+
+
+def paced(items, rate, clock=time.monotonic, sleep=time.sleep):
+    """Yields items no faster than rate per second of wall-clock time."""
+    start = clock()
+    for index, item in enumerate(items):
+        delay = start + index / rate - clock()
+        if delay > 0:
+            sleep(delay)
+        yield item
+
+
+class UpdateGenerator:
+    """
+    A seeded stream of Update objects built from the types of a spec. See
+    the module docstring for mix, rate, fields and optional.
+    """
+
+    def __init__(
+        self,
+        spec,
+        seed=0,
+        mix=None,
+        rate=100.0,
+        fields=None,
+        optional=0.0,
+        start=DEFAULT_START,
+        users=DEFAULT_USERS,
+    ):
+        self.types = spec["types"]
+        self.graph = type_graph.TypeGraph.from_spec(spec)
+        self.rng = random.Random(seed)
+        self.rate = rate
+        self.fields = DEFAULT_FIELDS if fields is None else fields
+        self.optional = optional
+        self.users = users
+        self.now = float(start)
+        self.update_id = 0
+        self._message_ids = itertools.count(1)
+        self._templates = {}
+        self._builders = {}
+
+        update_fields = {
+            field["name"]: field for field in self.types["Update"]["fields"]
+        }
+        self.mix = dict(DEFAULT_MIX if mix is None else mix)
+        self._kinds = []
+        self._totals = []
+        total = 0
+        for kind, weight in self.mix.items():
+            field = update_fields.get(kind)
+            if field is None or field["required"]:
+                raise ValueError(f"unknown kind of update: {kind!r}")
+            if weight <= 0:
+                continue
+            total += weight
+            self._kinds.append((kind, self._value(field["types"][0], kind, "")))
+            self._totals.append(total)
+        if not total:
+            raise ValueError("mix has no kind of update with a positive weight")
+
+    @classmethod
+    def from_file(cls, path=spec_merge.OUTPUT_PATH, **kwargs):
+        return cls(spec_merge.load_json(path), **kwargs)
+
+    def _builder(self, name):
+        """Returns the function that builds a value of a concrete type."""
+        builder = self._builders.get(name)
+        if builder is not None:
+            return builder
+        # Registered before the fields are compiled, for recursive types.
+        fields = self._templates[name] = []
+        rng, optional = self.rng, self.optional
+
+        def builder(depth):
+            found = {}
+            for key, produce, always in fields:
+                if always or (depth < MAX_DEPTH and rng.random() < optional):
+                    found[key] = produce(depth + 1)
+            return found
+
+        self._builders[name] = builder
+        chosen = self.fields.get(name, ())
+        for index, field in enumerate(self.types[name].get("fields", [])):
+            always = field["required"] or field["name"] in chosen
+            if not always and not optional:
+                continue
+            discriminator = validators.DISCRIMINATOR.search(field["description"])
+            fixed = model_codegen.fixed_value(field)
+            if index == 0 and discriminator:
+                produce = _constant(discriminator.group(1))
+            elif fixed is not None:
+                produce = _constant(fixed)
+            elif field["types"][0] == "Boolean":
+                # Optional flags are documented as "True, if ...".
+                produce = _constant(not field["required"])
+            else:
+                produce = self._value(
+                    field["types"][0], field["name"], field["description"]
+                )
+            fields.append((field["name"], produce, always))
+        return builder
+
+    def _value(self, type_ref, name, description):
+        """Returns the function that produces the value of a field."""
+        rng = self.rng
+        if type_ref.startswith(type_graph.ARRAY_PREFIX):
+            item = self._value(
+                type_ref.removeprefix(type_graph.ARRAY_PREFIX), name, description
+            )
+            return lambda depth: [item(depth) for _ in range(rng.randint(1, MAX_ITEMS))]
+        if type_ref == "Integer":
+            return self._integer(name)
+        if type_ref == "Float":
+            return lambda depth: round(rng.uniform(-90, 90), 6)
+        if type_ref == "Boolean":
+            return _constant(True)
+        if type_ref in ("String", "InputFile"):
+            return self._string(name, description)
+        concrete = [
+            self._builder(found)
+            for found in sorted(self.graph.concrete_types(type_ref))
+        ]
+        if len(concrete) == 1:
+            return concrete[0]
+        return lambda depth: rng.choice(concrete)(depth)
+
+    def _integer(self, name):
+        rng = self.rng
+        if name == "message_id":
+            return lambda depth: next(self._message_ids)
+        if name == "date" or name.endswith("_date"):
+            return lambda depth: int(self.now)
+        if name == "id" or name.endswith("_id"):
+            return lambda depth: rng.randint(1, self.users)
+        return lambda depth: rng.randint(0, 100)
+
+    def _string(self, name, description):
+        rng = self.rng
+        values = QUOTED.findall(description) if CHOICES.search(description) else []
+        if values:
+            return lambda depth: rng.choice(values)
+        if name in TEXT_FIELDS:
+            return lambda depth: " ".join(rng.choices(WORDS, k=rng.randint(1, 12)))
+        if name == "language_code":
+            return lambda depth: rng.choice(LANGUAGES)
+        if name == "id" or name.endswith("_id") or name == "chat_instance":
+            return lambda depth: format(rng.getrandbits(64), "x")
+        if name == "username":
+            return lambda depth: f"user{rng.randint(1, self.users)}"
+        return lambda depth: rng.choice(WORDS).capitalize()
+
+    def updates(self, count=None):
+        """Yields count Update objects, or an endless stream."""
+        rng = self.rng
+        kinds, totals = self._kinds, self._totals
+        total = totals[-1]
+        for _ in range(count) if count is not None else itertools.count():
+            self.now += rng.expovariate(self.rate)
+            self.update_id += 1
+            kind, build = kinds[bisect.bisect(totals, rng.random() * total)]
+            yield {"update_id": self.update_id, kind: build(0)}
+
+    def ndjson(self, count=None):
+        """Yields count updates as NDJSON lines (bytes ending with a newline)."""
+        for update in self.updates(count):
+            yield encode(update) + b"\n"
+
+
+def parse_mix(text):
+    """Parses a mix such as "message=9,callback_query=1"."""
+    mix = {}
+    for item in text.split(","):
+        kind, _, weight = item.partition("=")
+        mix[kind.strip()] = float(weight or 1)
+    return mix
+
+
+def main(argv=None):
+    """Writes a stream of synthetic updates as NDJSON to standard output."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--spec", default=spec_merge.OUTPUT_PATH)
+    parser.add_argument("--count", type=int, help="endless by default")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mix", type=parse_mix, help="e.g. message=9,callback_query=1")
+    parser.add_argument("--rate", type=float, default=100.0)
+    parser.add_argument("--optional", type=float, default=0.0)
+    parser.add_argument(
+        "--realtime", action="store_true", help="write --rate updates per second"
+    )
+    parser.add_argument(
+        "--get-updates",
+        type=int,
+        metavar="LIMIT",
+        help="write getUpdates responses of up to LIMIT updates instead",
+    )
+    args = parser.parse_args([] if argv is None else argv)
+    generator = UpdateGenerator.from_file(
+        args.spec, seed=args.seed, mix=args.mix, rate=args.rate, optional=args.optional
+    )
+    lines = generator.ndjson(args.count)
+    if args.realtime:
+        lines = paced(lines, args.rate)
+    if args.get_updates:
+        lines = (body + b"\n" for body in get_updates_bodies(lines, args.get_updates))
+    out = sys.stdout.buffer
+    try:
+        for line in lines:
+            out.write(line)
+            if args.realtime:
+                out.flush()
+    except BrokenPipeError:
+        pass
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
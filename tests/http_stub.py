@@ -0,0 +1,97 @@
+"""A local HTTP stand-in for core.telegram.org used by the tests and benchmarks."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class Route:
+    def __init__(self, body="", delay=0.0, statuses=(), headers=None):
+        self.body = body.encode() if isinstance(body, str) else body
+        self.delay = delay
+        # Status codes returned by the first requests, before falling back to 200.
+        self.statuses = list(statuses)
+        self.headers = dict(headers or {})
+        self.hits = 0
+
+
+class StubServer:
+    """
+    Serves canned pages over HTTP/1.1 keep-alive connections on 127.0.0.1.
+
+    Routes map a path to a Route; every request is counted so tests can assert
+    on retries, and every new TCP connection is counted so they can assert on
+    connection reuse.
+    """
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.connections = 0
+        self.requests = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        # Clients that time out on purpose close their connection mid-response.
+        self._server.handle_error = lambda request, client_address: None
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}
+        )
+        self._thread.daemon = True
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path):
+        return self.base_url + path
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+
+            def do_GET(self):
+                route = stub.routes.get(self.path)
+                with stub._lock:
+                    stub.requests.append((self.path, dict(self.headers)))
+                    if route:
+                        route.hits += 1
+                        status = route.statuses.pop(0) if route.statuses else 200
+                if route is None:
+                    status, body, headers = 404, b"", {}
+                else:
+                    time.sleep(route.delay)
+                    body, headers = route.body, route.headers
+                    etag = headers.get("ETag")
+                    if status == 200 and etag and self.headers["If-None-Match"] == etag:
+                        status = 304
+                    if status != 200:
+                        body = b""
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
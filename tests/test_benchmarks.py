@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import recording
+import scraper
+from benchmarks import suite
+
+BASELINE = {"threshold": 2.0, "cases": {"fast": 0.1, "tiny": 0.0001}}
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_baseline_covers_every_case(self):
+        self.assertEqual(list(suite.load_baseline()["cases"]), list(suite.cases()))
+
+    def test_page_cases_run_on_the_recorded_pages(self):
+        names = ["scrape_rate_limits[page]", "scrape_types[page]"]
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertEqual(suite.run(names, 1, tmp), {})
+            pages = recording.Recording(tmp)
+            pages.record(scraper.FAQ_URL, suite.read_fixture("faq.html"))
+            self.assertEqual(list(suite.run(names, 1, tmp)), names[:1])
+            path = os.path.join(tmp, "baseline.json")
+            suite.save_baseline({"scrape_types[page]": 0.5}, path)
+            suite.save_baseline({"scrape_rate_limits[page]": 0.25}, path)
+            cases = suite.load_baseline(path)["cases"]
+        self.assertEqual(list(cases), list(suite.cases()))
+        self.assertEqual(cases["scrape_rate_limits[page]"], 0.25)
+        self.assertEqual(cases["scrape_types[page]"], 0.5)
+        self.assertIsNone(cases["scrape_features[page]"])
+
+    def test_regressions_use_the_threshold(self):
+        results = {"fast": 0.25, "tiny": 0.0004, "new": 1.0}
+        self.assertEqual(
+            suite.regressions(results, BASELINE, 2.0), [("fast", 0.25, 0.1)]
+        )
+        self.assertEqual(suite.regressions(results, BASELINE, 3.0), [])
+
+    def test_threshold_can_be_overridden(self):
+        with patch.dict(os.environ, {suite.THRESHOLD_VARIABLE: ""}):
+            self.assertEqual(suite.threshold_for(BASELINE), 2.0)
+        with patch.dict(os.environ, {suite.THRESHOLD_VARIABLE: "1.2"}):
+            self.assertEqual(suite.threshold_for(BASELINE), 1.2)
+            self.assertEqual(suite.threshold_for(BASELINE, 4.0), 4.0)
+
+
+@unittest.skipUnless(
+    os.environ.get("RUN_BENCHMARKS"), "set RUN_BENCHMARKS=1 to run the benchmarks"
+)
+class TestBenchmarks(unittest.TestCase):
+    def test_no_stage_regresses(self):
+        baseline = suite.load_baseline()
+        threshold = suite.threshold_for(baseline)
+        results = suite.run()
+        for name, seconds, base in suite.regressions(results, baseline, threshold):
+            with self.subTest(case=name):
+                self.fail(f"{seconds * 1000:.2f}ms > {threshold} x {base * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    unittest.main()
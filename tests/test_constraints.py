@@ -0,0 +1,181 @@
+import re
+import unittest
+from unittest.mock import patch
+
+import constraints
+import update_extensions
+
+SPEC = {
+    "methods": {
+        "getUpdates": {
+            "href": "https://core.telegram.org/bots/api#getupdates",
+            "fields": [
+                {
+                    "name": "limit",
+                    "description": "Limits the number of updates to be retrieved. Values between 1-100 are accepted. Defaults to 100.",
+                },
+                {
+                    "name": "allowed_updates",
+                    "description": "A JSON-serialized list of the update types you want your bot to receive.",
+                },
+            ],
+        },
+        "sendPoll": {
+            "href": "https://core.telegram.org/bots/api#sendpoll",
+            "fields": [
+                {
+                    "name": "options",
+                    "description": "A JSON-serialized list of 2-12 answer options",
+                },
+                {
+                    "name": "type",
+                    "description": 'Poll type, "quiz" or "regular", defaults to "regular"',
+                },
+                {
+                    "name": "is_anonymous",
+                    "description": "True, if the poll needs to be anonymous, defaults to True",
+                },
+            ],
+        },
+    },
+    "types": {
+        "InlineQueryResultArticle": {
+            "href": "https://core.telegram.org/bots/api#inlinequeryresultarticle",
+            "fields": [
+                {
+                    "name": "id",
+                    "description": "Unique identifier for this result, 1-64 Bytes",
+                },
+                {
+                    "name": "title",
+                    "description": "Title of the result, at most a few words long",
+                },
+            ],
+        },
+        "Location": {
+            "href": "https://core.telegram.org/bots/api#location",
+            "fields": [
+                {
+                    "name": "heading",
+                    "description": "Optional. The direction in which user is moving, in degrees; 1-360. For active live locations only.",
+                },
+                {
+                    "name": "language_code",
+                    "description": "A two-letter ISO 639-1 language code",
+                },
+            ],
+        },
+    },
+}
+
+
+class TestConstraints(unittest.TestCase):
+    def test_extract(self):
+        restrictions, unmatched = constraints.extract(SPEC)
+        limit = restrictions["getUpdates"]["limit"]
+        self.assertEqual(
+            limit,
+            {
+                "min_value": 1,
+                "max_value": 100,
+                "default_value": 100,
+                "ref": {"url": "https://core.telegram.org/bots/api#getupdates"},
+            },
+        )
+        poll = restrictions["sendPoll"]
+        self.assertEqual(poll["options"]["min_items"], 2)
+        self.assertEqual(poll["options"]["max_items"], 12)
+        self.assertEqual(poll["type"]["default_value"], "regular")
+        self.assertIs(poll["is_anonymous"]["default_value"], True)
+        self.assertEqual(
+            restrictions["InlineQueryResultArticle"]["id"]["max_bytes"], 64
+        )
+        self.assertEqual(restrictions["Location"]["heading"]["max_value"], 360)
+        self.assertNotIn("allowed_updates", restrictions["getUpdates"])
+        self.assertEqual(
+            unmatched,
+            [
+                (
+                    "InlineQueryResultArticle",
+                    "title",
+                    "Title of the result, at most a few words long",
+                )
+            ],
+        )
+
+    def test_qualified_ranges_are_reported(self):
+        spec = update_extensions.spec_merge.load_json("api.json")
+        restrictions, unmatched = constraints.extract(spec)
+        reported = {(owner, name) for owner, name, _ in unmatched}
+        for owner, name in [
+            # 5-600 seconds in the future, not a Unix timestamp of 5-600.
+            ("sendPoll", "close_date"),
+            # 60-86400, or 0x7FFFFFFF.
+            ("sendLocation", "live_period"),
+            ("InlineQueryResultLocation", "live_period"),
+            ("InputLocationMessageContent", "live_period"),
+            # 5-100000 in Telegram Stars, another range in nanotoncoins.
+            ("SuggestedPostPrice", "amount"),
+        ]:
+            with self.subTest(owner=owner, name=name):
+                self.assertNotIn(name, restrictions.get(owner, {}))
+                self.assertIn((owner, name), reported)
+        for owner in ("setStickerKeywords", "InputSticker"):
+            with self.subTest(owner=owner):
+                # The 64 characters are the total length of all keywords.
+                keywords = restrictions[owner]["keywords"]
+                self.assertEqual(
+                    (keywords["min_items"], keywords["max_items"]), (0, 20)
+                )
+                self.assertNotIn("max_length", keywords)
+                self.assertIn((owner, "keywords"), reported)
+        open_period = restrictions["sendPoll"]["open_period"]
+        self.assertEqual((open_period["min_value"], open_period["max_value"]), (5, 600))
+        heading = restrictions["sendLocation"]["heading"]
+        self.assertEqual((heading["min_value"], heading["max_value"]), (1, 360))
+
+    def test_combined_scan_finds_what_every_pattern_finds(self):
+        spec = update_extensions.spec_merge.load_json("api.json")
+        text = constraints.SEPARATOR.join(
+            field["description"] for _, _, field in constraints.iter_fields(spec)
+        )
+        found = {
+            (match.start(), int(match.lastgroup[1:]))
+            for match in constraints.COMBINED.finditer(text)
+        }
+        for pattern, _ in constraints.PATTERNS:
+            with self.subTest(pattern=pattern):
+                for match in re.finditer(pattern, text):
+                    self.assertTrue(
+                        any(start == match.start() for start, _ in found),
+                        match.group(0),
+                    )
+
+    @patch("update_extensions.scraper.scrape_all")
+    def test_committed_extensions_are_reproduced(self, mock_scrape_all):
+        mock_scrape_all.return_value = {}
+        generator = update_extensions.Generator()
+        generator.extensions_ref_data = update_extensions.spec_merge.load_json(
+            "extensions.ref.json"
+        )
+        generator.generate_extensions_data_from_ref()
+        unmatched = generator.extract_restrictions()
+        self.assertTrue(unmatched)
+        self.assertEqual(
+            generator.extensions_data["sendMessage"]["x-restrictions"]["text"][
+                "max_length"
+            ],
+            4096,
+        )
+        generator.hoist_definitions()
+        with open("extensions.json") as f:
+            self.assertEqual(
+                f.read(),
+                update_extensions.output.dumps(
+                    generator.extensions_data, sort_keys=True
+                )[0],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import copy
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import definitions
+import spec_merge
+
+URL = "https://core.telegram.org/bots/faq#my-bot-is-hitting-limits-how-do-i-avoid-this"
+RATE_LIMIT = {
+    "per_chat_per_second": {
+        "value": 1,
+        "ref": {
+            "url": URL,
+            "text": "In a single chat, avoid sending more than one message per second.",
+        },
+    },
+}
+EXTENSIONS = {
+    "sendMessage": {
+        "x-rate-limit": RATE_LIMIT,
+        "x-restrictions": {"text": {"max_length": 4096}},
+    },
+    "sendPhoto": {"x-rate-limit": RATE_LIMIT},
+    "sendDice": {
+        "x-rate-limit": RATE_LIMIT,
+        "x-restrictions": {"text": {"max_length": 4096}},
+    },
+    "getMe": {"x-restrictions": {"ref": {"url": URL, "text": "Used only once."}}},
+}
+
+
+class TestDefinitions(unittest.TestCase):
+    def test_repeated_blocks_are_hoisted(self):
+        hoisted = definitions.hoist(copy.deepcopy(EXTENSIONS))
+        reference = {"$ref": "#/x-definitions/x-rate-limit"}
+        self.assertEqual(hoisted["x-definitions"], {"x-rate-limit": RATE_LIMIT})
+        for name in ("sendMessage", "sendPhoto", "sendDice"):
+            self.assertEqual(hoisted[name]["x-rate-limit"], reference)
+        # Blocks shorter than a reference, and blocks used once, stay inline.
+        self.assertEqual(
+            hoisted["sendDice"]["x-restrictions"], {"text": {"max_length": 4096}}
+        )
+        self.assertEqual(hoisted["getMe"], EXTENSIONS["getMe"])
+
+    def test_ref_objects_stay_inline(self):
+        ref = {"url": URL}
+        extensions = {
+            name: {"x-restrictions": {"text": {"max_length": 4096, "ref": ref}}}
+            for name in ("sendMessage", "sendDice")
+        }
+        extensions["getMe"] = {"x-notes": {"ref": ref}}
+        hoisted = definitions.hoist(copy.deepcopy(extensions))
+        self.assertEqual(list(hoisted["x-definitions"]), ["x-restrictions"])
+        self.assertEqual(hoisted["getMe"], extensions["getMe"])
+
+    def test_names_are_unique_and_escaped(self):
+        other = {
+            "per_chat_per_second": {
+                "value": 2,
+                "ref": RATE_LIMIT["per_chat_per_second"]["ref"],
+            }
+        }
+        extensions = {
+            "a": {"x-rate-limit": RATE_LIMIT},
+            "b": {"x-rate-limit": RATE_LIMIT},
+            "c": {"x-rate-limit": other},
+            "d": {"x-rate-limit": other},
+        }
+        hoisted = definitions.hoist(extensions)
+        self.assertEqual(
+            list(hoisted["x-definitions"]), ["x-rate-limit", "x-rate-limit-2"]
+        )
+        self.assertEqual(
+            hoisted["c"]["x-rate-limit"]["$ref"], "#/x-definitions/x-rate-limit-2"
+        )
+        self.assertEqual(definitions.pointer("a/b~c"), "#/x-definitions/a~1b~0c")
+
+    def test_without_repetition_nothing_changes(self):
+        extensions = {"getMe": EXTENSIONS["getMe"]}
+        self.assertEqual(definitions.hoist(copy.deepcopy(extensions)), extensions)
+
+    def test_resolver_expands_and_memoizes(self):
+        hoisted = definitions.hoist(copy.deepcopy(EXTENSIONS))
+        resolver = definitions.Resolver(hoisted)
+        for name, entry in EXTENSIONS.items():
+            self.assertEqual(resolver.get(name), entry)
+        self.assertEqual(
+            resolver.get("sendPhoto", "x-rate-limit", "per_chat_per_second", "value"), 1
+        )
+        self.assertIs(
+            resolver.get("sendMessage", "x-rate-limit"),
+            resolver.get("sendPhoto", "x-rate-limit"),
+        )
+        self.assertEqual(list(resolver._resolved), ["#/x-definitions/x-rate-limit"])
+
+    def test_resolver_rejects_cycles_and_remote_references(self):
+        resolver = definitions.Resolver({"a": {"$ref": "#/b"}, "b": {"$ref": "#/a"}})
+        with self.assertRaises(ValueError):
+            resolver.get("a")
+        with self.assertRaises(ValueError):
+            resolver.resolve("other.json#/a")
+
+    def test_references_resolve_in_the_extended_spec(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        spec = spec_merge.build(
+            extensions=definitions.hoist(copy.deepcopy(EXTENSIONS)),
+            output_path=os.path.join(tmp, "spec-extended.json"),
+            min_output_path=os.path.join(tmp, "spec-extended.min.json"),
+            patch_path=None,
+            restrictions_path=None,
+            binary_path=None,
+        )
+        with open(os.path.join(tmp, "spec-extended.json")) as f:
+            self.assertEqual(json.load(f), spec)
+        resolver = definitions.Resolver(spec)
+        self.assertEqual(
+            resolver.get("methods", "sendPhoto", "x-rate-limit"), RATE_LIMIT
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
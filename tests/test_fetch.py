@@ -0,0 +1,81 @@
+import time
+import unittest
+from unittest.mock import patch
+import scraper
+from http_stub import Route, StubServer
+
+FAQ_HTML = """
+<div>
+    <h4><a name="how-do-i-download-files"></a>How do I download files?</h4>
+    <p>The maximum file size to download is 20 MB.</p>
+</div>
+"""
+
+FEATURES_HTML = """
+<div>
+    <h3 id="what-features-do-bots-have">What features do bots have?</h3>
+    <h4><a name="inputs">Inputs</a></h4>
+    <p>Users can send messages of all types to bots.</p>
+</div>
+"""
+
+
+class TestFetch(unittest.TestCase):
+    def test_fetch_soups_downloads_pages_concurrently(self):
+        delay = 0.3
+        routes = {f"/page{i}": Route(f"<p>{i}</p>", delay=delay) for i in range(3)}
+        with StubServer(routes) as server:
+            urls = [server.url(path) for path in routes]
+            start = time.perf_counter()
+            soups = scraper.fetch_soups(urls)
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual([soups[url].p.get_text() for url in urls], ["0", "1", "2"])
+        self.assertLess(elapsed, 2 * delay)
+
+    def test_session_reuses_connections(self):
+        with StubServer({"/api": Route("<p>api</p>")}) as server:
+            session = scraper.make_session()
+            for _ in range(3):
+                self.assertIsNotNone(scraper.get_soup(server.url("/api"), session))
+            session.close()
+        self.assertEqual(server.connections, 1)
+
+    def test_get_soup_retries_server_errors(self):
+        route = Route("<p>ok</p>", statuses=[503, 502])
+        with StubServer({"/faq": route}) as server:
+            session = scraper.make_session(backoff_factor=0)
+            soup = scraper.get_soup(server.url("/faq"), session)
+            session.close()
+        self.assertEqual(soup.p.get_text(), "ok")
+        self.assertEqual(route.hits, 3)
+
+    def test_get_soup_gives_up_after_timeout(self):
+        with StubServer({"/slow": Route("<p>slow</p>", delay=1)}) as server:
+            session = scraper.make_session(retries=0)
+            soup = scraper.get_soup(server.url("/slow"), session, timeout=0.2)
+            session.close()
+        self.assertIsNone(soup)
+
+    def test_scrape_all_merges_sources_in_order(self):
+        routes = {
+            "/faq": Route(FAQ_HTML, delay=0.1),
+            "/features": Route(FEATURES_HTML),
+            "/api": Route(statuses=[404]),
+        }
+        with StubServer(routes) as server:
+            sources = [
+                (server.url("/faq"), scraper.scrape_faq_page),
+                (server.url("/api"), scraper.scrape_api_page),
+                (server.url("/features"), scraper.scrape_features_page),
+            ]
+            with patch("scraper.SOURCES", sources):
+                data = scraper.scrape_all()
+
+        self.assertEqual(list(data), ["x-rate-limit", "x-file-size-limits", "features"])
+        self.assertEqual(data["x-file-size-limits"]["download_mb"]["value"], 20)
+        self.assertIn("inputs", data["features"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,11 @@
+import os
+import shutil
+import tempfile
 import unittest
 from unittest.mock import patch
+import numpy as np
 import update_extensions
+from vector_cache import VectorCache
 
 
 class TestGenerator(unittest.TestCase):
@@ -202,8 +207,11 @@ class TestGenerator(unittest.TestCase):
             },
         }
 
+        # The rules also extend other methods; the five methods that were
+        # generated before the rule engine must not change.
+        self.assertEqual(list(generator.extensions_data)[:5], list(expected_data))
         self.assertEqual(
-            generator.extensions_data,
+            {name: generator.extensions_data[name] for name in expected_data},
             expected_data,
         )
 
@@ -211,25 +219,92 @@ class TestGenerator(unittest.TestCase):
     @patch("update_extensions.AIComponent")
     def test_ai_component_is_called(self, mock_ai_component, mock_scrape_all):
         mock_scrape_all.return_value = {"methods": {}, "types": {}}
-        update_extensions.main()
-        mock_ai_component.assert_called_once_with({"methods": {}, "types": {}})
+        # main() writes the extensions, the merged spec and the models to the
+        # working directory.
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        shutil.copy("api.json", tmp.name)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp.name)
+        with patch("sys.stdout"):
+            update_extensions.main()
+        mock_ai_component.assert_called_once()
+        self.assertEqual(
+            mock_ai_component.call_args.args[0], {"methods": {}, "types": {}}
+        )
         mock_ai_component.return_value.analyze_data.assert_called_once()
 
-    @patch("update_extensions.KMeans")
-    @patch("update_extensions.CountVectorizer")
-    def test_analyze_data(self, mock_count_vectorizer, mock_kmeans):
+    @patch("update_extensions.MiniBatchKMeans")
+    @patch("update_extensions.HashingVectorizer")
+    def test_analyze_data(self, mock_hashing_vectorizer, mock_kmeans):
         extensions_ref_data = {
             "methods": {"getMe": {"description": "A simple method"}},
             "types": {"User": {"description": "A Telegram user"}},
         }
+        mock_hashing_vectorizer.return_value.transform.return_value = np.eye(2)
+        mock_kmeans.return_value.cluster_centers_ = np.eye(2)
         ai_component = update_extensions.AIComponent(extensions_ref_data)
-        ai_component.analyze_data()
-        mock_count_vectorizer.assert_called_once_with(stop_words="english")
-        mock_count_vectorizer.return_value.fit_transform.assert_called_once_with(
+        result = ai_component.analyze_data()
+        mock_hashing_vectorizer.assert_called_once_with(
+            stop_words="english",
+            n_features=update_extensions.N_FEATURES,
+            alternate_sign=False,
+        )
+        mock_hashing_vectorizer.return_value.transform.assert_called_once_with(
             ["A simple method", "A Telegram user"]
         )
-        mock_kmeans.assert_called_once_with(n_clusters=2, random_state=0, n_init="auto")
-        mock_kmeans.return_value.fit.assert_called_once()
+        mock_kmeans.assert_called_once_with(
+            n_clusters=2,
+            random_state=0,
+            n_init="auto",
+            batch_size=update_extensions.BATCH_SIZE,
+        )
+        mock_kmeans.return_value.partial_fit.assert_called_once()
+        self.assertEqual(result["clusters"], {0: ["getMe"], 1: ["User"]})
+        self.assertEqual(result["field_clusters"], {})
+
+    def test_field_clustering_with_vector_cache(self):
+        extensions_ref_data = {
+            "methods": {
+                "sendMessage": {
+                    "description": "Use this method to send text messages.",
+                    "parameters": [
+                        {"name": "chat_id", "description": "Unique chat identifier"},
+                        {"name": "text", "description": "Text of the message"},
+                    ],
+                },
+            },
+            "types": {
+                "Chat": {
+                    "description": "This object represents a chat.",
+                    "fields": [
+                        {"name": "id", "description": "Unique chat identifier"},
+                    ],
+                },
+            },
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "vectors.npz")
+            with patch("builtins.print"):
+                first = update_extensions.AIComponent(
+                    extensions_ref_data, VectorCache(path)
+                ).analyze_data()
+                cache = VectorCache(path)
+                second = update_extensions.AIComponent(
+                    extensions_ref_data, cache
+                ).analyze_data()
+
+        self.assertEqual(first, second)
+        self.assertEqual(
+            sorted(sum(first["field_clusters"].values(), [])),
+            ["Chat.id", "sendMessage.chat_id", "sendMessage.text"],
+        )
+        labels = {
+            name: label
+            for label, names in first["field_clusters"].items()
+            for name in names
+        }
+        self.assertEqual(labels["Chat.id"], labels["sendMessage.chat_id"])
 
     def test_clustering(self):
         extensions_ref_data = {
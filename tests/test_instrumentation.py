@@ -0,0 +1,131 @@
+import json
+import os
+import pstats
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+import instrumentation
+import update_extensions
+
+MB = 1024 * 1024
+
+
+@instrumentation.timed()
+def allocate(size):
+    return len(bytearray(size))
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def test_inactive_spans_only_call_through(self):
+        self.assertEqual(allocate(10), 10)
+        with instrumentation.span("nothing"):
+            pass
+        self.assertIsNone(instrumentation._active)
+
+    def test_stages_are_aggregated_with_their_peaks(self):
+        with instrumentation.Recorder() as recorder:
+            with instrumentation.span("outer"):
+                # The largest allocation is freed before the next call, but
+                # stays the peak of the enclosing span.
+                allocate(8 * MB)
+                allocate(MB)
+                allocate(2 * MB)
+        self.assertIsNone(instrumentation._active)
+        stages = recorder.stages
+        self.assertEqual(stages["allocate"]["calls"], 3)
+        self.assertEqual(stages["allocate"]["parent"], "outer")
+        self.assertGreaterEqual(stages["allocate"]["peak_memory_bytes"], 8 * MB)
+        self.assertLess(stages["allocate"]["peak_memory_bytes"], 9 * MB)
+        self.assertGreaterEqual(stages["outer"]["peak_memory_bytes"], 8 * MB)
+        self.assertGreaterEqual(
+            stages["outer"]["wall_seconds"], stages["allocate"]["wall_seconds"]
+        )
+        self.assertEqual(recorder.report()["slowest"], "outer")
+
+    def test_thread_spans_belong_to_the_running_stage(self):
+        with instrumentation.Recorder() as recorder:
+            with instrumentation.span("scrape"):
+                thread = threading.Thread(target=allocate, args=(MB,))
+                thread.start()
+                thread.join()
+        self.assertEqual(recorder.stages["allocate"]["parent"], "scrape")
+        self.assertIsNone(recorder.stages["allocate"]["peak_memory_bytes"])
+
+    def test_profile_of_the_slowest_stage_is_saved(self):
+        with instrumentation.Recorder(profile=True) as recorder:
+            with instrumentation.span("fast"):
+                pass
+            allocate(4 * MB)
+        path = os.path.join(self.tmp, "report.json")
+        report = recorder.save(path)
+        with open(path) as f:
+            self.assertEqual(json.load(f), report)
+        self.assertEqual(report["profile"]["stage"], "allocate")
+        self.assertTrue(os.path.exists(os.path.join(self.tmp, "allocate.prof")))
+        self.assertTrue(os.path.exists(report["profile"]["memory"]))
+        self.assertEqual(
+            [stage["name"] for stage in report["stages"]], ["fast", "allocate"]
+        )
+
+    def test_profile_and_report_agree_on_the_slowest_stage(self):
+        with instrumentation.Recorder(profile=True) as recorder:
+            with instrumentation.span("single"):
+                time.sleep(0.03)
+            for _ in range(3):
+                with instrumentation.span("repeated"):
+                    time.sleep(0.02)
+        report = recorder.save(os.path.join(self.tmp, "report.json"))
+        self.assertEqual(report["slowest"], "repeated")
+        self.assertEqual(report["profile"]["stage"], "repeated")
+        self.assertIn("memory", report["profile"])
+
+    def test_profile_includes_the_worker_threads(self):
+        def work():
+            with instrumentation.span("fetch"):
+                allocate(MB)
+
+        with instrumentation.Recorder(profile=True) as recorder:
+            with instrumentation.span("scrape"):
+                threads = [threading.Thread(target=work) for _ in range(2)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        report = recorder.save(os.path.join(self.tmp, "report.json"))
+        self.assertEqual(report["profile"]["stage"], "scrape")
+        stats = pstats.Stats(report["profile"]["pstats"])
+        functions = {function for _, _, function in stats.stats}
+        self.assertIn("allocate", functions)
+
+    def test_main_writes_a_run_report(self):
+        for name in ("api.json", "sentence_examples.json"):
+            shutil.copy(name, self.tmp)
+        cwd = os.getcwd()
+        self.addCleanup(os.chdir, cwd)
+        os.chdir(self.tmp)
+        with open("ref.json", "w") as f:
+            json.dump({"methods": {}, "types": {}}, f)
+
+        with patch("sys.stdout"):
+            update_extensions.main(["--replay", "ref.json", "--no-cache", "--report"])
+        with open(instrumentation.DEFAULT_REPORT_PATH) as f:
+            report = json.load(f)
+        names = [stage["name"] for stage in report["stages"]]
+        for name in ("Generator.save_extensions_file", "spec_merge.build"):
+            self.assertIn(name, names)
+        self.assertGreater(report["total"]["wall_seconds"], 0)
+        self.assertGreater(report["total"]["peak_memory_bytes"], 0)
+        stages = {stage["name"]: stage for stage in report["stages"]}
+        self.assertIsNotNone(stages["spec_merge.build"]["peak_memory_bytes"])
+        self.assertNotIn("profile", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
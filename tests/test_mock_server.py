@@ -0,0 +1,176 @@
+import json
+import shutil
+import tempfile
+import time
+import unittest
+
+import mock_server
+import rate_limits
+import spec_merge
+import validators
+from benchmarks import bench_mock_server, bench_rate_limits
+
+Client = bench_mock_server.Client
+
+
+class TestMockServer(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.cache_dir = tempfile.mkdtemp()
+        cls.spec = spec_merge.load_json(spec_merge.OUTPUT_PATH)
+        cls.validators = validators.Validators.from_spec(
+            cls.spec, cache_dir=cls.cache_dir
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.cache_dir)
+
+    async def serve(self, **kwargs):
+        server = mock_server.MockServer(self.spec, self.validators, **kwargs)
+        await server.start()
+        self.addAsyncCleanup(server.close)
+        return server
+
+    async def test_results_are_objects_of_the_return_type(self):
+        server = await self.serve()
+        async with Client(server.base_url) as client:
+            status, reply = await client.call("getMe")
+            self.assertEqual(status, 200)
+            self.assertEqual(
+                reply["result"],
+                {"id": 1, "is_bot": True, "first_name": "first_name"},
+            )
+            payload = {"chat_id": 5, "text": "hi"}
+            _, first = await client.call("sendMessage", payload)
+            _, second = await client.call("SENDMESSAGE", payload)
+            self.assertEqual(set(first["result"]), {"message_id", "date", "chat"})
+            # Documented values rather than field names.
+            self.assertEqual(first["result"]["chat"], {"id": 1, "type": "private"})
+            self.assertEqual(second["result"]["message_id"], 2)
+            # Abstract types answer with a concrete subtype.
+            _, reply = await client.call("getChatMember", {"chat_id": 5, "user_id": 1})
+            self.assertEqual(reply["result"]["status"], "administrator")
+            _, reply = await client.call("setMyCommands", {"commands": []})
+            self.assertEqual(reply, {"ok": True, "result": True})
+        self.assertEqual((server.requests, server.connections), (5, 1))
+
+    async def test_invalid_requests_are_rejected(self):
+        server = await self.serve(tokens=["123456:mock-token"])
+        async with Client(server.base_url) as client:
+            status, reply = await client.call("sendMessage", {"chat_id": 5})
+            self.assertEqual(
+                (status, reply),
+                (
+                    400,
+                    {
+                        "ok": False,
+                        "error_code": 400,
+                        "description": "Bad Request: text: required",
+                    },
+                ),
+            )
+            status, reply = await client.call("sendMessage", b"{", "application/json")
+            self.assertEqual(status, 400)
+            status, reply = await client.call("sendNothing")
+            self.assertEqual((status, reply["description"]), (404, "Not Found"))
+        async with Client(server.base_url, token="1:other") as client:
+            status, _ = await client.call("getMe")
+            self.assertEqual(status, 401)
+
+    async def test_documented_requests_are_accepted(self):
+        server = await self.serve()
+        options = [{"text": "a"}, {"text": "b"}]
+        async with Client(server.base_url) as client:
+            for method, payload in [
+                (
+                    "sendPoll",
+                    {
+                        "chat_id": 5,
+                        "question": "?",
+                        "options": options,
+                        "close_date": int(time.time()) + 60,
+                    },
+                ),
+                (
+                    "sendLocation",
+                    {
+                        "chat_id": 5,
+                        "latitude": 51.5,
+                        "longitude": -0.1,
+                        "live_period": 0x7FFFFFFF,
+                    },
+                ),
+            ]:
+                with self.subTest(method=method):
+                    status, reply = await client.call(method, payload)
+                    self.assertEqual(status, 200, reply)
+
+    async def test_form_parameters_are_decoded_by_field_type(self):
+        server = await self.serve()
+        async with Client(server.base_url) as client:
+            form = b"chat_id=-100&text=42&disable_notification=true&entities=%5B%5D"
+            status, _ = await client.call(
+                "sendMessage", form, "application/x-www-form-urlencoded"
+            )
+            self.assertEqual(status, 200)
+            status, reply = await client.send(
+                b"GET /bot123456:mock-token/getUpdates?limit=500 HTTP/1.1\r\n\r\n"
+            )
+            self.assertEqual(
+                reply["description"],
+                "Bad Request: limit: value must be between 1 and 100",
+            )
+
+            boundary = "b0undary"
+            media = [
+                {"type": "photo", "media": "attach://one"},
+                {"type": "photo", "media": "attach://two"},
+            ]
+            parts = [
+                (b'name="chat_id"', b"@channel"),
+                (b'name="media"', json.dumps(media).encode()),
+                (b'name="one"; filename="one.jpg"', b"\xff\xd8"),
+                (b'name="two"; filename="two.jpg"', b"\xff\xd8"),
+            ]
+            body = b"".join(
+                b"--%s\r\nContent-Disposition: form-data; %s\r\n\r\n%s\r\n"
+                % (boundary.encode(), disposition, value)
+                for disposition, value in parts
+            )
+            body += b"--%s--\r\n" % boundary.encode()
+            status, reply = await client.call(
+                "sendMediaGroup", body, f"multipart/form-data; boundary={boundary}"
+            )
+            self.assertEqual((status, reply["result"]), (200, []))
+
+    async def test_rate_limits_answer_with_429(self):
+        limiter = rate_limits.RateLimiter(
+            bench_rate_limits.limits(), {"per_chat_per_second": 1}
+        )
+        server = await self.serve(rate_limiter=limiter)
+        async with Client(server.base_url) as client:
+            payload = {"chat_id": 5, "text": "hi"}
+            status, _ = await client.call("sendMessage", payload)
+            self.assertEqual(status, 200)
+            status, reply = await client.call("sendMessage", payload)
+            self.assertEqual(status, 429)
+            self.assertEqual(reply["parameters"], {"retry_after": 1})
+            status, _ = await client.call("sendMessage", dict(payload, chat_id=6))
+            self.assertEqual(status, 200)
+            status, _ = await client.call("getMe")
+            self.assertEqual(status, 200)
+
+    async def test_connection_close(self):
+        server = await self.serve()
+        async with Client(server.base_url) as client:
+            request = client.encode("getMe").replace(
+                b"\r\n\r\n", b"\r\nConnection: close\r\n\r\n"
+            )
+            status, _ = await client.send(request)
+            self.assertEqual(status, 200)
+            self.assertEqual(await client.reader.read(), b"")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+from pathlib import Path
+
+import model_codegen
+import models
+import spec_merge
+import synthetic_updates
+
+CHAT = {"id": 1, "type": "private"}
+
+
+class TestModels(unittest.TestCase):
+    def test_synthetic_updates_round_trip(self):
+        generator = synthetic_updates.UpdateGenerator.from_file(seed=5, optional=0.2)
+        for update in generator.updates(300):
+            decoded = models.Update.from_dict(update)
+            self.assertEqual(decoded.to_dict(), update)
+            self.assertEqual(decoded, models.Update.from_dict(update))
+
+    def test_fields(self):
+        message = models.Message.from_dict(
+            {
+                "message_id": 1,
+                "date": 2,
+                "chat": CHAT,
+                "from": {"id": 3, "is_bot": False, "first_name": "Ann"},
+                "photo": [
+                    {"file_id": "a", "file_unique_id": "b", "width": 1, "height": 1}
+                ],
+            }
+        )
+        self.assertIsInstance(message.chat, models.Chat)
+        self.assertEqual(message.from_.first_name, "Ann")
+        self.assertIsInstance(message.photo[0], models.PhotoSize)
+        self.assertIsNone(message.text)
+        self.assertNotIn("text", message.to_dict())
+        with self.assertRaises(AttributeError):
+            message.no_such_field
+        with self.assertRaises(AttributeError):
+            message.no_such_field = 1
+        user = models.User(id=3, is_bot=False, first_name="Ann", username="ann")
+        self.assertEqual(
+            user.to_dict(),
+            {"id": 3, "is_bot": False, "first_name": "Ann", "username": "ann"},
+        )
+
+    def test_abstract_types_choose_a_subtype(self):
+        self.assertTrue(issubclass(models.Message, models.MaybeInaccessibleMessage))
+        message = models.MaybeInaccessibleMessage.from_dict(
+            {"message_id": 1, "date": 0, "chat": CHAT}
+        )
+        self.assertIsInstance(message, models.InaccessibleMessage)
+        message = models.MaybeInaccessibleMessage.from_dict(
+            {"message_id": 1, "date": 2, "chat": CHAT}
+        )
+        self.assertIsInstance(message, models.Message)
+        user = {"id": 3, "is_bot": False, "first_name": "A"}
+        owner = models.ChatMember.from_dict(
+            {"status": "creator", "user": user, "is_anonymous": False}
+        )
+        self.assertIsInstance(owner, models.ChatMemberOwner)
+        # Cached and uploaded photos share their type and differ in fields.
+        cached = models.InlineQueryResult.from_dict(
+            {"type": "photo", "id": "1", "photo_file_id": "f"}
+        )
+        self.assertIsInstance(cached, models.InlineQueryResultCachedPhoto)
+        uploaded = models.InlineQueryResult.from_dict(
+            {"type": "photo", "id": "1", "photo_url": "u", "thumbnail_url": "t"}
+        )
+        self.assertIsInstance(uploaded, models.InlineQueryResultPhoto)
+        with self.assertRaises(ValueError):
+            models.InlineQueryResult.from_dict({"type": "photo", "id": "1"})
+
+    def test_committed_models_are_up_to_date(self):
+        spec = spec_merge.load_json(spec_merge.OUTPUT_PATH)
+        self.assertEqual(
+            Path(model_codegen.MODELS_PATH).read_text(), model_codegen.generate(spec)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
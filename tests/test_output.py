@@ -0,0 +1,95 @@
+import itertools
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import output
+
+TREE = {
+    "b": [1, -2, 3.5, True, None, {}, []],
+    "a": {
+        "text": "café — \U0001f600  ",
+        "control": '\x00\x1f\x7f\t\n"\\/',
+        "big": 2**63 - 1,
+    },
+    # orjson writes these as 1e16, 1e-7, 0.000025, null and null.
+    "c": [1e16, 1e-07, 2.5e-05, float("nan"), float("-inf"), 0.1, -0.0, 1e15],
+}
+
+
+class TestOutput(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = tmp.name
+        self.path = os.path.join(self.directory, "out.json")
+
+    def test_dumps_matches_json_module(self):
+        # Without the exponent floats, orjson encodes the tree.
+        plain = {key: value for key, value in TREE.items() if key != "c"}
+        for tree, has_orjson, sort_keys in itertools.product(
+            (TREE, plain), {False, output.HAS_ORJSON}, (False, True)
+        ):
+            with self.subTest(
+                floats=tree is TREE, has_orjson=has_orjson, sort_keys=sort_keys
+            ):
+                with patch("output.HAS_ORJSON", has_orjson):
+                    pretty, minified = output.dumps(tree, sort_keys)
+                    self.assertEqual(output.encode(tree, True, sort_keys), pretty)
+                    self.assertEqual(output.encode(tree, False, sort_keys), minified)
+                self.assertEqual(
+                    pretty, json.dumps(tree, indent=2, sort_keys=sort_keys)
+                )
+                self.assertEqual(
+                    minified,
+                    json.dumps(tree, separators=(",", ":"), sort_keys=sort_keys),
+                )
+
+    def test_only_the_written_variants_are_encoded(self):
+        with patch("output.HAS_ORJSON", False), patch(
+            "output.json.dumps", wraps=json.dumps
+        ) as encode:
+            output.write_min_json(TREE, self.path)
+            self.assertEqual(encode.call_count, 1)
+            self.assertEqual(encode.call_args.kwargs["separators"], (",", ":"))
+            output.write_json(TREE, self.path)
+            self.assertEqual(encode.call_count, 2)
+            output.write_json(TREE, self.path, self.path + ".min")
+            self.assertEqual(encode.call_count, 4)
+
+    def test_integers_orjson_rejects_fall_back(self):
+        self.assertEqual(output.dumps({"n": 2**70})[1], '{"n":%d}' % 2**70)
+
+    def test_unchanged_files_are_not_written(self):
+        self.assertEqual(
+            output.write_json(TREE, self.path, self.path + ".min"),
+            [self.path, self.path + ".min"],
+        )
+        os.utime(self.path, ns=(0, 0))
+        self.assertEqual(output.write_json(TREE, self.path, self.path + ".min"), [])
+        self.assertEqual(os.stat(self.path).st_mtime_ns, 0)
+        self.assertEqual(output.write_json({"a": 1}, self.path), [self.path])
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), {"a": 1})
+        self.assertEqual(
+            sorted(os.listdir(self.directory)), ["out.json", "out.json.min"]
+        )
+
+    def test_interrupted_write_keeps_the_old_file(self):
+        output.write_text(self.path, "old")
+        with patch("output.os.replace", side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                output.write_text(self.path, "new")
+        with open(self.path) as f:
+            self.assertEqual(f.read(), "old")
+
+    def test_canonical_sorts_every_object(self):
+        tree = output.canonical({"b": {"d": 1, "c": [{"f": 1, "e": 2}]}, "a": 0})
+        self.assertEqual(
+            json.dumps(tree), '{"a": 0, "b": {"c": [{"e": 2, "f": 1}], "d": 1}}'
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import scraper
+import update_extensions
+from http_stub import Route, StubServer
+from page_cache import PageCache
+
+FAQ_HTML = """
+<div>
+    <h4><a name="how-do-i-download-files"></a>How do I download files?</h4>
+    <p>The maximum file size to download is 20 MB.</p>
+</div>
+"""
+
+
+class TestPageCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_conditional_get_reuses_cached_results(self):
+        route = Route(FAQ_HTML, headers={"ETag": '"v1"'})
+        with StubServer({"/faq": route}) as server:
+            url = server.url("/faq")
+            first = scraper.scrape_source(
+                url, scraper.scrape_faq_page, cache=PageCache(self.tmp.name)
+            )
+            with patch("scraper.BeautifulSoup") as mock_soup:
+                second = scraper.scrape_source(
+                    url, scraper.scrape_faq_page, cache=PageCache(self.tmp.name)
+                )
+            mock_soup.assert_not_called()
+
+        self.assertEqual(first, second)
+        self.assertEqual(first["x-file-size-limits"]["download_mb"]["value"], 20)
+        self.assertNotIn("If-None-Match", server.requests[0][1])
+        self.assertEqual(server.requests[1][1]["If-None-Match"], '"v1"')
+
+    def test_get_soup_parses_cached_body_when_not_modified(self):
+        route = Route("<p>cached</p>", headers={"Last-Modified": "Mon, 01 Jan 2024"})
+        cache = PageCache(self.tmp.name)
+        with StubServer({"/api": route}) as server:
+            url = server.url("/api")
+            scraper.get_soup(url, cache=cache)
+            route.statuses.append(304)
+            soup = scraper.get_soup(url, cache=cache)
+
+        self.assertEqual(soup.p.get_text(), "cached")
+        self.assertEqual(server.requests[1][1]["If-Modified-Since"], "Mon, 01 Jan 2024")
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = PageCache(self.tmp.name, max_bytes=25)
+        headers = {"ETag": '"x"'}
+        cache.store("a", "a" * 10, headers)
+        cache.store("b", "b" * 10, headers)
+        cache.body("a")
+        cache.store("c", "c" * 10, headers)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertLessEqual(cache.size(), 25)
+        self.assertNotIn("b", PageCache(self.tmp.name))
+
+    def test_responses_without_validators_are_not_cached(self):
+        cache = PageCache(self.tmp.name)
+        cache.store("a", "body", {})
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.conditional_headers("a"), {})
+
+    @patch("update_extensions.scraper.scrape_all")
+    @patch("update_extensions.AIComponent")
+    def test_no_cache_flag(self, mock_ai_component, mock_scrape_all):
+        mock_scrape_all.return_value = {"methods": {}, "types": {}}
+        shutil.copy("api.json", self.tmp.name)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.tmp.name)
+        with patch("sys.stdout"):
+            update_extensions.main(["--no-cache"])
+        mock_scrape_all.assert_called_once()
+        self.assertIsNone(mock_scrape_all.call_args.kwargs["cache"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import copy
+import json
+import os
+import unittest
+import scraper
+import scraper_lxml
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+PAGES = {
+    "api.html": scraper.scrape_api_page,
+    "faq.html": scraper.scrape_faq_page,
+    "features.html": scraper.scrape_features_page,
+}
+# The results of the scraper before the single-pass scanner and the parser
+# backends, captured with html.parser from every page as <page>.baseline.json.
+# The entries below are the ones split_sections changed on purpose: a section
+# without a table no longer takes the table of the next section, and a
+# description no longer runs on into the paragraphs after the next h3.
+SCANNER_FIXES = {
+    "api.html": [
+        ("methods", "getMe", "parameters"),
+        ("methods", "logOut", "parameters"),
+        ("methods", "sendMessage", "description"),
+        ("types", "MaybeInaccessibleMessage", "fields"),
+        ("types", "ChatMember", "fields"),
+        ("types", "ChatMemberOwner", "description"),
+        ("types", "sendMessage", "description"),
+    ],
+    "faq.html": [],
+    "features.html": [("features", "keyboards", "description")],
+}
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def read_baseline(name):
+    return json.loads(read_fixture(name.replace(".html", ".baseline.json")))
+
+
+def without_fixes(results, name):
+    """Returns a copy of results without the entries SCANNER_FIXES changed."""
+    results = copy.deepcopy(results)
+    for kind, entry, key in SCANNER_FIXES[name]:
+        del results[kind][entry][key]
+    return results
+
+
+class TestBaseline(unittest.TestCase):
+    def test_results_match_the_baseline(self):
+        parsers = scraper.PARSERS if scraper_lxml.lxml else ("html.parser",)
+        for name, scrape_page in PAGES.items():
+            baseline = read_baseline(name)
+            for parser in parsers:
+                with self.subTest(page=name, parser=parser):
+                    results = scraper.scrape_body(
+                        read_fixture(name), scrape_page, parser
+                    )
+                    self.assertEqual(
+                        without_fixes(results, name), without_fixes(baseline, name)
+                    )
+
+    def test_scanner_fixes(self):
+        for name, fixes in SCANNER_FIXES.items():
+            baseline = read_baseline(name)
+            results = scraper.scrape_body(read_fixture(name), PAGES[name])
+            for kind, entry, key in fixes:
+                with self.subTest(page=name, entry=entry, key=key):
+                    old, new = baseline[kind][entry][key], results[kind][entry][key]
+                    if key == "description":
+                        # Cut at the end of the section.
+                        self.assertTrue(old.startswith(new + "\n"))
+                    else:
+                        # Borrowed from the next section.
+                        self.assertTrue(old)
+                        self.assertEqual(new, [])
+
+
+@unittest.skipIf(scraper_lxml.lxml is None, "lxml is not installed")
+class TestParsers(unittest.TestCase):
+    def test_backends_match_html_parser(self):
+        for name, scrape_page in PAGES.items():
+            body = read_fixture(name)
+            expected = json.dumps(scraper.scrape_body(body, scrape_page, "html.parser"))
+            for parser in scraper.PARSERS:
+                with self.subTest(page=name, parser=parser):
+                    results = scraper.scrape_body(body, scrape_page, parser)
+                    self.assertEqual(json.dumps(results), expected)
+
+    def test_fixture_results(self):
+        api = scraper.scrape_body(read_fixture("api.html"), scraper.scrape_api_page)
+        self.assertEqual(api["methods"]["getMe"]["parameters"], [])
+        self.assertEqual(api["methods"]["getUpdates"]["parameters"][1]["name"], "limit")
+        self.assertIn(
+            "“MarkdownV2” & HTML", api["methods"]["sendMessage"]["description"]
+        )
+        self.assertEqual(api["types"]["MaybeInaccessibleMessage"]["fields"], [])
+
+        faq = scraper.scrape_body(read_fixture("faq.html"), scraper.scrape_faq_page)
+        self.assertEqual(
+            sorted(faq["x-rate-limit"]),
+            ["broadcast_per_second", "group_per_minute", "per_chat_per_second"],
+        )
+        self.assertEqual(faq["x-file-size-limits"]["download_mb"]["value"], 20)
+
+    def test_unknown_parser(self):
+        with self.assertRaises(ValueError):
+            scraper.scrape_body("<p></p>", scraper.scrape_api_page, "html5")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+
+import numpy as np
+
+import rate_limits
+from benchmarks import bench_rate_limits
+
+LIMITS = {
+    "per_chat_per_second": {"value": 1},
+    "group_per_minute": {"value": 20},
+    "broadcast_per_second": {"value": 30},
+}
+
+
+def limiter(**burst):
+    return rate_limits.RateLimiter({"sendMessage": LIMITS}, burst)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_chat_bucket(self):
+        allowed, retry_after, level = limiter(per_chat_per_second=1).decide(
+            [0, 0.5, 1.0, 1.2], [5] * 4, ["sendMessage"] * 4
+        )
+        self.assertEqual(allowed.tolist(), [True, False, True, False])
+        self.assertEqual(retry_after.tolist(), [0, 1, 0, 1])
+        self.assertEqual(level.tolist(), [-1, 0, -1, 0])
+        # The default burst lets three messages through at once.
+        allowed, _, _ = limiter().decide([0] * 4, [5] * 4, ["sendMessage"] * 4)
+        self.assertEqual(allowed.tolist(), [True, True, True, False])
+
+    def test_group_and_broadcast_buckets(self):
+        allowed, retry_after, level = limiter(per_chat_per_second=100).decide(
+            [0] * 21, [-5] * 21, ["sendMessage"] * 21
+        )
+        self.assertEqual(allowed.sum(), 20)
+        self.assertEqual((retry_after[-1], level[-1]), (3, 1))
+
+        allowed, retry_after, level = limiter().decide(
+            [0] * 31, range(1, 32), ["sendMessage"] * 31
+        )
+        self.assertEqual(allowed.sum(), 30)
+        self.assertEqual((retry_after[-1], level[-1]), (1, 2))
+
+    def test_methods_without_limits_are_allowed(self):
+        rate_limiter = limiter(per_chat_per_second=1)
+        allowed, _, _ = rate_limiter.decide([0, 0, 0], [5] * 3, ["getMe"] * 3)
+        self.assertTrue(allowed.all())
+        self.assertIsNone(rate_limiter.check(0, 5, "sendMessage"))
+        self.assertEqual(rate_limiter.check(0.1, 5, "sendMessage"), 1)
+
+    def test_full_buckets_are_dropped(self):
+        rate_limiter = limiter()
+        rate_limiter.decide(np.zeros(1000), np.arange(1000), ["sendMessage"] * 1000)
+        self.assertEqual(rate_limiter.live_buckets()["per_chat_per_second"], 1000)
+        rate_limiter.decide([100], [1], ["sendMessage"])
+        self.assertEqual(
+            rate_limiter.live_buckets(),
+            {
+                "per_chat_per_second": 1,
+                "group_per_minute": 0,
+                "broadcast_per_second": 1,
+            },
+        )
+
+    def test_matches_buckets_decided_one_by_one(self):
+        times, chat_ids, methods = bench_rate_limits.traffic(events=50_000)
+        names = np.array(bench_rate_limits.METHODS)[methods]
+        limits = bench_rate_limits.limits()
+        allowed, retry_after, level = rate_limits.replay(
+            rate_limits.RateLimiter(limits), times, chat_ids, names, window=600
+        )
+        expected = bench_rate_limits.ScalarRateLimiter(limits).replay(
+            times, chat_ids, methods
+        )
+        self.assertGreater((~allowed).sum(), 1000)
+        self.assertEqual(allowed.tolist(), [ok for ok, _, _ in expected])
+        self.assertEqual(retry_after.tolist(), [retry for _, retry, _ in expected])
+        self.assertEqual(level.tolist(), [found for _, _, found in expected])
+
+    def test_busy_chats_match_buckets_decided_one_by_one(self):
+        rng = np.random.default_rng(1)
+        times = np.sort(rng.exponential(0.3, 5000).cumsum() % 600)
+        chat_ids = rng.choice([-1, -2, 3], 5000, p=[0.6, 0.2, 0.2])
+        methods = np.zeros(5000, dtype=int)
+        limits = bench_rate_limits.limits()
+        allowed, retry_after, _ = rate_limits.RateLimiter(limits).decide(
+            times, chat_ids, np.array(bench_rate_limits.METHODS)[methods]
+        )
+        expected = bench_rate_limits.ScalarRateLimiter(limits).replay(
+            times, chat_ids, methods
+        )
+        self.assertEqual(allowed.tolist(), [ok for ok, _, _ in expected])
+        self.assertEqual(retry_after.tolist(), [retry for _, retry, _ in expected])
+
+    def test_limits_are_read_from_the_spec(self):
+        spec = {
+            "methods": {
+                "sendMessage": {
+                    "x-rate-limit": {"$ref": "#/x-definitions/x-rate-limit"}
+                },
+                "getMe": {},
+            },
+            "x-definitions": {"x-rate-limit": LIMITS},
+        }
+        rate_limiter = rate_limits.RateLimiter.from_spec(spec)
+        self.assertEqual(rate_limiter.methods, ["sendMessage"])
+
+
+if __name__ == "__main__":
+    unittest.main()
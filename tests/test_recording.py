@@ -0,0 +1,119 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+import scraper
+import update_extensions
+from http_stub import Route, StubServer
+from recording import Recording
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+PAGES = {
+    scraper.FAQ_URL: "faq.html",
+    scraper.API_URL: "api.html",
+    scraper.FEATURES_URL: "features.html",
+}
+FAQ_HTML = """
+<div>
+    <h4><a name="how-do-i-download-files"></a>How do I download files?</h4>
+    <p>The maximum file size to download is 20 MB.</p>
+</div>
+"""
+
+
+class TestRecording(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.directory = os.path.join(self.tmp, "recording")
+
+    def record_fixtures(self):
+        recording = Recording(self.directory)
+        for url, name in PAGES.items():
+            with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+                recording.record(url, f.read())
+        return recording
+
+    def test_recorded_pages_are_replayed_without_parsing(self):
+        with StubServer({"/faq": Route(FAQ_HTML)}) as server:
+            url = server.url("/faq")
+            recorded = scraper.scrape_source(
+                url, scraper.scrape_faq_page, recording=Recording(self.directory)
+            )
+        with patch("scraper.extract_source") as mock_extract:
+            replayed = scraper.replay_source(
+                url, scraper.scrape_faq_page, Recording(self.directory)
+            )
+        mock_extract.assert_not_called()
+        self.assertEqual(replayed, recorded)
+        self.assertEqual(replayed["x-file-size-limits"]["download_mb"]["value"], 20)
+
+    def test_edited_pages_are_extracted_again(self):
+        recording = Recording(self.directory)
+        recording.record(scraper.FAQ_URL, FAQ_HTML, {"stale": {}}, "scrape_faq_page")
+        self.assertEqual(
+            scraper.replay_source(scraper.FAQ_URL, scraper.scrape_faq_page, recording),
+            {"stale": {}},
+        )
+        # Edit the recorded page in place, as when a fixture is updated by hand.
+        key = recording._index["pages"][scraper.FAQ_URL]["key"]
+        with open(os.path.join(self.directory, key + ".html"), "a") as f:
+            f.write("<p>Edited.</p>")
+        data = scraper.scrape_recorded(Recording(self.directory))
+        self.assertEqual(data["x-file-size-limits"]["download_mb"]["value"], 20)
+        self.assertEqual(
+            Recording(self.directory).results(
+                scraper.FAQ_URL, "scrape_faq_page", FAQ_HTML + "<p>Edited.</p>"
+            ),
+            data,
+        )
+
+    @patch("update_extensions.scraper.scrape_all")
+    def test_generator_scrapes_lazily(self, mock_scrape_all):
+        mock_scrape_all.return_value = {"methods": {}}
+        generator = update_extensions.Generator()
+        mock_scrape_all.assert_not_called()
+        generator.generate_extensions_ref_data()
+        self.assertEqual(generator.extensions_ref_data, {"methods": {}})
+        mock_scrape_all.assert_called_once()
+
+    def test_record_and_stream_are_exclusive(self):
+        with patch("sys.stderr"), self.assertRaises(SystemExit):
+            update_extensions.parse_args(["--record", "--stream"])
+
+    @patch("scraper.requests")
+    @patch("scraper.make_session")
+    def test_replayed_run_is_offline_and_fast(self, mock_session, mock_requests):
+        self.record_fixtures()
+        for name in ("api.json", "sentence_examples.json"):
+            shutil.copy(name, self.tmp)
+        cwd = os.getcwd()
+        self.addCleanup(os.chdir, cwd)
+        os.chdir(self.tmp)
+
+        with patch("sys.stdout"):
+            update_extensions.main(["--replay", self.directory, "--no-cache"])
+            with open("extensions.json") as f:
+                first = json.load(f)
+            start = time.perf_counter()
+            update_extensions.main(["--replay", self.directory])
+            elapsed = time.perf_counter() - start
+            with open("extensions.json") as f:
+                self.assertEqual(json.load(f), first)
+            update_extensions.main(["--replay", "extensions.ref.json", "--no-cache"])
+            with open("extensions.json") as f:
+                self.assertEqual(json.load(f), first)
+
+        mock_session.assert_not_called()
+        self.assertEqual(mock_requests.mock_calls, [])
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(
+            first["getUpdates"]["x-restrictions"]["limit"]["max_value"], 100
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
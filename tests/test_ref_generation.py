@@ -204,8 +204,11 @@ class TestRefGeneration(unittest.TestCase):
         }
 
         self.maxDiff = None
+        # The rules also extend other methods; the five methods that were
+        # generated before the rule engine must not change.
+        self.assertEqual(list(generator.extensions_data)[:5], list(expected_data))
         self.assertEqual(
-            generator.extensions_data,
+            {name: generator.extensions_data[name] for name in expected_data},
             expected_data,
         )
 
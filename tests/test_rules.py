@@ -0,0 +1,100 @@
+import json
+import unittest
+
+import rules
+import spec_merge
+
+METHODS = {
+    "sendMessage": {
+        "returns": ["Message"],
+        "fields": [{"name": "chat_id"}, {"name": "text"}],
+    },
+    "sendDice": {"returns": ["Message"], "fields": [{"name": "chat_id"}]},
+    "sendGift": {"returns": ["Boolean"], "fields": [{"name": "text"}]},
+    "getMe": {"returns": ["User"]},
+}
+
+
+class TestRules(unittest.TestCase):
+    def test_predicates_are_combined(self):
+        engine = rules.RuleEngine(
+            METHODS,
+            [
+                {"params": "text", "extension": {"x-a": 1}},
+                {"methods": ["send*"], "returns": ["Message"], "extension": {"x-b": 2}},
+                {"methods": ["getMe", "unknown"], "extension": {"x-c": 3}},
+                {"requires": "x-missing", "extension": {"x-d": 4}},
+            ],
+        )
+        self.assertEqual(
+            engine.generate({}),
+            {
+                "sendMessage": {"x-a": 1, "x-b": 2},
+                "sendGift": {"x-a": 1},
+                "sendDice": {"x-b": 2},
+                "getMe": {"x-c": 3},
+                "unknown": {"x-c": 3},
+            },
+        )
+
+    def test_earlier_rules_take_precedence(self):
+        engine = rules.RuleEngine(
+            METHODS,
+            [
+                {
+                    "methods": ["sendMessage"],
+                    "extension": {"x-restrictions": {"text": {"max_length": 1}}},
+                },
+                {
+                    "params": "text",
+                    "requires": "x-limits",
+                    "extension": {
+                        "x-restrictions": {"text": {"max_length": 2, "min_length": 1}},
+                        "x-limits": rules.FromRef("x-limits"),
+                    },
+                },
+            ],
+        )
+        extensions = engine.generate({"x-limits": {"value": 3}})
+        self.assertEqual(
+            extensions["sendMessage"],
+            {
+                "x-restrictions": {"text": {"max_length": 1, "min_length": 1}},
+                "x-limits": {"value": 3},
+            },
+        )
+        extensions["sendMessage"]["x-limits"]["value"] = 4
+        self.assertEqual(extensions["sendGift"]["x-limits"], {"value": 3})
+
+    def test_rules_cover_the_spec(self):
+        methods = spec_merge.load_json("api.json")["methods"]
+        extensions = rules.RuleEngine(methods).generate(
+            {
+                "x-rate-limit": {"per_chat_per_second": {"value": 1}},
+                "x-file-size-limits": {},
+            }
+        )
+        self.assertEqual(list(extensions)[:5], rules.KEY_METHODS)
+        self.assertIn("x-rate-limit", extensions["sendDice"])
+        self.assertEqual(
+            extensions["sendAudio"]["x-restrictions"], {"caption": {"max_length": 1024}}
+        )
+        self.assertNotIn("postStory", extensions)
+        self.assertNotIn("sendGift", extensions)
+
+    def test_rule_values_are_kept_in_committed_extensions(self):
+        methods = spec_merge.load_json("api.json")["methods"]
+        extensions = rules.RuleEngine(methods).generate(
+            spec_merge.load_json("extensions.ref.json")
+        )
+        committed = spec_merge.load_json("extensions.json")
+        # extensions.json is written in canonical (sorted) key order.
+        self.assertEqual(list(committed), sorted(committed))
+        for name, block in extensions.items():
+            merged = json.loads(json.dumps(committed[name]))
+            rules.merge_missing(merged, block)
+            self.assertEqual(merged, committed[name])
+
+
+if __name__ == "__main__":
+    unittest.main()
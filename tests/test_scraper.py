@@ -189,6 +189,41 @@ class TestScraper(unittest.TestCase):
         }
         self.assertEqual(scraper.scrape_types(soup), expected_data)
 
+    def test_sections_do_not_borrow_from_the_next_section(self):
+        html = """
+        <div>
+            <h3 id="available-types">Available types</h3>
+            <h4><a name="ChatMember">ChatMember</a></h4>
+            <p>This object contains information about one member of a chat.</p>
+            <h3 id="available-methods">Available methods</h3>
+            <p>All methods in the Bot API are case-insensitive.</p>
+            <h4><a name="getMe">getMe</a></h4>
+            <p>A simple method for testing your bot's authentication token.</p>
+            <h4><a name="close">close</a></h4>
+            <p>Use this method to close the bot instance.</p>
+            <table>
+                <tr><th>Parameter</th><th>Type</th><th>Required</th><th>Description</th></tr>
+                <tr><td>user_id</td><td>Integer</td><td>Yes</td><td>Target user</td></tr>
+            </table>
+        </div>
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        sections = scraper.split_sections(soup)
+
+        self.assertEqual(
+            [section.heading.name for section in sections],
+            ["h3", "h4", "h3", "h4", "h4"],
+        )
+        methods = scraper.scrape_methods(soup, sections)
+        self.assertEqual(methods["getMe"]["parameters"], [])
+        self.assertEqual(len(methods["close"]["parameters"]), 1)
+        types = scraper.scrape_types(soup, sections)
+        self.assertEqual(
+            types["ChatMember"]["description"],
+            "This object contains information about one member of a chat.",
+        )
+        self.assertEqual(list(types), ["ChatMember", "getMe", "close"])
+
 
 if __name__ == "__main__":
     unittest.main()
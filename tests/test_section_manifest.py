@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import scraper
+from section_manifest import SectionManifest
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+URL = "https://core.telegram.org/bots/api"
+
+
+class TestSectionManifest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "sections.json")
+        with open(os.path.join(FIXTURES, "api.html"), encoding="utf-8") as f:
+            self.body = f.read()
+
+    def scrape(self, body):
+        manifest = SectionManifest(self.path)
+        data = scraper.scrape_sections(
+            body, scraper.scrape_api_page, "html.parser", manifest, URL
+        )
+        return data, manifest.changed
+
+    def test_sections_match_whole_page(self):
+        data, changed = self.scrape(self.body)
+        expected = scraper.scrape_body(self.body, scraper.scrape_api_page)
+        self.assertEqual(json.dumps(data), json.dumps(expected))
+        self.assertIn(
+            {"url": URL, "kind": "methods", "name": "getMe", "change": "added"},
+            changed,
+        )
+
+    def test_only_changed_sections_are_extracted(self):
+        self.scrape(self.body)
+        body = self.body.replace("Values between 1-100", "Values between 1-200")
+        start = body.index('<h4><a class="anchor" name="logOut"')
+        end = body.index('<h4><a class="anchor" name="sendMessage"')
+        body = body[:start] + body[end:]
+
+        with patch("scraper.scrape_body", wraps=scraper.scrape_body) as scrape_body:
+            data, changed = self.scrape(body)
+
+        # One call builds the empty result, the other extracts getUpdates.
+        self.assertEqual(scrape_body.call_count, 2)
+        self.assertIn(
+            "1-200", data["methods"]["getUpdates"]["parameters"][1]["description"]
+        )
+        self.assertNotIn("logOut", data["methods"])
+        self.assertEqual(list(data["methods"])[-1], "answerCallbackQuery")
+        self.assertEqual(
+            {(change["kind"], change["name"], change["change"]) for change in changed},
+            {
+                ("methods", "getUpdates", "modified"),
+                ("types", "getUpdates", "modified"),
+                ("methods", "logOut", "removed"),
+                ("types", "logOut", "removed"),
+            },
+        )
+
+    def test_unchanged_page_reports_no_changes(self):
+        self.scrape(self.body)
+        _, changed = self.scrape(self.body)
+        self.assertEqual(changed, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import sentence_index
+import update_extensions
+
+FAQ_DATA = {
+    "x-rate-limit": {
+        "per_chat_per_second": {
+            "value": 1,
+            "ref": {
+                "url": "https://core.telegram.org/bots/faq#my-bot-is-hitting-limits-how-do-i-avoid-this",
+                "text": "In a single chat, avoid sending more than one message per second. We may allow short bursts that go over this limit, but eventually you'll begin receiving 429 errors.",
+            },
+        },
+    },
+    "x-file-size-limits": {
+        "download_mb": {
+            "value": 20,
+            "ref": {
+                "url": "https://core.telegram.org/bots/faq#how-do-i-download-files",
+                "text": "Use the getFile method. Please note that this will only work with files of up to 20 MB in size.",
+            },
+        },
+    },
+    "methods": {
+        "sendMessage": {
+            "description": "Use this method to send text messages. On success, the sent Message is returned.",
+            "parameters": [
+                {
+                    "name": "text",
+                    "type": "String",
+                    "required": "Yes",
+                    "description": "Text of the message to be sent, 1-4096 characters after entities parsing",
+                },
+            ],
+        },
+    },
+    "types": {},
+}
+
+
+class TestSentenceIndex(unittest.TestCase):
+    def test_split_sentences(self):
+        self.assertEqual(
+            sentence_index.split_sentences(
+                "Use getFile. Values between 1-100 are accepted. 2 more."
+            ),
+            ["Use getFile.", "Values between 1-100 are accepted.", "2 more."],
+        )
+        self.assertEqual(sentence_index.split_sentences(" "), [])
+
+    def test_iter_sentences(self):
+        sources = [source for source, _ in sentence_index.iter_sentences(FAQ_DATA)]
+        self.assertEqual(
+            sources,
+            [
+                "x-rate-limit.per_chat_per_second",
+                "x-rate-limit.per_chat_per_second",
+                "x-file-size-limits.download_mb",
+                "x-file-size-limits.download_mb",
+                "methods.sendMessage",
+                "methods.sendMessage",
+                "methods.sendMessage.parameters.text",
+            ],
+        )
+
+    def test_classify(self):
+        vectorizer = update_extensions.AIComponent({}).vectorizer
+        index = sentence_index.SentenceIndex.from_file(vectorizer)
+        results = index.classify(
+            [
+                "Avoid sending more than one message per second in a single chat.",
+                "Bots can download files of up to 20 MB in size.",
+                "Caption of the photo, 0-1024 characters after entities parsing",
+                "Use this method to send text messages.",
+                "Zebra quantum marmalade.",
+            ]
+        )
+        self.assertEqual(
+            [label for label, _ in results],
+            ["x-rate-limit", "x-file-size-limits", "x-restrictions", None, None],
+        )
+        for _, confidence in results:
+            self.assertGreaterEqual(confidence, 0)
+            self.assertLessEqual(confidence, 1)
+        self.assertEqual(results[-1][1], 0)
+        self.assertEqual(index.classify([]), [])
+
+    def test_classify_sentences(self):
+        with patch("builtins.print") as mock_print:
+            records = update_extensions.AIComponent(FAQ_DATA).classify_sentences()
+        mock_print.assert_any_call("Classified sentences: 7")
+        by_text = {record["text"]: record for record in records}
+        self.assertEqual(
+            by_text[
+                "Please note that this will only work with files of up to 20 MB in size."
+            ]["x-key"],
+            "x-file-size-limits",
+        )
+        self.assertEqual(
+            by_text[
+                "Text of the message to be sent, 1-4096 characters after entities parsing"
+            ]["x-key"],
+            "x-restrictions",
+        )
+        rate_limit = by_text[
+            "In a single chat, avoid sending more than one message per second."
+        ]
+        self.assertEqual(rate_limit["x-key"], "x-rate-limit")
+        self.assertGreater(rate_limit["x-confidence"], 0.3)
+
+    def test_known_sentences_are_routed(self):
+        vectorizer = update_extensions.AIComponent({}).vectorizer
+        index = sentence_index.SentenceIndex.from_file(vectorizer)
+        # Sentences of the saved pages in tests/fixtures.
+        routes = {
+            "In a single chat, avoid sending more than one message per second.": (
+                "x-rate-limit"
+            ),
+            "Values between 1-100 are accepted.": "x-restrictions",
+            "Returned only in getMe.": None,
+            "Text of the notification.": None,
+            "Mode for parsing entities in the message text.": None,
+        }
+        results = index.classify(list(routes))
+        self.assertEqual([label for label, _ in results], list(routes.values()))
+
+    def test_routes_are_used_in_generation(self):
+        data = dict(FAQ_DATA)
+        data["x-file-size-limits"] = {
+            "upload_mb": {"value": 50, "ref": {"url": "", "text": "Use getFile."}}
+        }
+        with patch("builtins.print"):
+            records = update_extensions.AIComponent(data).classify_sentences()
+        generator = update_extensions.Generator(scraped_data=data)
+        generator.generate_extensions_ref_data()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "routes.json")
+            generator.apply_routes(records, path)
+            with open(path) as f:
+                routes = json.load(f)
+
+        self.assertEqual(routes, [r for r in records if r["x-key"] is not None])
+        rate_limit = generator.extensions_ref_data["x-rate-limit"]
+        self.assertGreater(rate_limit["per_chat_per_second"]["x-confidence"], 0.35)
+        # No sentence of the upload limit states a file size limit, and it is
+        # kept without a confidence.
+        self.assertEqual(
+            generator.extensions_ref_data["x-file-size-limits"],
+            data["x-file-size-limits"],
+        )
+        generator.extract_restrictions()
+        restrictions = generator.extensions_data["sendMessage"]["x-restrictions"]
+        self.assertGreater(restrictions["text"]["x-confidence"], 0.35)
+        caption = generator.extensions_data["sendPhoto"]["x-restrictions"]["caption"]
+        self.assertNotIn("x-confidence", caption)
+
+
+if __name__ == "__main__":
+    unittest.main()
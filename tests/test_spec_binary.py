@@ -0,0 +1,73 @@
+import json
+import os
+import tempfile
+import unittest
+
+import spec_binary
+import spec_merge
+
+
+@unittest.skipUnless(spec_binary.HAS_MSGPACK, "msgpack is not installed")
+class TestSpecBinary(unittest.TestCase):
+    def test_round_trips_the_extended_spec(self):
+        with open("spec-extended.json") as f:
+            spec = json.load(f)
+        data = spec_binary.dumps(spec)
+        loaded = spec_binary.loads(data)
+
+        self.assertEqual(loaded, spec)
+        self.assertEqual(json.dumps(loaded), json.dumps(spec))
+        size = os.path.getsize("spec-extended.min.json")
+        self.assertLess(len(data), size * 0.7)
+        table = spec_binary.string_table(spec)
+        self.assertEqual(len(table), spec_binary.MAX_INTERNED)
+        for string in ("description", "chat_id", "Integer", "InlineKeyboardMarkup"):
+            self.assertIn(string, table)
+
+    def test_repeated_strings_are_interned(self):
+        spec = {
+            "methods": {
+                "sendMessage": {
+                    "href": "https://core.telegram.org/bots/api#sendmessage",
+                    "fields": [
+                        {"name": "chat_id", "types": ["Integer", "String"]},
+                        {"name": "text", "types": ["String"]},
+                    ],
+                },
+                "sendDice": {
+                    "href": "https://core.telegram.org/bots/api#senddice",
+                    "fields": [{"name": "chat_id", "types": ["Integer", "String"]}],
+                },
+            },
+            "empty": "",
+            "count": 2,
+            "ok": True,
+        }
+        table = spec_binary.string_table(spec)
+        self.assertEqual(table[:3], ["String", "chat_id", "Integer"])
+        self.assertNotIn("text", table)
+        self.assertNotIn("chat_id", spec_binary.string_table(spec, min_length=8))
+
+        loaded = spec_binary.loads(spec_binary.dumps(spec))
+        self.assertEqual(json.dumps(loaded), json.dumps(spec))
+        fields = [method["fields"][0]["name"] for method in loaded["methods"].values()]
+        self.assertIs(fields[0], fields[1])
+        types = [method["fields"][0]["types"] for method in loaded["methods"].values()]
+        self.assertIs(types[0][0], types[1][0])
+
+    def test_rejects_other_documents(self):
+        with self.assertRaises(ValueError):
+            spec_binary.loads(spec_binary.msgpack.packb([1, 2, 3]))
+
+    def test_committed_binary_spec_is_up_to_date(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "spec.msgpack")
+            spec_binary.dump(spec_merge.load_json("spec-extended.json"), path)
+            with open(path, "rb") as f:
+                expected = f.read()
+        with open(spec_merge.BINARY_PATH, "rb") as f:
+            self.assertEqual(f.read(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
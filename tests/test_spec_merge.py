@@ -0,0 +1,161 @@
+import json
+import os
+import tempfile
+import unittest
+import spec_merge
+import type_graph
+
+SPEC = {
+    "version": "Bot API 9.2",
+    "methods": {
+        "getMe": {"name": "getMe", "returns": ["User"]},
+        "sendMessage": {"name": "sendMessage", "x-restrictions": {"a": 1}},
+    },
+    "types": {"User": {"name": "User"}},
+}
+
+
+class TestSpecMerge(unittest.TestCase):
+    def test_merges_into_method_and_type_nodes(self):
+        spec = json.loads(json.dumps(SPEC))
+        get_me = spec["methods"]["getMe"]
+        spec_merge.merge_extensions(
+            spec,
+            {
+                "sendMessage": {"x-restrictions": {"text": {"max_length": 4096}}},
+                "User": {"x-notes": "bots are users too"},
+                "x-definitions": {"limit": 1},
+                # Replaced by the index of the spec being extended.
+                "x-type-graph": {"version": 1},
+            },
+        )
+
+        self.assertEqual(
+            spec["methods"]["sendMessage"]["x-restrictions"],
+            {"a": 1, "text": {"max_length": 4096}},
+        )
+        self.assertEqual(spec["types"]["User"]["x-notes"], "bots are users too")
+        self.assertEqual(spec["x-definitions"], {"limit": 1})
+        self.assertEqual(spec[type_graph.KEY], type_graph.build(SPEC))
+        self.assertIs(spec["methods"]["getMe"], get_me)
+        self.assertEqual(get_me, SPEC["methods"]["getMe"])
+
+    def test_build_writes_pretty_and_minified_output(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = {
+                name: os.path.join(tmp, name)
+                for name in (
+                    "api.json",
+                    "extensions.json",
+                    "out.json",
+                    "out.min.json",
+                    "out.patch.json",
+                    "out.restrictions.json",
+                    "out.msgpack",
+                    "models.py",
+                )
+            }
+            with open(paths["api.json"], "w") as f:
+                json.dump(SPEC, f)
+            with open(paths["extensions.json"], "w") as f:
+                json.dump(
+                    {
+                        "getMe": {"x-notes": "é"},
+                        "sendMessage": {"x-restrictions": {"text": {"max_length": 9}}},
+                    },
+                    f,
+                )
+
+            spec_merge.main(
+                [
+                    "--api",
+                    paths["api.json"],
+                    "--extensions",
+                    paths["extensions.json"],
+                    "--output",
+                    paths["out.json"],
+                    "--min-output",
+                    paths["out.min.json"],
+                    "--patch",
+                    paths["out.patch.json"],
+                    "--binary",
+                    paths["out.msgpack"],
+                    "--restrictions",
+                    paths["out.restrictions.json"],
+                    "--models",
+                    paths["models.py"],
+                ]
+            )
+            with open(paths["out.json"], "rb") as f:
+                pretty = f.read()
+            with open(paths["out.min.json"], "rb") as f:
+                minified = f.read()
+            with open(paths["out.patch.json"], "rb") as f:
+                patch = f.read()
+            with open(paths["out.restrictions.json"], "rb") as f:
+                restrictions = f.read()
+            with open(paths["models.py"]) as f:
+                models = f.read()
+
+        self.assertIn(b'  "methods": {\n    "getMe": {', pretty)
+        self.assertIn(b'"x-notes": "\\u00e9"', pretty)
+        self.assertTrue(minified.startswith(b'{"version":"Bot API 9.2","methods":'))
+        self.assertEqual(json.loads(pretty), json.loads(minified))
+        self.assertEqual(patch, b'{"methods":{"getMe":{"x-notes":"\\u00e9"}}}')
+        self.assertEqual(
+            restrictions,
+            b'{"methods":{"sendMessage":{"x-restrictions":{"text":{"max_length":9}}}}}',
+        )
+        self.assertEqual(
+            json.loads(pretty)[type_graph.KEY]["source"], type_graph.source_hash(SPEC)
+        )
+        self.assertIn("class User(Model):", models)
+
+    def test_split_patch_moves_the_definitions_only_restrictions_use(self):
+        limits = {"$ref": "#/x-definitions/x-restrictions"}
+        rate = {"$ref": "#/x-definitions/x-rate-limit"}
+        patch = {
+            "methods": {
+                "sendMessage": {"x-rate-limit": rate, "x-restrictions": limits},
+                "sendDice": {"x-restrictions": rate},
+            },
+            "types": {"User": {"x-notes": "bots are users too"}},
+            "x-definitions": {"x-rate-limit": {"a": 1}, "x-restrictions": {"b": 2}},
+        }
+        rest, restrictions = spec_merge.split_patch(patch)
+
+        self.assertEqual(
+            rest,
+            {
+                "methods": {"sendMessage": {"x-rate-limit": rate}},
+                "types": {"User": {"x-notes": "bots are users too"}},
+                "x-definitions": {"x-rate-limit": {"a": 1}},
+            },
+        )
+        self.assertEqual(
+            restrictions,
+            {
+                "methods": {
+                    "sendMessage": {"x-restrictions": limits},
+                    "sendDice": {"x-restrictions": rate},
+                },
+                "x-definitions": {"x-restrictions": {"b": 2}},
+            },
+        )
+        spec = spec_merge.apply_patches(json.loads(json.dumps(SPEC)), [rest])
+        self.assertEqual(spec[type_graph.KEY], type_graph.build(SPEC))
+        self.assertNotIn("x-restrictions", spec["x-definitions"])
+
+    def test_committed_spec_is_up_to_date(self):
+        spec = spec_merge.merge_extensions(
+            spec_merge.load_json("api.json"), spec_merge.load_json("extensions.json")
+        )
+        pretty, minified = spec_merge.dumps(spec)
+        with open("spec-extended.json") as f:
+            self.assertEqual(f.read(), pretty)
+        with open("spec-extended.min.json") as f:
+            self.assertEqual(f.read(), minified)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import json
+import os
+import tempfile
+import unittest
+import spec_merge
+import spec_patch
+import type_graph
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class TestSpecPatch(unittest.TestCase):
+    def test_committed_patch_round_trips_byte_for_byte(self):
+        patches = [
+            spec_merge.load_json(spec_merge.PATCH_PATH),
+            spec_merge.load_json(spec_merge.RESTRICTIONS_PATH),
+        ]
+        spec = spec_patch.extend(spec_merge.load_json("api.json"), patches)
+        pretty, minified = spec_merge.dumps(spec)
+        self.assertEqual(pretty.encode(), read("spec-extended.json"))
+        self.assertEqual(minified.encode(), read("spec-extended.min.json"))
+        # The derived indexes are not downloaded with the extensions.
+        self.assertNotIn(type_graph.KEY, patches[0])
+        self.assertNotIn("x-restrictions", json.dumps(patches[0]))
+        self.assertNotIn(type_graph.KEY, patches[1])
+
+    def test_cli_applies_several_patches(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output_path = os.path.join(tmp, "spec.json")
+            spec_patch.main(
+                [
+                    "apply",
+                    "api.json",
+                    spec_merge.PATCH_PATH,
+                    spec_merge.RESTRICTIONS_PATH,
+                    "--output",
+                    output_path,
+                ]
+            )
+            self.assertEqual(read(output_path), read("spec-extended.json"))
+
+    def test_cli_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            patch_path = os.path.join(tmp, "patch.json")
+            output_path = os.path.join(tmp, "spec.min.json")
+            spec_patch.main(
+                ["diff", "api.json", "spec-extended.json", "--output", patch_path]
+            )
+            spec_patch.main(
+                ["apply", "api.json", patch_path, "--output", output_path, "--min"]
+            )
+            self.assertEqual(read(output_path), read("spec-extended.min.json"))
+            self.assertLess(
+                os.path.getsize(patch_path), os.path.getsize("spec-extended.json") / 5
+            )
+
+    def test_make_patch(self):
+        source = {"a": 1, "b": {"c": 2, "d": 3}, "e": [1, 2]}
+        target = {"a": 1, "b": {"c": 2, "x": {"y": True}}, "e": [1], "f": "g"}
+        patch = spec_patch.make_patch(source, target)
+
+        self.assertEqual(
+            patch, {"b": {"d": None, "x": {"y": True}}, "e": [1], "f": "g"}
+        )
+        result = spec_patch.patched(source, patch)
+        self.assertEqual(result, target)
+        self.assertEqual(list(result["b"]), list(target["b"]))
+        self.assertEqual(source["b"], {"c": 2, "d": 3})
+
+    def test_null_values_cannot_be_patched(self):
+        with self.assertRaises(ValueError):
+            spec_patch.make_patch({"a": 1}, {"a": None})
+        with self.assertRaises(ValueError):
+            spec_merge.build(extensions={"getMe": {"x-notes": None}}, patch_path=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import spec_reader
+
+
+class TestSpecReader(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def copy(self, name):
+        path = os.path.join(self.tmp, name)
+        shutil.copyfile(name, path)
+        return path
+
+    def test_entries_match_json_load(self):
+        for name in ("api.json", "spec-extended.min.json"):
+            with self.subTest(name=name):
+                path = self.copy(name)
+                with open(path) as f:
+                    spec = json.load(f)
+                with spec_reader.SpecReader(path) as reader:
+                    self.assertEqual(reader.keys(), list(spec))
+                    self.assertEqual(reader.get("version"), spec["version"])
+                    self.assertEqual(dict(reader.iter_methods()), spec["methods"])
+                    self.assertEqual(dict(reader.iter_types()), spec["types"])
+                    self.assertEqual(reader.method_names(), list(spec["methods"]))
+                    with self.assertRaises(KeyError):
+                        reader.method("noSuchMethod")
+
+    def test_offsets_are_byte_offsets(self):
+        path = os.path.join(self.tmp, "spec.json")
+        spec = {
+            "version": "Bot API ✓",
+            "methods": {"a": {"description": "héllo → wörld"}, "b": {}},
+            "types": {},
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(spec, f, ensure_ascii=False, indent=2)
+        with spec_reader.SpecReader(path) as reader:
+            self.assertEqual(reader.get("version"), spec["version"])
+            self.assertEqual(reader.method("a"), spec["methods"]["a"])
+            self.assertEqual(reader.method("b"), {})
+            self.assertEqual(reader.type_names(), [])
+
+    def test_index_is_persisted_and_rebuilt_when_stale(self):
+        path = self.copy("api.json")
+        spec_reader.SpecReader(path).close()
+        self.assertTrue(os.path.exists(spec_reader.index_path_for(path)))
+
+        with mock.patch("spec_reader.build_index") as build_index:
+            with spec_reader.SpecReader(path) as reader:
+                reader.method("sendMessage")
+        build_index.assert_not_called()
+
+        with open(path, "w") as f:
+            json.dump({"methods": {"getMe": {"returns": ["User"]}}}, f)
+        with spec_reader.SpecReader(path) as reader:
+            self.assertEqual(reader.method_names(), ["getMe"])
+            self.assertEqual(reader.method("getMe"), {"returns": ["User"]})
+
+    def test_lookups_are_cached(self):
+        path = self.copy("api.json")
+        with spec_reader.SpecReader(path, cache_size=2) as reader:
+            self.assertIs(reader.method("getMe"), reader.method("getMe"))
+            reader.method("sendMessage")
+            reader.type("User")
+            self.assertEqual(reader._decode.cache_info().currsize, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import json
+import os
+import unittest
+import scraper
+from http_stub import Route, StubServer
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def chunked(text, size):
+    for start in range(0, len(text), size):
+        end = start + size
+        yield text[start:end]
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        with open(os.path.join(FIXTURES, "api.html"), encoding="utf-8") as f:
+            self.body = f.read()
+
+    def test_sections_split_across_chunks(self):
+        expected = scraper.split_raw_sections(self.body)
+        for size in (1, 3, 4, 100):
+            with self.subTest(size=size):
+                chunks = chunked(self.body, size)
+                self.assertEqual(list(scraper.iter_raw_sections(chunks)), expected)
+
+    def test_sections_are_yielded_as_soon_as_they_close(self):
+        chunks = iter(["<p>header</p><h3 id='a'>A</h3><p>intro", "</p><h4>B", "</h4>"])
+        sections = scraper.iter_raw_sections(chunks)
+        self.assertEqual(next(sections), ("3", "<h3 id='a'>A</h3><p>intro</p>"))
+        self.assertEqual(next(chunks), "</h4>")
+
+    def test_stream_source_matches_whole_page(self):
+        route = Route(self.body.encode("utf-8"))
+        with StubServer({"/api": route}) as server:
+            results = scraper.stream_source(
+                server.url("/api"), scraper.scrape_api_page, chunk_size=256
+            )
+        expected = scraper.scrape_body(self.body, scraper.scrape_api_page)
+        self.assertEqual(json.dumps(results), json.dumps(expected))
+
+    def test_stream_source_failure(self):
+        with StubServer({}) as server:
+            results = scraper.stream_source(
+                server.url("/missing"), scraper.scrape_api_page
+            )
+        self.assertIsNone(results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import json
+import unittest
+from collections import Counter
+
+import spec_merge
+import synthetic_updates
+import type_graph
+
+
+class TestUpdateGenerator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.spec = spec_merge.load_json(spec_merge.OUTPUT_PATH)
+        cls.graph = type_graph.TypeGraph.from_spec(cls.spec)
+
+    def generator(self, **kwargs):
+        return synthetic_updates.UpdateGenerator(self.spec, **kwargs)
+
+    def assertWellFormed(self, value, type_ref, loc="update"):
+        if type_ref.startswith(type_graph.ARRAY_PREFIX):
+            self.assertIsInstance(value, list, loc)
+            for index, item in enumerate(value):
+                item_type = type_ref.removeprefix(type_graph.ARRAY_PREFIX)
+                self.assertWellFormed(item, item_type, f"{loc}[{index}]")
+            return
+        expected = {"Integer": int, "Float": float, "Boolean": bool, "String": str}
+        if type_ref in expected:
+            self.assertIsInstance(value, expected[type_ref], loc)
+            return
+        self.assertIsInstance(value, dict, loc)
+        # The concrete type whose fields the object has.
+        for name in sorted(self.graph.concrete_types(type_ref)):
+            fields = {f["name"]: f for f in self.spec["types"][name].get("fields", [])}
+            required = {key for key, field in fields.items() if field["required"]}
+            if required <= value.keys() <= fields.keys():
+                break
+        else:
+            self.fail(f"{loc}: not a {type_ref}: {value}")
+        for key, item in value.items():
+            self.assertWellFormed(item, fields[key]["types"][0], f"{loc}.{key}")
+
+    def test_updates_are_well_formed(self):
+        updates = list(self.generator(optional=0.1).updates(300))
+        self.assertEqual(
+            [update["update_id"] for update in updates], list(range(1, 301))
+        )
+        for update in updates:
+            self.assertEqual(len(update), 2)
+            self.assertWellFormed(update, "Update")
+        message = next(update["message"] for update in updates if "message" in update)
+        self.assertIn(
+            message["chat"]["type"], ["private", "group", "supergroup", "channel"]
+        )
+
+    def test_fixed_values_are_applied(self):
+        generator = self.generator(mix={"callback_query": 1})
+        messages = [
+            update["callback_query"]["message"] for update in generator.updates(200)
+        ]
+        inaccessible = [message for message in messages if message["date"] == 0]
+        self.assertTrue(inaccessible)
+        for message in inaccessible:
+            # InaccessibleMessage, whose date is "Always 0".
+            self.assertEqual(message.keys(), {"chat", "message_id", "date"})
+        self.assertTrue(any(message["date"] for message in messages))
+
+    def test_the_mix_and_rate_are_followed(self):
+        generator = self.generator(mix={"message": 3, "callback_query": 1}, rate=10)
+        kinds = Counter()
+        for update in generator.updates(4000):
+            kinds.update(key for key in update if key != "update_id")
+        self.assertEqual(kinds.keys(), {"message", "callback_query"})
+        self.assertAlmostEqual(kinds["message"] / 4000, 0.75, delta=0.03)
+        # 4000 updates at 10 per second take about 400 seconds.
+        self.assertAlmostEqual(
+            generator.now - synthetic_updates.DEFAULT_START, 400, delta=40
+        )
+        with self.assertRaises(ValueError):
+            self.generator(mix={"update_id": 1})
+
+    def test_streams_are_deterministic(self):
+        first = b"".join(self.generator(seed=7).ndjson(200))
+        self.assertEqual(first, b"".join(self.generator(seed=7).ndjson(200)))
+        self.assertNotEqual(first, b"".join(self.generator(seed=8).ndjson(200)))
+        self.assertEqual(first.count(b"\n"), 200)
+
+    def test_get_updates_bodies(self):
+        lines = self.generator().ndjson(250)
+        bodies = [
+            json.loads(body) for body in synthetic_updates.get_updates_bodies(lines)
+        ]
+        self.assertEqual([len(body["result"]) for body in bodies], [100, 100, 50])
+        self.assertTrue(all(body["ok"] for body in bodies))
+        self.assertEqual(bodies[2]["result"][-1]["update_id"], 250)
+
+    def test_paced(self):
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        items = synthetic_updates.paced(range(5), 2, lambda: now[0], sleep)
+        self.assertEqual(list(items), [0, 1, 2, 3, 4])
+        self.assertEqual(sleeps, [0.5, 0.5, 0.5, 0.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import json
+import unittest
+
+import spec_merge
+import type_graph
+
+CHAT_MEMBERS = {
+    "ChatMemberAdministrator",
+    "ChatMemberBanned",
+    "ChatMemberLeft",
+    "ChatMemberMember",
+    "ChatMemberOwner",
+    "ChatMemberRestricted",
+}
+
+
+class TestTypeGraph(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open(spec_merge.API_PATH) as f:
+            cls.spec = json.load(f)
+        cls.index = type_graph.build(cls.spec)
+        cls.graph = type_graph.TypeGraph(cls.index)
+
+    def test_abstract_types_resolve_to_concrete_types(self):
+        self.assertEqual(self.graph.subtypes("ChatMember"), CHAT_MEMBERS)
+        self.assertEqual(self.graph.concrete_types("Array of ChatMember"), CHAT_MEMBERS)
+        self.assertEqual(self.graph.concrete_types("User"), {"User"})
+        self.assertIn("ChatMember", self.graph.ancestors("ChatMemberOwner"))
+        self.assertTrue(self.graph.is_subtype("Message", "MaybeInaccessibleMessage"))
+        self.assertFalse(self.graph.is_subtype("User", "ChatMember"))
+
+    def test_method_types_include_nested_types(self):
+        returns = self.graph.method_types("getChatAdministrators", "returns")
+        self.assertEqual(returns, CHAT_MEMBERS | {"ChatMember", "User"})
+        parameters = self.graph.method_types("sendMessage")
+        self.assertIn("MessageEntity", parameters)
+        self.assertIn("InlineKeyboardButton", parameters)
+        self.assertNotIn("Integer", parameters)
+
+    def test_reachable_is_computed_for_other_types(self):
+        self.assertNotIn("ChatMemberOwner", self.index["reachable"])
+        self.assertEqual(self.graph.reachable("ChatMemberOwner"), {"User"})
+
+    def test_index_is_sorted_and_serializable(self):
+        for name, found in self.index["descendants"].items():
+            self.assertEqual(found, sorted(found))
+        self.assertEqual(json.loads(json.dumps(self.index)), self.index)
+
+    def test_committed_spec_embeds_the_index(self):
+        with open(spec_merge.OUTPUT_PATH) as f:
+            spec = json.load(f)
+        self.assertEqual(spec[type_graph.KEY], self.index)
+        graph = type_graph.TypeGraph.from_spec(spec)
+        self.assertEqual(graph.concrete_types("ChatMember"), CHAT_MEMBERS)
+
+    def test_stale_index_is_rebuilt(self):
+        spec = dict(self.spec, **{type_graph.KEY: dict(self.index, concrete={})})
+        # An index built from the types and methods of the spec is trusted,
+        graph = type_graph.TypeGraph.from_spec(spec)
+        self.assertEqual(graph.concrete_types("ChatMember"), {"ChatMember"})
+        # and one built from others is not.
+        spec[type_graph.KEY]["source"] = type_graph.source_hash({})
+        graph = type_graph.TypeGraph.from_spec(spec)
+        self.assertEqual(graph.concrete_types("ChatMember"), CHAT_MEMBERS)
+
+    def test_unknown_version_is_rejected(self):
+        with self.assertRaises(ValueError):
+            type_graph.TypeGraph(dict(self.index, version=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,237 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import validators
+
+SPEC = {
+    "methods": {
+        "sendNote": {
+            "name": "sendNote",
+            "fields": [
+                {"name": "chat_id", "types": ["Integer", "String"], "required": True},
+                {"name": "text", "types": ["String"], "required": True},
+                {"name": "tags", "types": ["Array of String"], "required": False},
+            ],
+            "x-restrictions": {"$ref": "#/x-definitions/x-restrictions"},
+        },
+    },
+    "types": {},
+    "x-definitions": {
+        "x-restrictions": {
+            "text": {"min_length": 1, "max_length": 8},
+            "tags": {"max_items": 2},
+        },
+    },
+}
+
+
+class TestValidators(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.cache_dir = tempfile.mkdtemp()
+        cls.validators = validators.Validators.from_file(cache_dir=cls.cache_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.cache_dir)
+
+    def validate(self, method, payload):
+        return self.validators.validate(method, payload)
+
+    def test_valid_payloads_pass(self):
+        self.assertEqual(self.validate("sendMessage", {"chat_id": 1, "text": "hi"}), [])
+        payload = {
+            "chat_id": "@channel",
+            "text": "hi",
+            "entities": [{"type": "bold", "offset": 0, "length": 2}],
+            "reply_markup": {"inline_keyboard": [[{"text": "a", "url": "x"}]]},
+        }
+        self.assertEqual(self.validate("sendMessage", payload), [])
+
+    def test_fields_are_checked(self):
+        payload = {"chat_id": 1.5, "text": "x" * 4097, "colour": "red", "entities": {}}
+        self.assertEqual(
+            self.validate("sendMessage", payload),
+            [
+                "colour: unknown field",
+                "chat_id: expected Integer or String",
+                "text: length must be between 1 and 4096",
+                "entities: expected Array of MessageEntity",
+            ],
+        )
+        self.assertEqual(
+            self.validate("sendMessage", {}), ["chat_id: required", "text: required"]
+        )
+        self.assertEqual(self.validate("sendMessage", []), ["expected an object"])
+        # Booleans are not integers.
+        self.assertEqual(
+            self.validate("sendMessage", {"chat_id": True, "text": "hi"}),
+            ["chat_id: expected Integer or String"],
+        )
+
+    def test_value_limits(self):
+        for limit in (1, 100):
+            self.assertEqual(self.validate("getUpdates", {"limit": limit}), [])
+        for limit in (0, 101):
+            self.assertEqual(
+                self.validate("getUpdates", {"limit": limit}),
+                ["limit: value must be between 1 and 100"],
+            )
+
+    def test_documented_payloads_pass(self):
+        now = int(time.time())
+        options = [{"text": "a"}, {"text": "b"}]
+        location = {"chat_id": 1, "latitude": 51.5, "longitude": -0.1}
+        result = {"type": "location", "id": "1", "title": "Here", "latitude": 1.0}
+        result.update(longitude=2.0, live_period=0x7FFFFFFF)
+        poll = {"chat_id": 1, "question": "?", "options": options}
+        price = {"currency": "TON", "amount": 10_000_000_000}
+        for method, payload in [
+            # close_date is 5-600 seconds in the future.
+            ("sendPoll", dict(poll, close_date=now + 60)),
+            ("sendLocation", dict(location, live_period=0x7FFFFFFF)),
+            ("sendLocation", dict(location, live_period=60, heading=360)),
+            ("answerInlineQuery", {"inline_query_id": "1", "results": [result]}),
+            ("setStickerKeywords", {"sticker": "s", "keywords": ["cat", "dog"]}),
+            (
+                "sendMessage",
+                {
+                    "chat_id": 1,
+                    "text": "hi",
+                    "suggested_post_parameters": {"price": price},
+                },
+            ),
+            ("banChatMember", {"chat_id": 1, "user_id": 2, "until_date": now + 60}),
+        ]:
+            with self.subTest(method=method, payload=payload):
+                self.assertEqual(self.validate(method, payload), [])
+
+    def test_limits_of_other_types_are_not_enforced(self):
+        spec = {
+            "methods": {
+                "sendNote": {
+                    "name": "sendNote",
+                    "fields": [
+                        {
+                            "name": "send_date",
+                            "types": ["Integer"],
+                            "description": "Point in time (Unix timestamp)",
+                        },
+                        {"name": "tags", "types": ["Array of String"]},
+                    ],
+                    "x-restrictions": {
+                        "send_date": {"min_value": 5, "max_value": 600},
+                        "tags": {"max_length": 4, "max_items": 2},
+                    },
+                },
+            },
+            "types": {},
+        }
+        compiled = validators.Validators.from_spec(spec, cache_dir=None)
+        payload = {"send_date": int(time.time()), "tags": ["long tag"]}
+        self.assertEqual(compiled.validate("sendNote", payload), [])
+        self.assertEqual(
+            compiled.validate("sendNote", dict(payload, tags=["a", "b", "c"])),
+            ["tags: number of items must be at most 2"],
+        )
+
+    def test_nested_types_report_their_path(self):
+        payload = {
+            "chat_id": 1,
+            "text": "hi",
+            "entities": [{"type": "bold", "offset": 0}],
+            "reply_markup": {"inline_keyboard": [[{"text": 1}]]},
+        }
+        self.assertEqual(
+            self.validate("sendMessage", payload),
+            [
+                "entities[0].length: required",
+                "reply_markup.inline_keyboard[0][0].text: expected String",
+            ],
+        )
+        self.assertEqual(
+            self.validate(
+                "sendMessage", {"chat_id": 1, "text": "hi", "reply_markup": 1}
+            ),
+            [
+                "reply_markup: expected InlineKeyboardMarkup or ReplyKeyboardMarkup"
+                " or ReplyKeyboardRemove or ForceReply"
+            ],
+        )
+
+    def test_abstract_types_dispatch_on_their_discriminator(self):
+        payload = {"commands": [], "scope": {"type": "chat", "chat_id": 1}}
+        self.assertEqual(self.validate("setMyCommands", payload), [])
+        payload["scope"] = {"type": "chat"}
+        self.assertEqual(
+            self.validate("setMyCommands", payload), ["scope.chat_id: required"]
+        )
+        payload["scope"] = {"type": "everyone"}
+        (error,) = self.validate("setMyCommands", payload)
+        self.assertTrue(
+            error.startswith('scope.type: expected one of "all_chat_administrators"')
+        )
+        media = [{"type": "photo", "media": "a"}, {"type": "video", "media": "b"}]
+        self.assertEqual(
+            self.validate("sendMediaGroup", {"chat_id": 1, "media": media}), []
+        )
+        media[1] = {"type": "sticker", "media": "b"}
+        self.assertEqual(
+            self.validate("sendMediaGroup", {"chat_id": 1, "media": media}),
+            ['media[1].type: expected one of "audio", "document", "photo", "video"'],
+        )
+
+    def test_check_raises(self):
+        with self.assertRaises(validators.ValidationError) as raised:
+            self.validators.check("getUpdates", {"limit": 0})
+        self.assertEqual(
+            raised.exception.errors, ["limit: value must be between 1 and 100"]
+        )
+        self.assertIsInstance(raised.exception, ValueError)
+
+    def test_restrictions_are_resolved(self):
+        compiled = validators.Validators.from_spec(SPEC, cache_dir=None)
+        self.assertEqual(
+            compiled.validate("sendNote", {"chat_id": "a", "text": "b"}), []
+        )
+        self.assertEqual(
+            compiled.validate(
+                "sendNote", {"chat_id": "a", "text": "", "tags": ["a", "b", "c"]}
+            ),
+            [
+                "text: length must be between 1 and 8",
+                "tags: number of items must be at most 2",
+            ],
+        )
+        self.assertEqual(
+            compiled.validate("sendNote", {"chat_id": "a", "text": "b", "tags": [1]}),
+            ["tags[0]: expected String"],
+        )
+
+    def test_compiled_validators_are_cached(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        validators.Validators.from_spec(SPEC, cache_dir=cache_dir)
+        (name,) = os.listdir(cache_dir)
+        with patch("validators.compile_source", side_effect=AssertionError):
+            cached = validators.Validators.from_spec(SPEC, cache_dir=cache_dir)
+        self.assertIn("sendNote", cached)
+
+        # A damaged cache file is compiled again.
+        with open(os.path.join(cache_dir, name), "wb") as f:
+            f.write(b"\0")
+        self.assertIn(
+            "sendNote", validators.Validators.from_spec(SPEC, cache_dir=cache_dir)
+        )
+
+        changed = dict(SPEC, methods={"getMe": {"name": "getMe"}})
+        validators.Validators.from_spec(changed, cache_dir=cache_dir)
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from vector_cache import VectorCache
+
+
+class TestVectorCache(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "vectors.npz")
+        self.vectorizer = HashingVectorizer(n_features=2**10, alternate_sign=False)
+
+    def test_only_new_texts_are_vectorized(self):
+        cache = VectorCache(self.path)
+        matrix, new = cache.vectorize("docs", ["a cat", "a dog"], self.vectorizer)
+        self.assertEqual(new, [0, 1])
+        cache.update("docs", np.ones((2, 2**10)))
+        cache.save()
+
+        cache = VectorCache(self.path)
+        with patch.object(
+            self.vectorizer, "transform", wraps=self.vectorizer.transform
+        ) as transform:
+            updated, new = cache.vectorize(
+                "docs", ["a dog", "a bird", "a cat"], self.vectorizer
+            )
+        transform.assert_called_once_with(["a bird"])
+        self.assertEqual(new, [1])
+        expected = self.vectorizer.transform(["a dog", "a bird", "a cat"])
+        self.assertEqual((updated != expected).nnz, 0)
+        self.assertEqual(cache.centers("docs").tolist(), np.ones((2, 2**10)).tolist())
+
+    def test_other_vectorizer_width_starts_over(self):
+        cache = VectorCache(self.path)
+        cache.vectorize("docs", ["a cat"], self.vectorizer)
+        cache.update("docs", np.ones((2, 2**10)))
+        cache.save()
+
+        wider = HashingVectorizer(n_features=2**11, alternate_sign=False)
+        matrix, new = VectorCache(self.path).vectorize("docs", ["a cat"], wider)
+        self.assertEqual(new, [0])
+        self.assertEqual(matrix.shape, (1, 2**11))
+
+    def test_unreadable_cache_is_ignored(self):
+        with open(self.path, "w") as f:
+            f.write("not an archive")
+        self.assertIsNone(VectorCache(self.path).centers("docs"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,217 @@
+"""
+Type graph index of the Bot API (x-type-graph in the extended spec).
+
+Types refer to each other through the types of their fields, and abstract
+types such as MaybeInaccessibleMessage list the types that can stand in for
+them (subtypes, and subtype_of on the other side). build computes these
+relationships once:
+
+    references   the types the fields of every type refer to
+    subtypes     the direct subtypes of every abstract type
+    descendants  all subtypes of every abstract type, transitively
+    ancestors    all abstract types every type is a subtype of, transitively
+    concrete     the descendants of every abstract type that have no subtypes
+    reachable    every type that can occur inside a value of a type, for the
+                 types that methods take or return
+    methods      the types of the parameters and of the return value of every
+                 method
+
+Lists are sorted by name; primitive types such as Integer are left out.
+The index also records the hash of the parts of the spec it was built from
+(source), so that an index that no longer matches its spec is rebuilt
+instead of trusted. TypeGraph answers queries from the index with
+precomputed sets.
+"""
+
+import hashlib
+import json
+
+KEY = "x-type-graph"
+# Bump when the layout of the index changes.
+TYPE_GRAPH_VERSION = 2
+ARRAY_PREFIX = "Array of "
+
+
+def element_type(type_ref):
+    """Returns the type of the elements of a (nested) array type reference."""
+    while type_ref.startswith(ARRAY_PREFIX):
+        type_ref = type_ref.removeprefix(ARRAY_PREFIX)
+    return type_ref
+
+
+def _field_types(entry, types):
+    found = set()
+    for field in entry.get("fields", []):
+        for type_ref in field["types"]:
+            name = element_type(type_ref)
+            if name in types:
+                found.add(name)
+    return found
+
+
+def _closure(edges, start):
+    """Returns every node reachable from start, start excluded."""
+    seen = set()
+    stack = list(edges.get(start, ()))
+    while stack:
+        node = stack.pop()
+        if node not in seen:
+            seen.add(node)
+            stack.extend(edges.get(node, ()))
+    seen.discard(start)
+    return seen
+
+
+def source_hash(spec):
+    """
+    Returns the hash of the parts of a spec the index depends on: the field
+    types, subtypes and supertypes of every type, and the parameter and
+    return types of every method.
+    """
+    parts = [
+        [
+            kind,
+            name,
+            [field["types"] for field in entry.get("fields", [])],
+            entry.get("subtypes"),
+            entry.get("subtype_of"),
+            entry.get("returns"),
+        ]
+        for kind in ("types", "methods")
+        for name, entry in spec.get(kind, {}).items()
+    ]
+    data = json.dumps(parts, separators=(",", ":")).encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+def build(spec):
+    """Returns the x-type-graph index of a spec."""
+    types = spec.get("types", {})
+    references = {name: _field_types(entry, types) for name, entry in types.items()}
+    subtypes = {}
+    for name, entry in types.items():
+        for subtype in entry.get("subtypes", []):
+            subtypes.setdefault(name, set()).add(subtype)
+        for supertype in entry.get("subtype_of", []):
+            subtypes.setdefault(supertype, set()).add(name)
+
+    descendants = {name: _closure(subtypes, name) for name in subtypes}
+    ancestors = {}
+    for name, found in descendants.items():
+        for descendant in found:
+            ancestors.setdefault(descendant, set()).add(name)
+    concrete = {
+        name: {node for node in found if node not in subtypes}
+        for name, found in descendants.items()
+    }
+
+    # A value of a type contains the types its fields refer to, and can be
+    # any of its subtypes.
+    edges = {name: references[name] | subtypes.get(name, set()) for name in types}
+    methods = {}
+    roots = set()
+    for name, entry in spec.get("methods", {}).items():
+        returns = {element_type(type_ref) for type_ref in entry.get("returns", [])}
+        methods[name] = {
+            "parameters": _field_types(entry, types),
+            "returns": returns & types.keys(),
+        }
+        roots |= methods[name]["parameters"] | methods[name]["returns"]
+    reachable = {name: _closure(edges, name) for name in roots}
+
+    def lists(mapping):
+        return {
+            name: sorted(mapping[name]) for name in sorted(mapping) if mapping[name]
+        }
+
+    return {
+        "version": TYPE_GRAPH_VERSION,
+        "source": source_hash(spec),
+        "references": lists(references),
+        "subtypes": lists(subtypes),
+        "descendants": lists(descendants),
+        "ancestors": lists(ancestors),
+        "concrete": lists(concrete),
+        "reachable": lists(reachable),
+        "methods": {
+            name: {key: sorted(found) for key, found in entry.items()}
+            for name, entry in methods.items()
+        },
+    }
+
+
+class TypeGraph:
+    """Queries over an x-type-graph index, answered from precomputed sets."""
+
+    def __init__(self, index):
+        if index.get("version") != TYPE_GRAPH_VERSION:
+            raise ValueError(f"unsupported {KEY} version: {index.get('version')!r}")
+        self.index = index
+        self._sets = {
+            key: {name: frozenset(found) for name, found in index[key].items()}
+            for key in ("subtypes", "descendants", "ancestors", "concrete", "reachable")
+        }
+        self._method_types = {}
+
+    @classmethod
+    def from_spec(cls, spec):
+        """
+        Creates the query API for a spec, using its x-type-graph index when it
+        has one that was built from the types and methods of the spec, and
+        building the index otherwise.
+        """
+        index = spec.get(KEY)
+        if index is None or index.get("source") != source_hash(spec):
+            index = build(spec)
+        return cls(index)
+
+    def subtypes(self, name):
+        return self._sets["subtypes"].get(name, frozenset())
+
+    def descendants(self, name):
+        return self._sets["descendants"].get(name, frozenset())
+
+    def ancestors(self, name):
+        return self._sets["ancestors"].get(name, frozenset())
+
+    def is_subtype(self, name, of):
+        """Returns whether a value of type name can stand in for type of."""
+        return name == of or name in self.descendants(of)
+
+    def concrete_types(self, type_ref):
+        """
+        Returns the concrete types a value declared as type_ref can have:
+        the leaf subtypes of an abstract type, or the type itself. Array
+        type references are resolved to their element type.
+        """
+        name = element_type(type_ref)
+        return self._sets["concrete"].get(name) or frozenset((name,))
+
+    def reachable(self, name):
+        """Returns every type that can occur inside a value of type name."""
+        found = self._sets["reachable"].get(name)
+        if found is None:
+            found = self._sets["reachable"][name] = self._reachable(name)
+        return found
+
+    def _reachable(self, name):
+        references, subtypes = self.index["references"], self.index["subtypes"]
+        edges = {}
+        for node in references.keys() | subtypes.keys():
+            edges[node] = {*references.get(node, ()), *subtypes.get(node, ())}
+        return frozenset(_closure(edges, name))
+
+    def method_types(self, method, side="parameters"):
+        """
+        Returns every type that can occur in the parameters of a method, or
+        with side="returns" in its return value.
+        """
+        key = (method, side)
+        found = self._method_types.get(key)
+        if found is None:
+            roots = self.index["methods"][method][side]
+            found = set(roots)
+            for root in roots:
+                found |= self.reachable(root)
+            found = self._method_types[key] = frozenset(found)
+        return found
@@ -1,149 +1,445 @@
-import json
+import argparse
+import sys
+import constraints
+import definitions
+import instrumentation
+import model_codegen
+import output
+import rules
 import scraper
-from sklearn.cluster import KMeans
-from sklearn.feature_extraction.text import CountVectorizer
+import spec_merge
+from page_cache import PageCache
+from recording import DEFAULT_RECORDING_DIR, Recording
+from section_manifest import SectionManifest
+from sentence_index import SentenceIndex, iter_sentences
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.metrics import pairwise_distances_argmin
+from vector_cache import VectorCache
+
+N_CLUSTERS = 2
+# HashingVectorizer keeps no vocabulary, so the width of the document-term
+# matrix, and the memory used by the clustering, does not grow with the spec.
+N_FEATURES = 2**16
+BATCH_SIZE = 256
+EXTENSIONS_REF_PATH = "extensions.ref.json"
+ROUTES_PATH = "extensions.routes.json"
+# The keys of the reference data whose entries are limits scraped from the FAQ.
+FAQ_KEYS = ("x-rate-limit", "x-file-size-limits")
 
 
 class Generator:
-    def __init__(self):
-        self.scraped_data = scraper.scrape_all()
+    def __init__(
+        self,
+        cache=None,
+        parser=None,
+        manifest=None,
+        stream=False,
+        api_path=spec_merge.API_PATH,
+        recording=None,
+        replay=False,
+        scraped_data=None,
+    ):
+        """
+        Nothing is scraped until scraped_data is first used. With a
+        recording, the pages are stored in it as they are downloaded, or,
+        with replay, scraped from it without touching the network. Passing
+        scraped_data skips scraping altogether.
+        """
+        self.cache = cache
+        self.parser = parser
+        self.manifest = manifest
+        self.stream = stream
+        self.recording = recording
+        self.replay = replay
+        self._scraped_data = scraped_data
+        self.api_path = api_path
         self.extensions_ref_data = {}
         self.extensions_data = {}
+        # x-confidence of the x-restrictions sentences of fields, by
+        # (method or type, field name).
+        self.field_confidences = {}
+
+    @classmethod
+    def from_ref_file(cls, path=EXTENSIONS_REF_PATH, api_path=spec_merge.API_PATH):
+        """Creates a Generator for the reference data saved by a previous run."""
+        return cls(api_path=api_path, scraped_data=spec_merge.load_json(path))
 
+    @property
+    def scraped_data(self):
+        if self._scraped_data is None:
+            if self.replay:
+                self._scraped_data = scraper.scrape_recorded(
+                    self.recording, self.parser, self.manifest
+                )
+            else:
+                self._scraped_data = scraper.scrape_all(
+                    cache=self.cache,
+                    parser=self.parser,
+                    manifest=self.manifest,
+                    stream=self.stream,
+                    recording=self.recording,
+                )
+        return self._scraped_data
+
+    @property
+    def changed_sections(self):
+        """
+        The sections that changed since the previous run, when a section
+        manifest is used; None means that everything has to be regenerated.
+        """
+        return self.manifest.changed if self.manifest else None
+
+    @instrumentation.timed()
     def generate_extensions_ref_data(self):
         """
         Generates the extensions reference data from the scraped data.
         """
         self.extensions_ref_data = self.scraped_data
 
+    @instrumentation.timed()
     def save_extensions_ref_file(self):
         """
         Saves the extensions reference data to the extensions.ref.json file.
         """
-        with open("extensions.ref.json", "w") as f:
-            json.dump(self.extensions_ref_data, f, indent=2)
+        output.write_json(self.extensions_ref_data, EXTENSIONS_REF_PATH)
 
+    @instrumentation.timed()
+    def apply_routes(self, records, path=ROUTES_PATH):
+        """
+        Uses the sentences AIComponent.classify_sentences routed to an x- key.
+        A limit scraped from the FAQ gets the highest x-confidence of its
+        sentences routed to its own key, and the x-restrictions extracted
+        from a field get the highest x-confidence of its sentences routed to
+        x-restrictions. The confidences only annotate the scraped limits,
+        which are kept whatever they are. The routed sentences are saved to
+        extensions.routes.json.
+        """
+        routes = [record for record in records if record["x-key"] is not None]
+        output.write_json(routes, path)
+        confidences = {}
+        for record in routes:
+            key = (record["x-key"], record["source"])
+            confidences[key] = max(confidences.get(key, 0), record["x-confidence"])
+
+        ref_data = dict(self.extensions_ref_data)
+        for key in FAQ_KEYS:
+            if key not in ref_data:
+                continue
+            entries = {}
+            for name, entry in ref_data[key].items():
+                confidence = confidences.get((key, f"{key}.{name}"))
+                if confidence is not None:
+                    entry = {**entry, "x-confidence": confidence}
+                entries[name] = entry
+            ref_data[key] = entries
+        self.extensions_ref_data = ref_data
+
+        for (key, source), confidence in confidences.items():
+            parts = source.split(".")
+            if key == "x-restrictions" and len(parts) == 4:
+                self.field_confidences[parts[1], parts[3]] = confidence
+
+    @instrumentation.timed()
     def generate_extensions_data_from_ref(self):
         """
-        Generates the extensions data from the extensions reference data.
-        """
-        key_methods = [
-            "sendMessage",
-            "sendPhoto",
-            "editMessageText",
-            "answerCallbackQuery",
-            "getUpdates",
-        ]
-
-        for method in key_methods:
-            self.extensions_data[method] = {}
-
-        if "x-rate-limit" in self.extensions_ref_data:
-            rate_limits = {}
-            for key, value in self.extensions_ref_data["x-rate-limit"].items():
-                rate_limits[key] = value
-            for method in self.extensions_data:
-                self.extensions_data[method]["x-rate-limit"] = rate_limits
-
-        if "x-file-size-limits" in self.extensions_ref_data:
-            if "sendPhoto" in self.extensions_data:
-                self.extensions_data["sendPhoto"]["x-restrictions"] = {
-                    "photo": {
-                        "max_size_mb": 10,
-                        "max_dimensions_total": 10000,
-                        "max_ratio": 20,
-                    },
-                    "caption": {"max_length": 1024},
-                }
+        Generates the extensions data from the extensions reference data by
+        applying the rules in rules.py to every method of api.json.
+        """
+        methods = spec_merge.load_json(self.api_path).get("methods", {})
+        self.extensions_data = rules.RuleEngine(methods).generate(
+            self.extensions_ref_data
+        )
+
+    @instrumentation.timed()
+    def extract_restrictions(self):
+        """
+        Adds the limits stated in the field descriptions of api.json to the
+        x-restrictions of every method and type, with the x-confidence of
+        the field's routed sentences. Values that the rules already set are
+        kept. Returns the fields that looked like limits but matched
+        no pattern.
+        """
+        restrictions, unmatched = constraints.extract(
+            spec_merge.load_json(self.api_path)
+        )
+        for name, fields in restrictions.items():
+            for field, block in fields.items():
+                confidence = self.field_confidences.get((name, field))
+                if confidence is not None:
+                    block["x-confidence"] = confidence
+            rules.merge_missing(
+                self.extensions_data.setdefault(name, {}), {"x-restrictions": fields}
+            )
+        return unmatched
 
-        if "sendMessage" in self.extensions_data:
-            self.extensions_data["sendMessage"]["x-restrictions"] = {
-                "text": {"max_length": 4096}
-            }
-        if "editMessageText" in self.extensions_data:
-            self.extensions_data["editMessageText"]["x-restrictions"] = {
-                "edit": {"max_age_hours": 48},
-                "text": {"max_length": 4096},
-            }
-        if "answerCallbackQuery" in self.extensions_data:
-            self.extensions_data["answerCallbackQuery"]["x-restrictions"] = {
-                "text": {"max_length": 200}
-            }
-        if "getUpdates" in self.extensions_data:
-            self.extensions_data["getUpdates"]["x-restrictions"] = {
-                "limit": {"min_value": 1, "max_value": 100, "default_value": 100},
-                "timeout": {"default_value": 0},
-            }
+    @instrumentation.timed()
+    def hoist_definitions(self):
+        """
+        Moves the x- blocks that several methods and types share into the
+        x-definitions table of the extensions data, and replaces them with
+        JSON References. definitions.Resolver expands them.
+        """
+        definitions.hoist(self.extensions_data)
 
+    @instrumentation.timed()
     def save_extensions_file(self):
         """
         Saves the extensions data to extensions.json and extensions.min.json.
         """
-        with open("extensions.json", "w") as f:
-            json.dump(self.extensions_data, f, indent=2)
-
-        with open("extensions.min.json", "w") as f:
-            json.dump(self.extensions_data, f, separators=(",", ":"))
+        output.write_json(
+            self.extensions_data,
+            "extensions.json",
+            "extensions.min.json",
+            sort_keys=True,
+        )
 
 
 class AIComponent:
-    def __init__(self, extensions_ref_data):
+    def __init__(self, extensions_ref_data, vector_cache=None):
         self.extensions_ref_data = extensions_ref_data
+        self.vector_cache = vector_cache
+        self.vectorizer = HashingVectorizer(
+            stop_words="english", n_features=N_FEATURES, alternate_sign=False
+        )
+
+    def _cluster(self, corpus, names, texts):
+        """
+        Clusters texts and returns a dictionary mapping every cluster label to
+        the names of its texts. With a vector cache, only the texts that
+        changed since the previous run are vectorized, and the clustering
+        continues from the centres of that run with MiniBatchKMeans.partial_fit.
+        """
+        if len(texts) < N_CLUSTERS:
+            return {}
+        centers = None
+        with instrumentation.span("vectorize"):
+            if self.vector_cache is None:
+                X = self.vectorizer.transform(texts)
+                positions = range(len(texts))
+            else:
+                X, positions = self.vector_cache.vectorize(
+                    corpus, texts, self.vectorizer
+                )
+                centers = self.vector_cache.centers(corpus)
+
+        if centers is None:
+            kmeans = MiniBatchKMeans(
+                n_clusters=N_CLUSTERS,
+                random_state=0,
+                n_init="auto",
+                batch_size=BATCH_SIZE,
+            )
+            positions = range(len(texts))
+        else:
+            kmeans = MiniBatchKMeans(
+                n_clusters=N_CLUSTERS,
+                init=centers,
+                n_init=1,
+                random_state=0,
+                batch_size=BATCH_SIZE,
+            )
+        with instrumentation.span("kmeans"):
+            # The first batch initializes the centres and needs a sample per
+            # cluster; when fewer texts changed, the previous centres are kept.
+            if len(positions) >= N_CLUSTERS:
+                positions = list(positions)
+                for start in range(0, len(positions), BATCH_SIZE):
+                    stop = start + BATCH_SIZE
+                    kmeans.partial_fit(X[positions[start:stop]])
+                centers = kmeans.cluster_centers_
+            if self.vector_cache is not None:
+                self.vector_cache.update(corpus, centers)
+            labels = pairwise_distances_argmin(X, centers)
+
+        clusters = {}
+        for name, label in zip(names, labels):
+            clusters.setdefault(int(label), []).append(name)
+        return clusters
 
+    @instrumentation.timed()
     def analyze_data(self):
         """
         Analyzes the scraped data and suggests a more optimal structure for the
-        extensions.ref.json file.
+        extensions.ref.json file. Methods and types are clustered by their
+        descriptions, and so are the fields and parameters they contain.
         """
+        names = []
         descriptions = []
-        if "methods" in self.extensions_ref_data:
-            for method in self.extensions_ref_data["methods"].values():
-                descriptions.append(method["description"])
-        if "types" in self.extensions_ref_data:
-            for type in self.extensions_ref_data["types"].values():
-                descriptions.append(type["description"])
+        field_names = []
+        field_descriptions = []
+        for kind, fields_key in (("methods", "parameters"), ("types", "fields")):
+            for name, entry in self.extensions_ref_data.get(kind, {}).items():
+                names.append(name)
+                descriptions.append(entry["description"])
+                for field in entry.get(fields_key, []):
+                    field_names.append(f"{name}.{field['name']}")
+                    field_descriptions.append(field["description"])
 
-        vectorizer = CountVectorizer(stop_words="english")
-        X = vectorizer.fit_transform(descriptions)
-
-        kmeans = KMeans(n_clusters=2, random_state=0, n_init="auto")
-        kmeans.fit(X)
-
-        clusters = {}
-        for i, label in enumerate(kmeans.labels_):
-            if label not in clusters:
-                clusters[label] = []
-            if i < len(self.extensions_ref_data["methods"]):
-                clusters[label].append(
-                    list(self.extensions_ref_data["methods"].keys())[i]
-                )
-            else:
-                clusters[label].append(
-                    list(self.extensions_ref_data["types"].keys())[
-                        i - len(self.extensions_ref_data["methods"])
-                    ]
-                )
+        clusters = self._cluster("documents", names, descriptions)
+        field_clusters = self._cluster("fields", field_names, field_descriptions)
+        if self.vector_cache is not None:
+            self.vector_cache.save()
 
         print("Clusters:")
         for label, items in clusters.items():
             print(f"- Cluster {label}: {', '.join(items)}")
+        if field_clusters:
+            print("Field clusters:")
+            for label, items in field_clusters.items():
+                print(
+                    f"- Cluster {label}: {len(items)} fields, e.g. {', '.join(items[:5])}"
+                )
+        return {"clusters": clusters, "field_clusters": field_clusters}
+
+    @instrumentation.timed()
+    def classify_sentences(self):
+        """
+        Routes every scraped sentence to the x- key it most likely belongs
+        under, using the nearest labelled examples in sentence_examples.json.
+        Returns one record per sentence with its x- key (None if it belongs
+        under none) and x-confidence.
+        """
+        index = SentenceIndex.from_file(self.vectorizer, vector_cache=self.vector_cache)
+        sentences = list(iter_sentences(self.extensions_ref_data))
+        labels = index.classify([sentence for _, sentence in sentences])
+        if self.vector_cache is not None:
+            self.vector_cache.save()
+
+        records = []
+        counts = {}
+        for (source, sentence), (key, confidence) in zip(sentences, labels):
+            records.append(
+                {
+                    "source": source,
+                    "text": sentence,
+                    "x-key": key,
+                    "x-confidence": confidence,
+                }
+            )
+            if key is not None:
+                counts[key] = counts.get(key, 0) + 1
 
+        print(f"Classified sentences: {len(records)}")
+        for key, count in sorted(counts.items()):
+            print(f"- {key}: {count}")
+        return records
 
-def main():
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Generates extensions.json from the Bot API documentation."
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="download and extract every page again instead of using the cache",
+    )
+    parser.add_argument(
+        "--parser",
+        choices=scraper.PARSERS,
+        help=f"HTML parser backend (default: {scraper.DEFAULT_PARSER})",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="stream the API and features pages and extract them section by section",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--record",
+        nargs="?",
+        const=DEFAULT_RECORDING_DIR,
+        metavar="DIR",
+        help=f"store the downloaded pages for --replay (default: {DEFAULT_RECORDING_DIR})",
+    )
+    mode.add_argument(
+        "--replay",
+        nargs="?",
+        const=DEFAULT_RECORDING_DIR,
+        metavar="SOURCE",
+        help="generate from a --record directory, or from a saved reference"
+        f" data file such as {EXTENSIONS_REF_PATH}, without downloading anything",
+    )
+    parser.add_argument(
+        "--report",
+        nargs="?",
+        const=instrumentation.DEFAULT_REPORT_PATH,
+        metavar="PATH",
+        help="write the wall time, CPU time and peak traced memory of every stage"
+        f" to a JSON run report (default: {instrumentation.DEFAULT_REPORT_PATH})",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="also write cProfile stats and tracemalloc statistics of the"
+        " slowest stage next to the run report",
+    )
+    args = parser.parse_args(argv)
+    if args.record and args.stream:
+        parser.error("--record cannot be combined with --stream")
+    return args
+
+
+def main(argv=None):
     """
     Scrapes the Telegram Bot API documentation, generates the extensions data,
-    and saves it to the extensions.json and extensions.min.json files.
+    saves it to the extensions.json and extensions.min.json files, and merges
+    it into spec-extended.json and spec-extended.min.json. With --replay, the
+    documentation is read from a recording or a reference data file instead.
+    With --report or --profile, every stage of the run is instrumented.
     """
-    generator = Generator()
+    args = parse_args([] if argv is None else argv)
+    if not (args.report or args.profile):
+        run(args)
+        return
+    with instrumentation.Recorder(profile=args.profile) as recorder:
+        run(args)
+    path = args.report or instrumentation.DEFAULT_REPORT_PATH
+    report = recorder.save(path)
+    print(f"Run report: {path} (slowest stage: {report['slowest']})")
+
+
+def run(args):
+    """Runs the pipeline for the parsed command line arguments."""
+    cache = manifest = None
+    if not args.no_cache:
+        cache, manifest = PageCache(), SectionManifest()
+    if args.replay and args.replay.endswith(".json"):
+        generator = Generator.from_ref_file(args.replay)
+    else:
+        recording = None
+        if args.record or args.replay:
+            recording = Recording(args.record or args.replay)
+            if args.replay and not recording.urls():
+                sys.exit(f"No recorded pages in {args.replay}")
+        generator = Generator(
+            cache,
+            args.parser,
+            manifest,
+            args.stream,
+            recording=recording,
+            replay=bool(args.replay),
+        )
     generator.generate_extensions_ref_data()
+    if generator.changed_sections is not None:
+        print(f"Changed sections: {len(generator.changed_sections)}")
     generator.save_extensions_ref_file()
 
-    ai_component = AIComponent(generator.extensions_ref_data)
+    vector_cache = None if args.no_cache else VectorCache()
+    ai_component = AIComponent(generator.extensions_ref_data, vector_cache)
     ai_component.analyze_data()
+    generator.apply_routes(ai_component.classify_sentences())
 
     generator.generate_extensions_data_from_ref()
+    unmatched = generator.extract_restrictions()
+    print(f"Unmatched limit-like fields: {len(unmatched)}")
+    generator.hoist_definitions()
     generator.save_extensions_file()
 
+    spec = spec_merge.build(extensions=generator.extensions_data)
+    model_codegen.write(spec)
+
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])
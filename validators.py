@@ -0,0 +1,454 @@
+"""
+Request validators compiled from spec-extended.json.
+
+compile_source turns every method of the spec, and every type its parameters
+can contain, into a specialised Python function: the field names, the type
+checks and the x-restrictions limits of the entry become constants and
+straight-line code, so validating a payload does not look anything up in the
+spec. A validator returns the list of problems it found, each prefixed with
+the path of the offending value, and an empty list for a valid payload:
+
+    validators = Validators.from_file()
+    validators.validate("getUpdates", {"limit": 500})
+    # ["limit: value must be between 1 and 100"]
+
+Validators check required fields, unknown fields, the types of every field
+("Integer or String" unions included), nested objects and arrays, and the
+length, byte, item count, value and significant bit limits of x-restrictions.
+A limit is only enforced on the values it measures: a length limit on a field
+that can only be an array is not, and neither is a value limit on a Unix time,
+whose documented limits are relative to the current time.
+Abstract types such as InputMedia accept any of their concrete types, which
+are told apart by their discriminator field ("type", "source" or "status")
+when they have one. Lengths are counted in code points.
+
+The compiled code object is cached on disk, keyed by the hash of the spec, the
+compiler version and the Python version, so later processes only unmarshal
+it.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import re
+import sys
+
+import definitions
+import output
+import spec_merge
+import type_graph
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "validators")
+# Bump when the generated code changes.
+COMPILER_VERSION = 2
+
+# Predicates of the primitive types, for the value named v.
+PRIMITIVES = {
+    "String": "type({v}) is str",
+    "Integer": "type({v}) is int",
+    "Float": "(type({v}) is float or type({v}) is int)",
+    "Boolean": "type({v}) is bool",
+    "InputFile": "_is_input_file({v})",
+}
+# The primitive types each value kind of a restriction is certain for.
+KINDS = {
+    "str": {"String"},
+    "int": {"Integer"},
+    "number": {"Integer", "Float"},
+}
+GUARDS = {
+    "str": "type({v}) is str",
+    "int": "type({v}) is int",
+    "number": "(type({v}) is int or type({v}) is float)",
+    "list": "type({v}) is list",
+}
+# x-restrictions min_<suffix>/max_<suffix> pairs: (value kind, measure, noun).
+RANGES = {
+    "length": ("str", "len({v})", "length"),
+    "bytes": ("str", "len({v}.encode())", "size in bytes"),
+    "items": ("list", "len({v})", "number of items"),
+    "value": ("number", "{v}", "value"),
+}
+# The description of the first field of a concrete subtype that names the
+# value it always has, as in 'Type of the result, must be "photo"'.
+DISCRIMINATOR = re.compile(r'(?:always|must be) "?(\w+)"?$')
+# A field that holds a point in time, as in "Date the message was sent in Unix
+# time".
+UNIX_TIME = re.compile(r"\bUnix time", re.IGNORECASE)
+
+
+class ValidationError(ValueError):
+    def __init__(self, method, errors):
+        super().__init__(f"{method}: {'; '.join(errors)}")
+        self.method = method
+        self.errors = errors
+
+
+def _is_input_file(value):
+    """A file_id, URL or attach:// name, file contents, or a file object."""
+    return isinstance(value, (str, bytes)) or hasattr(value, "read")
+
+
+def _one_of(value, loc, errors, checkers, expected):
+    """
+    Accepts value if any of the checkers does. Otherwise reports the problems
+    of the candidate that came closest, or that value has none of the types.
+    """
+    best = None
+    mismatch = loc + ": expected"
+    for check in checkers:
+        found = []
+        check(value, loc, found)
+        if not found:
+            return
+        if not found[0].startswith(mismatch) and (
+            best is None or len(found) < len(best)
+        ):
+            best = found
+    errors.extend(best or [f"{mismatch} {expected}"])
+
+
+RUNTIME = {"_is_input_file": _is_input_file, "_one_of": _one_of}
+
+
+def _report(loc, message):
+    """
+    Returns the statement that reports a problem of the value at the location
+    expression loc, folded into one string when the location is constant.
+    """
+    try:
+        return f"errors.append({json.dumps(json.loads(loc) + message)})"
+    except ValueError:
+        return f"errors.append({loc} + {json.dumps(message)})"
+
+
+def _field_loc(loc, name):
+    """The expression for the location of a field of the object at loc."""
+    return json.dumps(name) if loc is None else f'{loc} + ".{name}"'
+
+
+class _Compiler:
+    def __init__(self, spec):
+        resolver = definitions.Resolver(spec)
+        self.methods = {name: resolver.get("methods", name) for name in spec["methods"]}
+        self.types = {name: resolver.get("types", name) for name in spec["types"]}
+        self.graph = type_graph.TypeGraph.from_spec(spec)
+        self.lines = []
+        # Functions emitted while another one is being emitted.
+        self.helpers = []
+        # Dispatch tables, which refer to functions defined anywhere.
+        self.tables = []
+        self.checkers = {}
+        self.compiled_types = set()
+        self.pending = []
+
+    def source(self):
+        for name, entry in self.methods.items():
+            self._function(f"m_{name}", entry, None)
+        while self.pending:
+            self._type(self.pending.pop())
+        self.lines.extend(self.helpers)
+        self.lines.extend(self.tables)
+        self.lines.append("")
+        self.lines.append("")
+        self.lines.append("METHODS = {")
+        self.lines.extend(f"    {name!r}: m_{name}," for name in self.methods)
+        self.lines.append("}")
+        return "\n".join(self.lines) + "\n"
+
+    def _type_function(self, name):
+        """Returns the name of the validator of a type, compiling it later."""
+        if name not in self.compiled_types:
+            self.compiled_types.add(name)
+            self.pending.append(name)
+        return f"_t_{name}"
+
+    def _type(self, name):
+        if self.graph.subtypes(name):
+            self._abstract(name)
+        else:
+            self._function(f"_t_{name}", self.types[name], "loc")
+
+    def _discriminator(self, name):
+        entry = self.types[name]
+        fields = entry.get("fields") or [{}]
+        match = DISCRIMINATOR.search(fields[0].get("description", ""))
+        return (fields[0]["name"], match.group(1)) if match else None
+
+    def _abstract(self, name):
+        concrete = sorted(self.graph.concrete_types(name))
+        self._dispatcher(self.lines, f"_t_{name}", name, concrete)
+
+    def _dispatcher(self, lines, function, expected, concrete):
+        """
+        Emits a validator that accepts any of the concrete types, choosing
+        the candidates by the value of their discriminator field when all of
+        them have the same one.
+        """
+        discriminators = [self._discriminator(type_name) for type_name in concrete]
+        lines.append("")
+        lines.append("")
+        lines.append(f"def {function}(value, loc, errors):")
+        if None in discriminators or len({key for key, _ in discriminators}) != 1:
+            checkers = ", ".join(self._type_function(n) for n in concrete)
+            lines.append(
+                f"    _one_of(value, loc, errors, ({checkers},), {expected!r})"
+            )
+            return
+        key = discriminators[0][0]
+        by_value = {}
+        for type_name, (_, value) in zip(concrete, discriminators):
+            by_value.setdefault(value, []).append(self._type_function(type_name))
+        table = f"_D{function}"
+        self.tables.append("")
+        self.tables.append(f"{table} = {{")
+        for value, checkers in by_value.items():
+            self.tables.append(f"    {value!r}: ({', '.join(checkers)},),")
+        self.tables.append("}")
+        values = ", ".join(json.dumps(value) for value in by_value)
+        lines.append("    if type(value) is not dict:")
+        lines.append("        " + _report("loc", f": expected {expected}"))
+        lines.append("        return")
+        lines.append(f"    checkers = {table}.get(value.get({key!r}))")
+        lines.append("    if checkers is None:")
+        lines.append("        " + _report("loc", f".{key}: expected one of {values}"))
+        lines.append("    elif len(checkers) == 1:")
+        lines.append("        checkers[0](value, loc, errors)")
+        lines.append("    else:")
+        lines.append(f"        _one_of(value, loc, errors, checkers, {expected!r})")
+
+    def _function(self, function, entry, loc):
+        """
+        Emits the validator of a method (loc None: the payload is the root of
+        every path) or of a concrete type.
+        """
+        fields = entry.get("fields", [])
+        restrictions = entry.get("x-restrictions") or {}
+        discriminator = self._discriminator(entry["name"]) if loc else None
+        names = sorted(field["name"] for field in fields)
+        lines = self.lines
+        lines.append("")
+        lines.append("")
+        lines.append(f"_F_{function} = frozenset({names!r})")
+        lines.append("")
+        lines.append("")
+        if loc is None:
+            lines.append(f"def {function}(value):")
+            lines.append("    errors = []")
+            lines.append("    if type(value) is not dict:")
+            lines.append('        errors.append("expected an object")')
+            lines.append("        return errors")
+        else:
+            lines.append(f"def {function}(value, loc, errors):")
+            lines.append("    if type(value) is not dict:")
+            lines.append("        " + _report("loc", f": expected {entry['name']}"))
+            lines.append("        return")
+        lines.append(f"    if not value.keys() <= _F_{function}:")
+        lines.append("        for key in value:")
+        lines.append(f"            if key not in _F_{function}:")
+        unknown = "key" if loc is None else f'{loc} + "." + key'
+        lines.append("                " + _report(unknown, ": unknown field"))
+        for field in fields:
+            name = field["name"]
+            field_loc = _field_loc(loc, name)
+            lines.append(f"    if {name!r} in value:")
+            lines.append(f"        v = value[{name!r}]")
+            limits = restrictions.get(name)
+            if limits and UNIX_TIME.search(field.get("description", "")):
+                limits = {
+                    key: value
+                    for key, value in limits.items()
+                    if key not in ("min_value", "max_value")
+                }
+            body = self._check("v", field["types"], field_loc, limits)
+            if discriminator and discriminator[0] == name and body:
+                body.append(f"elif v != {discriminator[1]!r}:")
+                expected = f": expected {json.dumps(discriminator[1])}"
+                body.append("    " + _report(field_loc, expected))
+            lines.extend("        " + line for line in body or ["pass"])
+            if field.get("required"):
+                lines.append("    else:")
+                lines.append("        " + _report(field_loc, ": required"))
+        if loc is None:
+            lines.append("    return errors")
+
+    def _checker(self, type_ref):
+        """Returns the name of a function that checks a single type reference."""
+        if type_ref in self.types and type_ref not in PRIMITIVES:
+            return self._type_function(type_ref)
+        if type_ref not in self.checkers:
+            name = self.checkers[type_ref] = f"_c{len(self.checkers)}"
+            body = self._check("value", [type_ref], "loc", None)
+            self.helpers.append("")
+            self.helpers.append("")
+            self.helpers.append(f"def {name}(value, loc, errors):")
+            self.helpers.extend("    " + line for line in body or ["pass"])
+        return self.checkers[type_ref]
+
+    def _union(self, type_refs, expected):
+        """Returns the name of a function that checks a union of types."""
+        key = tuple(type_refs)
+        if key not in self.checkers:
+            name = self.checkers[key] = f"_u{len(self.checkers)}"
+            concrete = set()
+            for type_ref in type_refs:
+                concrete |= self.graph.concrete_types(type_ref)
+            self._dispatcher(self.helpers, name, expected, sorted(concrete))
+        return self.checkers[key]
+
+    def _check(self, v, type_refs, loc, restrictions, depth=0):
+        """
+        Returns the lines that check the value named v against a union of
+        type references and the x-restrictions of its field, reporting
+        problems at the location expression loc.
+        """
+        # References to types the spec does not define are not checked.
+        names = PRIMITIVES.keys() | self.types.keys()
+        known = [t for t in type_refs if type_graph.element_type(t) in names]
+        if not known:
+            return []
+        expected = " or ".join(type_refs)
+        limits = self._limits(v, known, restrictions)
+        if all(type_ref in PRIMITIVES for type_ref in known):
+            predicate = " or ".join(PRIMITIVES[t].format(v=v) for t in known)
+            lines = [f"if not ({predicate}):"]
+            lines.append("    " + _report(loc, f": expected {expected}"))
+            for condition, message in limits:
+                lines.append(f"elif {condition}:")
+                lines.append("    " + _report(loc, ": " + message))
+            return lines
+        if all(t.startswith(type_graph.ARRAY_PREFIX) for t in known):
+            # "Array of InputMediaAudio, InputMediaDocument, ..." is scraped
+            # as one array type per element type, but means one array whose
+            # items can be any of them.
+            item_types = [t.removeprefix(type_graph.ARRAY_PREFIX) for t in known]
+            item, index = f"item{depth}", f"i{depth}"
+            lines = [f"if type({v}) is not list:"]
+            lines.append("    " + _report(loc, f": expected {expected}"))
+            for condition, message in limits:
+                lines.append(f"elif {condition}:")
+                lines.append("    " + _report(loc, ": " + message))
+            item_loc = f'{loc} + "[" + str({index}) + "]"'
+            body = self._check(item, item_types, item_loc, None, depth + 1)
+            if body:
+                lines.append("else:")
+                lines.append(f"    for {index}, {item} in enumerate({v}):")
+                lines.extend("        " + line for line in body)
+            return lines
+        if len(known) == 1:
+            lines = [f"{self._type_function(known[0])}({v}, {loc}, errors)"]
+        elif all(t in self.types and t not in PRIMITIVES for t in known):
+            lines = [f"{self._union(known, expected)}({v}, {loc}, errors)"]
+        else:
+            checkers = ", ".join(self._checker(type_ref) for type_ref in known)
+            lines = [f"_one_of({v}, {loc}, errors, ({checkers},), {expected!r})"]
+        # The limits only apply to values that have the type they measure.
+        for condition, message in limits:
+            lines.append(f"if {condition}:")
+            lines.append("    " + _report(loc, ": " + message))
+        return lines
+
+    def _limits(self, v, type_refs, restrictions):
+        """Returns (condition, message) for every limit of x-restrictions."""
+        if not restrictions:
+            return []
+        limits = []
+        arrays = [t.startswith(type_graph.ARRAY_PREFIX) for t in type_refs]
+        for suffix, (kind, measure, noun) in RANGES.items():
+            low = restrictions.get(f"min_{suffix}")
+            high = restrictions.get(f"max_{suffix}")
+            if low is None and high is None:
+                continue
+            # A limit that measures none of the types of the field, such as
+            # a length limit on an array of strings, is not enforced.
+            if not (any(arrays) if kind == "list" else set(type_refs) & KINDS[kind]):
+                continue
+            measure = measure.format(v=v)
+            if low is not None and high is not None:
+                condition = f"not {low!r} <= {measure} <= {high!r}"
+                message = f"{noun} must be between {low} and {high}"
+            elif low is not None:
+                condition = f"{measure} < {low!r}"
+                message = f"{noun} must be at least {low}"
+            else:
+                condition = f"{measure} > {high!r}"
+                message = f"{noun} must be at most {high}"
+            certain = all(arrays) if kind == "list" else set(type_refs) <= KINDS[kind]
+            if not certain:
+                condition = f"{GUARDS[kind].format(v=v)} and {condition}"
+            limits.append((condition, message))
+        bits = restrictions.get("max_significant_bits")
+        if bits is not None and set(type_refs) & KINDS["int"]:
+            condition = f"not {-(2**bits)} < {v} < {2**bits}"
+            if not set(type_refs) <= KINDS["int"]:
+                condition = f"{GUARDS['int'].format(v=v)} and {condition}"
+            limits.append((condition, f"value must fit in {bits} significant bits"))
+        return limits
+
+
+def compile_source(spec):
+    """Returns the Python source of the validators of every method of a spec."""
+    return _Compiler(spec).source()
+
+
+def cache_key(data):
+    """The cache key of the validators compiled from the spec bytes data."""
+    digest = hashlib.sha256(data)
+    digest.update(f"{COMPILER_VERSION}:{sys.implementation.cache_tag}".encode())
+    return digest.hexdigest()
+
+
+class Validators:
+    """The compiled validators of every method of a spec, by method name."""
+
+    def __init__(self, code):
+        namespace = dict(RUNTIME)
+        exec(code, namespace)
+        self.methods = namespace["METHODS"]
+
+    @classmethod
+    def _load(cls, key, build, cache_dir):
+        path = os.path.join(cache_dir, key + ".marshal") if cache_dir else None
+        if path:
+            try:
+                with open(path, "rb") as f:
+                    return cls(marshal.load(f))
+            except (OSError, EOFError, ValueError, TypeError):
+                pass
+        code = compile(compile_source(build()), "<validators>", "exec")
+        if path:
+            os.makedirs(cache_dir, exist_ok=True)
+            output.write_bytes(path, marshal.dumps(code))
+        return cls(code)
+
+    @classmethod
+    def from_spec(cls, spec, cache_dir=DEFAULT_CACHE_DIR):
+        data = json.dumps(spec, sort_keys=True).encode()
+        return cls._load(cache_key(data), lambda: spec, cache_dir)
+
+    @classmethod
+    def from_file(cls, path=spec_merge.OUTPUT_PATH, cache_dir=DEFAULT_CACHE_DIR):
+        """
+        Loads the validators of a spec file. On a cache hit the file is only
+        hashed, not parsed.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        return cls._load(cache_key(data), lambda: json.loads(data), cache_dir)
+
+    def __contains__(self, method):
+        return method in self.methods
+
+    def __getitem__(self, method):
+        return self.methods[method]
+
+    def validate(self, method, payload):
+        """Returns the problems of a request payload, or an empty list."""
+        return self.methods[method](payload)
+
+    def check(self, method, payload):
+        """Raises ValidationError if a request payload is not valid."""
+        errors = self.methods[method](payload)
+        if errors:
+            raise ValidationError(method, errors)
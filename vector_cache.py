@@ -0,0 +1,113 @@
+import hashlib
+import os
+
+import numpy as np
+import scipy.sparse
+
+DEFAULT_VECTOR_CACHE_PATH = os.path.join(".cache", "vectors.npz")
+# Bump when the layout of the cache or the vectorizer settings change.
+VECTOR_CACHE_VERSION = 1
+
+
+def text_hash(text):
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class VectorCache:
+    """
+    Persisted document-term matrices of the texts AIComponent clusters.
+
+    For every corpus (for example the method and type descriptions, or the
+    field descriptions) it stores one row per text, keyed by the hash of the
+    text, together with the cluster centres of the last run. Only texts that
+    were not seen before are vectorized again, and the centres let the
+    clustering continue from where the previous run stopped.
+    """
+
+    def __init__(self, path=DEFAULT_VECTOR_CACHE_PATH):
+        self.path = path
+        self._corpora = self._load()
+
+    def _load(self):
+        try:
+            with np.load(self.path, allow_pickle=False) as archive:
+                arrays = dict(archive)
+        except (OSError, ValueError):
+            return {}
+        if int(arrays.pop("version", -1)) != VECTOR_CACHE_VERSION:
+            return {}
+        corpora = {}
+        for key, array in arrays.items():
+            corpus, _, field = key.rpartition(".")
+            corpora.setdefault(corpus, {})[field] = array
+        return {
+            name: {
+                "hashes": fields["hashes"].tolist(),
+                "matrix": scipy.sparse.csr_matrix(
+                    (fields["data"], fields["indices"], fields["indptr"]),
+                    shape=tuple(fields["shape"]),
+                ),
+                "centers": fields.get("centers"),
+            }
+            for name, fields in corpora.items()
+        }
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        arrays = {"version": np.array(VECTOR_CACHE_VERSION)}
+        for name, corpus in self._corpora.items():
+            matrix = corpus["matrix"]
+            arrays[f"{name}.hashes"] = np.array(corpus["hashes"], dtype="U64")
+            arrays[f"{name}.data"] = matrix.data
+            arrays[f"{name}.indices"] = matrix.indices
+            arrays[f"{name}.indptr"] = matrix.indptr
+            arrays[f"{name}.shape"] = np.array(matrix.shape)
+            if corpus["centers"] is not None:
+                arrays[f"{name}.centers"] = corpus["centers"]
+        tmp_path = self.path + ".tmp.npz"
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, self.path)
+
+    def vectorize(self, name, texts, vectorizer):
+        """
+        Returns the document-term matrix of texts and the positions of the
+        texts that had to be vectorized because no earlier run had seen them.
+        The rows of texts that are no longer part of the corpus are dropped.
+        """
+        corpus = self._corpora.get(name)
+        cached = {}
+        if corpus is not None and corpus["matrix"].shape[1] == vectorizer.n_features:
+            cached = {digest: row for row, digest in enumerate(corpus["hashes"])}
+
+        hashes = [text_hash(text) for text in texts]
+        missing = {}
+        new_positions = []
+        for position, (text, digest) in enumerate(zip(texts, hashes)):
+            if digest not in cached:
+                missing.setdefault(digest, text)
+                new_positions.append(position)
+
+        empty = scipy.sparse.csr_matrix((0, vectorizer.n_features))
+        old = corpus["matrix"] if cached else empty
+        new = vectorizer.transform(list(missing.values())) if missing else empty
+        new_rows = {digest: row for row, digest in enumerate(missing)}
+        rows = [
+            cached[digest] if digest in cached else old.shape[0] + new_rows[digest]
+            for digest in hashes
+        ]
+        matrix = scipy.sparse.vstack([old, new], format="csr")[rows]
+
+        centers = corpus["centers"] if cached else None
+        self._corpora[name] = {"hashes": hashes, "matrix": matrix, "centers": centers}
+        return matrix, new_positions
+
+    def centers(self, name):
+        """Returns the cluster centres of the previous run, if there was one."""
+        corpus = self._corpora.get(name)
+        return None if corpus is None else corpus["centers"]
+
+    def update(self, name, centers):
+        """Stores the cluster centres of a corpus until the next save."""
+        self._corpora[name]["centers"] = centers